@@ -21,10 +21,24 @@ from beartype._check.checkmagic import (
     ARG_NAME_HINT,
     ARG_NAME_WARN,
     VAR_NAME_PITH_ROOT,
+    VAR_NAME_PITHS,
+    VAR_NAME_PITHS_INDEX,
     VAR_NAME_RANDOM_INT,
     VAR_NAME_VIOLATION,
 )
 
+# ....................{ PRIVATE ~ constants                }....................
+_RANDOM_INT_STEP = 0x9E3779B1
+'''
+Odd constant by which batch type-checking functions advance the pseudo-random
+integer shared by all objects of the passed iterable for each such object.
+
+This constant is the 32-bit golden ratio constant (i.e., ``2**32`` divided by
+the golden ratio, rounded to the nearest odd integer). Since this constant is
+odd and thus coprime to every power of two, advancing an integer by this
+constant visits every residue modulo ``2**32`` before repeating.
+'''
+
 # ....................{ CODE ~ signature                   }....................
 CODE_CHECKER_SIGNATURE = f'''{{code_signature_prefix}}def {{func_name}}(
     {VAR_NAME_PITH_ROOT},
@@ -62,6 +76,24 @@ Note that:
     space-suffixed keyword ``"async "``.
 '''
 
+
+CODE_CHECKER_MANY_SIGNATURE = f'''{{code_signature_prefix}}def {{func_name}}(
+    {VAR_NAME_PITHS},
+{{code_signature_args}}
+):'''
+'''
+Code snippet declaring the signature of all **batch type-checking functions**
+(i.e., functions type-checking each object of a passed iterable against the same
+type hint) created by the
+:func:`beartype._check.checkmake.make_func_tester_many` and
+:func:`beartype._check.checkmake.make_func_raiser_many` factories.
+
+See Also
+--------
+:data:`.CODE_CHECKER_SIGNATURE`
+    Further details.
+'''
+
 # ....................{ CODE ~ check                       }....................
 CODE_TESTER_CHECK_PREFIX = '''
     # Return true only if the passed object satisfies this type hint.
@@ -72,6 +104,64 @@ type-checking tester function against an arbitrary type hint passed to the same
 function.
 '''
 
+
+CODE_TESTER_MANY_CHECK_PREFIX = '''
+    # Return a list of booleans, each true only if the passed object with the
+    # same index satisfies this type hint.
+    return [
+        '''
+'''
+Code snippet prefixing the type-check of each object of an arbitrary iterable
+passed to a batch type-checking tester function against an arbitrary type hint
+passed to the same function.
+
+Note that the type-checking boolean expression embedded between this prefix and
+the :data:`.CODE_TESTER_MANY_CHECK_SUFFIX` suffix is evaluated in a list
+comprehension, which (unlike a generator expression) avoids suspending and
+resuming a generator for each object. Since that expression only assigns
+objects to ``__beartype_pith_{N}`` variables where ``{N}`` is a positive
+integer, assignment expressions in that expression never rebind the root pith
+iterated by this comprehension.
+'''
+
+
+CODE_TESTER_MANY_CHECK_SUFFIX = f'''
+        for {VAR_NAME_PITH_ROOT} in {VAR_NAME_PITHS}{{random_int_next}}
+    ]'''
+'''
+Code snippet suffixing the type-check of each object of an arbitrary iterable
+passed to a batch type-checking tester function against an arbitrary type hint
+passed to the same function.
+
+This snippet expects to be formatted with these named interpolations:
+
+* ``{random_int_next}``, whose value is either:
+
+  * If type-checking for the current type hint requires a pseudo-random integer,
+    :data:`.CODE_TESTER_MANY_RANDOM_INT_NEXT`.
+  * Else, the empty substring.
+'''
+
+
+CODE_TESTER_MANY_RANDOM_INT_NEXT = f'''
+        # Derive a pseudo-random integer unique to this object from that of the
+        # prior object. Since this integer is positive, this condition is
+        # always true.
+        if ({VAR_NAME_RANDOM_INT} := {VAR_NAME_RANDOM_INT} + {_RANDOM_INT_STEP})'''
+'''
+Code snippet deriving a pseudo-random integer unique to each object of an
+arbitrary iterable passed to a batch type-checking tester function from that of
+the prior object in that iterable.
+
+Batch type-checking functions pop only one pseudo-random integer per call. If
+all objects shared that integer, type-checks randomly sampling container items
+would sample the same index of every object, silently ignoring all other
+indices of equally sized containers across the entire batch. This snippet
+instead advances that integer by an odd constant for each object, reducing to a
+Weyl sequence whose residues modulo any container length are uniformly
+distributed across that batch.
+'''
+
 # ....................{ CODE ~ check                       }....................
 CODE_RAISER_HINT_OBJECT_CHECK_PREFIX = '''
 
@@ -84,6 +174,43 @@ function.
 '''
 
 
+CODE_RAISER_MANY_CHECK_PREFIX = f'''
+
+    # For each passed object and the 0-based index of that object...
+    for {VAR_NAME_PITHS_INDEX}, {VAR_NAME_PITH_ROOT} in enumerate({VAR_NAME_PITHS}):{{random_int_next}}
+        # Type-check this object against this type hint.
+        if not '''
+'''
+Code snippet prefixing the type-check of each object of an arbitrary iterable
+passed to a batch type-checking raiser function against an arbitrary type hint
+passed to the same function.
+
+This snippet expects to be formatted with these named interpolations:
+
+* ``{random_int_next}``, whose value is either:
+
+  * If type-checking for the current type hint requires a pseudo-random integer,
+    :data:`.CODE_RAISER_MANY_RANDOM_INT_NEXT`.
+  * Else, the empty substring.
+'''
+
+
+CODE_RAISER_MANY_RANDOM_INT_NEXT = f'''
+        # Derive a pseudo-random integer unique to this object from that of the
+        # prior object.
+        {VAR_NAME_RANDOM_INT} += {_RANDOM_INT_STEP}'''
+'''
+Code snippet deriving a pseudo-random integer unique to each object of an
+arbitrary iterable passed to a batch type-checking raiser function from that of
+the prior object in that iterable.
+
+See Also
+--------
+:data:`.CODE_TESTER_MANY_RANDOM_INT_NEXT`
+    Further details.
+'''
+
+
 CODE_RAISER_FUNC_PITH_CHECK_PREFIX = '''
         # Type-check this parameter or return against this type hint.
         if not '''
@@ -115,6 +242,25 @@ This snippet expects to be formatted with these named interpolations:
 '''
 
 
+CODE_GET_HINT_OBJECT_MANY_VIOLATION = f''':
+            {VAR_NAME_VIOLATION} = {ARG_NAME_GET_VIOLATION}(
+                obj={VAR_NAME_PITH_ROOT},
+                hint={ARG_NAME_HINT},
+                conf={ARG_NAME_CONF},
+                exception_prefix=f'Item {{{{{VAR_NAME_PITHS_INDEX}}}}} ',{{arg_random_int}}
+            )
+'''
+'''
+Code snippet suffixing all code type-checking each object of an arbitrary
+iterable passed to a batch type-checking raiser function against the root type
+hint by either raising a fatal exception or emitting a non-fatal warning
+prefixed by the 0-based index of the object violating that hint.
+
+This snippet expects to be formatted with the same named interpolations as the
+:data:`.CODE_GET_HINT_OBJECT_VIOLATION` snippet.
+'''
+
+
 CODE_GET_FUNC_PITH_VIOLATION = f''':
             {VAR_NAME_VIOLATION} = {ARG_NAME_GET_VIOLATION}(
                 func={ARG_NAME_FUNC},
@@ -12,6 +12,7 @@ This private submodule is *not* intended for importation by downstream callers.
 '''
 
 # ....................{ IMPORTS                            }....................
+from beartype._check.checkreiter import clear_reiterable_cache
 from beartype._check.code.codescope import _tuple_union_to_tuple_union
 from beartype._check.convert.convcoerce import _hint_repr_to_hint
 from beartype._check.forward.reference.fwdrefmake import (
@@ -34,6 +35,9 @@ def clear_checker_caches() -> None:
     * The **forward reference referee cache** (i.e., private
       :data:`beartype._check.forward.reference.fwdrefmeta._forwardref_to_referee`
       dictionary).
+    * The **reiterable iterator cache** (i.e., private
+      :data:`beartype._check.checkreiter._reiterable_id_to_iter_len`
+      dictionary).
     * The **tuple union cache** (i.e., private
       :data:`beartype._check.code.codescope._tuple_union_to_tuple_union`
       dictionary).
@@ -47,3 +51,227 @@ def clear_checker_caches() -> None:
     _forwardref_args_to_forwardref.clear()
     _hint_repr_to_hint.clear()
     _tuple_union_to_tuple_union.clear()
+    clear_reiterable_cache()
+
+
+def clear_checker_caches_module(module_name: str) -> None:
+    '''
+    Clear (i.e., remove) *only* those entries of internal caches specifically
+    leveraged by the :mod:`beartype._check` subpackage that **depend on** (i.e.,
+    transitively refer to objects declared by) the module with the passed
+    fully-qualified name, preserving all other entries of these caches.
+
+    This function is intended to be called when that module has been redefined
+    (e.g., by being externally reloaded), thus invalidating *all* cached
+    references to objects declared by the prior definition of that module
+    without invalidating cached references to objects declared by any other
+    modules. Notably, this function selectively clears:
+
+    * The **forward reference proxy cache** (i.e., private
+      :data:`beartype._check.forward.reference.fwdrefmake._forwardref_args_to_forwardref`
+      dictionary) of all forward reference proxies relative to that module
+      *or* referring to absolute forward references into that module.
+    * The **forward reference referee cache** (i.e., private
+      :data:`beartype._check.forward.reference.fwdrefmeta._forwardref_to_referee`
+      dictionary) of all forward reference proxies either resolved against
+      that module *or* referring to classes declared by that module.
+    * The **tuple union cache** (i.e., private
+      :data:`beartype._check.code.codescope._tuple_union_to_tuple_union`
+      dictionary) of all tuple unions containing classes declared by that
+      module.
+    * The **type hint coercion cache** (i.e., private
+      :data:`beartype._check.convert.convcoerce._hint_repr_to_hint`
+      dictionary) of all type hints transitively subscripted by objects
+      declared by that module.
+
+    The **reiterable iterator cache** (i.e., private
+    :data:`beartype._check.checkreiter._reiterable_id_to_iter_len` dictionary)
+    caches iterators over arbitrary user-defined objects rather than type hints
+    and is thus preserved as is.
+
+    Parameters
+    ----------
+    module_name : str
+        Fully-qualified name of the redefined module.
+    '''
+    assert isinstance(module_name, str), f'{repr(module_name)} not string.'
+
+    # For each forward reference proxy cache entry depending on that module,
+    # remove that entry. Forward reference proxy cache keys are 3-tuples
+    # "(scope_name, hint_name, type_bases)".
+    for forwardref_args in tuple(_forwardref_args_to_forwardref):
+        if _is_forwardref_args_module(forwardref_args, module_name):
+            _forwardref_args_to_forwardref.pop(forwardref_args, None)
+        # Else, this entry is independent of that module.
+
+    # For each forward reference referee cache entry depending on that module,
+    # remove that entry.
+    for forwardref, referee in tuple(_forwardref_to_referee.items()):
+        if (
+            _is_object_module(forwardref, module_name) or
+            _is_object_module(referee, module_name)
+        ):
+            _forwardref_to_referee.pop(forwardref, None)
+        # Else, this entry is independent of that module.
+
+    # For each tuple union cache entry depending on that module, remove that
+    # entry.
+    for tuple_union in tuple(_tuple_union_to_tuple_union):
+        if any(_is_object_module(cls, module_name) for cls in tuple_union):
+            _tuple_union_to_tuple_union.pop(tuple_union, None)
+        # Else, this entry is independent of that module.
+
+    # Remove all type hint coercion cache entries depending on that module.
+    _hint_repr_to_hint.clear_if(
+        lambda hint_repr, hint: _is_hint_module(hint, module_name))
+
+# ....................{ PRIVATE ~ testers                  }....................
+def _is_forwardref_args_module(
+    forwardref_args: tuple, module_name: str) -> bool:
+    '''
+    :data:`True` only if the passed tuple of all parameters previously passed
+    to the private
+    :func:`beartype._check.forward.reference.fwdrefmake._make_forwardref_subtype`
+    factory function describes a forward reference proxy either relative to
+    *or* absolutely referring into the module with the passed fully-qualified
+    name.
+
+    Parameters
+    ----------
+    forwardref_args : tuple
+        3-tuple ``(scope_name, hint_name, type_bases)`` to be inspected.
+    module_name : str
+        Fully-qualified name of the module to be tested against.
+
+    Returns
+    -------
+    bool
+        :data:`True` only if this proxy depends on this module.
+    '''
+
+    # Unpack this tuple.
+    scope_name, hint_name, _ = forwardref_args
+
+    # Return true only if...
+    return (
+        # This proxy is resolved relative to this module *OR*...
+        scope_name == module_name or
+        # This proxy absolutely refers to an attribute of this module.
+        hint_name.startswith(f'{module_name}.')
+    )
+
+
+def _is_hint_module(hint: object, module_name: str) -> bool:
+    '''
+    :data:`True` only if the passed type hint either is *or* is transitively
+    subscripted by one or more objects declared by the module with the passed
+    fully-qualified name.
+
+    This tester iteratively walks the child type hints (e.g., ``__args__``,
+    ``__origin__``) and :pep:`593`-compliant metadata (e.g., ``__metadata__``)
+    of this hint.
+
+    Parameters
+    ----------
+    hint : object
+        Type hint to be inspected.
+    module_name : str
+        Fully-qualified name of the module to be tested against.
+
+    Returns
+    -------
+    bool
+        :data:`True` only if this hint depends on this module.
+    '''
+
+    # Stack of all objects to be visited, initialized to this hint.
+    hints_unvisited = [hint]
+
+    # Set of the object identifiers of all previously visited objects, guarding
+    # against infinite recursion in the (hopefully unlikely) event of a
+    # circular type hint.
+    hint_ids_visited = set()
+
+    # While one or more objects remain to be visited...
+    while hints_unvisited:
+        # Object to be visited.
+        hint_curr = hints_unvisited.pop()
+
+        # Object identifier of this object.
+        hint_curr_id = id(hint_curr)
+
+        # If this object has already been visited, silently skip this object.
+        if hint_curr_id in hint_ids_visited:
+            continue
+        # Else, this object has yet to be visited.
+
+        # Record this object to have now been visited.
+        hint_ids_visited.add(hint_curr_id)
+
+        # If this object is declared by this module, return true.
+        if _is_object_module(hint_curr, module_name):
+            return True
+        # Else, this object is *NOT* declared by this module.
+
+        # For the name of each dunder attribute possibly referring to child
+        # objects of this object...
+        for hint_curr_attr_name in _HINT_CHILD_ATTR_NAMES:
+            # Child object(s) of this object if any *OR* "None" otherwise.
+            #
+            # Note that arbitrary objects may define arbitrary __getattr__()
+            # dunder methods raising arbitrary exceptions. Although unlikely,
+            # any such exception implies this object to be unintrospectable.
+            try:
+                hint_child = getattr(hint_curr, hint_curr_attr_name, None)
+            except Exception:
+                continue
+
+            # If this object is a tuple of child objects, visit each.
+            if isinstance(hint_child, tuple):
+                hints_unvisited.extend(hint_child)
+            # Else if this object has a single child object, visit that.
+            elif hint_child is not None:
+                hints_unvisited.append(hint_child)
+            # Else, this object has *NO* such child objects.
+
+    # Else, this hint is independent of this module. In this case, return
+    # false.
+    return False
+
+
+def _is_object_module(obj: object, module_name: str) -> bool:
+    '''
+    :data:`True` only if the passed object is declared by the module with the
+    passed fully-qualified name.
+
+    Parameters
+    ----------
+    obj : object
+        Object to be inspected.
+    module_name : str
+        Fully-qualified name of the module to be tested against.
+
+    Returns
+    -------
+    bool
+        :data:`True` only if this object is declared by this module.
+    '''
+
+    # Attempt to return true only if this object is declared by this module.
+    #
+    # Note that forward reference proxies are dynamically declared as residing
+    # in the modules they refer into and are thus also matched here.
+    try:
+        return getattr(obj, '__module__', None) == module_name
+    # If this object defines an exceptional __getattr__() dunder method, this
+    # object is unintrospectable. In this case, return false.
+    except Exception:
+        return False
+
+# ....................{ PRIVATE ~ constants                }....................
+_HINT_CHILD_ATTR_NAMES = ('__origin__', '__args__', '__metadata__')
+'''
+Tuple of the names of all dunder attributes possibly referring to one or more
+child objects of type hints (e.g., the ``__args__`` of ``list[MuhClass]``),
+visited by the :func:`._is_hint_module` tester.
+'''
@@ -58,16 +58,6 @@ callable passed to each wrapper function generated by the
 '''
 
 
-ARG_NAME_GETRANDBITS = f'{NAME_PREFIX}getrandbits'
-'''
-Name of the **private getrandbits parameter** (i.e., :mod:`beartype`-specific
-parameter whose default value is the highly performant C-based
-:func:`random.getrandbits` function conditionally passed to wrappers generated
-by the :func:`beartype.beartype` decorator whose type-checking logic requires
-one or more random integers).
-'''
-
-
 ARG_NAME_GET_VIOLATION = f'{NAME_PREFIX}get_violation'
 '''
 Name of the **private exception raising parameter** (i.e.,
@@ -88,6 +78,40 @@ passed to the current wrapper function generated by the
 '''
 
 
+
+ARG_NAME_RANDOM_INT_POP = f'{NAME_PREFIX}random_int_pop'
+'''
+Name of the **private pseudo-random integer popper parameter** (i.e.,
+:mod:`beartype`-specific parameter whose default value is the bound C-based
+:meth:`list.pop` method of the
+:data:`beartype._check.checkrandom.random_ints` buffer conditionally passed to
+wrappers generated by the :func:`beartype.beartype` decorator whose
+type-checking logic requires one or more random integers).
+'''
+
+
+ARG_NAME_RANDOM_INT_REFILL = f'{NAME_PREFIX}random_int_refill'
+'''
+Name of the **private pseudo-random integer refiller parameter** (i.e.,
+:mod:`beartype`-specific parameter whose default value is the
+:func:`beartype._check.checkrandom.refill_random_ints` function conditionally
+passed to wrappers generated by the :func:`beartype.beartype` decorator whose
+type-checking logic requires one or more random integers).
+'''
+
+
+ARG_NAME_STREAM_CHECKER = f'{NAME_PREFIX}stream_checker'
+'''
+Name of the **private stream checker parameter** (i.e.,
+:mod:`beartype`-specific parameter whose default value is the
+:class:`beartype._decor.wrap.wrapstream.StreamChecker` instance conditionally
+passed to wrappers generated by the :func:`beartype.beartype` decorator for
+callables returning iterators, generators, or asynchronous generators under
+configurations enabling the :attr:`beartype.BeartypeConf.check_stream_rate`
+option, wrapping the objects returned by those callables in proxies lazily
+type-checking the values streamed through those objects).
+'''
+
 #FIXME: Excise us up, pleas. This should no longer be required.
 ARG_NAME_TYPISTRY = f'{NAME_PREFIX}typistry'
 '''
@@ -150,6 +174,22 @@ Name of the local variable providing the **root pith** (i.e., value of the
 current parameter or return value being type-checked by the current call).
 '''
 
+
+VAR_NAME_PITHS = f'{NAME_PREFIX}piths'
+'''
+Name of the local variable providing the **piths** (i.e., iterable of arbitrary
+objects to be iteratively type-checked against the same type hint by the current
+call to a batch type-checking function).
+'''
+
+
+VAR_NAME_PITHS_INDEX = f'{NAME_PREFIX}piths_index'
+'''
+Name of the local variable providing the **pith index** (i.e., 0-based index of
+the object currently being type-checked in the iterable of objects passed to the
+current call to a batch type-checking function).
+'''
+
 # ....................{ CODE ~ pith                        }....................
 CODE_PITH_ROOT_NAME_PLACEHOLDER = '?|PITH_ROOT_NAME`^'
 '''
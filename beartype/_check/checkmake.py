@@ -15,14 +15,18 @@ This private submodule is *not* intended for importation by downstream callers.
 # ....................{ IMPORTS                            }....................
 from beartype.typing import (
     Callable,
+    Dict,
+    Iterable,
+    List,
     Optional,
+    Tuple,
 )
 from beartype._cave._cavemap import NoneTypeOr
 from beartype._check.checkmagic import (
     ARG_NAME_CONF,
-    ARG_NAME_GETRANDBITS,
     ARG_NAME_GET_VIOLATION,
     ARG_NAME_HINT,
+    ARG_NAME_RANDOM_INT_POP,
     ARG_NAME_WARN,
     CODE_PITH_ROOT_NAME_PLACEHOLDER,
     FUNC_CHECKER_NAME_PREFIX,
@@ -35,11 +39,18 @@ from beartype._check.error.errorget import (
 )
 from beartype._check.util.checkutilmake import make_func_signature
 from beartype._check._checksnip import (
+    CODE_CHECKER_MANY_SIGNATURE,
     CODE_CHECKER_SIGNATURE,
     CODE_RAISER_FUNC_PITH_CHECK_PREFIX,
     CODE_RAISER_HINT_OBJECT_CHECK_PREFIX,
+    CODE_RAISER_MANY_CHECK_PREFIX,
+    CODE_RAISER_MANY_RANDOM_INT_NEXT,
     CODE_TESTER_CHECK_PREFIX,
+    CODE_TESTER_MANY_CHECK_PREFIX,
+    CODE_TESTER_MANY_CHECK_SUFFIX,
+    CODE_TESTER_MANY_RANDOM_INT_NEXT,
     CODE_GET_FUNC_PITH_VIOLATION,
+    CODE_GET_HINT_OBJECT_MANY_VIOLATION,
     CODE_GET_HINT_OBJECT_VIOLATION,
     CODE_GET_VIOLATION_CLS_STACK,
     CODE_GET_VIOLATION_RANDOM_INT,
@@ -54,13 +65,19 @@ from beartype._conf.conftest import die_unless_conf
 from beartype._data.func.datafuncarg import ARG_NAME_RETURN_REPR
 from beartype._data.hint.datahinttyping import (
     CallableRaiser,
+    CallableRaiserMany,
     CallableRaiserOrTester,
     CallableTester,
+    CallableTesterMany,
     CodeGenerated,
     LexicalScope,
     TypeStack,
 )
 from beartype._util.cache.utilcachecall import callable_cached
+from beartype._util.cache.utilcachepolicy import (
+    get_cache_size_max,
+    uncache_dict_oldest,
+)
 from beartype._util.error.utilerrorraise import (
     EXCEPTION_PLACEHOLDER,
     reraise_exception_placeholder,
@@ -69,6 +86,7 @@ from beartype._util.func.utilfuncmake import make_func
 from beartype._util.hint.pep.proposal.pep484585.utilpep484585ref import (
     get_hint_pep484585_ref_names_relative_to)
 from beartype._util.hint.utilhinttest import is_hint_ignorable
+from beartype._util.utilobject import is_object_hashable
 from itertools import count
 from warnings import warn
 
@@ -170,6 +188,123 @@ def make_func_tester(
     return _make_func_checker(  # type: ignore[return-value]
         hint=hint, conf=conf, make_code_check=make_code_tester_check)
 
+# ....................{ FACTORIES ~ func : many            }....................
+@callable_cached
+def make_func_raiser_many(
+    #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+    # CAUTION: All calls to this memoized factory pass parameters *POSITIONALLY*
+    # rather than by keyword. Care should be taken when refactoring parameters,
+    # particularly with respect to parameter position.
+    #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+
+    # Mandatory parameters.
+    hint: object,
+
+    # Optional parameters.
+    conf: BeartypeConf = BEARTYPE_CONF_DEFAULT,
+) -> CallableRaiserMany:
+    '''
+    **Batch type-checking raiser function factory** (i.e., low-level callable
+    dynamically generating a pure-Python raiser function iteratively testing
+    whether each object of an arbitrary iterable passed to that raiser satisfies
+    the type hint passed to this factory and either raising an exception on the
+    first object violating that hint *or* emitting a warning for each object
+    violating that hint).
+
+    The generated raiser iterates over that iterable exactly once in a single
+    loop specialized to this hint, streaming that iterable *without*
+    materializing that iterable into an intermediary container.
+
+    This factory is memoized for efficiency.
+
+    Parameters
+    ----------
+    hint : object
+        Type hint to be type-checked.
+    conf : BeartypeConf, optional
+        **Beartype configuration** (i.e., self-caching dataclass encapsulating
+        all settings configuring type-checking for the passed object). Defaults
+        to ``BeartypeConf()``, the default :math:`O(1)` configuration.
+
+    Returns
+    -------
+    CallableRaiserMany
+        Batch type-checking raiser function generated by this factory for this
+        hint.
+
+    See Also
+    --------
+    :func:`._make_func_checker`
+        Further details.
+    '''
+
+    # Defer to this lower-level factory function for bountiful batches.
+    return _make_func_checker(  # type: ignore[return-value]
+        hint=hint,
+        conf=conf,
+        make_code_check=make_code_raiser_many_check,
+        code_signature_format=CODE_CHECKER_MANY_SIGNATURE,
+        func_checker_ignorable=_func_raiser_many_ignorable,
+    )
+
+
+@callable_cached
+def make_func_tester_many(
+    #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+    # CAUTION: All calls to this memoized factory pass parameters *POSITIONALLY*
+    # rather than by keyword. Care should be taken when refactoring parameters,
+    # particularly with respect to parameter position.
+    #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+
+    # Mandatory parameters.
+    hint: object,
+
+    # Optional parameters.
+    conf: BeartypeConf = BEARTYPE_CONF_DEFAULT,
+) -> CallableTesterMany:
+    '''
+    **Batch type-checking tester function factory** (i.e., low-level callable
+    dynamically generating a pure-Python tester function iteratively testing
+    whether each object of an arbitrary iterable passed to that tester satisfies
+    the type hint passed to this factory and returning a list of these results
+    as its return).
+
+    The generated tester iterates over that iterable exactly once in a single
+    list comprehension specialized to this hint, streaming that iterable
+    *without* materializing that iterable into an intermediary container.
+
+    This factory is memoized for efficiency.
+
+    Parameters
+    ----------
+    hint : object
+        Type hint to be type-checked.
+    conf : BeartypeConf, optional
+        **Beartype configuration** (i.e., self-caching dataclass encapsulating
+        all settings configuring type-checking for the passed object). Defaults
+        to ``BeartypeConf()``, the default :math:`O(1)` configuration.
+
+    Returns
+    -------
+    CallableTesterMany
+        Batch type-checking tester function generated by this factory for this
+        hint.
+
+    See Also
+    --------
+    :func:`._make_func_checker`
+        Further details.
+    '''
+
+    # Defer to this lower-level factory function for boundless booleans.
+    return _make_func_checker(  # type: ignore[return-value]
+        hint=hint,
+        conf=conf,
+        make_code_check=make_code_tester_many_check,
+        code_signature_format=CODE_CHECKER_MANY_SIGNATURE,
+        func_checker_ignorable=_func_tester_many_ignorable,
+    )
+
 # ....................{ FACTORIES ~ code                   }....................
 #FIXME: Unit test us up, please.
 @callable_cached
@@ -220,6 +355,71 @@ def make_code_tester_check(hint: object, conf: BeartypeConf) -> CodeGenerated:
         hint_refs_type_basename,
     )
 
+
+@callable_cached
+def make_code_tester_many_check(
+    hint: object, conf: BeartypeConf) -> CodeGenerated:
+    '''
+    Pure-Python code snippet of a batch type-checking tester function
+    type-checking each object of an arbitrary iterable against the passed type
+    hint under the passed beartype configuration by returning a list of whether
+    each such object satisfies this hint or not.
+
+    This factory is memoized for efficiency.
+
+    Parameters
+    ----------
+    hint : object
+        Type hint to be type-checked.
+    conf : BeartypeConf
+        **Beartype configuration** (i.e., self-caching dataclass encapsulating
+        all settings configuring type-checking for the passed object).
+
+    Returns
+    -------
+    CodeGenerated
+        Tuple containing the Python code snippet dynamically generated by this
+        code factory and metadata describing that code. See the
+        :attr:`beartype._data.hint.datahinttyping.CodeGenerated` type hint.
+
+    See Also
+    --------
+    :func:`.make_check_expr`
+        Further details.
+    '''
+
+    # Python code snippet comprising a single boolean expression type-checking
+    # an arbitrary object against this hint.
+    (
+        code_expr,
+        func_scope,
+        hint_refs_type_basename,
+    ) = make_check_expr(hint, conf)
+
+    # Code snippet suffixing the type-check of each pith of the passed
+    # iterable, deriving a pseudo-random integer unique to each such pith if
+    # type-checking this hint requires a pseudo-random integer.
+    code_check_suffix = CODE_TESTER_MANY_CHECK_SUFFIX.format(random_int_next=(
+        CODE_TESTER_MANY_RANDOM_INT_NEXT
+        if ARG_NAME_RANDOM_INT_POP in func_scope else
+        ''
+    ))
+
+    # Code snippet type-checking each pith of the passed iterable against the
+    # root hint.
+    func_code = (
+        f'{CODE_TESTER_MANY_CHECK_PREFIX}'
+        f'{code_expr}'
+        f'{code_check_suffix}'
+    )
+
+    # Return all metadata required by higher-level callers.
+    return (
+        func_code,
+        func_scope,
+        hint_refs_type_basename,
+    )
+
 # ....................{ FACTORIES ~ code : raiser          }....................
 #FIXME: Unit test us up, please.
 @callable_cached
@@ -287,14 +487,24 @@ def make_code_raiser_func_pith_check(
         code_expr,
         func_scope,
         hint_refs_type_basename,
-    ) = make_check_expr(hint, conf, cls_stack)
+    ) = make_check_expr(
+        hint,
+        conf,
+        cls_stack,
+        # Count the branches of unions only if this configuration enables
+        # adaptive union reordering. Since this raiser function is embedded
+        # *ONLY* in @beartype-generated wrapper functions, the
+        # "beartype._decor.wrap.wrapunion" submodule is guaranteed to
+        # subsequently reorder these branches.
+        conf.union_reorder_threshold is not None,
+    )
 
     # Code snippet passing the value of the random integer previously generated
     # for the current call to the exception-handling function call embedded in
     # the "CODE_HINT_ROOT_SUFFIX" snippet, defaulting to *NOT* passing this.
     arg_random_int = (
         CODE_GET_VIOLATION_RANDOM_INT
-        if ARG_NAME_GETRANDBITS in func_scope else
+        if ARG_NAME_RANDOM_INT_POP in func_scope else
         ''
     )
 
@@ -446,7 +656,7 @@ def make_code_raiser_hint_object_check(
     # the "CODE_HINT_ROOT_SUFFIX" snippet, defaulting to *NOT* passing this.
     arg_random_int = (
         CODE_GET_VIOLATION_RANDOM_INT
-        if ARG_NAME_GETRANDBITS in func_scope else
+        if ARG_NAME_RANDOM_INT_POP in func_scope else
         ''
     )
 
@@ -483,6 +693,105 @@ def make_code_raiser_hint_object_check(
         hint_refs_type_basename,
     )
 
+
+@callable_cached
+def make_code_raiser_many_check(
+    hint: object, conf: BeartypeConf) -> CodeGenerated:
+    '''
+    Pure-Python code snippet of a batch type-checking raiser function
+    type-checking each object of an arbitrary iterable against the passed type
+    hint under the passed beartype configuration by either raising a fatal
+    exception *or* emitting a non-fatal warning when an object of that iterable
+    violates this hint.
+
+    This factory is memoized for efficiency.
+
+    Parameters
+    ----------
+    hint : object
+        Type hint to be type-checked.
+    conf : BeartypeConf
+        **Beartype configuration** (i.e., self-caching dataclass encapsulating
+        all settings configuring type-checking for the passed object).
+
+    Returns
+    -------
+    CodeGenerated
+        Tuple containing the Python code snippet dynamically generated by this
+        code factory and metadata describing that code. See the
+        :attr:`beartype._data.hint.datahinttyping.CodeGenerated` type hint.
+
+    See Also
+    --------
+    :func:`.make_code_raiser_hint_object_check`
+        Further details.
+    '''
+
+    #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+    # CAUTION: Synchronize with the make_code_raiser_hint_object_check()
+    # factory.
+    #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+
+    # Python code snippet comprising a single boolean expression type-checking
+    # an arbitrary object against this hint.
+    (
+        code_expr,
+        func_scope,
+        hint_refs_type_basename,
+    ) = make_check_expr(hint, conf)
+
+    # Code snippet passing the value of the random integer previously generated
+    # for the current call to the exception-handling function call embedded in
+    # the "CODE_HINT_ROOT_SUFFIX" snippet, defaulting to *NOT* passing this.
+    arg_random_int = (
+        CODE_GET_VIOLATION_RANDOM_INT
+        if ARG_NAME_RANDOM_INT_POP in func_scope else
+        ''
+    )
+
+    # Pass hidden parameters to this raiser function exposing:
+    # * The get_hint_object_violation() getter called by the
+    #   "CODE_GET_HINT_OBJECT_MANY_VIOLATION" snippet.
+    # * The passed type hint accessed by this snippet.
+    func_scope[ARG_NAME_GET_VIOLATION] = get_hint_object_violation
+    func_scope[ARG_NAME_HINT] = hint
+
+    # Code snippet generating a human-readable violation exception or warning
+    # when the current pith violates the root type hint.
+    code_get_violation = CODE_GET_HINT_OBJECT_MANY_VIOLATION.format(
+        arg_random_int=arg_random_int)
+
+    # Code snippet handling the previously generated violation by either raising
+    # that violation as a fatal exception or emitting that violation as a
+    # non-fatal warning.
+    code_handle_violation = _make_code_raiser_violation(
+        conf=conf, func_scope=func_scope, is_param=None)
+
+    # Code snippet prefixing the type-check of each pith of the passed
+    # iterable, deriving a pseudo-random integer unique to each such pith if
+    # type-checking this hint requires a pseudo-random integer.
+    code_check_prefix = CODE_RAISER_MANY_CHECK_PREFIX.format(random_int_next=(
+        CODE_RAISER_MANY_RANDOM_INT_NEXT
+        if ARG_NAME_RANDOM_INT_POP in func_scope else
+        ''
+    ))
+
+    # Code snippet type-checking each pith of the passed iterable against the
+    # root hint.
+    func_code = (
+        f'{code_check_prefix}'
+        f'{code_expr}'
+        f'{code_get_violation}'
+        f'{code_handle_violation}'
+    )
+
+    # Return all metadata required by higher-level callers.
+    return (
+        func_code,
+        func_scope,
+        hint_refs_type_basename,
+    )
+
 # ....................{ PRIVATE ~ globals                  }....................
 _func_checker_name_counter = count(start=0, step=1)
 '''
@@ -492,7 +801,159 @@ integer incrementation starting at 0, leveraged by the
 functions dynamically generated by that factory).
 '''
 
+
+_hint_unhashable_key_to_func_checker: Dict[
+    tuple, Tuple[object, CallableRaiserOrTester]] = {}
+'''
+**Unhashable type hint type-checker cache** (i.e., dictionary mapping from a
+hashable key uniquely identifying each unhashable type hint previously passed
+to the :func:`._make_func_checker` factory to a 2-tuple
+``(hint, func_checker)`` of that hint and the type-checking function generated
+by that factory for that hint).
+
+Unhashable type hints (e.g., ``Annotated[int, []]``) *cannot* be memoized by the
+:func:`beartype._util.cache.utilcachecall.callable_cached` decorator, which
+silently calls the decorated factory *without* memoization when passed
+unhashable parameters. This secondary cache ensures that repeatedly passing
+equal copies of the same unhashable type hint to high-level type-checkers
+(e.g., :func:`beartype.door.is_bearable`) reuses the same type-checking function
+rather than repeatedly regenerating and recompiling that function.
+
+Each key of this dictionary is a 4-tuple
+``(hint_repr, conf, make_code_check, code_signature_format)`` of the
+machine-readable representation of that hint and the parameters passed to that
+factory with that hint. Since representations are *not* guaranteed to be
+unique, that factory additionally compares cached hints against passed hints
+for equality before reusing cached type-checking functions.
+'''
+
+
+_HINT_UNHASHABLE_KEY_LEN_MAX = get_cache_size_max()
+'''
+Maximum number of items in the :data:`._hint_unhashable_key_to_func_checker`
+dictionary.
+
+This dictionary is intentionally bounded regardless of the global cache policy.
+Unlike hashable type hints, unhashable type hints are often created anew on each
+type-check (e.g., ``is_bearable(obj, Annotated[int, [i]])`` in a loop) and thus
+*not* persisted for the lifetime of the active Python process. Since each such
+hint subscripted by a different object produces a different key, this
+dictionary would otherwise grow without bound even under the default policy.
+'''
+
+
+_hint_sane_key_to_func_checker: Dict[
+    tuple, Tuple[object, CallableRaiserOrTester]] = {}
+'''
+**Sanified type hint type-checker cache** (i.e., dictionary mapping from a
+hashable key uniquely identifying each **sanified type hint** (i.e., type hint
+returned by the :func:`.sanify_hint_root_statement` sanifier) previously
+generated by the :func:`._make_func_checker` factory to a 2-tuple
+``(hint_sane, func_checker)`` of that hint and the type-checking function
+generated by that factory for that hint).
+
+The memoized factories calling that factory (e.g., :func:`.make_func_tester`)
+memoize the *unsanified* type hints passed by callers. Since sanification
+coerces, reduces, and interns (i.e., deduplicates) type hints, unequal
+unsanified type hints are often sanified into the same type hint (e.g., the
+PEP-noncompliant tuple union ``(int, str)`` and the :pep:`484`-compliant union
+``Union[int, str]``). Those factories fail to memoize those type hints as the
+same type hint. This secondary cache ensures that those type hints then share
+the same type-checking function rather than each generating and compiling a
+new such function.
+
+Each key of this dictionary is a 4-tuple
+``(id(hint_sane), conf, make_code_check, code_signature_format)`` of the object
+identifier of that hint and the parameters passed to that factory with that
+hint. Sanified type hints are keyed by object identity rather than equality,
+as equal type hints are *not* necessarily interchangeable (e.g.,
+``Union[int, str] == Union[str, int]`` but type-checking violations describe
+these hints differently). Since each value of this dictionary pins that hint,
+the identifier of that hint is *never* recycled while cached.
+'''
+
+
+_HINT_SANE_KEY_LEN_MAX = get_cache_size_max()
+'''
+Maximum number of items in the :data:`._hint_sane_key_to_func_checker`
+dictionary.
+
+This dictionary is intentionally bounded regardless of the global cache policy
+for the same reasons as the :data:`._hint_unhashable_key_to_func_checker`
+dictionary. Since sanifying unhashable type hints created anew on each
+type-check produces new sanified type hints, this dictionary would otherwise
+grow without bound even under the default policy.
+'''
+
+# ....................{ PRIVATE ~ cachers                  }....................
+def _cache_func_checker_unhashable(
+    hint_unhashable_key: tuple,
+    hint: object,
+    func_checker: CallableRaiserOrTester,
+) -> None:
+    '''
+    Cache the passed type-checking function generated for the passed
+    unhashable type hint under the passed key uniquely identifying that hint in
+    the :data:`._hint_unhashable_key_to_func_checker` cache, evicting the least
+    recently cached type-checking functions exceeding the bound of that cache.
+
+    Parameters
+    ----------
+    hint_unhashable_key : tuple
+        Key uniquely identifying this hint.
+    hint : object
+        Unhashable type hint to be cached, pinned by that cache.
+    func_checker : CallableRaiserOrTester
+        Type-checking function generated for this hint.
+    '''
+
+    # Cache this function with this key *AND* this hint as is.
+    _hint_unhashable_key_to_func_checker[hint_unhashable_key] = (
+        hint, func_checker)
+
+    # Evict the least recently cached type-checking functions exceeding the
+    # bound of this cache.
+    uncache_dict_oldest(
+        _hint_unhashable_key_to_func_checker, _HINT_UNHASHABLE_KEY_LEN_MAX)
+
 # ....................{ PRIVATE ~ testers                  }....................
+def _is_hint_equal(hint_a: object, hint_b: object) -> bool:
+    '''
+    :data:`True` only if the two passed type hints are **equal** (i.e., either
+    the same object *or* compare equal without raising an exception).
+
+    This tester safely handles type hints whose comparison raises exceptions
+    or returns non-boolean objects (e.g., :pep:`593`-compliant
+    ``Annotated[...]`` hints subscripted by NumPy arrays, whose comparison
+    returns arrays whose truthiness is ambiguous).
+
+    Parameters
+    ----------
+    hint_a : object
+        First type hint to be compared.
+    hint_b : object
+        Second type hint to be compared.
+
+    Returns
+    -------
+    bool
+        :data:`True` only if these hints are equal.
+    '''
+
+    # If these hints are the same object, these hints are trivially equal.
+    if hint_a is hint_b:
+        return True
+    # Else, these hints are different objects.
+
+    # Attempt to return true only if these hints compare equal.
+    try:
+        return bool(hint_a == hint_b)
+    # If doing so raises *ANY* exception whatsoever, these hints are
+    # incomparable and thus assumed to be unequal.
+    except Exception:
+        return False
+
+
 def _func_checker_ignorable(obj: object) -> bool:
     '''
     **Ignorable type-checking tester function singleton** (i.e., function
@@ -507,12 +968,44 @@ def _func_checker_ignorable(obj: object) -> bool:
 
     return True
 
+
+def _func_raiser_many_ignorable(objs: Iterable[object]) -> None:
+    '''
+    **Ignorable batch type-checking raiser function singleton** (i.e., function
+    unconditionally reducing to a noop, semantically equivalent to a raiser
+    type-checking each object of an arbitrary iterable passed to this raiser
+    against an ignorable PEP-compliant type hint).
+
+    The :func:`make_func_raiser_many` factory efficiently returns this singleton
+    when passed an ignorable type hint. Since all objects satisfy that hint,
+    this singleton avoids needlessly iterating over the passed iterable.
+    '''
+
+    pass
+
+
+def _func_tester_many_ignorable(objs: Iterable[object]) -> List[bool]:
+    '''
+    **Ignorable batch type-checking tester function singleton** (i.e., function
+    unconditionally returning a list of ``True`` booleans, one for each object
+    of the passed iterable, semantically equivalent to a batch tester testing
+    whether each object of an arbitrary iterable passed to this tester satisfies
+    an ignorable PEP-compliant type hint).
+
+    The :func:`make_func_tester_many` factory efficiently returns this singleton
+    when passed an ignorable type hint.
+    '''
+
+    return [True for _ in objs]
+
 # ....................{ PRIVATE ~ factories : func         }....................
 #FIXME: Unit test us up, please.
 def _make_func_checker(
     hint: object,
     conf: BeartypeConf,
     make_code_check: Callable[..., CodeGenerated],
+    code_signature_format: str = CODE_CHECKER_SIGNATURE,
+    func_checker_ignorable: Callable = _func_checker_ignorable,
 ) -> CallableRaiserOrTester:
     '''
     **Type-checking function factory** (i.e., low-level callable dynamically
@@ -556,6 +1049,15 @@ def _make_func_checker(
         **Type-checking code factory** (i.e., function dynamically generating a
         code snippet of a function type-checking an arbitrary object against the
         passed type hint under the passed beartype configuration).
+    code_signature_format : str, optional
+        Code snippet declaring the unformatted signature of the type-checking
+        function to be generated. Defaults to :data:`.CODE_CHECKER_SIGNATURE`,
+        the signature of all type-checking functions accepting a single object.
+    func_checker_ignorable : Callable, optional
+        **Ignorable type-checking function singleton** (i.e., function to be
+        returned as is when the passed type hint is ignorable). Defaults to
+        :func:`._func_checker_ignorable`, the ignorable tester accepting a
+        single object.
 
     Returns
     -------
@@ -584,6 +1086,10 @@ def _make_func_checker(
     '''
     assert callable(make_code_check), f'{repr(make_code_check)} uncallable.'
 
+    # Key uniquely identifying this hint if this hint is unhashable *OR* "None"
+    # otherwise (i.e., if this hint is hashable), initialized below.
+    hint_unhashable_key: Optional[tuple] = None
+
     # Attempt to...
     try:
         # ....................{ VALIDATION                 }....................
@@ -591,6 +1097,50 @@ def _make_func_checker(
         # If this configuration is *NOT* a configuration, raise an exception.
         die_unless_conf(conf)
 
+        # ....................{ CACHE                      }....................
+        # If this hint is unhashable (e.g., "Annotated[int, []]"), the memoized
+        # factory calling this factory failed to memoize this hint and instead
+        # called this factory as is. Since this factory dynamically generates
+        # and compiles a new type-checking function on each call, doing so
+        # would be unacceptably slow for callers repeatedly passing copies of
+        # this hint (e.g., "is_bearable(obj, Annotated[int, []])" in a loop).
+        # In this case, attempt to reuse a type-checking function previously
+        # generated for an equal copy of this hint.
+        if not is_object_hashable(hint):
+            # Key uniquely identifying this hint as a fingerprint of this hint's
+            # structure. For the same reasons detailed by the
+            # "beartype._check.convert.convcoerce._hint_repr_to_hint" cache, the
+            # machine-readable representation of this hint is the most
+            # disambiguous hashable proxy for this hint.
+            hint_unhashable_key = (
+                repr(hint), conf, make_code_check, code_signature_format)
+
+            # 2-tuple "(hint_cached, func_checker_cached)" of the copy of this
+            # hint and the type-checking function previously generated for that
+            # copy if any *OR* "None" otherwise.
+            hint_func_checker_cached = _hint_unhashable_key_to_func_checker.get(
+                hint_unhashable_key)
+
+            # If a type-checking function was previously generated for a copy
+            # of this hint sharing the same representation *AND* that copy is
+            # equal to this hint, return that function. Since representations
+            # are *NOT* guaranteed to be unique (e.g., two different classes
+            # sharing the same fully-qualified name), equality is additionally
+            # tested to guard against false positives.
+            if (
+                hint_func_checker_cached is not None and
+                _is_hint_equal(hint_func_checker_cached[0], hint)
+            ):
+                return hint_func_checker_cached[1]  # type: ignore[return-value]
+            # Else, *NO* type-checking function was previously generated for a
+            # copy of this hint. Generate that function below and cache that
+            # function with this key *AFTER* successfully doing so.
+        # Else, this hint is hashable and thus already memoized by the memoized
+        # factory calling this factory.
+
+        # Unsanitized hint passed by the caller, preserved for caching below.
+        hint_unsanified = hint
+
         # Either:
         # * If this hint is PEP-noncompliant, the PEP-compliant type hint
         #   converted from this PEP-noncompliant type hint.
@@ -603,11 +1153,49 @@ def _make_func_checker(
             hint=hint, conf=conf, exception_prefix=EXCEPTION_PLACEHOLDER)
 
         # If this hint is ignorable, all objects satisfy this hint. In this
-        # case, return a trivial tester function unconditionally returning true.
+        # case, return the passed trivial type-checking function (e.g., a tester
+        # function unconditionally returning true).
         if is_hint_ignorable(hint):
-            return _func_checker_ignorable
+            return func_checker_ignorable  # type: ignore[return-value]
         # Else, this hint is unignorable.
 
+        # Key uniquely identifying this sanified hint. If this hint was
+        # sanified from an unsanified hint unequal to but sanified into the
+        # same hint as an unsanified hint previously passed to this factory
+        # (e.g., "(int, str)" and "Union[int, str]"), reuse the type-checking
+        # function previously generated for that hint rather than generating
+        # and compiling a new function.
+        hint_sane_key = (id(hint), conf, make_code_check, code_signature_format)
+
+        # 2-tuple "(hint_sane_cached, func_checker_cached)" of the sanified hint
+        # and the type-checking function previously generated for that hint if
+        # any *OR* "None" otherwise.
+        hint_sane_func_checker_cached = _hint_sane_key_to_func_checker.get(
+            hint_sane_key)
+
+        # If a type-checking function was previously generated for this
+        # sanified hint, return that function. Since object identifiers of
+        # pinned objects are unique, the identity test below is merely a
+        # trivial safeguard.
+        if (
+            hint_sane_func_checker_cached is not None and
+            hint_sane_func_checker_cached[0] is hint
+        ):
+            func_checker_cached = hint_sane_func_checker_cached[1]
+
+            # If the unsanified hint is unhashable, cache that function with
+            # the key uniquely identifying that hint, avoiding resanifying
+            # subsequent copies of that hint.
+            if hint_unhashable_key is not None:
+                _cache_func_checker_unhashable(
+                    hint_unhashable_key, hint_unsanified, func_checker_cached)
+            # Else, the unsanified hint is hashable.
+
+            # Return that function.
+            return func_checker_cached  # type: ignore[return-value]
+        # Else, *NO* type-checking function was previously generated for this
+        # sanified hint. Generate that function below.
+
         # ....................{ CODE                       }....................
         # Python code snippet comprising a single boolean expression
         # type-checking an arbitrary object against this hint.
@@ -667,7 +1255,7 @@ def _make_func_checker(
         code_signature = make_func_signature(
             func_name=func_checker_name,
             func_scope=func_scope,
-            code_signature_format=CODE_CHECKER_SIGNATURE,
+            code_signature_format=code_signature_format,
             conf=conf,
         )
 
@@ -683,6 +1271,22 @@ def _make_func_checker(
             func_label='die_if_unbearable() or is_bearable() type-checker',
             is_debug=conf.is_debug,
         )
+
+        # Cache this function with the key uniquely identifying this sanified
+        # hint *AND* this hint as is, pinning this hint.
+        _hint_sane_key_to_func_checker[hint_sane_key] = (hint, func_tester)
+
+        # Evict the least recently cached type-checking functions exceeding the
+        # bound of this cache.
+        uncache_dict_oldest(
+            _hint_sane_key_to_func_checker, _HINT_SANE_KEY_LEN_MAX)
+
+        # If this hint is unhashable, cache this function with the key uniquely
+        # identifying this hint *AND* this hint as is.
+        if hint_unhashable_key is not None:
+            _cache_func_checker_unhashable(
+                hint_unhashable_key, hint_unsanified, func_tester)
+        # Else, this hint is hashable.
     # If doing so raises *ANY* exception, reraise this exception with each
     # placeholder substring (i.e., "EXCEPTION_PLACEHOLDER" instance) replaced by
     # an explanatory prefix.
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2024 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Beartype **pseudo-random integer buffer** (i.e., low-level globals and
+functions enabling :mod:`beartype`-generated type-checkers to retrieve the
+pseudo-random integer type-checking randomly indexed container items on each
+call with a single C-based method call rather than a call to the
+:func:`random.getrandbits` function).
+
+Generating a pseudo-random integer with :func:`random.getrandbits` requires
+both advancing Python's C-based Mersenne Twister *and* allocating a new
+:class:`int` object, which collectively dominate the cost of that call. This
+submodule instead pops each pseudo-random integer off a module-scoped buffer
+(i.e., :class:`list`) with the C-based :meth:`list.pop` method, amortizing both
+of those costs across a large batch of calls:
+
+* Each **pool** of pseudo-random integers is generated all at once, either with
+  NumPy if NumPy has already been imported by the active Python interpreter
+  *or* with a single :func:`random.getrandbits` call generating all bits of
+  that pool otherwise.
+* Each **refill** of this buffer extends this buffer by the current pool
+  rotated by a pseudo-random offset, merely incrementing the reference counts
+  of the existing integers of that pool rather than allocating new integers.
+* Each pool is reused across several refills before being regenerated,
+  bounding the number of distinct pseudo-random integers observed by
+  type-checkers between regenerations to at least the length of that pool.
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                            }....................
+from array import array
+from beartype.typing import List
+from beartype._util.module.utilmodget import get_module_imported_or_none
+from random import getrandbits
+
+# ....................{ GLOBALS                            }....................
+random_ints: List[int] = []
+'''
+**Pseudo-random integer buffer** (i.e., list of zero or more pseudo-random
+unsigned 32-bit integers, each popped off by a
+:func:`beartype.beartype`-generated type-checker requiring a pseudo-random
+integer and refilled by the :func:`.refill_random_ints` function on exhausting
+this buffer).
+
+Since the C-based :meth:`list.pop` and :meth:`list.extend` methods are atomic
+under the Global Interpreter Lock (GIL) *and* internally locked under
+free-threaded interpreters, this buffer is safely shared between threads.
+Concurrent refills merely extend this buffer by multiple pools.
+'''
+
+
+random_int_pop = random_ints.pop
+'''
+Bound :meth:`list.pop` method of the :data:`.random_ints` buffer, bound exactly
+once here. Since each access of a method on an object creates a new bound
+method object, passing this singleton to *all* type-checkers enables their
+lexical scopes to be safely merged without spurious key-value collisions.
+'''
+
+# ....................{ REFILLERS                          }....................
+def refill_random_ints() -> int:
+    '''
+    Refill the **pseudo-random integer buffer** (i.e., :data:`.random_ints`
+    list) with the current pool of pseudo-random integers rotated by a
+    pseudo-random offset *and* return the first such integer popped off this
+    buffer.
+
+    This function is intended to be called *only* from
+    :func:`beartype.beartype`-generated type-checkers on failing to pop a
+    pseudo-random integer off this buffer, implying this buffer to have been
+    exhausted.
+
+    Returns
+    -------
+    int
+        Pseudo-random unsigned 32-bit integer.
+    '''
+
+    # Globals modified below.
+    global _random_ints_pool, _random_ints_pool_refills
+
+    # If the current pool has been reused for the maximum number of refills,
+    # regenerate this pool.
+    if _random_ints_pool_refills >= _RANDOM_INTS_POOL_REFILLS_MAX:
+        _random_ints_pool = _make_random_ints_pool()
+        _random_ints_pool_refills = 0
+    # Else, the current pool is still reusable.
+
+    # Localize this pool to avoid race conditions with other threads
+    # concurrently regenerating this pool.
+    random_ints_pool = _random_ints_pool
+
+    # Pseudo-random offset to rotate this pool by.
+    pool_offset = getrandbits(32) % _RANDOM_INTS_POOL_LEN
+
+    # Refill this buffer with this pool rotated by this offset.
+    random_ints.extend(random_ints_pool[pool_offset:])
+    random_ints.extend(random_ints_pool[:pool_offset])
+    _random_ints_pool_refills += 1
+
+    # Return the first pseudo-random integer popped off this buffer. Since
+    # another thread could have concurrently exhausted this buffer in the
+    # interim, this pop is guarded by a fallback to a fresh integer.
+    try:
+        return random_ints.pop()
+    except IndexError:  # pragma: no cover
+        return getrandbits(32)
+
+# ....................{ PRIVATE ~ constants                }....................
+_RANDOM_INTS_POOL_LEN = 2 ** 12
+'''
+Number of pseudo-random integers in each pool refilling the
+:data:`.random_ints` buffer.
+
+This length was chosen to balance the space consumed by each pool (i.e.,
+roughly 160KB, dominated by the integers themselves) against the time consumed
+by each refill of this buffer.
+'''
+
+
+_RANDOM_INTS_POOL_REFILLS_MAX = 8
+'''
+Maximum number of refills of the :data:`.random_ints` buffer by the same pool
+of pseudo-random integers, after which that pool is regenerated.
+
+Smaller values improve the quality of pseudo-random integers observed by
+type-checkers at the cost of allocating new integers more frequently.
+'''
+
+# ....................{ PRIVATE ~ factories                }....................
+def _make_random_ints_pool() -> List[int]:
+    '''
+    New **pseudo-random integer pool** (i.e., list of
+    :data:`._RANDOM_INTS_POOL_LEN` pseudo-random unsigned 32-bit integers).
+
+    If NumPy has already been imported by the active Python interpreter, this
+    factory defers to NumPy to generate these integers; else, this factory
+    generates all bits of these integers with a single call to the C-based
+    :func:`random.getrandbits` function and then reinterprets those bits as
+    unsigned 32-bit integers. Notably, this factory *never* imports NumPy
+    itself, as doing so would substantially increase the import-time cost of
+    :mod:`beartype`.
+
+    Returns
+    -------
+    List[int]
+        New pseudo-random integer pool.
+    '''
+
+    # NumPy if NumPy has already been imported *OR* "None" otherwise.
+    numpy = get_module_imported_or_none('numpy')
+
+    # If NumPy has already been imported, defer to NumPy.
+    if numpy is not None:
+        return numpy.random.randint(  # type: ignore[no-any-return]
+            0, 2 ** 32, size=_RANDOM_INTS_POOL_LEN, dtype=numpy.uint32,
+        ).tolist()
+    # Else, NumPy has yet to be imported.
+
+    # Array of unsigned integers, whose size in bytes is platform-specific.
+    random_ints_array = array(_RANDOM_INTS_ARRAY_TYPECODE)
+
+    # Populate this array with all bits of this pool, generated all at once.
+    random_ints_array.frombytes(getrandbits(
+        _RANDOM_INTS_POOL_LEN * random_ints_array.itemsize * 8).to_bytes(
+            _RANDOM_INTS_POOL_LEN * random_ints_array.itemsize, 'little'))
+
+    # Return this array converted into a list of integers truncated to 32 bits.
+    return (
+        random_ints_array.tolist()
+        if random_ints_array.itemsize == 4 else
+        [random_int & 0xFFFFFFFF for random_int in random_ints_array]
+    )
+
+
+_RANDOM_INTS_ARRAY_TYPECODE = 'I' if array('I').itemsize >= 4 else 'L'
+'''
+Type code of the :class:`array.array` of unsigned integers reinterpreting
+pseudo-random bits generated by the :func:`._make_random_ints_pool` factory,
+guaranteed to be at least 32 bits wide.
+'''
+
+# ....................{ PRIVATE ~ globals                  }....................
+_random_ints_pool: List[int] = []
+'''
+Current **pseudo-random integer pool** (i.e., list of pseudo-random unsigned
+32-bit integers refilling the :data:`.random_ints` buffer).
+
+This pool is lazily generated by the first call to the
+:func:`.refill_random_ints` function, avoiding import-time costs.
+'''
+
+
+_random_ints_pool_refills = _RANDOM_INTS_POOL_REFILLS_MAX
+'''
+Number of refills of the :data:`.random_ints` buffer by the current
+:data:`._random_ints_pool` since that pool was last regenerated, initialized to
+the maximum to force the first call to the :func:`.refill_random_ints`
+function to generate the first pool.
+'''
@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2024 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Beartype **reiterable item sampler** (i.e., low-level globals and getters
+enabling :mod:`beartype`-generated type-checkers to deeply type-check a
+different item of each **reiterable** (i.e., container that is *not* a sequence
+but is safely iterable multiple times, like sets and dictionary views) on each
+type-check in amortized ``O(1)`` time). This sampler similarly enables those
+type-checkers to deeply type-check a different key-value pair of each mapping on
+each type-check.
+
+Reiterables do *not* support ``O(1)`` indexation by position. The only generic
+means of retrieving an item other than the first item of a reiterable is to
+iterate over that reiterable up to that item, which is ``O(n)``. Instead, this
+submodule caches a single iterator over each recently type-checked reiterable
+in a bounded Least Recently Used (LRU) cache. Each type-check of a reiterable
+then merely advances that iterator by one item, eventually visiting *all* items
+of that reiterable across sufficiently many type-checks.
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                            }....................
+from beartype.typing import (
+    Collection,
+    Dict,
+    Iterator,
+    Mapping,
+    Tuple,
+)
+from threading import Lock
+
+# ....................{ GETTERS                            }....................
+def get_reiterable_nonempty_item_next(reiterable: Collection) -> object:
+    '''
+    Next item of the passed non-empty reiterable, retrieved from the iterator
+    over this reiterable cached by the most recent call to this getter passed
+    this reiterable if any *or* the first item of this reiterable otherwise in
+    amortized ``O(1)`` time.
+
+    This getter is intended to be called *only* from
+    :func:`beartype.beartype`-generated wrapper functions deeply type-checking
+    reiterables under the default constant-time strategy (i.e.,
+    :attr:`beartype.BeartypeStrategy.O1`). Since each call advances the cached
+    iterator over this reiterable, repeatedly type-checking the same
+    reiterable eventually visits *all* items of that reiterable rather than
+    repeatedly visiting only its first item.
+
+    Design
+    ------
+    This getter caches iterators in the private
+    :data:`._reiterable_id_to_iter_len` dictionary keyed by the object
+    identifiers of their reiterables. Since an iterator over a reiterable
+    strongly refers to that reiterable, that reiterable remains alive (and thus
+    retains that identifier) for as long as that iterator remains cached. These
+    identifiers are thus guaranteed to be unambiguous.
+
+    That same strong reference also prevents this reiterable from being
+    garbage-collected until this iterator is evicted from this cache. This
+    cache is thus bounded both by the maximum number of cached iterators (i.e.,
+    :data:`._REITERABLE_CACHE_ITERS_LEN_MAX`) *and* by the maximum total number
+    of items of all reiterables kept alive by those iterators (i.e.,
+    :data:`._REITERABLE_CACHE_ITEMS_LEN_MAX`), bounding the memory this cache
+    may prevent from being reclaimed. Reiterables exceeding the latter bound
+    are never cached; this getter reduces to returning the first item of these
+    reiterables.
+
+    This getter gracefully restarts iteration whenever the cached iterator is
+    either exhausted *or* invalidated by an intervening mutation of this
+    reiterable (e.g., a :class:`set` changing size during iteration).
+
+    Caveats
+    -------
+    **This reiterable is assumed to be non-empty.** If this is *not* the case,
+    this getter raises a :exc:`StopIteration` exception. For efficiency, this
+    getter intentionally does *not* validate this constraint; callers are
+    responsible for doing so.
+
+    **Items returned by this getter are not reproducible.** Unlike the
+    pseudo-random items of sequences and mappings derived from the
+    ``__beartype_random_int`` integer, the item returned by this getter depends
+    on prior calls to this getter. Violation finders subsequently describing
+    type-checking violations thus type-check *all* items of reiterables
+    instead.
+
+    Parameters
+    ----------
+    reiterable : Collection
+        Non-empty reiterable to retrieve an item from.
+
+    Returns
+    -------
+    object
+        Next item of this reiterable.
+    '''
+
+    # Defer to this lower-level getter, keying this iterator on the object
+    # identifier of this reiterable.
+    return _get_reiterable_nonempty_item_next(id(reiterable), reiterable)
+
+
+def get_mapping_nonempty_item_next(mapping: Mapping) -> Tuple[object, object]:
+    '''
+    Next **key-value pair** (i.e., 2-tuple ``(key, value)``) of the passed
+    non-empty mapping, retrieved from the iterator over the pairs of this
+    mapping cached by the most recent call to this getter passed this mapping
+    if any *or* the first pair of this mapping otherwise in amortized ``O(1)``
+    time.
+
+    This getter is intended to be called *only* from
+    :func:`beartype.beartype`-generated wrapper functions deeply type-checking
+    mappings. Since mappings do *not* support ``O(1)`` indexation by position,
+    this getter shares the same bounded cache of iterators as the
+    :func:`.get_reiterable_nonempty_item_next` getter. Each call advances the
+    cached iterator over the pairs of this mapping, eventually visiting *all*
+    pairs of that mapping across sufficiently many type-checks.
+
+    This getter is also efficient for mappings whose :func:`len` and
+    :func:`iter` are ``O(n)`` (e.g., :class:`collections.ChainMap`). Both are
+    only called when restarting iteration (i.e., at most once per ``n`` calls
+    passed the same cached mapping), amortizing their costs to ``O(1)``.
+
+    Caveats
+    -------
+    **This mapping is assumed to be non-empty.** If this is *not* the case,
+    this getter raises a :exc:`StopIteration` exception.
+
+    **Pairs returned by this getter are not reproducible.** Violation finders
+    subsequently describing type-checking violations thus type-check *all*
+    pairs of mappings instead.
+
+    Parameters
+    ----------
+    mapping : Mapping
+        Non-empty mapping to retrieve a pair from.
+
+    Returns
+    -------
+    Tuple[object, object]
+        Next key-value pair of this mapping.
+
+    See Also
+    --------
+    :func:`.get_reiterable_nonempty_item_next`
+        Further details.
+    '''
+
+    # Defer to this lower-level getter, keying this iterator on the bitwise
+    # complement of the object identifier of this mapping. Since object
+    # identifiers are non-negative, this key is negative and thus never
+    # collides with the key of an iterator over the same object iterated as a
+    # reiterable (e.g., a dictionary type-checked by both "dict[str, int]" and
+    # "Collection[str]"), whose iterator yields keys rather than pairs.
+    return _get_reiterable_nonempty_item_next(  # type: ignore[return-value]
+        ~id(mapping), mapping.items())
+
+# ....................{ CLEARERS                           }....................
+def clear_reiterable_cache() -> None:
+    '''
+    Clear (i.e., empty) the **reiterable iterator cache** (i.e., private
+    :data:`._reiterable_id_to_iter_len` dictionary), releasing *all* strong
+    references to reiterables held by the iterators in this cache.
+    '''
+
+    # Globals modified below.
+    global _reiterable_cache_items_len
+
+    # With this cache locked, clear this cache.
+    with _reiterable_cache_lock:
+        _reiterable_id_to_iter_len.clear()
+        _reiterable_cache_items_len = 0
+
+# ....................{ PRIVATE ~ constants                }....................
+_REITERABLE_CACHE_ITERS_LEN_MAX = 256
+'''
+Maximum number of iterators cached by the
+:func:`.get_reiterable_nonempty_item_next` getter, after which the least
+recently used iterators are evicted.
+'''
+
+
+_REITERABLE_CACHE_ITEMS_LEN_MAX = 2 ** 16
+'''
+Maximum total number of items across *all* reiterables kept alive by the
+iterators cached by the :func:`.get_reiterable_nonempty_item_next` getter,
+after which the least recently used iterators are evicted.
+
+Since each such reiterable consumes at least one machine word per item, this
+bound effectively caps the memory this cache may prevent from being reclaimed
+to at most a few megabytes.
+'''
+
+# ....................{ PRIVATE ~ globals                  }....................
+_reiterable_cache_items_len = 0
+'''
+Total number of items across *all* reiterables kept alive by the iterators
+cached in the :data:`._reiterable_id_to_iter_len` dictionary, as recorded when
+those iterators were cached.
+'''
+
+
+_reiterable_cache_lock = Lock()
+'''
+**Non-reentrant reiterable cache thread lock** (i.e., low-level thread locking
+mechanism guarding the :data:`._reiterable_id_to_iter_len` dictionary and
+:data:`._reiterable_cache_items_len` integer against concurrent modification).
+
+Note that this lock is *never* held while iterating reiterables, which may
+themselves call :func:`beartype.beartype`-decorated callables re-entering the
+:func:`.get_reiterable_nonempty_item_next` getter.
+'''
+
+
+_reiterable_id_to_iter_len: Dict[int, Tuple[Iterator, int]] = {}
+'''
+**Reiterable iterator cache** (i.e., dictionary mapping from the object
+identifier of each reiterable recently type-checked by the
+:func:`.get_reiterable_nonempty_item_next` getter *or* the bitwise complement of
+the object identifier of each mapping recently type-checked by the
+:func:`.get_mapping_nonempty_item_next` getter to a 2-tuple
+``(reiterable_iter, reiterable_len)``, where ``reiterable_iter`` is an iterator
+over that reiterable and ``reiterable_len`` is the number of items in that
+reiterable when that iterator was cached).
+
+Since dictionaries preserve insertion order, the first key of this dictionary
+is the least recently used key.
+'''
+
+# ....................{ PRIVATE ~ getters                  }....................
+def _get_reiterable_nonempty_item_next(
+    reiterable_id: int, reiterable: Collection) -> object:
+    '''
+    Next item of the passed non-empty reiterable, retrieved from the iterator
+    cached under the passed key by the most recent call to this getter passed
+    that key if any *or* the first item of this reiterable otherwise in
+    amortized ``O(1)`` time.
+
+    Parameters
+    ----------
+    reiterable_id : int
+        Key uniquely identifying this reiterable in this cache, typically the
+        object identifier of this reiterable.
+    reiterable : Collection
+        Non-empty reiterable to retrieve an item from.
+
+    Returns
+    -------
+    object
+        Next item of this reiterable.
+
+    See Also
+    --------
+    :func:`.get_reiterable_nonempty_item_next`
+        Further details.
+    '''
+
+    # Globals modified below.
+    global _reiterable_cache_items_len
+
+    # With this cache locked, pop the iterator previously cached for this
+    # reiterable if any. Popping (rather than merely getting) this iterator
+    # enables this iterator to be subsequently pushed back onto the most
+    # recently used end of this cache.
+    with _reiterable_cache_lock:
+        reiterable_iter_len = _reiterable_id_to_iter_len.pop(
+            reiterable_id, None)
+
+        # If an iterator was previously cached for this reiterable, record
+        # this iterator as no longer cached.
+        if reiterable_iter_len is not None:
+            _reiterable_cache_items_len -= reiterable_iter_len[1]
+        # Else, *NO* iterator was previously cached for this reiterable.
+
+    # If an iterator was previously cached for this reiterable...
+    if reiterable_iter_len is not None:
+        # This iterator and the length of this reiterable when this iterator
+        # was cached.
+        reiterable_iter, reiterable_len = reiterable_iter_len
+
+        # Attempt to return the next item of this iterator.
+        try:
+            reiterable_item = next(reiterable_iter)
+        # If this iterator is either exhausted *OR* invalidated by a mutation
+        # of this reiterable, silently restart iteration below.
+        except (RuntimeError, StopIteration):
+            reiterable_iter_len = None
+        # Else, this iterator yielded the next item of this reiterable.
+    # Else, *NO* iterator was previously cached for this reiterable.
+
+    # If either *NO* iterator was previously cached for this reiterable *OR*
+    # that iterator was exhausted or invalidated...
+    if reiterable_iter_len is None:
+        # Number of items in this reiterable.
+        reiterable_len = len(reiterable)
+
+        # New iterator over this reiterable.
+        reiterable_iter = iter(reiterable)
+
+        # First item of this reiterable.
+        reiterable_item = next(reiterable_iter)
+
+        # If this reiterable is too large to be cached, return this item
+        # *WITHOUT* caching this iterator.
+        if reiterable_len > _REITERABLE_CACHE_ITEMS_LEN_MAX:
+            return reiterable_item
+        # Else, this reiterable is small enough to be cached.
+
+    # Push this iterator onto the most recently used end of this cache.
+    _cache_reiterable_iter(reiterable_id, reiterable_iter, reiterable_len)
+
+    # Return this item.
+    return reiterable_item
+
+# ....................{ PRIVATE ~ cachers                  }....................
+def _cache_reiterable_iter(
+    reiterable_id: int, reiterable_iter: Iterator, reiterable_len: int) -> None:
+    '''
+    Cache the passed iterator over the reiterable with the passed object
+    identifier and length as the most recently used iterator, evicting the
+    least recently used iterators as needed to preserve the bounds of this
+    cache.
+
+    Parameters
+    ----------
+    reiterable_id : int
+        Object identifier of this reiterable.
+    reiterable_iter : Iterator
+        Iterator over this reiterable.
+    reiterable_len : int
+        Number of items in this reiterable.
+    '''
+
+    # Globals modified below.
+    global _reiterable_cache_items_len
+
+    # With this cache locked...
+    with _reiterable_cache_lock:
+        # Iterator previously cached for this reiterable by another thread
+        # preempting the current thread if any.
+        reiterable_iter_len_old = _reiterable_id_to_iter_len.pop(
+            reiterable_id, None)
+
+        # If another thread cached an iterator for this reiterable in the
+        # interim, record that iterator as no longer cached.
+        if reiterable_iter_len_old is not None:
+            _reiterable_cache_items_len -= reiterable_iter_len_old[1]
+        # Else, *NO* other thread cached an iterator for this reiterable.
+
+        # Cache this iterator as the most recently used iterator.
+        _reiterable_id_to_iter_len[reiterable_id] = (
+            reiterable_iter, reiterable_len)
+        _reiterable_cache_items_len += reiterable_len
+
+        # While this cache exceeds either bound, evict the least recently used
+        # iterator. Since this reiterable is no larger than the latter bound,
+        # this iterator itself is never evicted.
+        while (
+            len(_reiterable_id_to_iter_len) > _REITERABLE_CACHE_ITERS_LEN_MAX or
+            _reiterable_cache_items_len > _REITERABLE_CACHE_ITEMS_LEN_MAX
+        ):
+            _reiterable_cache_items_len -= _reiterable_id_to_iter_len.pop(
+                next(iter(_reiterable_id_to_iter_len)))[1]
+
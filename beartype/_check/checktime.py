@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2024 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Beartype **type-checking deadline scheduler** (i.e., low-level globals and
+factories enabling :mod:`beartype`-generated type-checkers under non-constant
+strategies like :attr:`beartype.BeartypeStrategy.On` to bound the fraction of
+the total running time of the active Python process devoted to type-checking by
+progressively degrading those strategies as that fraction approaches the
+:attr:`beartype.BeartypeConf.check_time_max_multiplier` configured by users).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                            }....................
+from beartype.typing import (
+    Callable,
+    Iterable,
+    Iterator,
+)
+from beartype._conf.confenum import BeartypeStrategy
+from beartype._util.cache.utilcachecall import callable_cached
+from beartype._util.kind.sequence.utilseqiter import iter_sequence_items_ologn
+from collections.abc import Sequence
+from time import perf_counter
+
+# ....................{ GLOBALS                            }....................
+CHECK_TIMES = [perf_counter(), 0.0, 0, 0.0]
+'''
+**Type-checking wall-clock time accumulator** (i.e., list whose items allow
+:mod:`beartype`-generated type-checkers under non-constant strategies like
+:attr:`beartype.BeartypeStrategy.On` to record how much time the active Python
+process has devoted to :mod:`beartype`, enabling :mod:`beartype` to degrade
+type-checking when those type-checkers exceed scheduled deadlines).
+
+Specifically, this global is a 4-list
+``(process_time_start, check_time_total, check_depth, check_time_start)``,
+where:
+
+* ``process_time_start`` is the initial time at which the active Python process
+  was started, denominated in fractional seconds. Since the standard library
+  provides *no* portable means of retrieving that time, this is approximated as
+  the time at which :mod:`beartype` was first imported.
+* ``check_time_total`` is the total time consumed by all *prior* deadlined
+  type-checks, denominated in fractional seconds.
+* ``check_depth`` is the number of deadlined type-checks currently in progress
+  (i.e., the current nesting depth of deadlined type-checks over nested
+  containers).
+* ``check_time_start`` is the initial time at which the outermost deadlined
+  type-check currently in progress was started, denominated in fractional
+  seconds.
+
+Caveats
+-------
+**This accumulator is intentionally shared between all threads and thus only
+approximate under multithreading.** Guarding this accumulator with a thread
+lock would impose a prohibitive cost on each container type-check, which is
+precisely the cost this accumulator exists to bound. Since this accumulator
+only governs a heuristic budget, an occasionally lost update is harmless.
+'''
+
+# ....................{ TESTERS                            }....................
+def is_all_items_timed(items: Iterable[object]) -> bool:
+    '''
+    :data:`True` only if all items of the passed iterable are truthy, recording
+    the time consumed by this deadlined type-check in the global
+    :data:`.CHECK_TIMES` accumulator.
+
+    This tester is a drop-in replacement for the :func:`all` builtin, called by
+    :mod:`beartype`-generated type-checkers imposing a deadline in lieu of that
+    builtin. This tester wraps that builtin in a ``try``-``finally`` block
+    accounting for the nesting depth and time consumed by this type-check.
+    Since this block is finalized as soon as that builtin returns or raises,
+    this accounting is prompt; it does *not* depend on when the garbage
+    collector closes an abandoned generator (e.g., after that builtin
+    short-circuits on the first falsy item).
+
+    Parameters
+    ----------
+    items : Iterable[object]
+        Iterable whose items are the results of type-checking the items of a
+        container (e.g., a generator expression over the iterable returned by a
+        function created by the :func:`.make_iter_sequence_items_timed`
+        factory).
+
+    Returns
+    -------
+    bool
+        :data:`True` only if all items of this iterable are truthy.
+    '''
+
+    # If this is the outermost deadlined type-check currently in progress,
+    # record the time at which this type-check started.
+    if not CHECK_TIMES[_CHECK_TIMES_INDEX_DEPTH]:
+        CHECK_TIMES[_CHECK_TIMES_INDEX_START] = perf_counter()
+    # Else, this is a type-check nested in another deadlined type-check
+    # currently in progress (e.g., over an item of an outer container), whose
+    # start time subsumes that of this type-check.
+
+    # Note this type-check to be in progress.
+    CHECK_TIMES[_CHECK_TIMES_INDEX_DEPTH] += 1
+
+    # Attempt to return true only if all items of this iterable are truthy.
+    try:
+        return all(items)
+    # Regardless of whether this type-check succeeded, failed, or raised an
+    # exception...
+    finally:
+        # Note this type-check to no longer be in progress.
+        CHECK_TIMES[_CHECK_TIMES_INDEX_DEPTH] -= 1
+
+        # If this is the outermost deadlined type-check, add the time consumed
+        # by this type-check to the total time consumed by all deadlined
+        # type-checks. Nested type-checks are intentionally ignored, as their
+        # times are already subsumed by this time.
+        if not CHECK_TIMES[_CHECK_TIMES_INDEX_DEPTH]:
+            CHECK_TIMES[_CHECK_TIMES_INDEX_TOTAL] += (
+                perf_counter() - CHECK_TIMES[_CHECK_TIMES_INDEX_START])
+        # Else, this is a nested type-check.
+
+# ....................{ FACTORIES                          }....................
+@callable_cached
+def make_iter_sequence_items_timed(
+    strategy: BeartypeStrategy,
+    check_time_max_multiplier: int,
+) -> Callable[[Sequence, int], Iterable[object]]:
+    '''
+    **Deadlined sequence item selector** (i.e., function returning an iterable
+    over the subset of the items of a passed sequence to be type-checked under
+    the passed non-constant type-checking strategy, progressively degrading
+    that strategy as the total time devoted to type-checking approaches the
+    passed deadline multiplier) dynamically created for the passed parameters.
+
+    This factory is memoized for efficiency.
+
+    Let:
+
+    * ``T`` be the total time the active Python process has been running.
+    * ``b`` be the total time :mod:`beartype` has spent performing deadlined
+      type-checks in that process.
+    * ``K`` be the passed deadline multiplier.
+
+    Then the function created by this factory returns an iterable over the
+    items of the passed sequence to be type-checked as follows:
+
+    * If ``b * K < T / 2``, the items selected by the passed strategy (i.e.,
+      either all items *or* approximately ``log2(n)`` pseudo-random items).
+    * Else if ``b * K < 3 * T / 4``, approximately ``log2(n)`` pseudo-random
+      items.
+    * Else if ``b * K < T``, a single pseudo-random item.
+    * Else, no items.
+
+    Under the linear-time strategy, that iterable additionally re-evaluates the
+    constraint ``b * K < T`` every :data:`._CHECK_ITEMS_PER_DEADLINE` items and
+    halts iteration as soon as that constraint is violated.
+
+    All items iterated under each degraded strategy are a subset of the items
+    iterated under the passed strategy for the same pseudo-random integer,
+    guaranteeing that violation finders subsequently describing type-checking
+    violations raised under the passed strategy re-check at least the items
+    previously checked by that iterable.
+
+    Caveats
+    -------
+    **The function created by this factory only reads the global**
+    :data:`.CHECK_TIMES` **accumulator.** The caller is responsible for
+    accounting for the time consumed by iterating that iterable, typically by
+    passing that iterable to the :func:`.is_all_items_timed` tester.
+
+    Parameters
+    ----------
+    strategy : BeartypeStrategy
+        Non-constant type-checking strategy to be degraded, which is either
+        :attr:`beartype.BeartypeStrategy.On` *or*
+        :attr:`beartype.BeartypeStrategy.Ologn`.
+    check_time_max_multiplier : int
+        Deadline multiplier (i.e., the
+        :attr:`beartype.BeartypeConf.check_time_max_multiplier` setting).
+
+    Returns
+    -------
+    Callable[[Sequence, int], Iterable[object]]
+        Function accepting a sequence and a non-negative pseudo-random integer
+        and returning an iterable over the items of that sequence to be
+        type-checked.
+    '''
+    assert strategy in _STRATEGIES_DEADLINED, (
+        f'{repr(strategy)} not non-constant strategy.')
+    assert isinstance(check_time_max_multiplier, int), (
+        f'{repr(check_time_max_multiplier)} not integer.')
+    assert check_time_max_multiplier > 0, (
+        f'{check_time_max_multiplier} not positive.')
+
+    # True only if this strategy is the linear-time strategy.
+    is_strategy_On = strategy is BeartypeStrategy.On
+
+    # Localize this multiplier under a concise name for readability.
+    K = check_time_max_multiplier
+
+    def iter_sequence_items_deadlined(sequence: Sequence) -> Iterator[object]:
+        '''
+        Generator yielding all items of the passed sequence until the current
+        deadline is exceeded.
+
+        This generator is only iterated by the :func:`.is_all_items_timed`
+        tester, which records the start time of the outermost deadlined
+        type-check *before* iterating this generator.
+
+        Parameters
+        ----------
+        sequence : Sequence
+            Sequence to be iterated.
+
+        Yields
+        ------
+        object
+            Item of this sequence.
+        '''
+
+        # 0-based index of the current item.
+        sequence_index = 0
+
+        # For each item of this sequence...
+        for item in sequence:
+            # Yield this item.
+            yield item
+
+            # Increment this index *AFTER* yielding this item.
+            sequence_index += 1
+
+            # If this is the last item of the current batch of items between
+            # deadline checks...
+            if not sequence_index & _CHECK_ITEMS_PER_DEADLINE_MASK:
+                # Current time.
+                check_time_curr = perf_counter()
+
+                # If beartype has now exceeded its budget, halt.
+                if K * (
+                    CHECK_TIMES[_CHECK_TIMES_INDEX_TOTAL] +
+                    check_time_curr -
+                    CHECK_TIMES[_CHECK_TIMES_INDEX_START]
+                ) >= (
+                    check_time_curr -
+                    CHECK_TIMES[_CHECK_TIMES_INDEX_PROCESS_START]
+                ):
+                    return
+                # Else, beartype has yet to exceed its budget.
+
+    def iter_sequence_items_timed(
+        sequence: Sequence, random_int: int) -> Iterable[object]:
+        '''
+        Iterable over the subset of the items of the passed sequence to be
+        type-checked under the current deadline.
+
+        Parameters
+        ----------
+        sequence : Sequence
+            Sequence to be iterated.
+        random_int : int
+            Non-negative pseudo-random integer from which to derive these items.
+
+        Returns
+        -------
+        Iterable[object]
+            Iterable over these items.
+        '''
+
+        # Current time, denominated in fractional seconds.
+        check_time_curr = perf_counter()
+
+        # Total time the active Python process has been running (i.e., "T").
+        process_time = (
+            check_time_curr - CHECK_TIMES[_CHECK_TIMES_INDEX_PROCESS_START])
+
+        # Total time budgeted by beartype type-checks (i.e., "b * K"),
+        # including the time consumed by the outermost deadlined type-check
+        # currently in progress if any. Note that this function is called
+        # *BEFORE* the is_all_items_timed() tester records the start time of
+        # the type-check iterating the iterable returned by this function.
+        check_time_budget = K * (
+            CHECK_TIMES[_CHECK_TIMES_INDEX_TOTAL] + (
+                check_time_curr - CHECK_TIMES[_CHECK_TIMES_INDEX_START]
+                if CHECK_TIMES[_CHECK_TIMES_INDEX_DEPTH] else
+                0.0
+            )
+        )
+
+        # Note that these comparisons are intentionally multiplicative rather
+        # than divisive, avoiding division by zero.
+        #
+        # If beartype has consumed less than half of its budget...
+        if check_time_budget * 2 < process_time:
+            # If this strategy is the linear-time strategy, iterate all items
+            # of this sequence while periodically checking this deadline.
+            if is_strategy_On:
+                return iter_sequence_items_deadlined(sequence)
+            # Else, this strategy is the logarithmic-time strategy. In this
+            # case, iterate a pseudo-random subset of these items.
+            return iter_sequence_items_ologn(sequence, random_int)
+        # Else, beartype has consumed at least half of its budget.
+        #
+        # If beartype has consumed less than three-quarters of its budget,
+        # degrade to iterating a pseudo-random subset of these items.
+        elif check_time_budget * 4 < process_time * 3:
+            return iter_sequence_items_ologn(sequence, random_int)
+        # Else, beartype has consumed at least three-quarters of its budget.
+        #
+        # If beartype has yet to exceed its budget *AND* this sequence is
+        # non-empty, degrade to iterating a single pseudo-random item. Note
+        # that this is the first item yielded by the iter_sequence_items_ologn()
+        # generator for this integer.
+        elif check_time_budget < process_time and sequence:
+            return (sequence[random_int % len(sequence)],)
+
+        # Else, beartype has exceeded its budget. In this case, degrade to
+        # iterating *NO* items.
+        return ()
+
+    # Return this function.
+    return iter_sequence_items_timed
+
+# ....................{ PRIVATE ~ constants                }....................
+_CHECK_TIMES_INDEX_PROCESS_START = 0
+'''
+0-based index into the :data:`.CHECK_TIMES` list of the initial time at which
+the active Python process was started.
+'''
+
+
+_CHECK_TIMES_INDEX_TOTAL = 1
+'''
+0-based index into the :data:`.CHECK_TIMES` list of the total time consumed by
+all prior deadlined type-checks.
+'''
+
+
+_CHECK_TIMES_INDEX_DEPTH = 2
+'''
+0-based index into the :data:`.CHECK_TIMES` list of the current nesting depth of
+deadlined type-checks.
+'''
+
+
+_CHECK_TIMES_INDEX_START = 3
+'''
+0-based index into the :data:`.CHECK_TIMES` list of the initial time at which
+the outermost deadlined type-check currently in progress was started.
+'''
+
+
+_CHECK_ITEMS_PER_DEADLINE = 256
+'''
+Number of items iterated over by each deadlined type-check under the
+linear-time strategy :attr:`beartype.BeartypeStrategy.On` between consecutive
+deadline checks, amortizing the cost of querying the current time over these
+items.
+
+This integer *must* be a power of two, enabling the modulo in that deadline
+check to be efficiently reduced to a bitwise conjunction.
+'''
+
+
+_CHECK_ITEMS_PER_DEADLINE_MASK = _CHECK_ITEMS_PER_DEADLINE - 1
+'''
+Bit mask reducing the modulo of an integer by :data:`._CHECK_ITEMS_PER_DEADLINE`
+to a bitwise conjunction.
+'''
+
+
+_STRATEGIES_DEADLINED = frozenset((
+    BeartypeStrategy.On,
+    BeartypeStrategy.Ologn,
+))
+'''
+Frozen set of all **deadlined type-checking strategies** (i.e., non-constant
+strategies degradable by the functions created by the
+:func:`.make_iter_sequence_items_timed` factory).
+'''
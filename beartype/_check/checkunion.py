@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2024 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Beartype **union branch hit counters** (i.e., low-level classes enabling
+:mod:`beartype`-generated wrapper functions configured by the non-default
+:attr:`beartype.BeartypeConf.union_reorder_threshold` option to count how many
+objects satisfy each branch of each union type hint type-checked by those
+wrappers, enabling those wrappers to be subsequently regenerated with the most
+frequently satisfied branches of those unions type-checked first).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                            }....................
+from beartype.typing import (
+    Callable,
+    List,
+    Optional,
+    Tuple,
+)
+
+# ....................{ CLASSES                            }....................
+class UnionBranchHits(object):
+    '''
+    **Union branch hit counter** (i.e., object counting how many objects
+    satisfied each **branch** (i.e., subexpression type-checking one or more
+    members) of the code type-checking a union type hint in a
+    :func:`beartype.beartype`-generated wrapper function).
+
+    Code generated for each such union in each such wrapper calls this counter
+    as ``hits(branch_index)`` *after* each branch of that code is satisfied.
+    Since this call unconditionally returns :data:`True`, this call preserves
+    the truthiness of that branch. After this counter has been called
+    :attr:`hits_threshold` times, this counter calls its :attr:`on_threshold`
+    callback (if any) exactly once, which then regenerates that wrapper with
+    these branches reordered in descending order of hits and these calls
+    removed.
+
+    Attributes
+    ----------
+    hint : object
+        Union type hint whose branches are counted by this counter.
+    hint_branches : Tuple[object, ...]
+        Tuple of one item for each branch of the code type-checking this union
+        in the order these branches were originally generated, where each item
+        is either:
+
+        * If this branch type-checks a PEP-compliant member of this union, that
+          member.
+        * Else, this branch type-checks *all* PEP-noncompliant members (i.e.,
+          types) of this union in a single :func:`isinstance` call. In this
+          case, the tuple of those types.
+    hits : List[int]
+        List of one integer for each branch of the code type-checking this
+        union, counting the number of objects that have satisfied that branch.
+    hits_threshold : int
+        Total number of hits across all branches after which this counter calls
+        its :attr:`on_threshold` callback.
+    hits_total : int
+        Total number of hits across all branches.
+    is_reordered : bool
+        :data:`True` only if the wrapper containing the code calling this
+        counter has been regenerated with these branches reordered.
+    on_threshold : Optional[Callable[['UnionBranchHits'], None]]
+        Callback called exactly once when the total number of hits across all
+        branches reaches :attr:`hits_threshold` *or* :data:`None` if this
+        counter is a **template** (i.e., counter memoized with the code
+        type-checking this union, cloned by the :meth:`copy` method into a new
+        counter specific to each wrapper containing that code).
+    '''
+
+    # ..................{ CLASS VARIABLES                    }..................
+    # Slot all instance variables defined on this object to minimize the time
+    # complexity of both reading and writing variables across frequently called
+    # @beartype decorations. Slotting has been shown to reduce read and write
+    # costs by approximately ~10%, which is non-trivial.
+    __slots__ = (
+        'hint',
+        'hint_branches',
+        'hits',
+        'hits_threshold',
+        'hits_total',
+        'is_reordered',
+        'on_threshold',
+    )
+
+    # ..................{ INITIALIZERS                       }..................
+    def __init__(
+        self,
+        hint: object,
+        hint_branches: Tuple[object, ...],
+        hits_threshold: int,
+    ) -> None:
+        '''
+        Initialize this union branch hit counter.
+
+        Parameters
+        ----------
+        hint : object
+            Union type hint whose branches are counted by this counter.
+        hint_branches : Tuple[object, ...]
+            Tuple of one item for each branch of the code type-checking this
+            union. See the class docstring for further details.
+        hits_threshold : int
+            Total number of hits across all branches after which this counter
+            calls its :attr:`on_threshold` callback.
+        '''
+        assert isinstance(hint_branches, tuple), (
+            f'{repr(hint_branches)} not tuple.')
+        assert isinstance(hits_threshold, int), (
+            f'{repr(hits_threshold)} not integer.')
+        assert hits_threshold > 0, f'{hits_threshold} not positive.'
+
+        # Classify all passed parameters.
+        self.hint = hint
+        self.hint_branches = hint_branches
+        self.hits_threshold = hits_threshold
+
+        # Nullify all remaining instance variables.
+        self.hits: List[int] = [0] * len(hint_branches)
+        self.hits_total = 0
+        self.is_reordered = False
+        self.on_threshold: Optional[
+            Callable[['UnionBranchHits'], None]] = None
+
+    # ..................{ DUNDERS                            }..................
+    def __call__(self, branch_index: int) -> bool:
+        '''
+        Record that an object satisfied the branch with the passed index of the
+        code type-checking this union *and* return :data:`True`.
+
+        Parameters
+        ----------
+        branch_index : int
+            0-based index of the branch satisfied by that object.
+
+        Returns
+        -------
+        bool
+            Always :data:`True`, preserving the truthiness of that branch.
+        '''
+
+        # Record this hit.
+        self.hits[branch_index] += 1
+        self.hits_total += 1
+
+        # If this is the hit reaching the threshold *AND* a callback is
+        # registered, call this callback. Testing equality rather than
+        # inequality guarantees this callback to be called at most once even
+        # when this counter is called again before that callback removes the
+        # code calling this counter (e.g., by another thread).
+        if (
+            self.hits_total == self.hits_threshold and
+            self.on_threshold is not None
+        ):
+            self.on_threshold(self)
+        # Else, this is *NOT* that hit.
+
+        # Preserve the truthiness of that branch.
+        return True
+
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}('
+            f'hint={repr(self.hint)}, '
+            f'hits={repr(self.hits)}, '
+            f'hits_threshold={repr(self.hits_threshold)}, '
+            f'is_reordered={repr(self.is_reordered)}'
+            f')'
+        )
+
+    # ..................{ GETTERS                            }..................
+    def get_branch_indices_by_hits(self) -> List[int]:
+        '''
+        List of the 0-based indices of all branches of the code type-checking
+        this union in descending order of hits.
+
+        Since this sort is stable, branches with the same number of hits
+        (e.g., branches that have yet to be hit) preserve their original
+        relative order.
+
+        Returns
+        -------
+        List[int]
+            List of these indices.
+        '''
+
+        # Localize this list for efficiency.
+        hits = self.hits
+
+        # Return these indices sorted by descending hits.
+        return sorted(
+            range(len(hits)), key=lambda branch_index: -hits[branch_index])
+
+    # ..................{ COPIERS                            }..................
+    def copy(self) -> 'UnionBranchHits':
+        '''
+        New union branch hit counter counting the same branches of the same
+        union as this counter but with *no* hits and *no* callback.
+
+        Returns
+        -------
+        UnionBranchHits
+            New counter cloned from this counter.
+        '''
+
+        return UnionBranchHits(
+            hint=self.hint,
+            hint_branches=self.hint_branches,
+            hits_threshold=self.hits_threshold,
+        )
@@ -48,201 +48,6 @@
 #  Lastly, note that (much like "typing.NoReturn") "typing.TypeGuard"
 #  subscriptions are *ONLY* usable as return annotations. Raise exceptions, yo.
 
-#FIXME: [O(n)] Ah-ha! We now know how to implement O(log n) and O(n)
-#type-checking in a scaleable manner that preserves @beartype's strong
-#performance guarantees. How? With a timed deadline cutoff. Specifically:
-#* Define a new "BeartypeConf.check_time_max_multiplier" instance variable,
-#  which we've already conveniently documented.
-#* Note this critical formula in the documentation for that variable (with the
-#  equality flipped so as to express the condition under which @beartype
-#  continues to perform type-checks):
-#      b * check_time_max_multiplier < T
-#
-#  Naturally, real life isn't quite that convenient. We don't actually have
-#  either "b" or "T". We need to dynamically compute them on each check. What we
-#  *DO* have is:
-#  * "B", the total time consumed by all *PRIOR* @beartype type-checks.
-#  * "t", the current time.
-#  * "s", the initial time at which the current round of @beartype type-checks
-#    was started (e.g., for the current call to a @beartype-decorated callable).
-#  * "Z", the initial time at which the active Python interpreter was started.
-#
-#  For convenience, additionally let:
-#  * "K" be "check_time_max_multiplier" for readability.
-#
-#  Note that "t - s" yields the total time consumed by the *CURRENT* round of
-#  @beartype type-checks. Ergo, "B + t - s" yields the total time consumed by
-#  *ALL* @beartype type-checks. Given that, "b" and "T" can both then be
-#  expressed in terms of these known quantities:
-#      b = B + t - s
-#      T =     t - Z
-#
-#  Then the above formula expands to:
-#      (B + t - s) * K < t - Z     (4 total arithmetic operations)
-#
-#  Note that "t" *MUST* be localized as a local instance variable (e.g., as
-#  "time_curr = time()) to avoid erroneous recomputation of that time. Also, "K"
-#  and "Z" are constants. Ideally, we would be able to simplify away some of
-#  this. Superficially, simplification yields *NO* significant joys:
-#      Bk + Kt - Ks - t + Z < 0
-#      Bk + Z + t(K - 1) < Ks      (6 total arithmetic operations)
-#
-#  However, "K - 1" is clearly also a constant. Let "L = K - 1". Then:
-#      KB + Z + Lt < Ks            (5 total arithmetic operations)
-#      KB - Ks + Z + Lt < 0
-#      K(B - s) + Lt < -Z          (5 total arithmetic operations)
-#
-#  Ah-ha! But "-Z" is also a constant. Let "Y = -Z". Then we have:
-#      K(B - s) + Lt < Y           (4 total arithmetic operations)
-#
-#  This is considerably better. Since "t" only appears once, we no longer need
-#  to localize the result of calling the time() function and can instead simply
-#  embed that call directly -- a significant savings in both time and code
-#  complexity.
-#
-#  Can we do better? Possibly. Note that "s ~= t" for most intents and purposes.
-#  In particular, "s - Z ~= t - Z" (with respect to orders of magnitude, which
-#  is all the right side of that equation is attempting to capture, anyway).
-#  We can then resimplify as follows:
-#      (B + t - s) * K < s - Z     (4 total arithmetic operations)
-#      KB + Kt - Ks - s < -Z
-#      KB + Kt - Ks - s < -Z
-#      K(B + t) - s(K + 1) < Y
-#      K(B + t) - Ls < Y           (4 total arithmetic operations)
-#
-#  Amusingly, that fails to help (and in fact reduces accuracy). Gah! The best
-#  we can do from here is to eliminate the need for "Y" from above as follows:
-#      K(B - s) + Lt < -Z          (5 total arithmetic operations)
-#      K(B - s) < -Lt - Z
-#      K(B - s) < -(Lt + Z)
-#      -K(B - s) > Lt + Z
-#      K(s - B) > Lt + Z           (4 total arithmetic operations)
-#      K(s - B) - Lt > Z           (4 total arithmetic operations)
-#
-#  Furthermore, note that:
-#  * "s" is internally localized at the start of the body of each
-#    @beartype-decorated callable.
-#  * "t" is simply a call to the time() function.
-#  * "K" and "L = K - 1" don't actually need to be passed anywhere. They're
-#    *NOT* variables; they're just hard-coded in at code generation time.
-#  * "B and Z", on the other hand, *DO* need to passed to each
-#    @beartype-decorated callable under the O(n) strategy.
-#  * Moreover, "B" *MUST* be updated by each @beartype-decorated callable under
-#    the O(n) strategy.
-#
-#  Ah-ha! With respect to each call to a @beartype-decorated callable under the
-#  O(n) strategy, the quantity "K(s - B)" is actually a constant. Since "Z" is
-#  also a constant, we simply localize these two constants at the start of the
-#  body of each such callable into a new constant "J = K(s - B) - Z". This then
-#  yields:
-#      K(s - B) - Lt > Z           (4 total arithmetic operations)
-#      K(s - B) - Z > Lt
-#      J > Lt
-#      Lt < J                      (1 total arithmetic operation)
-#
-#  And... that's all she wrote, folks. While that condition holds, @beartype
-#  continues performing O(n) type-checks. It should be noted that this
-#  simplified conditional trivially follows from only a few steps of the
-#  original conditional like so:
-#      (B + t - s) * K < t - Z
-#      KB + Kt - Ks < t - Z
-#      Kt - t < Ks - KB - Z
-#      t(K - 1) < K(s - B) - Z
-#* Altogether, the above implies that each @beartype-decorated callable under
-#  the O(n) strategy should be passed a new hidden "__beartype_times" parameter.
-#  This parameter is a 2-list "(process_time_start, beartype_time_total)",
-#  where:
-#  * "process_time_start" is simply "Z".
-#  * "beartype_time_total" is simply "B".
-#
-#  This 2-list is a global list exposed to each @beartype-decorated callable via
-#  this "__beartype_times" parameter. Declare this global list in a separate
-#  submodule -- say, a new "exprtime" submodule -- as follows:
-#      from time import monotonic
-#
-#      CHECK_TIMES = [monotonic(), 0.0]
-#      '''
-#      **Type-checking wall-clock time accumulator** (i.e., list whose items
-#      allow :mod:`beartype`-generated type-checkers under non-constant
-#      strategies like :attr:`beartype.BeartypeStrategy.On` to record how much
-#      time the active Python process has devoted to :mod:`beartype`, enabling
-#      :mod:`beartype` to prematurely halt type-checking when those
-#      type-checkers exceed scheduled deadlines).
-#
-#      Specifically, this global is a 2-list
-#      ``(process_time_start, beartype_time_total)``, where:
-#
-#      * ``process_time_start`` is the initial time at which the active Python
-#        process was started, denominated in fractional seconds.
-#      * ``beartype_time_total`` is the total time consumed by all *prior*
-#        :mod:`beartype`-generated type-checks, denominated in fractional
-#        seconds.
-#      '''
-#* Now, note the naive implementation of an O(n) type-check for a callable
-#  accepting a parameter annotated by the type hint "list[str]":
-#      @beartype(conf=BeartypeConf(strategy=BeartypeStrategy.On))
-#      def muh_callable(muh_param: list[str]) -> None:
-#          ...
-#
-#          if not (
-#              isinstance(muh_param, list) and
-#              all(isinstance(muh_item, str) for muh_item in list)
-#          ):
-#              raise get_func_pith_violation(...)
-#          ...
-#
-#  Trivial. Now, note the non-naive implementation of the same O(n) type-check
-#  respecting the "check_time_max_multiplier" configuration setting:
-#      from beartype._check._expr.exprtime import CHECK_TIMES
-#      from time import monotonic
-#
-#      @beartype(conf=BeartypeConf(strategy=BeartypeStrategy.On))
-#      def muh_callable(
-#          muh_param: list[str],
-#          __beartype_check_times = CHECK_TIMES,
-#          __beartype_get_time_monotonic = monotonic,
-#      ) -> None:
-#          # Constant "J" in the inequality "Lt < J" governing @beartype's
-#          # deadline scheduler for non-constant type-checking, denominated in
-#          # fractional seconds.
-#          CHECK_TIME_START = __beartype_get_time_monotonic()
-#          CHECK_TIME_MAX = (
-#              {check_time_max_multiplier}(
-#                  CHECK_TIME_START - __beartype_check_times[1]
-#              ) - __beartype_check_times[0]
-#          )
-#
-#          ...
-#
-#          if not (
-#              isinstance(muh_param, list) and
-#              # For each item of this iterable...
-#              all(
-#                  (
-#                      # If @beartype has yet to exceed its scheduled deadline
-#                      # for non-constant type-checks *AND*...
-#                      (
-#                          {check_time_max_multiplier - 1} *
-#                          __beartype_get_time_monotonic() < CHECK_TIME_MAX
-#                      ) and
-#                      isinstance(muh_item, str)
-#                  )
-#                  for muh_item in list
-#              )
-#          # *AND* @beartype has yet to exceed its scheduled deadline for
-#          # non-constant type-checks...
-#          ) and ({check_time_max_multiplier - 1}*monotonic() < CHECK_TIME_MAX):
-#              raise get_func_pith_violation(...)
-#          # Else, this pith either satisfies this hint *OR* @beartype has
-#          # exceeded its scheduled deadline for non-constant type-checks.
-#
-#          # Update the total time consumed by @beartype type-checks.
-#          __beartype_check_times[1] += (
-#              __beartype_get_time_monotonic() - CHECK_TIME_START)
-#          ...
-#
-#Seriously trivial, everybody. \o/
-
 #FIXME: [DFS] The "LRUDuffleCacheStrong" class designed below assumes that
 #calculating the semantic height of a type hint (e.g., 3 for the complex hint
 #Optional[int, dict[Union[bool, tuple[int, ...], Sequence[set]], list[str]])
@@ -484,296 +289,6 @@
 #* If that fails, do *NOT* hesitate to generalize to a multi-function recursive
 #  approach. However we can implement this is how we must implement this.
 
-#FIXME: Note that there exist four possible approaches to random item selection
-#for arbitrary containers depending on container type. Either the actual pith
-#object (in descending order of desirability):
-#* Satisfies "collections.abc.Sequence" (*NOTE: NOT* "typing.Sequence", as we
-#  don't particularly care how the pith is type-hinted for this purpose), in
-#  which case the above approach trivially applies.
-#* Else is *NOT* a one-shot container (e.g., generator and... are there any
-#  other one-shot container types?) and is *NOT* slotted (i.e., has no
-#  "__slots__" attribute), then generalize the mapping-specific
-#  _get_dict_nonempty_random_key() approach delineated below.
-#* Else is *NOT* a one-shot container (e.g., generator and... are there any
-#  other one-shot container types?) but is slotted (i.e., has a "__slots__"
-#  attribute), then the best we can do is the trivial O(1) approach by
-#  calling "{hint_child_pith} := next({hint_curr_pith})" to unconditionally
-#  check the first item of this container. What you goin' do? *shrug* (Note
-#  that we could try getting around this with a global cache of weak references
-#  to iterators mapped on object ID, but... ain't nobody got time or interest
-#  for that. Also, prolly plenty dangerous.)
-#* Else is a one-shot container, in which case *DO ABSOLUTELY NUTHIN'.*
-#FIXME: We should ultimately make this user-configurable (e.g., as a global
-#configuration setting). Some users might simply prefer to *ALWAYS* look up a
-#fixed 0-based index (e.g., "0", "-1"). For the moment, however, the above
-#probably makes the most sense as a reasonably general-purpose default.
-#FIXME: [THIS-IS-BOSS] *AH-HA.* First, note that the above
-#_get_dict_nonempty_random_key() concept, while clever, is largely useless. Why?
-#Because *ALL* builtin C-based reiterables (e.g., dict, set) are slotted. We'd
-#might as well just ignore that and leap straight to a general-purpose answer.
-#
-#Indeed, we've *FINALLY* realized how to genuinely perform iterative access to
-#arbitrary non-sequence containers in an O(1) manner *WITHOUT* introducing
-#memory leaks or requiring asynchronous background shenanigans. The core conceit
-#is quite simple, really. Internally:
-#
-#* @beartype maintains two global dictionaries:
-#  * A global "_REITERABLE_ID_TO_WEAKPROXY" dictionary mapping from the object
-#    ID of each reiterable that has been previously type-checked by @beartype to
-#    at least once to a strong reference to a "weakref.proxy" instance safely
-#    proxying that reiterable.
-#  * A global "_REITERABLE_ID_TO_ITER" dictionary mapping from the object ID of
-#    each reiterable that has been previously type-checked by @beartype to
-#    at least once to a strong reference to an iterator over that
-#    "weakref.proxy" instance safely proxying that reiterable.
-#
-#  This approach substantially reduces the negative harms associated with memory
-#  leaks -- although one worst-case memory leak *DOES* still remain. Notably,
-#  since these proxies are themselves discrete objects, storing strong
-#  references to both these proxies and these iterators could under worst-case
-#  behaviour consume all available space. Ergo, this dictionary will need to be
-#  efficiently maintained as a large (but still limited) LRU cache. Ideally, the
-#  real-world size of this cache should be bound to a maximum of (say) 1MB space
-#  consumption. Since only proxy shim objects and iterators over those objects
-#  are stored (and we expect the size of these proxies and iterators to be quite
-#  small), this cache *SHOULD* be able to support an exceedingly large number of
-#  proxies before becoming full.
-#
-#  Since this dictionary is only leveraged for type-checking, thread
-#  synchronization is irrelevant (although, of course, care should be taken to
-#  ensure that this dictionary remains internally consistent regardless of
-#  thread preemption).
-#* @beartype provides a trivial _get_reiterable_item_next() getter for use in
-#  dynamically generated type-checking code, which will then call that getter
-#  rather than iter() on reiterables to retrieve an effectively random item from
-#  those reiterables. Internally, this getter leverages the above global
-#  dictionaries as follows:
-#      # Note that this getter assumes the passed reiterable to be *NON-EMPTY.*
-#      # It is the caller's responsibility to ensure that (e.g., by explicitly
-#      # calling "len(reiterable)" or "bool(reiterable)" *BEFORE* calling this
-#      # getter). Trivial, but worth noting. For efficiency, this getter
-#      # intentionally does *NOT* explicitly validate that constraint.
-#      def _get_reiterable_item_next(
-#          reiterable: _BeartypeReiterableTypes) -> object:
-#
-#          #FIXME: Curiously, some C-based containers *DO* support weak
-#          #references. Crucially, this includes sets, frozensets, arrays, and
-#          #deques. Dicts, however, do *NOT*. Are dicts the only notable
-#          #exceptions? Not quite. *ANY* user-defined reiterable defining
-#          #"__slots__" that does *NOT* contain the string '__weakref__' also
-#          #does *NOT* support weak references. In short, we can really only
-#          #perform the following for a small subset of type hints: e.g.,
-#          #* "typing.Deque".
-#          #* "typing.FrozenSet".
-#          #* "typing.Set".
-#          #
-#          #Aaaaaaand... we're pretty sure that's it. Three is better than
-#          #nothing, of course. But... that's still not that great. We could try
-#          #to dynamically test for weak-referenceability -- except we're pretty
-#          #sure that that *CANNOT* be done efficiently in the general case.
-#          #We'd need to either:
-#          #* Call dir(), which dynamically creates and returns a new dict.
-#          #  That's right out.
-#          #* Access "__dict__" directly, which is only defined for pure-Python
-#          #  instances. That attribute does *NOT* exist for C-based instances.
-#          #
-#          #Actually, the most efficient detection heuristic would probably be:
-#          #* Define yet another global
-#          #  "_REITERABLE_TYPE_TO_IS_WEAKREFFABLE" dictionary mapping from
-#          #  reiterable types to boolean "True" only if those types can be
-#          #  weakly referenced. This dictionary can be pre-initialized for
-#          #  efficiency with the most common builtin C-based reiterable types
-#          #  in a global context as follows:
-#          #      _REITERABLE_TYPE_TO_IS_WEAKREFFABLE = {
-#          #          DefaultDict: False,
-#          #          dict: False,
-#          #          deque: True,
-#          #          frozenset: True,
-#          #          set: True,
-#          #      }
-#          #  We don't bother LRU-bounding that. Size is irrelevant here.
-#          #* Likewise, define yet another globl
-#          #  "_REITERABLE_TYPE_TO_IS_LENGTHHINTED" dictionary mapping from
-#          #  reiterable types to boolean "True" only if those types define
-#          #  iterators defining semantically meaningful __length_hint__()
-#          #  dunder methods. Since detecting that at runtime is infeasible, we
-#          #  simply preallocate that to those we do know about:
-#          #      _REITERABLE_TYPE_TO_IS_LENGTHHINTED = {
-#          #          deque: True,  # <-- unsure if true, actually *shrug*
-#          #          frozenset: True,
-#          #          set: True,
-#          #      }
-
-#          #* Given that, we then efficiently detect weak-referenceability:
-#
-#          REITERABLE_TYPE = reiterable.__class__
-#
-#          #FIXME: Again, optimize ...get() method access, please.
-#          reiterable_is_weakreffable = (
-#              _REITERABLE_TYPE_TO_IS_WEAKREFFABLE.get(REITERABLE_TYPE))
-#
-#          if reiterable_is_weakreffable is None:
-#              reiterable_dict = getattr(reiterable, '__dict__')
-#              #FIXME: Alternately, we could try just taking a weak proxy
-#              #of this reiterable and catching exceptions. Although
-#              #slower, this caching operation only occurs once per type.
-#              #For now, let's run with this faster heuristic.
-#              if not reiterable_dict:
-#                  reiterable_is_weakreffable = False
-#              else:
-#                  reiterable_slots = reiterable_dict.get('__slots__')
-#                  reiterable_is_weakreffable = (
-#                      reiterable_slots and
-#                      '__weakref__' not in reiterable_slots
-#                  )
-#              _REITERABLE_TYPE_TO_IS_WEAKREFFABLE[REITERABLE_TYPE] = (
-#                  reiterable_is_weakreffable)
-#
-#          # If this reiterable is a C-based container that does *NOT* support
-#          # weak references, reduce to simply returning the first item of this
-#          # reiterable.
-#          if not reiterable_is_weakreffable:
-#              return next(iter(reiterable))
-#
-#          REITERABLE_ID = id(reiterable)
-#
-#          #FIXME: Optimize by storing and calling a bound
-#          #"_REITERABLE_ID_TO_ITER_get" method instead, please.
-#          reiterable_iter = _REITERABLE_ID_TO_ITER.get(REITERABLE_ID)
-#
-#          if reiterable_iter:
-#              #FIXME: Note that this can be conditionally optimized for
-#              #iterators that define the PEP 424-compliant __length_hint__()
-#              #dunder method -- which thankfully appears to be *ALL* iterators
-#              #over C-based reiterables (e.g., dicts, sets). For these objects,
-#              #__length_hint__() provides the number of remaining items in the
-#              #iterator. Ergo, this can be optimized as follows:
-#              #    if reiterable_iter.__length_hint__():
-#              #        return next(reiterable_iter)
-#              #    else:
-#              #        ...
-#              #
-#              #The issue, of course, is that that *ONLY* works for strict type
-#              #hints constrained to C-based iterables (e.g.,
-#              #"typing.Dict[...]"). General-purpose type hints like
-#              #"typing.Mapping[...]" would be inapplicable, sadly. For the
-#              #latter, dynamically testing for the existence of a semantically
-#              #meaningful __length_hint__() getter would consume far more time
-#              #than calling that getter would actually save. *shrug*
-#              try:
-#                  return next(reiterable_iter)
-#              except StopIteration:
-#                  #FIXME: Violates DRY a bit, but more efficient. *shrug*
-#                  reiterable_weakproxy = _REITERABLE_ID_TO_WEAKPROXY[
-#                      REITERABLE_ID]
-#                  _REITERABLE_ID_TO_ITER[REITERABLE_ID] = iter(
-#                      reiterable_weakproxy)
-#                  return next(reiterable_iter)
-#
-#          if len(_REITERABLE_ID_TO_WEAKPROXY) >= _REITERABLE_CACHE_MAX_LEN:
-#               #FIXME: Efficiently kick out the least-used item from both the
-#               #"_REITERABLE_ID_TO_WEAKPROXY" and "_REITERABLE_ID_TO_ITER"
-#               #dictionaries here. Research exactly how to do that. Didn't we
-#               #already implement an efficient LRU somewhere in @beartype?
-#
-#          reiterable_weakproxy = _REITERABLE_ID_TO_WEAKPROXY[REITERABLE_ID] = (
-#              proxy(reiterable))
-#          _REITERABLE_ID_TO_ITER[REITERABLE_ID] = iter(reiterable_weakproxy)
-#          return next(reiterable_iter)
-#FIXME: Pretty boss, if we do say so. And we do. There are also considerable
-#opportunities for both macro- and microoptimization. The biggest
-#macrooptimization would be doing away entirely with the
-#"_REITERABLE_ID_TO_WEAKPROXY" cache. Strictly speaking, we only actually need
-#the "_REITERABLE_ID_TO_ITER" cache. Doing away with the
-#"_REITERABLE_ID_TO_WEAKPROXY" cache is *PROBABLY* the right thing to do in most
-#cases. Why? Because we don't necessarily expect that @beartype type-checkers
-#will exhaust all available items for most reiterables. But we *DO* know that
-#all reiterables that will be type-checked will be type-checked at least once.
-#In other words, the trailing code in _get_reiterable_item_next() is guaranteed
-#to *ALWAYS* happen at least once per reiterable (so we should optimize that);
-#conversely, the leading code that restarts iteration from the beginning only
-#happens in edge cases for smaller reiterables passed or returned frequently
-#between @beartype-decorated callables (so we shouldn't bother optimizing that).
-#Optimizing away "_REITERABLE_ID_TO_WEAKPROXY" then yields:
-#
-#      #FIXME: Don't even bother calling this getter with "dict" objects. The
-#      #caller should explicitly perform an "pith.__class__ is dict" check to
-#      #switch to more efficient "next(iter(pith.keys())" and
-#      #"next(iter(pith.values())" logic when the pith is a "dict" object. Note
-#      #that user-defined "dict" subclasses are fine, however. *facepalm*
-#      def _get_reiterable_item_next(
-#          reiterable: _BeartypeReiterableTypes) -> object:
-#
-#          REITERABLE_TYPE = reiterable.__class__
-#
-#          #FIXME: Again, optimize ...get() method access, please.
-#          reiterable_is_weakreffable = (
-#              _REITERABLE_TYPE_TO_IS_WEAKREFFABLE.get(REITERABLE_TYPE))
-#
-#          if reiterable_is_weakreffable is None:
-#              reiterable_dict = getattr(reiterable, '__dict__')
-#              #FIXME: Alternately, we could try just taking a weak proxy
-#              #of this reiterable and catching exceptions. Although
-#              #slower, this caching operation only occurs once per type.
-#              #For now, let's run with this faster heuristic.
-#              if not reiterable_dict:
-#                  reiterable_is_weakreffable = False
-#              else:
-#                  reiterable_slots = reiterable_dict.get('__slots__')
-#                  reiterable_is_weakreffable = (
-#                      reiterable_slots and
-#                      '__weakref__' not in reiterable_slots
-#                  )
-#              _REITERABLE_TYPE_TO_IS_WEAKREFFABLE[REITERABLE_TYPE] = (
-#                  reiterable_is_weakreffable)
-#
-#          # If this reiterable is a C-based container that does *NOT* support
-#          # weak references, reduce to simply returning the first item of this
-#          # reiterable.
-#          if not reiterable_is_weakreffable:
-#              return next(iter(reiterable))
-#
-#          REITERABLE_ID = id(reiterable)
-#
-#          #FIXME: Optimize by storing and calling a bound
-#          #"_REITERABLE_ID_TO_ITER_get" method instead, please.
-#          reiterable_iter = _REITERABLE_ID_TO_ITER.get(REITERABLE_ID)
-#
-#          if reiterable_iter:
-#              #FIXME: Optimize us up, yo!
-#              if _REITERABLE_TYPE_TO_IS_LENGTHHINTED.get(REITERABLE_TYPE):
-#                  if reiterable_iter.__length_hint__():
-#                      return next(reiterable_iter)
-#              else:
-#                  try:
-#                      return next(reiterable_iter)
-#                  except StopIteration:
-#                      pass
-#          elif len(_REITERABLE_ID_TO_ITER) >= _REITERABLE_CACHE_MAX_LEN:
-#               #FIXME: Efficiently kick out the least-used item from the
-#               #"_REITERABLE_ID_TO_ITER" dictionary here. Research exactly how
-#               #to do that. Didn't we already implement an efficient LRU
-#               #somewhere in @beartype?
-#               #FIXME: *AH-HA!* Forget LRU. Seriously. LRU would impose too
-#               #much overhead here, as we'd need to update the LRU on each
-#               #access. Instead, let's just friggin *CLEAR* the entire cache
-#               #here. Yes, that's right! Nuke it from orbit, bois! So, what?
-#               #Right? Who cares if we start over from zero? Nobody! It's
-#               #minimal overhead to just start iterating things all over again.
-#               #And if the cache is full up, that's a good indication that the
-#               #caller has gone off the rails a bit, anyway.
-#               _REITERABLE_ID_TO_ITER.clear()  # <-- *BOOM STICK*
-#
-#          reiterable_iter = _REITERABLE_ID_TO_ITER[REITERABLE_ID] = iter(
-#              proxy(reiterable))
-#          return next(reiterable_iter)
-#
-#Seems legitimately boss, yes? Everything above is feasible and *REASONABLY*
-#efficient -- but is that efficient enough? Honestly, that's probably fast
-#enough for *MOST* use cases. If users justifiably complain about performance
-#degradations, we could always provide a new "BeartypeConf" parameter defaulting
-#to enabled to control this behaviour. *shrug*
-
 #FIXME: Note that randomly checking mapping (e.g., "dict") keys and/or values
 #will be non-trivial, as there exists no out-of-the-box O(1) approach in either
 #the general case or the specific case of a "dict". Actually, there does -- but
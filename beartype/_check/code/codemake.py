@@ -21,19 +21,35 @@ from beartype.roar import (
     BeartypeDecorHintPepUnsupportedException,
     BeartypeDecorHintPep593Exception,
 )
-from beartype.typing import Optional
+from beartype.typing import (
+    List,
+    Optional,
+)
 from beartype._cave._cavefast import TestableTypes
 from beartype._check.checkmagic import (
     ARG_NAME_CLS_STACK,
-    ARG_NAME_GETRANDBITS,
+    ARG_NAME_RANDOM_INT_POP,
+    ARG_NAME_RANDOM_INT_REFILL,
     VAR_NAME_PREFIX_PITH,
     VAR_NAME_PITH_ROOT,
 )
+from beartype._check.checkrandom import (
+    random_int_pop,
+    refill_random_ints,
+)
+from beartype._check.checkreiter import (
+    get_mapping_nonempty_item_next,
+    get_reiterable_nonempty_item_next,
+)
+from beartype._check.checktime import (
+    is_all_items_timed,
+    make_iter_sequence_items_timed,
+)
+from beartype._check.checkunion import UnionBranchHits
 from beartype._check.code.codemagic import (
     EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL,
     EXCEPTION_PREFIX_HINT,
     HINT_META_INDEX_HINT,
-    HINT_META_INDEX_PLACEHOLDER,
     HINT_META_INDEX_PITH_EXPR,
     HINT_META_INDEX_PITH_VAR_NAME,
     HINT_META_INDEX_INDENT,
@@ -51,7 +67,14 @@ from beartype._check.code.codesnip import (
     PEP484585_CODE_HINT_GENERIC_CHILD,
     PEP484585_CODE_HINT_GENERIC_PREFIX,
     PEP484585_CODE_HINT_GENERIC_SUFFIX,
+    PEP484585_CODE_HINT_MAPPING,
+    PEP484585_CODE_HINT_MAPPING_KEY_PITH_CHILD_EXPR,
+    PEP484585_CODE_HINT_MAPPING_VALUE_PITH_CHILD_EXPR,
+    PEP484585_CODE_HINT_REITERABLE_ARGS_1_PITH_CHILD_EXPR,
     PEP484585_CODE_HINT_SEQUENCE_ARGS_1,
+    PEP484585_CODE_HINT_SEQUENCE_ARGS_1_ITER,
+    PEP484585_CODE_HINT_SEQUENCE_ARGS_1_ITER_TYPE,
+    PEP484585_CODE_HINT_SEQUENCE_ARGS_1_RANDOM_PITH_ITER_EXPR,
     PEP484585_CODE_HINT_SEQUENCE_ARGS_1_PITH_CHILD_EXPR,
     PEP484585_CODE_HINT_SUBCLASS,
     PEP484585_CODE_HINT_TUPLE_FIXED_EMPTY,
@@ -63,6 +86,9 @@ from beartype._check.code.codesnip import (
     PEP484_CODE_HINT_INSTANCE,
     PEP484_CODE_HINT_UNION_CHILD_PEP,
     PEP484_CODE_HINT_UNION_CHILD_NONPEP,
+    PEP484_CODE_HINT_UNION_HITS_CHILD_PEP,
+    PEP484_CODE_HINT_UNION_HITS_CHILD_NONPEP,
+    PEP484_CODE_HINT_UNION_HITS_PITH_ASSIGN,
     PEP484_CODE_HINT_UNION_PREFIX,
     PEP484_CODE_HINT_UNION_SUFFIX,
     PEP586_CODE_HINT_LITERAL,
@@ -73,16 +99,12 @@ from beartype._check.code.codesnip import (
     PEP593_CODE_HINT_VALIDATOR_SUFFIX,
 )
 from beartype._conf.confcls import BeartypeConf
+from beartype._conf.confenum import BeartypeStrategy
 from beartype._data.hint.datahinttyping import (
     CodeGenerated,
     TypeStack,
 )
 from beartype._util.cache.utilcachecall import callable_cached
-from beartype._util.cache.pool.utilcachepoollistfixed import (
-    FIXED_LIST_SIZE_MEDIUM,
-    acquire_fixed_list,
-    release_fixed_list,
-)
 from beartype._util.cache.pool.utilcachepoolobjecttyped import (
     acquire_object_typed,
     release_object_typed,
@@ -99,6 +121,8 @@ from beartype._data.hint.pep.sign.datapepsigns import (
     HintSignType,
 )
 from beartype._data.hint.pep.sign.datapepsignset import (
+    HINT_SIGNS_MAPPING,
+    HINT_SIGNS_REITERABLE_ARGS_1,
     HINT_SIGNS_SEQUENCE_ARGS_1,
     HINT_SIGNS_SUPPORTED_DEEP,
     HINT_SIGNS_ORIGIN_ISINSTANCEABLE,
@@ -108,7 +132,9 @@ from beartype._util.func.utilfuncscope import add_func_scope_attr
 from beartype._util.hint.pep.proposal.pep484585.utilpep484585 import (
     is_hint_pep484585_tuple_empty)
 from beartype._util.hint.pep.proposal.pep484585.utilpep484585arg import (
-    get_hint_pep484585_args_1)
+    get_hint_pep484585_args_1,
+    get_hint_pep484585_args_2,
+)
 from beartype._util.hint.pep.proposal.pep484585.utilpep484585generic import (
     get_hint_pep484585_generic_type,
     iter_hint_pep484585_generic_bases_unerased_tree,
@@ -138,16 +164,20 @@ from beartype._util.hint.pep.utilpeptest import (
 from beartype._check.convert.convsanify import sanify_hint_any
 from beartype._util.hint.utilhinttest import is_hint_ignorable
 from beartype._util.kind.map.utilmapset import update_mapping
+from beartype._util.kind.sequence.utilseqiter import iter_sequence_items_ologn
 from beartype._util.text.utiltextmagic import (
     CODE_INDENT_1,
     CODE_INDENT_2,
     LINE_RSTRIP_INDEX_AND,
     LINE_RSTRIP_INDEX_OR,
 )
-from beartype._util.text.utiltextmunge import replace_str_substrs
 from beartype._util.text.utiltextrepr import represent_object
 from collections.abc import Callable
-from random import getrandbits
+from itertools import repeat
+from re import (
+    compile as re_compile,
+    escape as re_escape,
+)
 
 # ....................{ MAKERS                             }....................
 #FIXME: Attempt to JIT this function with Numba at some point. This will almost
@@ -164,6 +194,7 @@ def make_check_expr(
 
     # ..................{ ARGS ~ optional                    }..................
     cls_stack: TypeStack = None,
+    is_union_reorderable: bool = False,
 
     # ..................{ ARGS ~ optional : speed            }..................
     # Globals defined above, declared as optional parameters for efficient
@@ -179,7 +210,6 @@ def make_check_expr(
 
     # "beartype._check.code.codemagic" globals.
     _HINT_META_INDEX_HINT=HINT_META_INDEX_HINT,
-    _HINT_META_INDEX_PLACEHOLDER=HINT_META_INDEX_PLACEHOLDER,
     _HINT_META_INDEX_PITH_EXPR=HINT_META_INDEX_PITH_EXPR,
     _HINT_META_INDEX_PITH_VAR_NAME=HINT_META_INDEX_PITH_VAR_NAME,
     _HINT_META_INDEX_INDENT=HINT_META_INDEX_INDENT,
@@ -194,8 +224,22 @@ def make_check_expr(
         PEP484_CODE_HINT_INSTANCE.format),
     PEP484585_CODE_HINT_GENERIC_CHILD_format: Callable = (
         PEP484585_CODE_HINT_GENERIC_CHILD.format),
+    PEP484585_CODE_HINT_MAPPING_format: Callable = (
+        PEP484585_CODE_HINT_MAPPING.format),
+    PEP484585_CODE_HINT_MAPPING_KEY_PITH_CHILD_EXPR_format: Callable = (
+        PEP484585_CODE_HINT_MAPPING_KEY_PITH_CHILD_EXPR.format),
+    PEP484585_CODE_HINT_MAPPING_VALUE_PITH_CHILD_EXPR_format: Callable = (
+        PEP484585_CODE_HINT_MAPPING_VALUE_PITH_CHILD_EXPR.format),
+    PEP484585_CODE_HINT_REITERABLE_ARGS_1_PITH_CHILD_EXPR_format: Callable = (
+        PEP484585_CODE_HINT_REITERABLE_ARGS_1_PITH_CHILD_EXPR.format),
     PEP484585_CODE_HINT_SEQUENCE_ARGS_1_format: Callable = (
         PEP484585_CODE_HINT_SEQUENCE_ARGS_1.format),
+    PEP484585_CODE_HINT_SEQUENCE_ARGS_1_ITER_format: Callable = (
+        PEP484585_CODE_HINT_SEQUENCE_ARGS_1_ITER.format),
+    PEP484585_CODE_HINT_SEQUENCE_ARGS_1_ITER_TYPE_format: Callable = (
+        PEP484585_CODE_HINT_SEQUENCE_ARGS_1_ITER_TYPE.format),
+    PEP484585_CODE_HINT_SEQUENCE_ARGS_1_RANDOM_PITH_ITER_EXPR_format: Callable = (
+        PEP484585_CODE_HINT_SEQUENCE_ARGS_1_RANDOM_PITH_ITER_EXPR.format),
     PEP484585_CODE_HINT_SEQUENCE_ARGS_1_PITH_CHILD_EXPR_format: Callable = (
         PEP484585_CODE_HINT_SEQUENCE_ARGS_1_PITH_CHILD_EXPR.format),
     PEP484585_CODE_HINT_SUBCLASS_format: Callable = (
@@ -212,6 +256,12 @@ def make_check_expr(
         PEP484_CODE_HINT_UNION_CHILD_PEP.format),
     PEP484_CODE_HINT_UNION_CHILD_NONPEP_format: Callable = (
         PEP484_CODE_HINT_UNION_CHILD_NONPEP.format),
+    PEP484_CODE_HINT_UNION_HITS_CHILD_PEP_format: Callable = (
+        PEP484_CODE_HINT_UNION_HITS_CHILD_PEP.format),
+    PEP484_CODE_HINT_UNION_HITS_CHILD_NONPEP_format: Callable = (
+        PEP484_CODE_HINT_UNION_HITS_CHILD_NONPEP.format),
+    PEP484_CODE_HINT_UNION_HITS_PITH_ASSIGN_format: Callable = (
+        PEP484_CODE_HINT_UNION_HITS_PITH_ASSIGN.format),
     PEP586_CODE_HINT_LITERAL_format: Callable = (
         PEP586_CODE_HINT_LITERAL.format),
     PEP586_CODE_HINT_PREFIX_format: Callable = (
@@ -272,6 +322,17 @@ def make_check_expr(
         :func:`beartype.beartype`-decorated classes lexically containing the
         class variable or method annotated by this hint *or* :data:`None`).
         Defaults to :data:`None`.
+    is_union_reorderable : bool, optional
+        :data:`True` only if the caller is generating code embedded in a
+        :func:`beartype.beartype`-generated wrapper function *and* this
+        configuration enables the
+        :attr:`beartype.BeartypeConf.union_reorder_threshold` option. If
+        :data:`True`, the code type-checking each union with two or more
+        branches counts the hits of each branch with a
+        :class:`beartype._check.checkunion.UnionBranchHits` counter added to
+        the returned scope, which the
+        :mod:`beartype._decor.wrap.wrapunion` submodule subsequently inspects
+        to reorder these branches. Defaults to :data:`False`.
 
     Returns
     -------
@@ -328,13 +389,6 @@ def make_check_expr(
     # type) associated with the currently visited type hint if any.
     hint_curr_expr = None
 
-    # Placeholder string to be globally replaced in the Python code snippet to
-    # be returned (i.e., "func_wrapper_code") by a Python code snippet
-    # type-checking the current pith expression (i.e.,
-    # "pith_curr_var_name") against the currently visited hint (i.e.,
-    # "hint_curr").
-    hint_curr_placeholder = None
-
     # Full Python expression evaluating to the value of the current pith (i.e.,
     # possibly nested object of the passed parameter or return value to be
     # type-checked against the currently visited hint).
@@ -478,23 +532,21 @@ def make_check_expr(
     # ..................{ METADATA                           }..................
     # Tuple of metadata describing the currently visited hint, appended by
     # the previously visited parent hint to the "hints_meta" stack.
-    hint_curr_meta: tuple = None  # type: ignore[assignment]
-
-    # Fixed list of all metadata describing all visitable hints currently
-    # discovered by the breadth-first search (BFS) below. This list acts as a
-    # standard First In First Out (FILO) queue, enabling this BFS to be
-    # implemented as an efficient imperative algorithm rather than an
-    # inefficient (and dangerous, due to both unavoidable stack exhaustion and
-    # avoidable infinite recursion) recursive algorithm.
+    hint_curr_meta: Optional[tuple] = None
+
+    # List of all metadata describing all visitable hints currently discovered
+    # by the breadth-first search (BFS) below. This list acts as a standard
+    # First In First Out (FILO) queue, enabling this BFS to be implemented as an
+    # efficient imperative algorithm rather than an inefficient (and dangerous,
+    # due to both unavoidable stack exhaustion and avoidable infinite
+    # recursion) recursive algorithm.
     #
-    # Note that this list is guaranteed by the previously called
-    # _die_if_hint_repr_exceeds_child_limit() function to be larger than the
-    # number of hints transitively visitable from this root hint. Ergo, *ALL*
-    # indexation into this list performed by this BFS is guaranteed to be safe.
-    # Ergo, avoid explicitly testing below that the "hints_meta_index_last"
-    # integer maintained by this BFS is strictly less than "FIXED_LIST_SIZE_MEDIUM", as this
-    # constraint is already guaranteed to be the case.
-    hints_meta = acquire_fixed_list(FIXED_LIST_SIZE_MEDIUM)
+    # Note that this list is intentionally a growable list rather than a fixed
+    # list acquired from the fixed list pool. Since the number of hints
+    # transitively visitable from this root hint is unbounded (e.g., a
+    # "TypedDict" subclass declaring hundreds of fields), a fixed list would
+    # impose an arbitrary limit on the size of type-checkable hints.
+    hints_meta: List[Optional[tuple]] = []
 
     # 0-based index of metadata describing the currently visited hint in the
     # "hints_meta" list.
@@ -512,9 +564,25 @@ def make_check_expr(
 
     # ..................{ FUNC ~ code                        }..................
     # Python code snippet type-checking the current pith against the currently
-    # visited hint (to be appended to the "func_wrapper_code" string).
+    # visited hint (to be appended to the "func_curr_codes" list).
     func_curr_code: str = None  # type: ignore[assignment]
 
+    # List of all Python code snippets type-checking the piths of all visited
+    # hints, such that the item at each 0-based index of this list is the code
+    # snippet generated by visiting the hint whose metadata resides at the same
+    # index of the "hints_meta" list. Since the breadth-first search (BFS)
+    # below visits hints in the same order as enqueueing those hints, each such
+    # code snippet is merely appended to this list.
+    #
+    # Code snippets generated for parent hints embed placeholder substrings
+    # referring to the code snippets generated for their child hints. Rather
+    # than globally replacing each such placeholder in the full wrapper code
+    # on visiting each child hint (which would consume quadratic time in the
+    # size of the hint tree), these placeholders are replaced only *AFTER*
+    # this search in a single linear pass emitting the final code snippet. See
+    # the _emit_check_expr() function for further details.
+    func_curr_codes: List[str] = []
+
     # ..................{ FUNC ~ code : locals               }..................
     # Local scope (i.e., dictionary mapping from the name to value of each
     # attribute referenced in the signature) of this wrapper function required
@@ -531,7 +599,8 @@ def make_check_expr(
     # Closures centralizing frequently repeated logic, addressing Don't Repeat
     # Yourself (DRY) concerns during the breadth-first search (BFS) below.
 
-    def _enqueue_hint_child(pith_child_expr: str) -> str:
+    def _enqueue_hint_child(
+        pith_child_expr: str, pith_child_var_name: Optional[str] = None) -> str:
         '''
         **Enqueue** (i.e., append) a new tuple of metadata describing the
         currently iterated child hint to the end of the ``hints_meta`` queue,
@@ -543,6 +612,16 @@ def make_check_expr(
         pith_child_expr : str
             Python code snippet evaluating to the child pith to be
             type-checked against the currently iterated child hint.
+        pith_child_var_name : Optional[str]
+            Either:
+
+            * If the child pith is already localized to a unique local variable
+              (e.g., the iteration variable of a generator expression iterating
+              over the current pith), the name of that variable.
+            * Else, :data:`None`. In this case, this name defaults to that of
+              the current pith variable (i.e., ``pith_curr_var_name``).
+
+            Defaults to :data:`None`.
 
         This closure also implicitly expects the following local variables of
         the outer scope to be set to relevant values:
@@ -563,11 +642,8 @@ def make_check_expr(
 
         # Increment both the 0-based index of metadata describing the last
         # visitable hint in the "hints_meta" list and the unique identifier of
-        # the currently iterated child hint *BEFORE* overwriting the existing
-        # metadata at this index.
-        #
-        # Note this index is guaranteed to *NOT* exceed the fixed length of
-        # this list, by prior validation.
+        # the currently iterated child hint *BEFORE* appending the metadata at
+        # this index.
         hints_meta_index_last += 1
 
         # Placeholder string to be globally replaced by code type-checking the
@@ -591,19 +667,15 @@ def make_check_expr(
             f'{PEP_CODE_HINT_CHILD_PLACEHOLDER_SUFFIX}'
         )
 
-        # Create and insert a new tuple of metadata describing this child hint
+        # Create and append a new tuple of metadata describing this child hint
         # at this index of this list.
-        #
-        # Note that this assignment is guaranteed to be safe, as
-        # "FIXED_LIST_SIZE_MEDIUM" is guaranteed to be substantially larger than
-        # "hints_meta_index_last".
-        hints_meta[hints_meta_index_last] = (
+        hints_meta.append((
             hint_child,
             hint_child_placeholder,
             pith_child_expr,
-            pith_curr_var_name,
+            pith_child_var_name or pith_curr_var_name,
             indent_child,
-        )
+        ))
 
         # Return this placeholder string.
         return hint_child_placeholder
@@ -624,11 +696,6 @@ def make_check_expr(
     # function to validate this code to be valid *BEFORE* returning this code.
     func_root_code = hint_child_placeholder
 
-    # Python code snippet to be returned, seeded with a placeholder to be
-    # replaced on the first iteration of the breadth-first search performed
-    # below with a snippet type-checking the root pith against the root hint.
-    func_wrapper_code = func_root_code
-
     # ..................{ SEARCH                             }..................
     # While the 0-based index of metadata describing the next visited hint in
     # the "hints_meta" list does *NOT* exceed that describing the last
@@ -640,19 +707,20 @@ def make_check_expr(
 
         # Assert this metadata is a tuple as expected. This enables us to
         # distinguish between proper access of used items and improper access
-        # of unused items of the parent fixed list containing this tuple, since
-        # an unused item of this list is initialized to "None" by default.
-        assert hint_curr_meta.__class__ is tuple, (
+        # of nullified items of the parent list containing this tuple, since
+        # each previously visited item of this list is nullified to "None".
+        # This assertion also narrows this metadata to a tuple for static type
+        # checkers.
+        assert isinstance(hint_curr_meta, tuple), (
             f'Current hint metadata {repr(hint_curr_meta)} at '
             f'index {hints_meta_index_curr} not tuple.')
 
         #FIXME: [SPEED] Optimize by reducing to a single tuple unpacking.
         # Localize metadatum for both efficiency and f-string purposes.
-        hint_curr             = hint_curr_meta[_HINT_META_INDEX_HINT]
-        hint_curr_placeholder = hint_curr_meta[_HINT_META_INDEX_PLACEHOLDER]
-        pith_curr_expr        = hint_curr_meta[_HINT_META_INDEX_PITH_EXPR]
-        pith_curr_var_name    = hint_curr_meta[_HINT_META_INDEX_PITH_VAR_NAME]
-        indent_curr           = hint_curr_meta[_HINT_META_INDEX_INDENT]
+        hint_curr          = hint_curr_meta[_HINT_META_INDEX_HINT]
+        pith_curr_expr     = hint_curr_meta[_HINT_META_INDEX_PITH_EXPR]
+        pith_curr_var_name = hint_curr_meta[_HINT_META_INDEX_PITH_VAR_NAME]
+        indent_curr        = hint_curr_meta[_HINT_META_INDEX_INDENT]
         # print(f'Visiting type hint {repr(hint_curr)}...')
 
         # If this is a child hint rather than the root hint, sanify (i.e.,
@@ -671,13 +739,6 @@ def make_check_expr(
             )
         # Else, this is the already sanified root hint.
 
-        #FIXME: Comment this sanity check out after we're sufficiently
-        #convinced this algorithm behaves as expected. While useful, this check
-        #requires a linear search over the entire code and is thus costly.
-        # assert hint_curr_placeholder in func_wrapper_code, (
-        #     '{} {!r} placeholder {} not found in wrapper body:\n{}'.format(
-        #         hint_curr_exception_prefix, hint, hint_curr_placeholder, func_wrapper_code))
-
         # ................{ PEP                                }................
         # If this hint is PEP-compliant...
         if is_hint_pep(hint_curr):
@@ -985,7 +1046,10 @@ def make_check_expr(
 
                 # If...
                 if (
-                    # The current pith is not the root pith *AND*...
+                    # The current pith is not already localized to the current
+                    # pith variable (e.g., as either the root pith *OR* the
+                    # iteration variable of a generator expression iterating
+                    # over the parent pith) *AND*...
                     #
                     # Note that we explicitly test against piths rather than
                     # seemingly equivalent metadata to account for edge cases.
@@ -994,7 +1058,7 @@ def make_check_expr(
                     # *NOT* the root hint. Ergo, a seemingly equivalent test
                     # like "hints_meta_index_curr != 0" would generate false
                     # positives and thus unnecessarily inefficient code.
-                    pith_curr_expr is not VAR_NAME_PITH_ROOT and
+                    pith_curr_expr != pith_curr_var_name and
 
                     #FIXME: Overly ambiguous, unfortunately. This suffices
                     #for now but absolutely *WILL* fail with inscrutable
@@ -1279,107 +1343,197 @@ def make_check_expr(
                     # these arguments to the substring prefixing all such code.
                     func_curr_code = PEP484_CODE_HINT_UNION_PREFIX
 
-                    # If this union is subscripted by one or more
-                    # PEP-noncompliant child hints, generate and append
-                    # efficient code type-checking these child hints *BEFORE*
-                    # less efficient code type-checking any PEP-compliant child
-                    # hints subscripting this union.
-                    if hint_childs_nonpep:
-                        func_curr_code += (
-                            PEP484_CODE_HINT_UNION_CHILD_NONPEP_format(
-                                # Python expression yielding the value of the
-                                # current pith. Specifically...
-                                pith_curr_expr=(
-                                    # If this union is subscripted by one or
-                                    # more PEP-compliant child hints, prefer
-                                    # the expression assigning this value to a
-                                    # local variable efficiently reused by
-                                    # subsequent code generated for
-                                    # PEP-compliant child hints.
-                                    pith_curr_assign_expr
-                                    if hint_childs_pep else
-                                    # Else, this union is *NOT* subscripted by
-                                    # one or more PEP-compliant child hints.
-                                    # Since this is the first and only test
-                                    # generated for this union, prefer the
-                                    # expression yielding the value of the
-                                    # current pith *WITHOUT* assigning this
-                                    # value to a local variable, which would
-                                    # otherwise pointlessly go unused.
-                                    pith_curr_expr
-                                ),
-                                # Python expression evaluating to a tuple of
-                                # these arguments.
-                                #
-                                # Note that we would ideally avoid coercing this
-                                # set into a tuple when this set only contains
-                                # one type by passing that type directly to the
-                                # _add_func_wrapper_local_type() function.
-                                # Sadly, the "set" class defines no convenient
-                                # or efficient means of retrieving the only item
-                                # of a 1-set. Indeed, the most efficient means
-                                # of doing so is to iterate over that set and
-                                # break:
-                                #     for first_item in muh_set: break
-                                #
-                                # While we *COULD* technically leverage that
-                                # approach here, doing so would also mandate
-                                # adding multiple intermediate tests, mitigating
-                                # any performance gains. Ultimately, we avoid
-                                # doing so by falling back to the usual
-                                # approach. See also this relevant
-                                # self-StackOverflow post:
-                                #       https://stackoverflow.com/a/40054478/2809027
-                                hint_curr_expr=add_func_scope_types(
-                                    types=hint_childs_nonpep,
-                                    func_scope=func_wrapper_scope,
-                                    exception_prefix=_EXCEPTION_PREFIX_HINT,
-                                ),
-                            ))
+                    # If the caller requested that the branches of this union
+                    # be counted *AND* this union has two or more branches,
+                    # generate code counting the hits of each branch. Note
+                    # that all PEP-noncompliant child hints collectively
+                    # comprise only one branch, type-checked by a single
+                    # isinstance() call already ordered efficiently by the C
+                    # layer. Since only one branch has nothing to reorder,
+                    # unions with only one branch are *NOT* counted.
+                    if is_union_reorderable and (
+                        len(hint_childs_pep) + bool(hint_childs_nonpep) >= 2):
+                        # Tuple of all branches of this union in the order
+                        # that code type-checking these branches is generated
+                        # below. See the "UnionBranchHits" docstring.
+                        hint_branches: tuple = tuple(hint_childs_pep)
+                        if hint_childs_nonpep:
+                            hint_branches = (
+                                (tuple(hint_childs_nonpep),) + hint_branches)
+
+                        # Name of a hidden parameter exposing a new counter of
+                        # the hits of these branches to this wrapper.
+                        #
+                        # Note that this counter is merely a template memoized
+                        # with this code. Since this code is shared between all
+                        # wrappers type-checking this hint, the
+                        # "beartype._decor.wrap.wrapunion" submodule clones
+                        # this template into a new counter specific to each
+                        # wrapper before creating that wrapper.
+                        hits_name = add_func_scope_attr(
+                            attr=UnionBranchHits(
+                                hint=hint_curr,
+                                hint_branches=hint_branches,
+                                hits_threshold=(
+                                    conf.union_reorder_threshold),  # type: ignore[arg-type]
+                            ),
+                            func_scope=func_wrapper_scope,
+                            exception_prefix=(
+                                _EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL),
+                        )
 
-                    # For each PEP-compliant child hint of this union, generate
-                    # and append code type-checking this child hint.
-                    for hint_child_index, hint_child in enumerate(
-                        hint_childs_pep):
-                        func_curr_code += (
-                            PEP484_CODE_HINT_UNION_CHILD_PEP_format(
-                                # Python expression yielding the value of the
-                                # current pith.
-                                hint_child_placeholder=_enqueue_hint_child(
-                                    # If this union is subscripted by either...
+                        # If the current pith is *NOT* already a local
+                        # variable, localize this pith *BEFORE* all branches.
+                        # Since these branches are subsequently reordered, no
+                        # branch may localize this pith itself.
+                        if pith_curr_assign_expr != pith_curr_var_name:
+                            func_curr_code += (
+                                PEP484_CODE_HINT_UNION_HITS_PITH_ASSIGN_format(
+                                    pith_curr_assign_expr=pith_curr_assign_expr,
+                                    pith_curr_var_name=pith_curr_var_name,
+                                ))
+                        # Else, the current pith is already a local variable.
+
+                        # For the 0-based index of each branch of this union
+                        # and that branch, generate and append code
+                        # type-checking that branch *AND* counting its hits.
+                        #
+                        # Note that the _enqueue_hint_child() closure called
+                        # below expects each PEP-compliant branch to be
+                        # localized to the "hint_child" variable.
+                        for branch_index, hint_child in enumerate(
+                            hint_branches):
+                            # If this branch is the tuple of all
+                            # PEP-noncompliant child hints of this union...
+                            if hint_child.__class__ is tuple:
+                                func_curr_code += (
+                                    PEP484_CODE_HINT_UNION_HITS_CHILD_NONPEP_format(
+                                        pith_curr_var_name=pith_curr_var_name,
+                                        hint_curr_expr=add_func_scope_types(
+                                            types=hint_childs_nonpep,
+                                            func_scope=func_wrapper_scope,
+                                            exception_prefix=(
+                                                _EXCEPTION_PREFIX_HINT),
+                                        ),
+                                        hits_name=hits_name,
+                                        branch_index=branch_index,
+                                    ))
+                            # Else, this branch is a PEP-compliant child hint.
+                            else:
+                                func_curr_code += (
+                                    PEP484_CODE_HINT_UNION_HITS_CHILD_PEP_format(
+                                        hint_child_placeholder=(
+                                            _enqueue_hint_child(
+                                                pith_curr_var_name)),
+                                        hits_name=hits_name,
+                                        branch_index=branch_index,
+                                    ))
+                    # Else, either the caller did *NOT* request that the
+                    # branches of this union be counted *OR* this union has
+                    # only one branch. In this case, generate code
+                    # type-checking these branches in a fixed order.
+                    else:
+                        # If this union is subscripted by one or more
+                        # PEP-noncompliant child hints, generate and append
+                        # efficient code type-checking these child hints *BEFORE*
+                        # less efficient code type-checking any PEP-compliant child
+                        # hints subscripting this union.
+                        if hint_childs_nonpep:
+                            func_curr_code += (
+                                PEP484_CODE_HINT_UNION_CHILD_NONPEP_format(
+                                    # Python expression yielding the value of the
+                                    # current pith. Specifically...
+                                    pith_curr_expr=(
+                                        # If this union is subscripted by one or
+                                        # more PEP-compliant child hints, prefer
+                                        # the expression assigning this value to a
+                                        # local variable efficiently reused by
+                                        # subsequent code generated for
+                                        # PEP-compliant child hints.
+                                        pith_curr_assign_expr
+                                        if hint_childs_pep else
+                                        # Else, this union is *NOT* subscripted by
+                                        # one or more PEP-compliant child hints.
+                                        # Since this is the first and only test
+                                        # generated for this union, prefer the
+                                        # expression yielding the value of the
+                                        # current pith *WITHOUT* assigning this
+                                        # value to a local variable, which would
+                                        # otherwise pointlessly go unused.
+                                        pith_curr_expr
+                                    ),
+                                    # Python expression evaluating to a tuple of
+                                    # these arguments.
                                     #
-                                    # Then prefer the expression efficiently
-                                    # reusing the value previously assigned to
-                                    # a local variable by either the above
-                                    # conditional or prior iteration of the
-                                    # current conditional.
-                                    pith_curr_var_name
-                                    if (
-                                        # One or more PEP-noncompliant child
-                                        # hints *OR*...
-                                        hint_childs_nonpep or
-                                        # This is any PEP-compliant child hint
-                                        # *EXCEPT* the first...
-                                        hint_child_index
-                                    ) else
-                                    # Else, this union is both subscripted by
-                                    # no PEP-noncompliant child hints *AND*
-                                    # this is the first PEP-compliant child
-                                    # hint, prefer the expression assigning
-                                    # this value to a local variable
-                                    # efficiently reused by code generated by
-                                    # subsequent iteration.
+                                    # Note that we would ideally avoid coercing this
+                                    # set into a tuple when this set only contains
+                                    # one type by passing that type directly to the
+                                    # _add_func_wrapper_local_type() function.
+                                    # Sadly, the "set" class defines no convenient
+                                    # or efficient means of retrieving the only item
+                                    # of a 1-set. Indeed, the most efficient means
+                                    # of doing so is to iterate over that set and
+                                    # break:
+                                    #     for first_item in muh_set: break
                                     #
-                                    # Note this child hint is guaranteed to be
-                                    # followed by at least one more child hint.
-                                    # Why? Because the "typing" module forces
-                                    # unions to be subscripted by two or more
-                                    # child hints. By deduction, those child
-                                    # hints *MUST* be PEP-compliant. Ergo, we
-                                    # needn't explicitly validate that
-                                    # constraint here.
-                                    pith_curr_assign_expr
-                                )))
+                                    # While we *COULD* technically leverage that
+                                    # approach here, doing so would also mandate
+                                    # adding multiple intermediate tests, mitigating
+                                    # any performance gains. Ultimately, we avoid
+                                    # doing so by falling back to the usual
+                                    # approach. See also this relevant
+                                    # self-StackOverflow post:
+                                    #       https://stackoverflow.com/a/40054478/2809027
+                                    hint_curr_expr=add_func_scope_types(
+                                        types=hint_childs_nonpep,
+                                        func_scope=func_wrapper_scope,
+                                        exception_prefix=_EXCEPTION_PREFIX_HINT,
+                                    ),
+                                ))
+
+                        # For each PEP-compliant child hint of this union, generate
+                        # and append code type-checking this child hint.
+                        for hint_child_index, hint_child in enumerate(
+                            hint_childs_pep):
+                            func_curr_code += (
+                                PEP484_CODE_HINT_UNION_CHILD_PEP_format(
+                                    # Python expression yielding the value of the
+                                    # current pith.
+                                    hint_child_placeholder=_enqueue_hint_child(
+                                        # If this union is subscripted by either...
+                                        #
+                                        # Then prefer the expression efficiently
+                                        # reusing the value previously assigned to
+                                        # a local variable by either the above
+                                        # conditional or prior iteration of the
+                                        # current conditional.
+                                        pith_curr_var_name
+                                        if (
+                                            # One or more PEP-noncompliant child
+                                            # hints *OR*...
+                                            hint_childs_nonpep or
+                                            # This is any PEP-compliant child hint
+                                            # *EXCEPT* the first...
+                                            hint_child_index
+                                        ) else
+                                        # Else, this union is both subscripted by
+                                        # no PEP-noncompliant child hints *AND*
+                                        # this is the first PEP-compliant child
+                                        # hint, prefer the expression assigning
+                                        # this value to a local variable
+                                        # efficiently reused by code generated by
+                                        # subsequent iteration.
+                                        #
+                                        # Note this child hint is guaranteed to be
+                                        # followed by at least one more child hint.
+                                        # Why? Because the "typing" module forces
+                                        # unions to be subscripted by two or more
+                                        # child hints. By deduction, those child
+                                        # hints *MUST* be PEP-compliant. Ergo, we
+                                        # needn't explicitly validate that
+                                        # constraint here.
+                                        pith_curr_assign_expr
+                                    )))
 
                     # If this code is *NOT* its initial value, this union is
                     # subscripted by one or more unignorable child hints and
@@ -1410,7 +1564,9 @@ def make_check_expr(
                 # If this hint is either...
                 elif (
                     # A standard sequence (e.g., "typing.List[int]") *OR*...
-                    hint_curr_sign in HINT_SIGNS_SEQUENCE_ARGS_1 or (
+                    hint_curr_sign in HINT_SIGNS_SEQUENCE_ARGS_1 or
+                    # A standard reiterable (e.g., "typing.Set[int]") *OR*...
+                    hint_curr_sign in HINT_SIGNS_REITERABLE_ARGS_1 or (
                         # A tuple *AND*...
                         hint_curr_sign is HintSignTuple and
                         # This tuple is subscripted by exactly two child hints
@@ -1427,10 +1583,17 @@ def make_check_expr(
                     #
                     # See below for logic handling fixed-length tuples.
                 ):
-                # Then this hint is either a single-argument sequence *OR* a
-                # similar hint semantically resembling a single-argument
-                # sequence subscripted by one argument and one or more
-                # ignorable arguments.
+                # Then this hint is either a single-argument sequence, a
+                # single-argument reiterable, *OR* a similar hint semantically
+                # resembling a single-argument sequence subscripted by one
+                # argument and one or more ignorable arguments.
+
+                    # True only if this hint is a reiterable. Since reiterables
+                    # (e.g., sets) do *NOT* support O(1) indexation, items of
+                    # reiterables are only ever either iterated in full *OR*
+                    # sampled one at a time from a cached iterator.
+                    is_hint_curr_reiterable = (
+                        hint_curr_sign in HINT_SIGNS_REITERABLE_ARGS_1)
 
                     # Python expression evaluating to this origin type.
                     hint_curr_expr = add_func_scope_type(
@@ -1457,12 +1620,231 @@ def make_check_expr(
                             exception_prefix=_EXCEPTION_PREFIX,
                         )
 
-                    # If this child hint is *NOT* ignorable, deeply type-check
-                    # both the type of the current pith *AND* a randomly
-                    # indexed item of this pith. Specifically...
-                    if not is_hint_ignorable(hint_child):
-                        # Record that a pseudo-random integer is now required.
-                        is_var_random_int_needed = True
+                    # If this child hint is ignorable, fallback to generating
+                    # trivial code shallowly type-checking the current pith as
+                    # an instance of this origin type.
+                    if is_hint_ignorable(hint_child):
+                        func_curr_code = (
+                            PEP484_CODE_HINT_INSTANCE_format(
+                                pith_curr_expr=pith_curr_expr,
+                                hint_curr_expr=hint_curr_expr,
+                            ))
+                    # Else, this child hint is unignorable.
+                    #
+                    # If this configuration enables either the linear- or
+                    # logarithmic-time strategy, deeply type-check both the
+                    # type of the current pith *AND* either all items or a
+                    # pseudo-random subset of approximately log2(n) items of
+                    # this pith (respectively). Since reiterables do *NOT*
+                    # support O(1) indexation, reiterables are only deeply
+                    # type-checked in this way under the linear-time strategy
+                    # *WITHOUT* a deadline. Specifically...
+                    elif (
+                        conf.strategy is BeartypeStrategy.On or
+                        conf.strategy is BeartypeStrategy.Ologn
+                    ) and (
+                        not is_hint_curr_reiterable or (
+                            conf.strategy is BeartypeStrategy.On and
+                            conf.check_time_max_multiplier is None
+                        )
+                    ):
+                        # Python expression evaluating to the callable
+                        # deciding whether all items of this pith satisfy this
+                        # child hint, defaulting to the all() builtin.
+                        all_expr = 'all'
+
+                        # If this configuration imposes a deadline on
+                        # non-constant type-checks...
+                        if conf.check_time_max_multiplier is not None:
+                            # Record that a pseudo-random integer is now
+                            # required.
+                            is_var_random_int_needed = True
+
+                            # Decide whether all items of this pith satisfy
+                            # this child hint with a drop-in replacement for
+                            # the all() builtin accounting for the time
+                            # consumed by this type-check.
+                            all_expr = add_func_scope_attr(
+                                attr=is_all_items_timed,
+                                func_scope=func_wrapper_scope,
+                                exception_prefix=(
+                                    _EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL),
+                            )
+
+                            # Iterate over the subset of this pith permitted
+                            # by this deadline, progressively degrading this
+                            # strategy as this deadline approaches.
+                            pith_curr_iter_expr = (
+                                PEP484585_CODE_HINT_SEQUENCE_ARGS_1_RANDOM_PITH_ITER_EXPR_format(
+                                    pith_curr_var_name=pith_curr_var_name,
+                                    # Python expression evaluating to a
+                                    # deadlined item selector specific to this
+                                    # strategy and deadline multiplier.
+                                    iter_items_expr=add_func_scope_attr(
+                                        attr=make_iter_sequence_items_timed(
+                                            conf.strategy,
+                                            conf.check_time_max_multiplier,
+                                        ),
+                                        func_scope=func_wrapper_scope,
+                                        exception_prefix=(
+                                            _EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL),
+                                    ),
+                                ))
+                        # Else, this configuration imposes *NO* deadline.
+                        #
+                        # If this configuration enables the linear-time
+                        # strategy, iterate over this pith as is.
+                        elif conf.strategy is BeartypeStrategy.On:
+                            pith_curr_iter_expr = pith_curr_var_name
+                        # Else, this configuration enables the
+                        # logarithmic-time strategy. In this case...
+                        else:
+                            # Record that a pseudo-random integer is now
+                            # required.
+                            is_var_random_int_needed = True
+
+                            # Iterate over a pseudo-random subset of this pith
+                            # derived from that integer.
+                            pith_curr_iter_expr = (
+                                PEP484585_CODE_HINT_SEQUENCE_ARGS_1_RANDOM_PITH_ITER_EXPR_format(
+                                    pith_curr_var_name=pith_curr_var_name,
+                                    # Python expression evaluating to the
+                                    # iter_sequence_items_ologn() generator.
+                                    iter_items_expr=add_func_scope_attr(
+                                        attr=iter_sequence_items_ologn,
+                                        func_scope=func_wrapper_scope,
+                                        exception_prefix=(
+                                            _EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL),
+                                    ),
+                                ))
+
+                        # This child hint sanified (i.e., sanitized) from this
+                        # child hint if this child hint is reducible *OR*
+                        # preserved as is otherwise. Sanification is required
+                        # to decide whether this child hint is a trivial type
+                        # (e.g., to avoid misclassifying the "float" type as
+                        # trivial when "conf.is_pep484_tower=True" expands that
+                        # type into the union "float | int").
+                        hint_child_sanified = sanify_hint_any(
+                            hint=hint_child,
+                            conf=conf,
+                            cls_stack=cls_stack,
+                            exception_prefix=_EXCEPTION_PREFIX,
+                        )
+
+                        # If this sanified child hint is a PEP-noncompliant
+                        # type (e.g., "int" in "list[int]"), generate
+                        # efficient code type-checking these items of this pith
+                        # with C-based iteration *WITHOUT* visiting this child
+                        # hint.
+                        if (
+                            isinstance(hint_child_sanified, type) and
+                            not is_hint_pep(hint_child_sanified)
+                        ):
+                            func_curr_code = (
+                                PEP484585_CODE_HINT_SEQUENCE_ARGS_1_ITER_TYPE_format(
+                                    indent_curr=indent_curr,
+                                    all_expr=all_expr,
+                                    pith_curr_assign_expr=pith_curr_assign_expr,
+                                    pith_curr_iter_expr=pith_curr_iter_expr,
+                                    hint_curr_expr=hint_curr_expr,
+                                    # Python expression evaluating to this type.
+                                    hint_child_expr=add_func_scope_type(
+                                        cls=hint_child_sanified,
+                                        func_scope=func_wrapper_scope,
+                                        exception_prefix=(
+                                            _EXCEPTION_PREFIX_HINT),
+                                    ),
+                                    # Python expression evaluating to the
+                                    # itertools.repeat() factory.
+                                    repeat_expr=add_func_scope_attr(
+                                        attr=repeat,
+                                        func_scope=func_wrapper_scope,
+                                        exception_prefix=(
+                                            _EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL),
+                                    ),
+                                ))
+                        # Else, this sanified child hint is *NOT* a
+                        # PEP-noncompliant type. In this case, generate code
+                        # type-checking these items of this pith by iterating a
+                        # generator expression whose iteration variable is the
+                        # child pith to be type-checked against this child hint.
+                        else:
+                            # Increment the integer suffixing the name of the
+                            # local variable localizing the child pith *BEFORE*
+                            # defining this variable.
+                            pith_curr_assign_expr_name_counter += 1
+
+                            # Name of the iteration variable of this generator
+                            # expression, localizing each item of this pith.
+                            pith_child_var_name = (
+                                f'{VAR_NAME_PREFIX_PITH}'
+                                f'{pith_curr_assign_expr_name_counter}'
+                            )
+
+                            # Indent code type-checking this child pith by one
+                            # additional level, as this code is embedded in the
+                            # body of this generator expression.
+                            indent_child = f'{indent_child}{_CODE_INDENT_1}'
+
+                            # Code type-checking this pith against this type.
+                            func_curr_code = (
+                                PEP484585_CODE_HINT_SEQUENCE_ARGS_1_ITER_format(
+                                    indent_curr=indent_curr,
+                                    all_expr=all_expr,
+                                    pith_curr_assign_expr=pith_curr_assign_expr,
+                                    pith_curr_iter_expr=pith_curr_iter_expr,
+                                    pith_child_var_name=pith_child_var_name,
+                                    hint_curr_expr=hint_curr_expr,
+                                    hint_child_placeholder=_enqueue_hint_child(
+                                        # Python expression yielding the value
+                                        # of each item of the current pith,
+                                        # already localized to this iteration
+                                        # variable.
+                                        pith_child_var_name,
+                                        pith_child_var_name,
+                                    ),
+                                ))
+                    # Else, either this configuration enables the default
+                    # constant-time strategy *OR* this hint is a reiterable
+                    # that cannot be efficiently type-checked under the
+                    # current non-constant strategy. In either case, deeply
+                    # type-check both the type of the current pith *AND* a
+                    # single item of this pith. Specifically...
+                    else:
+                        # If this hint is a reiterable...
+                        if is_hint_curr_reiterable:
+                            # Python expression yielding the value of the next
+                            # item of the current pith (i.e., standard
+                            # reiterable) to be type-checked against this child
+                            # hint, sampled from the iterator over this pith
+                            # cached by the reiterable item sampler.
+                            pith_child_expr = (
+                                PEP484585_CODE_HINT_REITERABLE_ARGS_1_PITH_CHILD_EXPR_format(
+                                    pith_curr_var_name=pith_curr_var_name,
+                                    # Python expression evaluating to the
+                                    # get_reiterable_nonempty_item_next()
+                                    # getter.
+                                    get_item_expr=add_func_scope_attr(
+                                        attr=get_reiterable_nonempty_item_next,
+                                        func_scope=func_wrapper_scope,
+                                        exception_prefix=(
+                                            _EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL),
+                                    ),
+                                ))
+                        # Else, this hint is a sequence. In this case...
+                        else:
+                            # Record that a pseudo-random integer is now
+                            # required.
+                            is_var_random_int_needed = True
+
+                            # Python expression yielding the value of a
+                            # randomly indexed item of the current pith (i.e.,
+                            # standard sequence) to be type-checked against
+                            # this child hint.
+                            pith_child_expr = (
+                                PEP484585_CODE_HINT_SEQUENCE_ARGS_1_PITH_CHILD_EXPR_format(
+                                    pith_curr_var_name=pith_curr_var_name))
 
                         # Code type-checking this pith against this type.
                         func_curr_code = (
@@ -1473,26 +1855,112 @@ def make_check_expr(
                                     pith_curr_var_name),
                                 hint_curr_expr=hint_curr_expr,
                                 hint_child_placeholder=_enqueue_hint_child(
-                                    # Python expression yielding the value of a
-                                    # randomly indexed item of the current pith
-                                    # (i.e., standard sequence) to be
-                                    # type-checked against this child hint.
-                                    PEP484585_CODE_HINT_SEQUENCE_ARGS_1_PITH_CHILD_EXPR_format(
-                                        pith_curr_var_name=(
-                                            pith_curr_var_name))),
+                                    pith_child_expr),
                             ))
-                    # Else, this child hint is ignorable. In this case,
-                    # fallback to generating trivial code shallowly
-                    # type-checking the current pith as an instance of this
-                    # origin type.
-                    else:
+                # Else, this hint is neither a standard sequence *NOR* variadic
+                # tuple.
+                #
+                # ............{ MAPPINGS                           }............
+                # If this hint is a standard mapping (e.g., "dict[str, int]")...
+                elif hint_curr_sign in HINT_SIGNS_MAPPING:
+                    # Python expression evaluating to this origin type.
+                    hint_curr_expr = add_func_scope_type(
+                        # Origin type of this mapping.
+                        cls=get_hint_pep_origin_type_isinstanceable(hint_curr),
+                        func_scope=func_wrapper_scope,
+                        exception_prefix=_EXCEPTION_PREFIX_HINT,
+                    )
+
+                    # Child key and value hints subscripting this parent hint.
+                    hint_child_key, hint_child_value = (
+                        get_hint_pep484585_args_2(
+                            hint=hint_curr,
+                            exception_prefix=_EXCEPTION_PREFIX,
+                        ))
+
+                    # True only if these child hints are ignorable.
+                    is_hint_child_key_ignorable = is_hint_ignorable(
+                        hint_child_key)
+                    is_hint_child_value_ignorable = is_hint_ignorable(
+                        hint_child_value)
+
+                    # If both child hints are ignorable, fallback to generating
+                    # trivial code shallowly type-checking the current pith as
+                    # an instance of this origin type.
+                    if is_hint_child_key_ignorable and (
+                        is_hint_child_value_ignorable):
                         func_curr_code = (
                             PEP484_CODE_HINT_INSTANCE_format(
                                 pith_curr_expr=pith_curr_expr,
                                 hint_curr_expr=hint_curr_expr,
                             ))
-                # Else, this hint is neither a standard sequence *NOR* variadic
-                # tuple.
+                    # Else, one or more child hints are unignorable. In this
+                    # case, deeply type-check both the type of the current
+                    # pith *AND* the next key-value pair of this pith sampled
+                    # by a cached iterator in amortized O(1) time.
+                    # Specifically...
+                    else:
+                        # Increment the integer suffixing the name of the local
+                        # variable localizing this pair *BEFORE* defining this
+                        # variable.
+                        pith_curr_assign_expr_name_counter += 1
+
+                        # Name of the local variable localizing this pair.
+                        pith_item_var_name = (
+                            f'{VAR_NAME_PREFIX_PITH}'
+                            f'{pith_curr_assign_expr_name_counter}'
+                        )
+
+                        # Indent code type-checking these child piths by one
+                        # additional level, as this code is embedded in a
+                        # nested parenthesized expression.
+                        indent_child = f'{indent_child}{_CODE_INDENT_1}'
+
+                        # Placeholders for code type-checking these child
+                        # piths against these child hints, enqueued in the
+                        # same order as these child hints.
+                        hint_child_placeholders = []
+
+                        # If the child key hint is unignorable, enqueue this
+                        # hint for type-checking against the key of this pair.
+                        if not is_hint_child_key_ignorable:
+                            hint_child = hint_child_key
+                            hint_child_placeholders.append(_enqueue_hint_child(
+                                PEP484585_CODE_HINT_MAPPING_KEY_PITH_CHILD_EXPR_format(
+                                    pith_item_var_name=pith_item_var_name)))
+                        # Else, the child key hint is ignorable.
+
+                        # If the child value hint is unignorable, enqueue this
+                        # hint for type-checking against the value of this
+                        # pair.
+                        if not is_hint_child_value_ignorable:
+                            hint_child = hint_child_value
+                            hint_child_placeholders.append(_enqueue_hint_child(
+                                PEP484585_CODE_HINT_MAPPING_VALUE_PITH_CHILD_EXPR_format(
+                                    pith_item_var_name=pith_item_var_name)))
+                        # Else, the child value hint is ignorable.
+
+                        # Code type-checking this pith against this mapping.
+                        func_curr_code = PEP484585_CODE_HINT_MAPPING_format(
+                            indent_curr=indent_curr,
+                            pith_curr_assign_expr=pith_curr_assign_expr,
+                            pith_curr_var_name=pith_curr_var_name,
+                            pith_item_var_name=pith_item_var_name,
+                            hint_curr_expr=hint_curr_expr,
+                            # Python expression evaluating to the
+                            # get_mapping_nonempty_item_next() getter.
+                            get_item_expr=add_func_scope_attr(
+                                attr=get_mapping_nonempty_item_next,
+                                func_scope=func_wrapper_scope,
+                                exception_prefix=(
+                                    _EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL),
+                            ),
+                            # Conjunction of these placeholders.
+                            hint_child_placeholders=(
+                                f' and\n{indent_curr}        '.join(
+                                    hint_child_placeholders)),
+                        )
+                # Else, this hint is *NOT* a standard mapping.
                 #
                 # ............{ SEQUENCES ~ tuple : fixed          }............
                 # If this hint is a tuple, this tuple is *NOT* of the variadic
@@ -1997,12 +2465,10 @@ def make_check_expr(
             )
 
         # ................{ CLEANUP                            }................
-        # Inject this code into the body of this wrapper.
-        func_wrapper_code = replace_str_substrs(
-            text=func_wrapper_code,
-            old=hint_curr_placeholder,
-            new=func_curr_code,
-        )
+        # Record this code for subsequent emission into the body of this
+        # wrapper. Note that this code is appended at the 0-based index of the
+        # metadata describing this hint in the "hints_meta" list.
+        func_curr_codes.append(func_curr_code)
 
         # Nullify the metadata describing the previously visited hint in this
         # list for safety.
@@ -2014,8 +2480,10 @@ def make_check_expr(
         hints_meta_index_curr += 1
 
     # ..................{ CLEANUP                            }..................
-    # Release the fixed list of all such metadata.
-    release_fixed_list(hints_meta)
+    # Python code snippet to be returned, emitted by replacing each placeholder
+    # substring embedded in the code snippet type-checking each parent hint
+    # with the code snippet type-checking the corresponding child hint.
+    func_wrapper_code = _emit_check_expr(func_curr_codes)
 
     # If the Python code snippet to be returned remains unchanged from its
     # initial value, the breadth-first search above failed to generate code. In
@@ -2038,10 +2506,12 @@ def make_check_expr(
     # Else, type-checking for the root pith requires *NO* type stack.
 
     # If type-checking for the root pith requires a pseudo-random integer, pass
-    # a hidden parameter to this wrapper function exposing the
-    # random.getrandbits() function required to generate this integer.
+    # hidden parameters to this wrapper function exposing the bound
+    # list.pop() method of the pseudo-random integer buffer *AND* the
+    # function refilling that buffer required to retrieve this integer.
     if is_var_random_int_needed:
-        func_wrapper_scope[ARG_NAME_GETRANDBITS] = getrandbits
+        func_wrapper_scope[ARG_NAME_RANDOM_INT_POP] = random_int_pop
+        func_wrapper_scope[ARG_NAME_RANDOM_INT_REFILL] = refill_random_ints
     # Else, type-checking for the root pith requires *NO* pseudo-random integer.
 
     # ..................{ CODE ~ suffix                      }..................
@@ -2063,3 +2533,164 @@ def make_check_expr(
         func_wrapper_scope,
         hint_refs_type_basename_tuple,
     )
+
+# ....................{ PRIVATE ~ constants                }....................
+_HINT_CHILD_PLACEHOLDER_REGEX = re_compile(
+    f'{re_escape(PEP_CODE_HINT_CHILD_PLACEHOLDER_PREFIX)}'
+    r'(\d+)'
+    f'{re_escape(PEP_CODE_HINT_CHILD_PLACEHOLDER_SUFFIX)}'
+)
+'''
+Compiled regular expression matching each **placeholder hint child
+type-checking substring** (i.e., placeholder embedded by the
+:func:`.make_check_expr` factory in the code snippet type-checking a parent hint
+to be replaced by the code snippet type-checking a child hint of that parent),
+capturing the 0-based index of the metadata describing that child hint as the
+first and only group of this expression.
+'''
+
+# ....................{ PRIVATE ~ emitters                 }....................
+def _emit_check_expr(func_codes: List[str]) -> str:
+    '''
+    Python code snippet type-checking the root pith against the root hint,
+    **emitted** (i.e., assembled) from the passed list of all code snippets
+    generated by the :func:`.make_check_expr` factory for all hints visitable
+    from that root hint in time linear in the total length of these snippets.
+
+    The :func:`.make_check_expr` factory generates code in two phases:
+
+    #. **Build.** A breadth-first search (BFS) over the tree of all hints
+       visitable from the root hint generates one code snippet per hint. The
+       code snippet generated for each parent hint embeds one placeholder
+       substring (e.g., ``"@[3)!"``) per child hint of that parent, referring
+       to the code snippet generated for that child hint by the 0-based index
+       of that hint in the BFS order.
+    #. **Emit.** This function then replaces each such placeholder with the
+       code snippet generated for the corresponding child hint.
+
+    The prior single-phase design instead globally replaced each placeholder in
+    the full wrapper code on visiting each child hint, consuming time
+    quadratic in the size of the hint tree (i.e., ``O(n**2)`` for a tree of
+    ``n`` hints) by repeatedly copying an ever-growing string. This function
+    instead splits each code snippet on its placeholders exactly once and then
+    performs a depth-first traversal appending each substring to a list exactly
+    once, joining that list into the final code snippet exactly once. The
+    resulting time complexity is thus linear in the total length of these
+    snippets (i.e., ``O(n)``). This traversal is iterative rather than
+    recursive, preserving the stack against deeply nested hints.
+
+    Parameters
+    ----------
+    func_codes : List[str]
+        List of all code snippets generated for all visited hints, such that the
+        item at each 0-based index of this list is the code snippet generated
+        for the hint whose placeholder embeds the same index. The first item is
+        the code snippet generated for the root hint.
+
+    Returns
+    -------
+    str
+        Code snippet type-checking the root pith against the root hint.
+
+    Raises
+    ------
+    BeartypeDecorHintPepException
+        If any code snippet other than that generated for the root hint is
+        *not* referred to by exactly one placeholder (i.e., is referred to by
+        either no placeholder *or* multiple placeholders), implying
+        :func:`.make_check_expr` to have erroneously either enqueued a child
+        hint without embedding the placeholder referring to the code
+        type-checking that hint *or* embedded that placeholder multiply. This
+        includes placeholders referring to the root code snippet or to
+        nonexistent code snippets.
+    '''
+    assert isinstance(func_codes, list), f'{repr(func_codes)} not list.'
+    assert func_codes, 'Code snippets empty.'
+
+    # List of lists of substrings split from each code snippet on placeholders,
+    # such that each even-indexed substring is literal code and each
+    # odd-indexed substring is the stringified 0-based index of the code
+    # snippet to be substituted in place of the corresponding placeholder.
+    func_codes_split = [
+        _HINT_CHILD_PLACEHOLDER_REGEX.split(func_code)
+        for func_code in func_codes
+    ]
+
+    # List of booleans such that the item at each 0-based index of this list is
+    # true only if the code snippet at the same index of the "func_codes" list
+    # is referred to by a placeholder, validated below. The root code snippet
+    # is referred to by *NO* placeholder and is thus marked as referred to.
+    func_codes_referred = [False] * len(func_codes)
+    func_codes_referred[0] = True
+
+    # For each list of substrings split from each code snippet...
+    for func_code_split in func_codes_split:
+        # For each placeholder embedded in this code snippet...
+        for func_code_split_index in range(1, len(func_code_split), 2):
+            # 0-based index of the code snippet referred to by this placeholder.
+            func_code_index = int(func_code_split[func_code_split_index])
+
+            # If this placeholder refers to a code snippet that is either
+            # nonexistent *OR* already referred to by a prior placeholder (which
+            # includes the root code snippet), raise an exception.
+            if (
+                func_code_index >= len(func_codes) or
+                func_codes_referred[func_code_index]
+            ):
+                raise BeartypeDecorHintPepException(
+                    f'{EXCEPTION_PREFIX_HINT}code snippet {func_code_index} '
+                    f'either nonexistent or referred to by multiple '
+                    f'placeholders:\n{func_codes}'
+                )
+            # Else, this placeholder is the first to refer to an existing code
+            # snippet.
+
+            # Record this code snippet as referred to *AND* convert the
+            # stringified index of this code snippet into that integer index
+            # in-place.
+            func_codes_referred[func_code_index] = True
+            func_code_split[func_code_split_index] = func_code_index
+
+    # If one or more code snippets are referred to by *NO* placeholder, raise an
+    # exception.
+    if not all(func_codes_referred):
+        raise BeartypeDecorHintPepException(
+            f'{EXCEPTION_PREFIX_HINT}code snippet '
+            f'{func_codes_referred.index(False)} '
+            f'referred to by no placeholder:\n{func_codes}'
+        )
+    # Else, each code snippet other than the root code snippet is referred to
+    # by exactly one placeholder.
+
+    # List of all substrings to be joined into the code snippet to be returned.
+    func_code_substrs: List[str] = []
+
+    # Stack of 2-tuples "(func_code_split, func_code_split_index)" describing
+    # partially emitted code snippets, where "func_code_split" is the list of
+    # substrings split from such a snippet and "func_code_split_index" is the
+    # 0-based index of the next substring of that list to be emitted,
+    # initialized to the root code snippet.
+    func_codes_stack = [(func_codes_split[0], 0)]
+
+    # While one or more code snippets remain to be emitted...
+    while func_codes_stack:
+        # Pop the most recently pushed partially emitted code snippet.
+        func_code_split, func_code_split_index = func_codes_stack.pop()
+
+        # Emit the next literal substring of this snippet.
+        func_code_substrs.append(func_code_split[func_code_split_index])
+
+        # If this substring is succeeded by a placeholder...
+        if func_code_split_index + 1 < len(func_code_split):
+            # Resume this snippet *AFTER* that placeholder later.
+            func_codes_stack.append(
+                (func_code_split, func_code_split_index + 2))
+
+            # Emit the child snippet referred to by that placeholder first.
+            func_codes_stack.append((func_codes_split[
+                func_code_split[func_code_split_index + 1]], 0))  # type: ignore[index]
+        # Else, this substring is the last substring of this snippet, which is
+        # now fully emitted.
+
+    # Join these substrings into the code snippet to be returned.
+    return ''.join(func_code_substrs)
@@ -130,7 +130,10 @@ against a parent **standard sequence type** (i.e., PEP-compliant type hint
 accepting exactly one subscripted type hint unconditionally constraining *all*
 items of this pith, which necessarily satisfies the
 :class:`collections.abc.Sequence` protocol with guaranteed ``O(1)`` indexation
-across all sequence items).
+across all sequence items) *or* **standard reiterable type** (e.g.,
+``set[int]``) under the default constant-time strategy, where
+``{hint_child_placeholder}`` type-checks either a randomly indexed item of this
+sequence *or* the next item of this reiterable (respectively).
 
 Caveats
 -------
@@ -169,6 +172,153 @@ randomly indexed item of the current pith (which, by definition, *must* be a
 standard sequence).
 '''
 
+PEP484585_CODE_HINT_REITERABLE_ARGS_1_PITH_CHILD_EXPR = (
+    '''{get_item_expr}({pith_curr_var_name})''')
+'''
+:pep:`484`- and :pep:`585`-compliant Python expression yielding the value of the
+next item of the current pith (which, by definition, *must* be a standard
+reiterable like a set), where ``{get_item_expr}`` evaluates to the
+:func:`beartype._check.checkreiter.get_reiterable_nonempty_item_next` getter.
+
+This expression is embedded in the :data:`.PEP484585_CODE_HINT_SEQUENCE_ARGS_1`
+snippet, whose ``not {pith_curr_var_name} or`` guard guarantees this pith to be
+non-empty as that getter requires.
+'''
+
+# ....................{ HINT ~ pep : (484|585) : iter     }....................
+PEP484585_CODE_HINT_SEQUENCE_ARGS_1_ITER = '''(
+{indent_curr}    # True only if this pith is of this sequence type.
+{indent_curr}    isinstance({pith_curr_assign_expr}, {hint_curr_expr}) and
+{indent_curr}    # True only if all iterated items of this pith deeply satisfy
+{indent_curr}    # this hint.
+{indent_curr}    {all_expr}(
+{indent_curr}        {hint_child_placeholder}
+{indent_curr}        for {pith_child_var_name} in {pith_curr_iter_expr}
+{indent_curr}    )
+{indent_curr})'''
+'''
+:pep:`484`- and :pep:`585`-compliant code snippet type-checking the current pith
+against a parent **standard sequence type** under a **non-constant-time
+strategy** (i.e., either :attr:`beartype.BeartypeStrategy.On` or
+:attr:`beartype.BeartypeStrategy.Ologn`), deeply type-checking each item of
+this pith yielded by the ``{pith_curr_iter_expr}`` iterable (e.g., either this
+pith itself *or* a pseudo-random subset of this pith) by iterating a generator
+expression whose iteration variable ``{pith_child_var_name}`` is the child pith
+type-checked by the child code embedded as ``{hint_child_placeholder}``.
+``{all_expr}`` evaluates to either:
+
+* *Without* a deadline, the :func:`all` builtin.
+* *With* a deadline (i.e., a non-:data:`None`
+  :attr:`beartype.BeartypeConf.check_time_max_multiplier`), the
+  :func:`beartype._check.checktime.is_all_items_timed` tester, which accounts
+  for the time consumed by this type-check.
+
+Caveats
+-------
+**The child pith is the iteration variable of this generator expression rather
+than an assignment expression.** :pep:`572` prohibits assignment expressions
+from rebinding comprehension iteration variables. Since the child pith is
+already localized to a unique local variable, child code need *not* (and thus
+does *not*) relocalize that variable to yet another local variable.
+
+**The** ``{pith_curr_iter_expr}`` **expression cannot contain assignment
+expressions.** :pep:`572` prohibits assignment expressions in the iterable
+expressions of comprehensions. Since that expression only ever refers to the
+current pith by its variable name, this constraint is trivially satisfied.
+'''
+
+
+PEP484585_CODE_HINT_SEQUENCE_ARGS_1_ITER_TYPE = '''(
+{indent_curr}    # True only if this pith is of this sequence type.
+{indent_curr}    isinstance({pith_curr_assign_expr}, {hint_curr_expr}) and
+{indent_curr}    # True only if all iterated items of this pith are instances of
+{indent_curr}    # this type.
+{indent_curr}    {all_expr}(map(isinstance, {pith_curr_iter_expr}, {repeat_expr}({hint_child_expr})))
+{indent_curr})'''
+'''
+:pep:`484`- and :pep:`585`-compliant code snippet type-checking the current pith
+against a parent **standard sequence type** subscripted by a child
+PEP-noncompliant isinstanceable type (e.g., ``list[int]``) under a
+**non-constant-time strategy** (i.e., either
+:attr:`beartype.BeartypeStrategy.On` or :attr:`beartype.BeartypeStrategy.Ologn`).
+
+This snippet is an optimization of the more general
+:data:`.PEP484585_CODE_HINT_SEQUENCE_ARGS_1_ITER` snippet. Whereas that snippet
+resumes a pure-Python generator expression for each item of this pith, this
+snippet delegates iteration to the C-based :func:`map` builtin passed the
+C-based :func:`isinstance` builtin and an infinite C-based
+:func:`itertools.repeat` iterator yielding this type. Doing so avoids *all*
+per-item bytecode dispatch, reducing the per-item cost of type-checking to
+roughly that of a hand-written :func:`isinstance` loop. As in that snippet,
+``{all_expr}`` evaluates to either the :func:`all` builtin *or* the
+:func:`beartype._check.checktime.is_all_items_timed` tester.
+'''
+
+
+PEP484585_CODE_HINT_SEQUENCE_ARGS_1_RANDOM_PITH_ITER_EXPR = (
+    f'''{{iter_items_expr}}({{pith_curr_var_name}}, {VAR_NAME_RANDOM_INT})''')
+'''
+:pep:`484`- and :pep:`585`-compliant Python expression yielding an iterable over
+a subset of the items of the current pith (which, by definition, *must* be a
+standard sequence) derived from the current pseudo-random integer, where
+``{iter_items_expr}`` evaluates to either:
+
+* Under the **logarithmic-time strategy** (i.e.,
+  :attr:`beartype.BeartypeStrategy.Ologn`) *without* a deadline, the
+  :func:`beartype._util.kind.sequence.utilseqiter.iter_sequence_items_ologn`
+  generator.
+* Under any non-constant strategy *with* a deadline (i.e., a non-:data:`None`
+  :attr:`beartype.BeartypeConf.check_time_max_multiplier`), a function created
+  by the :func:`beartype._check.checktime.make_iter_sequence_items_timed`
+  factory.
+'''
+
+# ....................{ HINT ~ pep : (484|585) : mapping   }....................
+PEP484585_CODE_HINT_MAPPING = '''(
+{indent_curr}    # True only if this pith is of this mapping type.
+{indent_curr}    isinstance({pith_curr_assign_expr}, {hint_curr_expr}) and
+{indent_curr}    # True only if either this pith is empty *OR* this pith is
+{indent_curr}    # both non-empty and the next key-value pair sampled from
+{indent_curr}    # this pith deeply satisfies these hints.
+{indent_curr}    (not {pith_curr_var_name} or (
+{indent_curr}        # Localize this pair to a local variable. Since this
+{indent_curr}        # pair is a non-empty tuple, this pair is truthy.
+{indent_curr}        ({pith_item_var_name} := {get_item_expr}({pith_curr_var_name})) and
+{indent_curr}        {hint_child_placeholders}
+{indent_curr}    ))
+{indent_curr})'''
+'''
+:pep:`484`- and :pep:`585`-compliant code snippet type-checking the current pith
+against a parent **standard mapping type** (i.e., PEP-compliant type hint
+accepting exactly two subscripted type hints unconditionally constraining *all*
+keys and values of this pith, which necessarily satisfies the
+:class:`collections.abc.Mapping` protocol) in amortized ``O(1)`` time, where:
+
+* ``{get_item_expr}`` evaluates to the
+  :func:`beartype._check.checkreiter.get_mapping_nonempty_item_next` getter.
+* ``{hint_child_placeholders}`` is either the placeholder for the child key
+  hint, the placeholder for the child value hint, *or* both delimited by
+  ``and`` (when neither of these child hints is ignorable).
+'''
+
+
+PEP484585_CODE_HINT_MAPPING_KEY_PITH_CHILD_EXPR = '''{pith_item_var_name}[0]'''
+'''
+:pep:`484`- and :pep:`585`-compliant Python expression yielding the key of the
+sampled key-value pair of the current pith (which, by definition,
+*must* be a standard mapping) previously localized by the
+:data:`.PEP484585_CODE_HINT_MAPPING` snippet.
+'''
+
+
+PEP484585_CODE_HINT_MAPPING_VALUE_PITH_CHILD_EXPR = '''{pith_item_var_name}[1]'''
+'''
+:pep:`484`- and :pep:`585`-compliant Python expression yielding the value of the
+sampled key-value pair of the current pith (which, by definition,
+*must* be a standard mapping) previously localized by the
+:data:`.PEP484585_CODE_HINT_MAPPING` snippet.
+'''
+
 # ....................{ HINT ~ pep : (484|585) : tuple     }....................
 PEP484585_CODE_HINT_TUPLE_FIXED_PREFIX = '''(
 {indent_curr}    # True only if this pith is a tuple.
@@ -178,6 +328,16 @@ PEP484585_CODE_HINT_TUPLE_FIXED_PREFIX = '''(
 type-checking the current pith against each subscripted child hint of an
 itemized :class:`typing.Tuple` type of the form ``typing.Tuple[{typename1},
 {typename2}, ..., {typenameN}]``.
+
+Caveats
+-------
+**Code generated by this and related snippets type-checks all items of
+fixed-length tuples regardless of type-checking strategy.** Since the length
+of fixed-length tuples is bounded by the number of child hints subscripting
+those tuples, doing so is already ``O(1)`` with respect to the pith. Ergo, both
+the default constant-time strategy :attr:`beartype.BeartypeStrategy.O1` *and*
+the linear-time strategy :attr:`beartype.BeartypeStrategy.On` generate the
+same code for fixed-length tuples.
 '''
 
 
@@ -326,6 +486,54 @@ See Also
     Further details.
 '''
 
+# ....................{ HINT ~ pep : 484 : union : hits    }....................
+PEP484_CODE_HINT_UNION_HITS_PITH_ASSIGN = '''
+{{indent_curr}}    # False only after localizing this pith, enabling the branches below
+{{indent_curr}}    # to be safely reordered.
+{{indent_curr}}    ({pith_curr_assign_expr}) is not {pith_curr_var_name} or'''
+'''
+:pep:`484`-compliant code snippet localizing the current pith *before* the
+counted branches type-checking that pith against each subscripted argument of a
+:class:`typing.Union` type hint under the non-default
+:attr:`beartype.BeartypeConf.union_reorder_threshold` option.
+
+Since these branches are subsequently reordered, no branch may assume itself to
+be the first branch evaluated and thus localize that pith itself.
+'''
+
+
+PEP484_CODE_HINT_UNION_HITS_CHILD_PEP = '''
+{{indent_curr}}    ({hint_child_placeholder} and {hits_name}({branch_index})) or'''
+'''
+:pep:`484`-compliant code snippet type-checking the current pith against the
+current PEP-compliant child argument subscripting a parent :class:`typing.Union`
+type hint *and* counting each satisfaction of that argument with the
+:class:`beartype._check.checkunion.UnionBranchHits` counter named
+``{hits_name}``.
+
+See Also
+--------
+:data:`PEP484_CODE_HINT_UNION_CHILD_PEP`
+    Further details.
+'''
+
+
+PEP484_CODE_HINT_UNION_HITS_CHILD_NONPEP = '''
+{{indent_curr}}    # True only if this pith is of one of these types.
+{{indent_curr}}    (isinstance({pith_curr_var_name}, {hint_curr_expr}) and {hits_name}({branch_index})) or'''
+'''
+:pep:`484`-compliant code snippet type-checking the current pith against *all*
+PEP-noncompliant child arguments subscripting a parent :class:`typing.Union`
+type hint *and* counting each satisfaction of those arguments with the
+:class:`beartype._check.checkunion.UnionBranchHits` counter named
+``{hits_name}``.
+
+See Also
+--------
+:data:`PEP484_CODE_HINT_UNION_CHILD_PEP`
+    Further details.
+'''
+
 # ....................{ HINT ~ pep : 586                   }....................
 PEP586_CODE_HINT_PREFIX = '''(
 {{indent_curr}}    # True only if this pith is of one of these literal types.
@@ -65,7 +65,7 @@ from beartype._data.func.datafuncarg import ARG_NAME_RETURN
 from beartype._data.func.datafunc import METHOD_NAMES_DUNDER_BINARY
 from beartype._check.checkcall import BeartypeCall
 from beartype._check.forward.fwdmain import resolve_hint
-from beartype._util.cache.map.utilmapbig import CacheUnboundedStrong
+from beartype._util.cache.utilcachepolicy import make_cache
 from beartype._util.hint.utilhinttest import is_hint_uncached
 from beartype._util.hint.pep.proposal.pep484.utilpep484union import (
     make_hint_pep484_union)
@@ -283,10 +283,9 @@ def coerce_hint_any(hint: object) -> Any:
     * A **PEP-compliant uncached type hint** (i.e., hint *not* already
       internally cached by its parent class or module), this function:
 
-      * If this hint has already been passed to a prior call of this function,
-        returns the semantically equivalent PEP-compliant type hint having the
-        same machine-readable representation as this hint cached by that call.
-        Doing so deduplicates this hint, which both:
+      * If an equal copy of this hint has already been passed to a prior call
+        of this function, returns that copy cached by that call. Doing so
+        deduplicates this hint, which both:
 
         * Minimizes space complexity across the lifetime of this process.
         * Minimizes time complexity by enabling beartype-specific memoized
@@ -294,8 +293,11 @@ def coerce_hint_any(hint: object) -> Any:
           when repeatedly passed copies of this hint nonetheless sharing the
           same machine-readable representation.
 
-      * Else, internally caches this hint with a thread-safe global cache and
-        returns this hint as is.
+      * Else if *no* hint having the same machine-readable representation as
+        this hint has been passed to a prior call of this function, internally
+        caches this hint with a thread-safe global cache and returns this hint
+        as is.
+      * Else, returns this hint as is (see caveats below).
 
       Uncached hints include:
 
@@ -366,6 +368,31 @@ def coerce_hint_any(hint: object) -> Any:
     for :math:`n` the size of the inheritance hierarchy of this hint, this
     function should be called sparingly.
 
+    **This function interns hints keyed only by their machine-readable
+    representations.** These representations are *not* unique. Unequal hints
+    may share the same representation, as with hints subscripted by distinct
+    classes sharing the same fully-qualified name (e.g., classes locally
+    redefined by each call to the same function):
+
+    .. code-block:: python
+
+       >>> def make_class():
+       ...     class MuhClass(object): pass
+       ...     return MuhClass
+       >>> MuhClassA = make_class()
+       >>> MuhClassB = make_class()
+       >>> repr(list[MuhClassA]) == repr(list[MuhClassB])
+       True
+       >>> list[MuhClassA] == list[MuhClassB]
+       False
+
+    This function thus only returns a previously cached hint equal to the
+    passed hint. If the passed hint instead merely shares the same
+    representation as that cached hint, this function returns the passed hint
+    as is *without* deduplicating that hint. Since only the first such hint is
+    cached, subsequent unequal hints sharing that representation are *not*
+    deduplicated and thus memoized less efficiently -- but still correctly.
+
     This function intentionally does *not* cache :pep:`484`-compliant generics
     subscripted by type variables under Python < 3.9. Those hints are
     technically uncached but silently treated by this function as self-cached
@@ -407,15 +434,33 @@ def coerce_hint_any(hint: object) -> Any:
     #   copy of this hint originally passed to a prior call of this function.
     if is_hint_uncached(hint):
         # print(f'Self-caching type hint {repr(hint)}...')
-        return _hint_repr_to_hint.cache_or_get_cached_value(
+
+        # First copy of this hint cached under the machine-readable
+        # representation of this hint, caching this hint if this is the first.
+        hint_cached = _hint_repr_to_hint.cache_or_get_cached_value(
             key=repr(hint), value=hint)
+
+        # If that copy is either this hint *OR* equal to this hint, return that
+        # copy.
+        #
+        # Note that machine-readable representations are *NOT* unique.
+        # Distinct hints subscripted by distinct classes with the same
+        # fully-qualified name (e.g., classes locally redefined by each call to
+        # the same function) share the same representation but are unequal
+        # (e.g., "list[muh_func.<locals>.MuhClass]"). Returning that copy for
+        # such a hint would silently type-check against the wrong class.
+        if hint_cached is hint or hint_cached == hint:
+            return hint_cached
+        # Else, that copy is a distinct hint that merely shares the same
+        # representation as this hint. In this case, preserve this hint as is
+        # *WITHOUT* deduplicating this hint.
     # Else, this hint is (hopefully) self-caching.
 
     # Return this uncoerced hint as is.
     return hint
 
 # ....................{ PRIVATE ~ mappings                 }....................
-_hint_repr_to_hint = CacheUnboundedStrong()
+_hint_repr_to_hint = make_cache()
 '''
 **Type hint cache** (i.e., thread-safe cache mapping from the machine-readable
 representations of all non-self-cached type hints to cached singleton instances
@@ -461,6 +506,12 @@ rather than the :func:`functools.lru_cache` decorator. Why? Because:
   temporarily caching hints in an LRU cache is pointless, as there are *no*
   space savings in dropping stale references to unused hints.
 
+  Long-lived processes dynamically creating type hints at runtime (e.g.,
+  :pep:`586`-compliant literals) violate these assumptions. This cache is thus
+  created by the :func:`beartype._util.cache.utilcachepolicy.make_cache`
+  factory, which instead bounds or weakens this cache when the
+  ``${BEARTYPE_CACHE_POLICY}`` environment variable is set.
+
 **This dictionary intentionally caches machine-readable representation strings
 hashes rather than alternative keys** (e.g., actual hashes). Why? Disambiguity.
 Although comparatively less efficient in both space and time to construct than
@@ -26,7 +26,6 @@ from beartype._check.convert.convreduce import reduce_hint
 from beartype._conf.confcls import BeartypeConf
 from beartype._data.func.datafuncarg import ARG_NAME_RETURN
 from beartype._data.hint.datahinttyping import TypeStack
-from beartype._util.cache.map.utilmapbig import CacheUnboundedStrong
 from beartype._util.error.utilerrorraise import EXCEPTION_PLACEHOLDER
 from beartype._util.hint.pep.proposal.pep484585.utilpep484585func import (
     reduce_hint_pep484585_func_return)
@@ -182,6 +181,16 @@ def sanify_hint_root_func(
         exception_prefix=exception_prefix,
     )
 
+    # Intern this reduced hint (i.e., deduplicate this hint against all prior
+    # copies of this hint sharing the same machine-readable representation).
+    # Although the above coercion already interned the unreduced hint,
+    # different unreduced hints may reduce to different copies of the same
+    # reduced hint (e.g., two PEP 695-compliant type aliases declared in
+    # different modules whose values are both "list[int]"). Interning this
+    # reduced hint enables memoized callables downstream (e.g., the
+    # make_check_expr() code factory) to reuse work performed for those copies.
+    hint = coerce_hint_any(hint)
+
     # Return this sanified hint.
     return hint
 
@@ -259,6 +268,10 @@ def sanify_hint_root_statement(
     # sanify_hint_root_func() for further commentary.
     hint = reduce_hint(hint=hint, conf=conf, exception_prefix=exception_prefix)
 
+    # Intern this reduced hint. See sanify_hint_root_func() for further
+    # commentary.
+    hint = coerce_hint_any(hint)
+
     # Return this sanified hint.
     return hint
 
@@ -329,49 +342,3 @@ def sanify_hint_any(
         pith_name=pith_name,
         exception_prefix=exception_prefix,
     )
-
-# ....................{ PRIVATE ~ mappings                 }....................
-_HINT_REPR_TO_HINT = CacheUnboundedStrong()
-'''
-**Type hint cache** (i.e., thread-safe cache mapping from the machine-readable
-representations of all non-self-cached type hints to those hints).**
-
-This cache caches:
-
-* :pep:`585`-compliant type hints, which do *not* cache themselves.
-
-This cache does *not* cache:
-
-* Type hints declared by the :mod:`typing` module, which implicitly cache
-  themselves on subscription thanks to inscrutable metaclass magic.
-* :pep:`563`-compliant **deferred type hints** (i.e., type hints persisted as
-  evaluable strings rather than actual type hints). Ideally, this cache would
-  cache the evaluations of *all* deferred type hints. Sadly, doing so is
-  infeasible in the general case due to global and local namespace lookups
-  (e.g., ``Dict[str, int]`` only means what you think it means if an
-  importation resembling ``from typing import Dict`` preceded that type hint).
-
-Design
-------
-**This dictionary is intentionally thread-safe.** Why? Because this dictionary
-is used to modify the ``__attributes__`` dunder variable of arbitrary callables.
-Since most of those callables are either module- or class-scoped, that variable
-is effectively global. To prevent race conditions between competing threads
-contending over that global variable, this dictionary *must* be thread-safe.
-
-This dictionary is intentionally designed as a naive dictionary rather than a
-robust LRU cache, for the same reasons that callables accepting hints are
-memoized by the :func:`beartype._util.cache.utilcachecall.callable_cached`
-rather than the :func:`functools.lru_cache` decorator. Why? Because:
-
-* The number of different type hints instantiated across even worst-case
-  codebases is negligible in comparison to the space consumed by those hints.
-* The :attr:`sys.modules` dictionary persists strong references to all
-  callables declared by previously imported modules. In turn, the
-  ``func.__annotations__`` dunder dictionary of each such callable persists
-  strong references to all type hints annotating that callable. In turn, these
-  two statements imply that type hints are *never* garbage collected but
-  instead persisted for the lifetime of the active Python process. Ergo,
-  temporarily caching hints in an LRU cache is pointless, as there are *no*
-  space savings in dropping stale references to unused hints.
-'''
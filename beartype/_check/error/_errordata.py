@@ -17,6 +17,8 @@ from beartype.typing import (
 )
 from beartype._data.hint.pep.sign.datapepsigncls import HintSign
 from beartype._data.hint.pep.sign.datapepsignset import (
+    HINT_SIGNS_MAPPING,
+    HINT_SIGNS_REITERABLE_ARGS_1,
     HINT_SIGNS_SEQUENCE_ARGS_1,
     HINT_SIGNS_ORIGIN_ISINSTANCEABLE,
     HINT_SIGNS_UNION,
@@ -62,6 +64,10 @@ def _init() -> None:
         find_cause_union)
     from beartype._check.error._pep._pep484585._errorgeneric import (
         find_cause_generic)
+    from beartype._check.error._pep._pep484585._errormapping import (
+        find_cause_mapping)
+    from beartype._check.error._pep._pep484585._errorreiterable import (
+        find_cause_reiterable_args_1)
     from beartype._check.error._pep._pep484585._errorsequence import (
         find_cause_sequence_args_1,
         find_cause_tuple,
@@ -78,6 +84,15 @@ def _init() -> None:
         HINT_SIGN_TO_GET_CAUSE_FUNC[pep_sign_origin_isinstanceable] = (
             find_cause_type_instance_origin)
 
+    # Map each mapping sign to its corresponding getter.
+    for pep_sign_mapping in HINT_SIGNS_MAPPING:
+        HINT_SIGN_TO_GET_CAUSE_FUNC[pep_sign_mapping] = find_cause_mapping
+
+    # Map each 1-argument reiterable sign to its corresponding getter.
+    for pep_sign_reiterable_args_1 in HINT_SIGNS_REITERABLE_ARGS_1:
+        HINT_SIGN_TO_GET_CAUSE_FUNC[pep_sign_reiterable_args_1] = (
+            find_cause_reiterable_args_1)
+
     # Map each 1-argument sequence sign to its corresponding getter.
     for pep_sign_sequence_args_1 in HINT_SIGNS_SEQUENCE_ARGS_1:
         HINT_SIGN_TO_GET_CAUSE_FUNC[pep_sign_sequence_args_1] = (
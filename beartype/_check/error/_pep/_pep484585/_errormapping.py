@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2024 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype** :pep:`484`- and :pep:`585`-compliant **mapping type hint violation
+describers** (i.e., functions returning human-readable strings explaining
+violations of :pep:`484`- and :pep:`585`-compliant mapping type hints).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                            }....................
+from beartype._data.hint.pep.sign.datapepsignset import HINT_SIGNS_MAPPING
+from beartype._check.error._errorcause import ViolationCause
+from beartype._check.error._errortype import (
+    find_cause_type_instance_origin)
+from beartype._check.error._util.errorutilcolor import (
+    color_repr,
+    color_type,
+)
+from beartype._util.hint.utilhinttest import is_hint_ignorable
+from beartype._util.text.utiltextlabel import label_object_type
+from beartype._util.text.utiltextrepr import represent_object
+
+# ....................{ GETTERS                            }....................
+def find_cause_mapping(cause: ViolationCause) -> ViolationCause:
+    '''
+    Output cause describing whether the pith of the passed input cause either
+    satisfies or violates the **standard mapping type hint** (i.e.,
+    PEP-compliant type hint accepting exactly two subscripted arguments
+    constraining *all* keys and values of this object, which necessarily
+    satisfies the :class:`collections.abc.Mapping` protocol) of that cause.
+
+    Parameters
+    ----------
+    cause : ViolationCause
+        Input cause providing this data.
+
+    Returns
+    ----------
+    ViolationCause
+        Output cause type-checking this data.
+    '''
+    assert isinstance(cause, ViolationCause), f'{repr(cause)} not cause.'
+    assert cause.hint_sign in HINT_SIGNS_MAPPING, (
+        f'{repr(cause.hint)} not mapping hint.')
+
+    # Assert this mapping was subscripted by exactly two arguments. Note that
+    # the "typing" module should have already guaranteed this on our behalf.
+    assert len(cause.hint_childs) == 2, (
+        f'Mapping hint {repr(cause.hint)} subscripted by '
+        f'{len(cause.hint_childs)} != 2.')
+
+    # Shallow output cause to be returned, type-checking only whether this path
+    # is an instance of the type originating this hint (e.g., "dict" for
+    # "dict[str, int]").
+    cause_shallow = find_cause_type_instance_origin(cause)
+
+    # If this pith is *NOT* an instance of this type, return this shallow cause.
+    if cause_shallow.cause_str_or_none is not None:
+        return cause_shallow
+    # Else, this pith is an instance of this type and is thus a mapping.
+    #
+    # If this mapping is empty, all keys and values of this mapping (of which
+    # there are none) are valid. Just go with it, people.
+    elif not cause.pith:
+        return cause
+    # Else, this mapping is non-empty.
+
+    # Child key and value hints subscripting this parent hint.
+    hint_child_key, hint_child_value = cause.hint_childs
+
+    # For each key and value of this mapping...
+    #
+    # Note that the parent @beartype-generated wrapper function type-checked
+    # the next pair sampled from an iterator over this mapping cached by the
+    # get_mapping_nonempty_item_next() getter, whose state has since advanced.
+    # Since that pair is *NOT* reproducible, type-check *ALL* pairs of this
+    # mapping in O(n) time. Since this function is only called to describe a
+    # known violation, this cost is only paid on failure.
+    for pith_key, pith_value in cause.pith.items():
+        # If the child key hint is unignorable...
+        if not is_hint_ignorable(hint_child_key):
+            # Deep output cause, type-checking whether this key satisfies this
+            # child key hint.
+            cause_deep = cause.permute(
+                pith=pith_key, hint=hint_child_key).find_cause()
+
+            # If this key is the cause of this failure...
+            if cause_deep.cause_str_or_none is not None:
+                # Human-readable substring prefixing this failure with metadata
+                # describing this key.
+                cause_deep.cause_str_or_none = (
+                    f'{color_type(label_object_type(cause.pith))} key '
+                    f'{cause_deep.cause_str_or_none}'
+                )
+
+                # Return this cause.
+                return cause_deep
+            # Else, this key is *NOT* the cause of this failure.
+        # Else, the child key hint is ignorable.
+
+        # If the child value hint is unignorable...
+        if not is_hint_ignorable(hint_child_value):
+            # Deep output cause, type-checking whether this value satisfies this
+            # child value hint.
+            cause_deep = cause.permute(
+                pith=pith_value, hint=hint_child_value).find_cause()
+
+            # If this value is the cause of this failure...
+            if cause_deep.cause_str_or_none is not None:
+                # Human-readable substring prefixing this failure with metadata
+                # describing this key and value.
+                cause_deep.cause_str_or_none = (
+                    f'{color_type(label_object_type(cause.pith))} key '
+                    f'{color_repr(represent_object(pith_key))} value '
+                    f'{cause_deep.cause_str_or_none}'
+                )
+
+                # Return this cause.
+                return cause_deep
+            # Else, this value is *NOT* the cause of this failure.
+        # Else, the child value hint is ignorable.
+
+    # Return this cause as is; all pairs of this mapping are valid,
+    # implying this mapping to deeply satisfy this hint.
+    return cause
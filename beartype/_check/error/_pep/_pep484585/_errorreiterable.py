@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2024 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype** :pep:`484`- and :pep:`585`-compliant **reiterable type hint
+violation describers** (i.e., functions returning human-readable strings
+explaining violations of :pep:`484`- and :pep:`585`-compliant reiterable type
+hints).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                            }....................
+from beartype._data.hint.pep.sign.datapepsignset import (
+    HINT_SIGNS_REITERABLE_ARGS_1)
+from beartype._check.error._errorcause import ViolationCause
+from beartype._check.error._errortype import (
+    find_cause_type_instance_origin)
+from beartype._check.error._util.errorutilcolor import color_type
+from beartype._util.hint.utilhinttest import is_hint_ignorable
+from beartype._util.text.utiltextlabel import label_object_type
+
+# ....................{ GETTERS                            }....................
+def find_cause_reiterable_args_1(cause: ViolationCause) -> ViolationCause:
+    '''
+    Output cause describing whether the pith of the passed input cause either
+    satisfies or violates the **single-argument reiterable type hint** (i.e.,
+    PEP-compliant type hint accepting exactly one subscripted argument
+    constraining *all* items of this object, which necessarily satisfies the
+    :class:`collections.abc.Collection` protocol *without* necessarily
+    supporting ``O(1)`` indexation) of that cause.
+
+    Unlike sequences and mappings, the single item of this reiterable
+    type-checked by the parent :func:`beartype.beartype`-generated wrapper
+    function under the constant-time strategy is *not* reproducible from the
+    pseudo-random integer of this cause. Instead, that item was sampled from an
+    iterator over this reiterable cached by the
+    :func:`beartype._check.checkreiter.get_reiterable_nonempty_item_next`
+    getter, whose state has since advanced. This function thus unconditionally
+    type-checks *all* items of this reiterable in ``O(n)`` time. Since this
+    function is only called to describe a known violation, this cost is only
+    paid on failure.
+
+    Parameters
+    ----------
+    cause : ViolationCause
+        Input cause providing this data.
+
+    Returns
+    ----------
+    ViolationCause
+        Output cause type-checking this data.
+    '''
+    assert isinstance(cause, ViolationCause), f'{repr(cause)} not cause.'
+    assert cause.hint_sign in HINT_SIGNS_REITERABLE_ARGS_1, (
+        f'{repr(cause.hint)} not 1-argument reiterable hint.')
+
+    # Assert this reiterable was subscripted by exactly one argument. Note that
+    # the "typing" module should have already guaranteed this on our behalf.
+    assert len(cause.hint_childs) == 1, (
+        f'1-argument reiterable hint {repr(cause.hint)} subscripted by '
+        f'{len(cause.hint_childs)} != 1.')
+
+    # Shallow output cause to be returned, type-checking only whether this path
+    # is an instance of the type originating this hint (e.g., "set" for
+    # "set[str]").
+    cause_shallow = find_cause_type_instance_origin(cause)
+
+    # If this pith is *NOT* an instance of this type, return this shallow cause.
+    if cause_shallow.cause_str_or_none is not None:
+        return cause_shallow
+    # Else, this pith is an instance of this type and is thus a reiterable.
+
+    # Child hint subscripting this parent hint.
+    hint_child = cause.hint_childs[0]
+
+    # If this child hint is ignorable, all items of this reiterable are valid.
+    if is_hint_ignorable(hint_child):
+        return cause
+    # Else, this child hint is unignorable.
+
+    # For each item of this reiterable...
+    for pith_item in cause.pith:
+        # Deep output cause, type-checking whether this item satisfies this
+        # child hint.
+        cause_deep = cause.permute(pith=pith_item, hint=hint_child).find_cause()
+
+        # If this item is the cause of this failure...
+        if cause_deep.cause_str_or_none is not None:
+            # Human-readable substring prefixing this failure with metadata
+            # describing this item.
+            cause_deep.cause_str_or_none = (
+                f'{color_type(label_object_type(cause.pith))} item '
+                f'{cause_deep.cause_str_or_none}'
+            )
+
+            # Return this cause.
+            return cause_deep
+        # Else, this item is *NOT* the cause of this failure. Silently continue
+        # to the next.
+
+    # Return this cause as is; all items of this reiterable are valid, implying
+    # this reiterable to deeply satisfy this hint.
+    return cause
@@ -13,6 +13,12 @@ This private submodule is *not* intended for importation by downstream callers.
 '''
 
 # ....................{ IMPORTS                            }....................
+from beartype.typing import (
+    Iterator,
+    Optional,
+    Tuple,
+)
+from beartype._conf.confenum import BeartypeStrategy
 from beartype._data.hint.pep.sign.datapepsigns import HintSignTuple
 from beartype._data.hint.pep.sign.datapepsignset import (
     HINT_SIGNS_SEQUENCE_ARGS_1)
@@ -24,6 +30,8 @@ from beartype._check.error._util.errorutiltext import represent_pith
 from beartype._util.hint.pep.proposal.pep484585.utilpep484585 import (
     is_hint_pep484585_tuple_empty)
 from beartype._util.hint.utilhinttest import is_hint_ignorable
+from beartype._util.kind.sequence.utilseqiter import (
+    iter_sequence_indices_ologn)
 from beartype._util.text.utiltextlabel import label_object_type
 
 # ....................{ GETTERS ~ sequence                 }....................
@@ -241,17 +249,48 @@ def _find_cause_sequence(cause: ViolationCause) -> ViolationCause:
             # zero or more 2-tuples of the form "(item_index, item)", where:
             # * "item_index" is the 0-based index of this item.
             # * "item" is an arbitrary item of this sequence.
-            pith_enumerator = None
-
-            # If this sequence was indexed by the parent @beartype-generated
-            # wrapper function by a pseudo-random integer in O(1) time,
-            # type-check *ONLY* the same index of this sequence also in O(1)
-            # time. Since the current call to that function failed a type-check,
-            # either this index is the index responsible for that failure *OR*
-            # this sequence is valid and another container is responsible for
-            # that failure. In either case, no other indices of this sequence
-            # need be checked.
-            if cause.random_int is not None:
+            pith_enumerator: Optional[Iterator[Tuple[int, object]]] = None
+
+            # If this sequence was iterated by the parent @beartype-generated
+            # wrapper function in O(n) time *OR* no pseudo-random integer was
+            # passed, type-check *ALL* indices of this sequence in O(n) time.
+            #
+            # Note that the linear-time strategy iterates over *ALL* items of
+            # this sequence regardless of whether a pseudo-random integer was
+            # also generated (e.g., for another container).
+            if (
+                cause.random_int is None or
+                cause.conf.strategy is BeartypeStrategy.On
+            ):
+                # Iterator yielding all indices and items of this sequence.
+                pith_enumerator = enumerate(cause.pith)
+                # print('Checking sequence in O(n) time!')
+            # Else, a pseudo-random integer was passed.
+            #
+            # If this sequence was iterated by the parent @beartype-generated
+            # wrapper function over a pseudo-random subset of approximately
+            # log2(n) indices in O(log n) time, type-check *ONLY* the same
+            # indices of this sequence also in O(log n) time. Since these
+            # indices are derived from the same pseudo-random integer by the
+            # same generator, these indices are exactly those previously
+            # type-checked by that function.
+            elif cause.conf.strategy is BeartypeStrategy.Ologn:
+                # Iterator yielding these indices and items of this sequence.
+                pith_enumerator = (
+                    (pith_item_index, cause.pith[pith_item_index])
+                    for pith_item_index in iter_sequence_indices_ologn(
+                        len(cause.pith), cause.random_int)
+                )
+                # print('Checking sequence in O(log n) time!')
+            # Else, this sequence was indexed by the parent @beartype-generated
+            # wrapper function by a pseudo-random integer in O(1) time. In this
+            # case, type-check *ONLY* the same index of this sequence also in
+            # O(1) time. Since the current call to that function failed a
+            # type-check, either this index is the index responsible for that
+            # failure *OR* this sequence is valid and another container is
+            # responsible for that failure. In either case, no other indices of
+            # this sequence need be checked.
+            else:
                 # 0-based index of this item calculated from this random
                 # integer in the *SAME EXACT WAY* as in the parent
                 # @beartype-generated wrapper function.
@@ -267,13 +306,10 @@ def _find_cause_sequence(cause: ViolationCause) -> ViolationCause:
                 # Iterator yielding only this 2-tuple.
                 pith_enumerator = iter((pith_enumeratable,))
                 # print(f'Checking item {pith_item_index} in O(1) time!')
-            # Else, this sequence was iterated by the parent
-            # @beartype-generated wrapper function in O(n) time. In this case,
-            # type-check *ALL* indices of this sequence in O(n) time as well.
-            else:
-                # Iterator yielding all indices and items of this sequence.
-                pith_enumerator = enumerate(cause.pith)
-                # print('Checking sequence in O(n) time!')
+
+            # If *NO* iterator was defined above, raise an exception.
+            assert pith_enumerator is not None, (
+                f'{repr(cause.hint)} sequence enumerator undefined.')
 
             # For each enumerated item of this (sub)sequence...
             for pith_item_index, pith_item in pith_enumerator:
@@ -84,6 +84,42 @@ def prefix_beartypeable_return_value(
         f'{color_repr(represent_object(return_value))} '
     )
 
+
+def prefix_beartypeable_return_stream_value(
+    func: Callable, stream_verb: str, stream_value: object) -> str:
+    '''
+    Human-readable label describing the passed trimmed value streamed through
+    the iterator, generator, or asynchronous generator returned by the passed
+    **decorated callable** (i.e., callable wrapped by the
+    :func:`beartype.beartype` decorator with a wrapper function type-checking
+    that callable) suffixed by delimiting whitespace.
+
+    Parameters
+    ----------
+    func : Callable
+        Decorated callable to be labelled.
+    stream_verb : str
+        Past-tense verb describing how this value streamed through that object
+        (e.g., ``"yielded"``, ``"sent"``, ``"returned"``).
+    stream_value : object
+        Value streamed through that object to be labelled.
+
+    Returns
+    ----------
+    str
+        Human-readable label describing this streamed value.
+    '''
+    assert isinstance(stream_verb, str), f'{repr(stream_verb)} not string.'
+
+    # Avoid circular import dependencies.
+    from beartype._check.error._util.errorutilcolor import color_repr
+
+    # Create and return this label.
+    return (
+        f'{prefix_beartypeable_return(func)}{stream_verb} value '
+        f'{color_repr(represent_object(stream_value))} '
+    )
+
 # ....................{ REPRESENTERS                       }....................
 def represent_pith(pith: object) -> str:
     '''
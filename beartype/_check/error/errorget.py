@@ -200,6 +200,7 @@ def get_hint_object_violation(
     pith_name: Optional[str] = None,
     cls_stack: TypeStack = None,
     random_int: Optional[int] = None,
+    exception_prefix: Optional[str] = None,
 ) -> Exception:
     '''
     Human-readable exception detailing the failure of the passed object to
@@ -293,6 +294,16 @@ def get_hint_object_violation(
 
         Defaults to :data:`None`, implying this exception handler runs in linear
         time by default.
+    exception_prefix : Optional[str], optional
+        Human-readable substring prefixing the message of this violation *or*
+        :data:`None` if this function should instead derive this substring from
+        the passed ``func`` and ``pith_name`` parameters. Callers type-checking
+        objects that are neither parameters nor returns of decorated callables
+        but are nonetheless associated with decorated callables (e.g., values
+        yielded by generators returned by decorated callables) should pass
+        this substring to describe those objects. Note that this parameter only
+        governs the message of this violation; the ``pith_name`` parameter still
+        governs the type of this violation. Defaults to :data:`None`.
 
     Returns
     -------
@@ -332,8 +343,9 @@ def get_hint_object_violation(
     # Type of violation to be raised.
     exception_cls: TypeException = None  # type: ignore[assignment]
 
-    # Substring prefixing the message of the violation to be raised below.
-    exception_prefix: str = None  # type: ignore[assignment]
+    # Substring prefixing the message of the violation to be raised below,
+    # defaulting to the substring passed by the caller if any.
+    exception_prefix_default: str = None  # type: ignore[assignment]
 
     # If the passed object is neither a parameter or return of a decorated
     # callable, this object was directly passed to either the
@@ -341,19 +353,33 @@ def get_hint_object_violation(
     # functions. In either case, set the above local variables appropriately.
     if pith_name is None:
         exception_cls = conf.violation_door_type
-        exception_prefix = 'Object '
+        exception_prefix_default = 'Object '
     # If the name of this parameter is the magic string implying the passed
     # object to be a return value, set the above local variables appropriately.
     elif pith_name == ARG_NAME_RETURN:
         exception_cls = conf.violation_return_type
-        exception_prefix = prefix_beartypeable_return_value(
-            func=func, return_value=obj)  # type: ignore[arg-type]
+
+        # If the caller passed *NO* prefix, default this prefix.
+        if exception_prefix is None:
+            exception_prefix_default = prefix_beartypeable_return_value(
+                func=func, return_value=obj)  # type: ignore[arg-type]
+        # Else, the caller passed a prefix.
     # Else, the passed object is a parameter. In this case, set the above local
     # variables appropriately.
     else:
         exception_cls = conf.violation_param_type
-        exception_prefix = prefix_beartypeable_arg_value(
-            func=func, arg_name=pith_name, arg_value=obj)  # type: ignore[arg-type]
+
+        # If the caller passed *NO* prefix, default this prefix.
+        if exception_prefix is None:
+            exception_prefix_default = prefix_beartypeable_arg_value(
+                func=func, arg_name=pith_name, arg_value=obj)  # type: ignore[arg-type]
+        # Else, the caller passed a prefix.
+
+    # If the caller passed *NO* prefix, default this prefix to that decided
+    # above.
+    if exception_prefix is None:
+        exception_prefix = exception_prefix_default
+    # Else, the caller passed a prefix. Preserve this prefix as is.
 
     # Uppercase the first character of this violation prefix for readability.
     exception_prefix = uppercase_str_char_first(exception_prefix)
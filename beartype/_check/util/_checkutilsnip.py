@@ -14,7 +14,8 @@ This private submodule is *not* intended for importation by downstream callers.
 
 # ....................{ IMPORTS                            }....................
 from beartype._check.checkmagic import (
-    ARG_NAME_GETRANDBITS,
+    ARG_NAME_RANDOM_INT_POP,
+    ARG_NAME_RANDOM_INT_REFILL,
     VAR_NAME_RANDOM_INT,
 )
 from beartype._util.text.utiltextmagic import CODE_INDENT_1
@@ -39,53 +40,30 @@ of that callable.
 '''
 
 # ....................{ CODE ~ init                        }....................
-#FIXME: Note that NumPy provides an efficient means of generating a large
-#number of pseudo-random integers all-at-once. The core issue there, of
-#course, is that we then need to optionally depend upon and detect NumPy,
-#which then requires us to split our random integer generation logic into two
-#parallel code paths that we'll then have to maintain -- and the two will be
-#rather different. In any case, here's how one generates a NumPy array
-#containing 100 pseudo-random integers in the range [0, 127]:
-#    random_ints = numpy.random.randint(128, size=100)
-#
-#To leverage that sanely, we'd need to:
-#* Globally cache that array somewhere.
-#* Globally cache the current index into that array.
-#* When NumPy is unimportable, fallback to generating a Python list containing
-#  the same number of pseudo-random integers in the same range.
-#* In either case, we'd probably want to wrap that logic in a globally
-#  accessible infinite generator singleton that returns another pseudo-random
-#  integer every time you iterate it. This assumes, of course, that iterating
-#  generators is reasonably fast in Python. (If not, just make that a getter
-#  method of a standard singleton object.)
-#* Replace the code snippet below with something resembling:
-#      '''
-#      __beartype_random_int = next(__beartype_random_int_generator)
-#      '''
-#Note that thread concurrency issues are probable ignorable here, but that
-#there's still a great deal of maintenance and refactoring that would need to
-#happen to sanely support this. In other words, ain't happenin' anytime soon.
-#FIXME: To support both NumPy and non-NumPy code paths transparently, design a
-#novel private data structure named "_BeartypeRNJesus" whose __next__() dunder
-#method transparently returns a new random integer. The implementation of that
-#method then handles all of the low-level minutiae like:
-#* Storing and iterating the 0-based index of the next index into an internally
-#  cached NumPy array created by calling numpy.random.randint().
-#* Creating a new cached NumPy array after exhausting the prior cached array.
-
 CODE_INIT_RANDOM_INT = f'''
-    # Generate and localize a sufficiently large pseudo-random integer for
-    # subsequent indexation in type-checking randomly selected container items.
-    {VAR_NAME_RANDOM_INT} = {ARG_NAME_GETRANDBITS}(32)'''
+    # Pop and localize a sufficiently large pseudo-random integer for
+    # subsequent indexation in type-checking randomly selected container items
+    # off the pseudo-random integer buffer, refilling that buffer if exhausted.
+    try:
+        {VAR_NAME_RANDOM_INT} = {ARG_NAME_RANDOM_INT_POP}()
+    except IndexError:
+        {VAR_NAME_RANDOM_INT} = {ARG_NAME_RANDOM_INT_REFILL}()'''
 '''
-PEP-specific code snippet generating and localizing a pseudo-random unsigned
+PEP-specific code snippet popping and localizing a pseudo-random unsigned
 32-bit integer for subsequent use in type-checking randomly indexed container
-items.
+items off the :data:`beartype._check.checkrandom.random_ints` buffer.
+
+Popping a pre-generated integer with the bound C-based :meth:`list.pop` method
+is faster than generating a new integer with the C-based
+:func:`random.getrandbits` function, which must both advance Python's Mersenne
+Twister *and* allocate a new integer on each call. Since the ``try`` block
+guarding this pop is zero-cost under Python >= 3.11 and nearly so under older
+Python versions, the rare refill of this buffer on exhaustion is effectively
+free for the common case.
 
 This bit length was intentionally chosen to correspond to the number of bits
 generated by each call to Python's C-based Mersenne Twister underlying the
-:func:`random.getrandbits` function called here. Exceeding this number of bits
-would cause that function to inefficiently call the Twister multiple times.
+:func:`random.getrandbits` function generating these integers.
 
 This bit length produces unsigned 32-bit integers efficiently representable as
 C-based atomic integers rather than **big numbers** (i.e., aggregations of
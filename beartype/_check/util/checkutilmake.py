@@ -15,7 +15,7 @@ This private submodule is *not* intended for importation by downstream callers.
 # ....................{ IMPORTS                            }....................
 from beartype.typing import Callable
 from beartype._check.checkmagic import (
-    ARG_NAME_GETRANDBITS,
+    ARG_NAME_RANDOM_INT_POP,
 )
 from beartype._check.util._checkutilsnip import (
     CODE_SIGNATURE_ARG,
@@ -143,7 +143,7 @@ def make_func_signature(
         # If the body of this wrapper requires a pseudo-random integer, append
         # code generating and localizing such an integer to this signature.
         CODE_INIT_RANDOM_INT
-        if ARG_NAME_GETRANDBITS in func_scope else
+        if ARG_NAME_RANDOM_INT_POP in func_scope else
         # Else, this body requires *NO* such integer. In this case, preserve
         # this signature as is.
         ''
@@ -22,7 +22,9 @@ callers.
 #FIXME: [DOCOS] Document all newly defined configuration parameters in our
 #reST-formatted docos, please -- including:
 #* "claw_is_pep526".
+#* "claw_is_pyc_hash".
 #* "hint_overrides".
+#* "is_lazy".
 #* "violation_door_type".
 #* "violation_param_type".
 #* "violation_return_type".
@@ -38,6 +40,7 @@ from beartype.typing import (
     TYPE_CHECKING,
     Dict,
     Optional,
+    Tuple,
 )
 from beartype._conf.confenum import (
     BeartypeStrategy,
@@ -50,6 +53,7 @@ from beartype._conf.confoverrides import (
 from beartype._conf.conftest import (
     default_conf_kwargs_after,
     default_conf_kwargs_before,
+    die_if_conf_args_uncacheable,
     die_if_conf_kwargs_invalid,
 )
 from beartype._conf._confget import get_is_color
@@ -73,12 +77,38 @@ class BeartypeConf(object):
 
     Attributes
     ----------
+    _check_stream_rate : Optional[float]
+        **Stream sampling rate** (i.e., fraction of the values yielded by and
+        sent to iterators, generators, and asynchronous generators returned by
+        :func:`beartype.beartype`-decorated callables to be type-checked as
+        those values stream through those objects) *or* :data:`None` if
+        :mod:`beartype` should only shallowly type-check those objects. See
+        also the :meth:`__new__` method docstring.
+    _check_time_max_multiplier : Optional[int]
+        **Deadline multiplier** (i.e., positive integer bounding the fraction of
+        the total running time of the active Python interpreter devoted to
+        non-constant type-checks) *or* :data:`None` if :mod:`beartype` should
+        never degrade non-constant type-checks. See also the :meth:`__new__`
+        method docstring.
     _claw_is_pep526 : bool
         :data:`True` only if type-checking **annotated variable assignments**
         (i.e., :pep:`526`-compliant assignments to local, global, class, and
         instance variables annotated by type hints) when importing modules
         under import hooks published by the :mod:`beartype.claw` subpackage. See
         also the :meth:`__new__` method docstring.
+    _claw_is_pyc_hash : bool
+        :data:`True` only if :mod:`beartype.claw` import hooks cache modules
+        they transform to :pep:`552`-compliant **hash-based bytecode files**
+        (i.e., ``.pyc`` files validated against a hash of the source of those
+        modules rather than the modification times of those sources). See also
+        the :meth:`__new__` method docstring.
+    _claw_loop_sample : Optional[Tuple[int, int]]
+        **Loop sampling schedule** (i.e., 2-tuple ``(first, every)`` of
+        non-negative integers instructing :mod:`beartype.claw` import hooks to
+        type-check statements in loop bodies only on the first ``first``
+        iterations and every ``every``-th iteration thereafter) *or*
+        :data:`None` if those hooks should type-check those statements on every
+        iteration. See also the :meth:`__new__` method docstring.
     _conf_args : tuple
         Tuple of the values of *all* possible keyword parameters (in arbitrary
         order) configuring this configuration.
@@ -113,6 +143,10 @@ class BeartypeConf(object):
     _is_debug : bool
         :data:`True` only if debugging :mod:`beartype`. See also the
         :meth:`__new__` method docstring.
+    _is_lazy : bool
+        :data:`True` only if deferring the generation of type-checking wrapper
+        functions for decorated callables until those callables are first
+        called. See also the :meth:`__new__` method docstring.
     _is_pep484_tower : bool
         :data:`True` only if enabling support for the :pep:`484`-compliant
         implicit numeric tower. See also the :meth:`__new__` method docstring.
@@ -143,6 +177,14 @@ class BeartypeConf(object):
         member) with which to implement all type-checks in the wrapper function
         dynamically generated by the :func:`beartype.beartype` decorator for
         the decorated callable.
+    _union_reorder_threshold : Optional[int]
+        **Union reordering threshold** (i.e., positive integer number of
+        type-checks of each union type hint by each
+        :func:`beartype.beartype`-generated wrapper function after which that
+        wrapper is regenerated to type-check the members of that union most
+        frequently matched so far first) *or* :data:`None` if :mod:`beartype`
+        should never reorder union members. See also the :meth:`__new__`
+        method docstring.
     violation_door_type : TypeException
         **DOOR violation type** (i.e., type of exception raised by the
         :func:`beartype.door.die_if_unbearable` type-checker when the object
@@ -194,13 +236,18 @@ class BeartypeConf(object):
     # cache dunder methods. Slotting has been shown to reduce read and write
     # costs by approximately ~10%, which is non-trivial.
     __slots__ = (
+        '_check_stream_rate',
+        '_check_time_max_multiplier',
         '_claw_is_pep526',
+        '_claw_is_pyc_hash',
+        '_claw_loop_sample',
         '_conf_args',
         '_conf_kwargs',
         '_hash',
         '_hint_overrides',
         '_is_color',
         '_is_debug',
+        '_is_lazy',
         '_is_pep484_tower',
         '_is_violation_door_warn',
         '_is_violation_param_warn',
@@ -208,6 +255,7 @@ class BeartypeConf(object):
         '_is_warning_cls_on_decorator_exception_set',
         '_repr',
         '_strategy',
+        '_union_reorder_threshold',
         '_violation_door_type',
         '_violation_param_type',
         '_violation_return_type',
@@ -219,13 +267,18 @@ class BeartypeConf(object):
     # Squelch false negatives from mypy. This is absurd. This is mypy. See:
     #     https://github.com/python/mypy/issues/5941
     if TYPE_CHECKING:
+        _check_stream_rate: Optional[float]
+        _check_time_max_multiplier: Optional[int]
         _claw_is_pep526: bool
+        _claw_is_pyc_hash: bool
+        _claw_loop_sample: Optional[Tuple[int, int]]
         _conf_args: tuple
         _conf_kwargs: DictStrToAny
         _hash: int
         _hint_overrides: BeartypeHintOverrides
         _is_color: Optional[bool]
         _is_debug: bool
+        _is_lazy: bool
         _is_pep484_tower: bool
         _is_violation_door_warn: bool
         _is_violation_param_warn: bool
@@ -233,6 +286,7 @@ class BeartypeConf(object):
         _is_warning_cls_on_decorator_exception_set: bool
         _repr: Optional[str]
         _strategy: BeartypeStrategy
+        _union_reorder_threshold: Optional[int]
         _violation_door_type: TypeException
         _violation_param_type: TypeException
         _violation_return_type: TypeException
@@ -256,14 +310,18 @@ class BeartypeConf(object):
         # Optional keyword-only parameters.
         *,
 
-        # Uncomment us when implementing O(n) type-checking, please.
-        # check_time_max_multiplier: Union[int, None] = 1000,
+        check_stream_rate: Optional[float] = None,
+        check_time_max_multiplier: Optional[int] = None,
         claw_is_pep526: bool = True,
+        claw_is_pyc_hash: bool = False,
+        claw_loop_sample: Optional[Tuple[int, int]] = None,
         hint_overrides: BeartypeHintOverrides = BEARTYPE_HINT_OVERRIDES_EMPTY,
         is_color: BoolTristateUnpassable = ARG_VALUE_UNPASSED,
         is_debug: bool = False,
+        is_lazy: bool = False,
         is_pep484_tower: bool = False,
         strategy: BeartypeStrategy = BeartypeStrategy.O1,
+        union_reorder_threshold: Optional[int] = None,
         violation_door_type: Optional[TypeException] = None,
         violation_param_type: Optional[TypeException] = None,
         violation_return_type: Optional[TypeException] = None,
@@ -293,38 +351,75 @@ class BeartypeConf(object):
 
         Parameters
         ----------
-        check_time_max_multiplier : Union[int, None] = 1000
+        check_stream_rate : Optional[float], optional
+            **Stream sampling rate** (i.e., floating-point number in the
+            half-open interval ``(0.0, 1.0]`` instructing :mod:`beartype` to
+            deeply type-check that fraction of the values streamed through
+            iterators, generators, and asynchronous generators returned by
+            :func:`beartype.beartype`-decorated callables) *or* :data:`None` if
+            :mod:`beartype` should only shallowly type-check those objects.
+
+            By default, the return of a callable annotated by an iterator or
+            generator hint (e.g., ``collections.abc.Iterator[int]``,
+            ``typing.Generator[str, bytes, float]``) is only shallowly
+            type-checked as an instance of the expected type. Deeply
+            type-checking the values produced by that iterator or generator
+            would require consuming it, which is infeasible.
+
+            When this rate is non-:data:`None`, :mod:`beartype` instead wraps
+            each returned iterator, generator, and asynchronous generator in a
+            thin proxy lazily type-checking values as they stream through that
+            proxy *without* materializing those values, including:
+
+            * Values yielded by that object against the yield type hint.
+            * Values explicitly sent to that object (e.g., via the
+              :meth:`generator.send` method) against the send type hint.
+            * The value returned by that object (i.e., the value of the
+              :exc:`StopIteration` exception terminating that object) against
+              the return type hint.
+
+            Yielded and sent values are sampled deterministically at this rate
+            (e.g., a rate of ``0.01`` type-checks one of every hundred values);
+            returned values are always type-checked. Defaults to :data:`None`,
+            in which case returned iterators and generators are returned as is.
+
+            Note that these proxies are *not* the original objects. Although
+            these proxies satisfy the same :mod:`collections.abc` protocols as
+            those objects (e.g., :class:`collections.abc.Generator`), these
+            proxies do *not* expose implementation-specific attributes of those
+            objects (e.g., the ``gi_frame`` attribute of generators).
+        check_time_max_multiplier : Optional[int], optional
             **Deadline multiplier** (i.e., positive integer instructing
-            :mod:`beartype` to prematurely halt the current type-check when the
-            total running time of the active Python interpreter exceeds this
-            integer multiplied by the running time consumed by both the current
-            type-check and all prior type-checks *and* the caller also passed a
-            non-default ``strategy``) *or* ``None`` if :mod:`beartype` should
-            never prematurely halt runtime type-checks.
+            :mod:`beartype` to progressively degrade non-constant type-checks
+            when the total running time of the active Python interpreter no
+            longer exceeds this integer multiplied by the running time consumed
+            by all prior type-checks *and* the caller also passed a non-default
+            ``strategy``) *or* :data:`None` if :mod:`beartype` should never
+            degrade runtime type-checks.
 
             Increase this quantity to type-check more container items at a cost
             of decreasing application responsiveness. Likewise, decrease this
             quantity to increase application responsiveness at a cost of
-            type-checking fewer container items.
+            type-checking fewer container items. For example, a multiplier of
+            20 devotes at most ~5% of the total runtime of the active Python
+            process to non-constant :mod:`beartype` type-checks over container
+            items.
 
             Ignored when ``strategy`` is :attr:`BeartypeStrategy.O1`, as that
             strategy is already effectively instantaneous; imposing deadlines
             and thus bureaucratic bookkeeping on that strategy would only
             reduce its efficiency for no good reason, which is a bad reason.
 
-            Defaults to 1000, in which case a maximum of %0.1 of the total
-            runtime of the active Python process will be devoted to performing
-            non-constant :mod:`beartype` type-checks over container items. This
-            default has been carefully tuned to strike a reasonable balance
-            between runtime type-check coverage and application responsiveness,
-            typically enabling smaller containers to be fully type-checked
-            without noticeably impacting codebase performance.
+            Defaults to :data:`None`, in which case non-constant type-checks
+            are never degraded.
 
             *Theory time.* Let:
 
-            * ``T`` be the total time this interpreter has been running.
-            * ``b`` be the total time :mod:`beartype` has spent type-checking in
-              this interpreter.
+            * ``T`` be the total time this interpreter has been running
+              (approximated as the time elapsed since :mod:`beartype` was first
+              imported).
+            * ``b`` be the total time :mod:`beartype` has spent type-checking
+              container items under this multiplier in this interpreter.
 
             Clearly, ``b <= T``. Generally, ``b <<<<<<< T`` (i.e., type-checks
             consume much less time than the total time consumed by the process).
@@ -334,13 +429,25 @@ class BeartypeConf(object):
             large nested container subject to the non-default ``strategy`` of
             :attr:`BeartypeStrategy.On`.
 
-            This deadline multiplier mitigates that worst-case behaviour.
-            Specifically, :mod:`beartype` will prematurely halt any iterative
-            type-check across a container when this constraint is triggered:
+            This deadline multiplier mitigates that worst-case behaviour. Let
+            ``K`` be this multiplier. Then each container type-check
+            progressively degrades as the budget ``b * K`` approaches ``T``:
 
-            .. code-block:: python
+            * If ``b * K < T / 2``, the configured ``strategy`` applies.
+            * Else if ``b * K < 3 * T / 4``, the container is type-checked as
+              under :attr:`BeartypeStrategy.Ologn`.
+            * Else if ``b * K < T``, the container is type-checked as under
+              :attr:`BeartypeStrategy.O1`.
+            * Else, the items of the container are *not* type-checked at all.
+
+            Under :attr:`BeartypeStrategy.On`, this constraint is additionally
+            re-evaluated periodically while iterating over a container, halting
+            that iteration as soon as ``b * K >= T``. Since ``b`` continues to
+            decrease relative to ``T`` while the process performs useful work,
+            degraded type-checks are transparently restored over time.
 
-               b * check_time_max_multiplier >= T
+            This multiplier currently applies to the same container hints as
+            :attr:`BeartypeStrategy.On`.
         claw_is_pep526 : bool, optional
             :data:`True` only if implicitly type-checking **annotated variable
             assignments** (i.e., :pep:`526`-compliant assignments to local,
@@ -364,6 +471,61 @@ class BeartypeConf(object):
             performance-sensitive modules *after* profiling those modules to
             suffer performance regressions under import hooks published by the
             :mod:`beartype.claw` subpackage. Defaults to :data:`True`.
+        claw_is_pyc_hash : bool, optional
+            :data:`True` only if import hooks published by the
+            :mod:`beartype.claw` subpackage cache the bytecode of modules they
+            transform to :pep:`552`-compliant **checked hash-based bytecode
+            files** rather than standard timestamp-based bytecode files. If
+            this boolean is:
+
+            * :data:`False`, those bytecode files are validated by comparing
+              the modification time and size of the source of those modules
+              recorded in those files against those of that source on disk.
+              Since that source is only hashed by its modification time,
+              environments normalizing modification times (e.g., reproducible
+              container builds) both defeat this validation *and* risk loading
+              stale bytecode transformed from older sources.
+            * :data:`True`, those bytecode files are instead keyed on (in
+              order):
+
+              * A hash of the source of those modules, embedded in those files
+                and validated on each import.
+              * The version of :mod:`beartype` transforming those modules,
+                embedded in the filenames of those files.
+              * A digest of this configuration, also embedded in the filenames
+                of those files.
+
+              Bytecode files cached under this boolean are thus safely reusable
+              across builds and machines, regardless of modification times.
+              Since validating these files requires reading and hashing the
+              source of those modules on each import, importing these files is
+              marginally slower than importing timestamp-based bytecode files.
+
+            Defaults to :data:`False`.
+        claw_loop_sample : Optional[Tuple[int, int]], optional
+            **Loop sampling schedule** (i.e., 2-tuple ``(first, every)`` of a
+            non-negative integer ``first`` and a positive integer ``every``)
+            *or* :data:`None`. If this schedule is:
+
+            * :data:`None`, import hooks published by the :mod:`beartype.claw`
+              subpackage type-check each statement they type-check (e.g.,
+              annotated variable assignments enabled by ``claw_is_pep526``) on
+              *every* execution of that statement.
+            * Non-:data:`None`, those import hooks instead type-check each such
+              statement residing in the body of a ``for`` or ``while`` loop
+              only on the first ``first`` executions of that statement *and*
+              every ``every``-th execution thereafter. Each such statement is
+              preceded by an increment of a per-statement counter stored in a
+              module-scoped list, reducing the cost of skipped type-checks to a
+              list item increment and comparison.
+
+            Enabling this schedule enables ``claw_is_pep526`` to remain enabled
+            in performance-sensitive inner loops (e.g., numerical code) whose
+            annotated variable assignments would otherwise dominate the cost of
+            those loops. Since objects violating type hints on skipped
+            iterations are *not* detected, this schedule trades safety for
+            speed and should only be enabled for such loops. Statements
+            residing outside loops are unaffected. Defaults to :data:`None`.
         hint_overrides : BeartypeHintOverrides
             **Type hint overrides** (i.e., frozen dictionary mapping from
             arbitrary source to target type hints), enabling callers to lie to
@@ -458,6 +620,31 @@ class BeartypeConf(object):
               enabling this boolean.
 
             Defaults to :data:`False`.
+        is_lazy : bool, optional
+            :data:`True` only if deferring the generation of the type-checking
+            wrapper function for each decorated callable until that callable is
+            first called. Enabling this boolean:
+
+            * Replaces each decorated synchronous callable by a **lazy
+              trampoline** (i.e., placeholder function masquerading as that
+              callable, cheaply created without generating code) rather than a
+              type-checking wrapper function. When first called, that
+              trampoline generates that wrapper *and* replaces itself in-place
+              by that wrapper (i.e., by replacing its own code object), such
+              that subsequent calls incur *no* additional overhead.
+            * Substantially reduces decoration-time overhead for callables that
+              are never called. This especially benefits short-lived processes
+              importing large packages decorated by :mod:`beartype.claw` import
+              hooks but calling only a small subset of the callables defined
+              by those packages (e.g., command-line tools, task workers).
+            * Defers both the cost of generating type-checking code *and* any
+              exceptions raised by doing so (e.g., due to invalid type hints)
+              from decoration time to the first call of each callable.
+
+            Asynchronous callables (e.g., coroutines) are decorated eagerly
+            regardless, as frameworks commonly distinguish synchronous from
+            asynchronous callables by introspecting their code objects at
+            registration time. Defaults to :data:`False`.
         is_pep484_tower : bool, optional
             :data:`True` only if enabling support for the :pep:`484`-compliant
             **implicit numeric tower** (i.e., lossy conversion of integers to
@@ -487,6 +674,36 @@ class BeartypeConf(object):
             :func:`beartype.beartype` decorator for the decorated callable.
             Defaults to :attr: `BeartypeStrategy.O1`, the ``O(1)`` constant-time
             strategy.
+        union_reorder_threshold : Optional[int], optional
+            **Union reordering threshold** (i.e., positive integer instructing
+            :mod:`beartype` to adaptively reorder the members of each union
+            type hint type-checked by each :func:`beartype.beartype`-generated
+            wrapper function after that wrapper has type-checked that union
+            this many times) *or* :data:`None` if :mod:`beartype` should never
+            reorder union members.
+
+            By default, the members of a union (e.g., ``Union[A, B, C]``) are
+            type-checked in a fixed order. Objects satisfying members
+            type-checked late thus pay for type-checking *all* members
+            type-checked earlier. When this threshold is non-:data:`None`,
+            each wrapper instead counts how many objects satisfy each member
+            of each union it type-checks. After any union has been satisfied
+            this many times, that wrapper is regenerated in-place to
+            type-check the members of each union in descending order of these
+            counts *without* further counting. Counting only occurs during
+            this warm-up phase; after regeneration, that wrapper is as fast as
+            a wrapper generated without this option but with members of unions
+            optimally ordered for the objects observed during that phase.
+
+            The counters of each wrapper are inspectable as the tuple of
+            :class:`beartype._check.checkunion.UnionBranchHits` objects
+            assigned to the ``__beartype_union_hits`` attribute of that
+            wrapper. Defaults to :data:`None`, in which case union members are
+            never reordered.
+
+            This option only applies to :func:`beartype.beartype`-generated
+            wrapper functions. Statement-level type-checkers (e.g.,
+            :func:`beartype.door.die_if_unbearable`) ignore this option.
         violation_door_type : Optional[TypeException]
             **DOOR violation type** (i.e., type of exception raised by the
             :func:`beartype.door.die_if_unbearable` type-checker when the object
@@ -585,11 +802,17 @@ class BeartypeConf(object):
         BeartypeConfParamException
             If either:
 
+            * ``claw_is_pyc_hash`` is *not* a boolean.
+            * ``claw_loop_sample`` is neither :data:`None` *nor* a 2-tuple of a
+              non-negative integer and a positive integer.
             * ``is_color`` is *not* a tri-state boolean.
             * ``is_debug`` is *not* a boolean.
+            * ``is_lazy`` is *not* a boolean.
             * ``is_pep484_tower`` is *not* a boolean.
             * ``strategy`` is *not* a :class:`BeartypeStrategy` enumeration
               member.
+            * ``union_reorder_threshold`` is neither :data:`None` *nor* a
+              positive integer.
             * ``warning_cls_on_decorator_exception`` is neither :data:`None`
               *nor* a **warning category** (i.e., :class:`Warning` subclass).
         BeartypeConfShellVarException
@@ -614,18 +837,32 @@ class BeartypeConf(object):
         # may actually do a great deal of real-world good. Safety first, all!
         with _beartype_conf_lock:
             # ..................{ CACHE                      }..................
+            # If one or more passed parameters are invalid in a manner that the
+            # cache lookup below would silently ignore, raise an exception.
+            die_if_conf_args_uncacheable(
+                check_stream_rate=check_stream_rate,
+                check_time_max_multiplier=check_time_max_multiplier,
+                claw_loop_sample=claw_loop_sample,
+            )
+
             # Validate and possibly override the "is_color" parameter by the
             # value of the ${BEARTYPE_IS_COLOR} environment variable (if set).
             is_color = get_is_color(is_color)
 
             # Efficiently hashable tuple of these parameters in arbitrary order.
             conf_args = (
+                check_stream_rate,
+                check_time_max_multiplier,
                 claw_is_pep526,
+                claw_is_pyc_hash,
+                claw_loop_sample,
                 hint_overrides,
                 is_color,
                 is_debug,
+                is_lazy,
                 is_pep484_tower,
                 strategy,
+                union_reorder_threshold,
                 violation_door_type,
                 violation_param_type,
                 violation_return_type,
@@ -648,12 +885,18 @@ class BeartypeConf(object):
             # defined *AFTER* this method first attempts to efficiently reduce
             # to a noop by returning a previously instantiated configuration.
             conf_kwargs = dict(
+                check_stream_rate=check_stream_rate,
+                check_time_max_multiplier=check_time_max_multiplier,
                 claw_is_pep526=claw_is_pep526,
+                claw_is_pyc_hash=claw_is_pyc_hash,
+                claw_loop_sample=claw_loop_sample,
                 hint_overrides=hint_overrides,
                 is_color=is_color,
                 is_debug=is_debug,
+                is_lazy=is_lazy,
                 is_pep484_tower=is_pep484_tower,
                 strategy=strategy,
+                union_reorder_threshold=union_reorder_threshold,
                 violation_door_type=violation_door_type,
                 violation_param_type=violation_param_type,
                 violation_return_type=violation_return_type,
@@ -717,12 +960,21 @@ class BeartypeConf(object):
             # parameters from the "conf_kwargs" dictionary possibly modified by
             # the above call to the default_conf_kwargs() function rather than
             # the original passed values of these parameters.
+            self._check_stream_rate = conf_kwargs[  # pyright: ignore
+                'check_stream_rate']
+            self._check_time_max_multiplier = conf_kwargs[  # pyright: ignore
+                'check_time_max_multiplier']
             self._claw_is_pep526 = conf_kwargs['claw_is_pep526']  # pyright: ignore
+            self._claw_is_pyc_hash = conf_kwargs['claw_is_pyc_hash']  # pyright: ignore
+            self._claw_loop_sample = conf_kwargs['claw_loop_sample']  # pyright: ignore
             self._hint_overrides = conf_kwargs['hint_overrides']  # pyright: ignore
             self._is_color = conf_kwargs['is_color']  # pyright: ignore
             self._is_debug = conf_kwargs['is_debug']  # pyright: ignore
+            self._is_lazy = conf_kwargs['is_lazy']  # pyright: ignore
             self._is_pep484_tower = conf_kwargs['is_pep484_tower']  # pyright: ignore
             self._strategy = conf_kwargs['strategy']  # pyright: ignore
+            self._union_reorder_threshold = conf_kwargs[  # pyright: ignore
+                'union_reorder_threshold']
             self._violation_door_type = conf_kwargs['violation_door_type']  # pyright: ignore
             self._violation_param_type = conf_kwargs['violation_param_type']  # pyright: ignore
             self._violation_return_type = conf_kwargs['violation_return_type']  # pyright: ignore
@@ -807,6 +1059,59 @@ class BeartypeConf(object):
     # Read-only public properties with which this configuration was originally
     # instantiated (as keyword-only parameters).
 
+    @property
+    def check_stream_rate(self) -> Optional[float]:
+        '''
+        **Stream sampling rate** (i.e., fraction of the values yielded by and
+        sent to iterators, generators, and asynchronous generators returned by
+        :func:`beartype.beartype`-decorated callables to be type-checked as
+        those values stream through those objects) *or* :data:`None` if
+        :mod:`beartype` should only shallowly type-check those objects.
+
+        See Also
+        --------
+        :meth:`__new__`
+            Further details.
+        '''
+
+        return self._check_stream_rate
+
+
+    @property
+    def check_time_max_multiplier(self) -> Optional[int]:
+        '''
+        **Deadline multiplier** (i.e., positive integer bounding the fraction of
+        the total running time of the active Python interpreter devoted to
+        non-constant type-checks) *or* :data:`None` if :mod:`beartype` should
+        never degrade non-constant type-checks.
+
+        See Also
+        --------
+        :meth:`__new__`
+            Further details.
+        '''
+
+        return self._check_time_max_multiplier
+
+
+    @property
+    def claw_loop_sample(self) -> Optional[Tuple[int, int]]:
+        '''
+        **Loop sampling schedule** (i.e., 2-tuple ``(first, every)`` instructing
+        :mod:`beartype.claw` import hooks to type-check statements in loop
+        bodies only on the first ``first`` executions of those statements and
+        every ``every``-th execution thereafter) *or* :data:`None` if those
+        hooks should type-check those statements on every execution.
+
+        See Also
+        --------
+        :meth:`__new__`
+            Further details.
+        '''
+
+        return self._claw_loop_sample
+
+
     @property
     def hint_overrides(self) -> BeartypeHintOverrides:
         '''
@@ -844,6 +1149,25 @@ class BeartypeConf(object):
         return self._strategy
 
 
+    @property
+    def union_reorder_threshold(self) -> Optional[int]:
+        '''
+        **Union reordering threshold** (i.e., positive integer number of
+        type-checks of each union type hint by each
+        :func:`beartype.beartype`-generated wrapper function after which that
+        wrapper is regenerated to type-check the members of that union most
+        frequently matched so far first) *or* :data:`None` if :mod:`beartype`
+        should never reorder union members.
+
+        See Also
+        --------
+        :meth:`__new__`
+            Further details.
+        '''
+
+        return self._union_reorder_threshold
+
+
     @property
     def warning_cls_on_decorator_exception(self) -> (
         Optional[TypeWarning]):
@@ -881,6 +1205,24 @@ class BeartypeConf(object):
         return self._claw_is_pep526
 
 
+    @property
+    def claw_is_pyc_hash(self) -> bool:
+        '''
+        :data:`True` only if :mod:`beartype.claw` import hooks cache modules
+        they transform to :pep:`552`-compliant **checked hash-based bytecode
+        files** keyed on the source of those modules, the version of
+        :mod:`beartype`, and this configuration rather than on the modification
+        times of those sources.
+
+        See Also
+        --------
+        :meth:`__new__`
+            Further details.
+        '''
+
+        return self._claw_is_pyc_hash
+
+
     @property
     def is_color(self) -> Optional[bool]:
         '''
@@ -921,6 +1263,22 @@ class BeartypeConf(object):
         return self._is_debug
 
 
+    @property
+    def is_lazy(self) -> bool:
+        '''
+        :data:`True` only if deferring the generation of type-checking wrapper
+        functions for decorated callables until those callables are first
+        called.
+
+        See Also
+        --------
+        :meth:`__new__`
+            Further details.
+        '''
+
+        return self._is_lazy
+
+
     @property
     def is_pep484_tower(self) -> bool:
         '''
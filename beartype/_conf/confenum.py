@@ -67,12 +67,18 @@ class BeartypeStrategy(Enum):
     Ologn : EnumMemberType
         **Logarithmic-time strategy** (i.e., the ``O(log n)`` strategy,
         type-checking a randomly selected number of items ``log(len(obj))`` of
-        each container ``obj``). This strategy is **currently unimplemented.**
-        (*To be implemented by a future beartype release.*)
+        each container ``obj``). All such items are distinct and derived from
+        the same pseudo-random integer generated once per call. This strategy
+        currently applies to the same container hints as :attr:`On`. All other
+        container hints are type-checked as under :attr:`O1`.
     On : EnumMemberType
         **Linear-time strategy** (i.e., the ``O(n)`` strategy, type-checking
-        *all* items of a container). This strategy is **currently
-        unimplemented.** (*To be implemented by a future beartype release.*)
+        *all* items of a container). This strategy currently applies to
+        single-argument sequence hints (e.g., ``list[int]``,
+        ``collections.abc.Sequence[str]``) and variadic tuple hints (e.g.,
+        ``tuple[int, ...]``). Fixed-length tuple hints (e.g., ``tuple[int,
+        str]``) are already type-checked in full under all strategies. All
+        other container hints are type-checked as under :attr:`O1`.
     '''
 
     O0 = next_enum_member_value()
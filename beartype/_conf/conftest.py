@@ -59,6 +59,102 @@ def die_unless_conf(conf: 'beartype.BeartypeConf') -> None:
     # Else, this object is a configuration.
 
 
+def die_if_conf_args_uncacheable(
+    check_stream_rate: object,
+    check_time_max_multiplier: object,
+    claw_loop_sample: object,
+) -> None:
+    '''
+    Raise an exception if one or more of the passed beartype configuration
+    parameters are invalid in a manner indistinguishable by the cache of all
+    previously instantiated beartype configurations.
+
+    This raiser is intended to be called by the
+    :meth:`beartype.BeartypeConf.__new__` method *before* that method attempts
+    to return a previously instantiated configuration. Since that cache is a
+    dictionary keyed on tuples of parameters, invalid parameters comparing equal
+    to valid parameters (e.g., the boolean :data:`True` comparing equal to the
+    valid sampling rate ``1.0``) would otherwise silently return a previously
+    instantiated configuration rather than raise an exception. Likewise,
+    unhashable invalid parameters (e.g., the list ``[1, 2]``) would otherwise
+    raise a non-human-readable :exc:`TypeError` from that lookup.
+
+    Parameters
+    ----------
+    check_stream_rate : object
+        Value of the ``check_stream_rate`` parameter to be validated.
+    check_time_max_multiplier : object
+        Value of the ``check_time_max_multiplier`` parameter to be validated.
+    claw_loop_sample : object
+        Value of the ``claw_loop_sample`` parameter to be validated.
+
+    Raises
+    ------
+    BeartypeConfParamException
+        If one or more of these parameters are invalid.
+    '''
+
+    # If "check_stream_rate" is neither "None" *NOR* a number in the half-open
+    # interval (0.0, 1.0], raise an exception. Note that booleans are integers
+    # and thus explicitly excluded.
+    if not (
+        check_stream_rate is None or (
+            isinstance(check_stream_rate, (float, int)) and
+            not isinstance(check_stream_rate, bool) and
+            0.0 < check_stream_rate <= 1.0
+        )
+    ):
+        raise BeartypeConfParamException(
+            f'Beartype configuration parameter "check_stream_rate" '
+            f'value {repr(check_stream_rate)} '
+            f'neither "None" nor number in the interval (0.0, 1.0].'
+        )
+    # Else, "check_stream_rate" is either "None" *OR* a number in that
+    # interval.
+    #
+    # If "check_time_max_multiplier" is neither "None" *NOR* a positive integer,
+    # raise an exception. Note that booleans are integers and thus explicitly
+    # excluded.
+    elif not (
+        check_time_max_multiplier is None or (
+            isinstance(check_time_max_multiplier, int) and
+            not isinstance(check_time_max_multiplier, bool) and
+            check_time_max_multiplier > 0
+        )
+    ):
+        raise BeartypeConfParamException(
+            f'Beartype configuration parameter "check_time_max_multiplier" '
+            f'value {repr(check_time_max_multiplier)} '
+            f'neither "None" nor positive integer.'
+        )
+    # Else, "check_time_max_multiplier" is either "None" *OR* a positive
+    # integer.
+    #
+    # If "claw_loop_sample" is neither "None" *NOR* a 2-tuple of a non-negative
+    # integer and a positive integer, raise an exception. Note that booleans
+    # are integers and thus explicitly excluded.
+    elif not (
+        claw_loop_sample is None or (
+            isinstance(claw_loop_sample, tuple) and
+            len(claw_loop_sample) == 2 and
+            all(
+                isinstance(claw_loop_sample_item, int) and
+                not isinstance(claw_loop_sample_item, bool)
+                for claw_loop_sample_item in claw_loop_sample
+            ) and
+            claw_loop_sample[0] >= 0 and
+            claw_loop_sample[1] > 0
+        )
+    ):
+        raise BeartypeConfParamException(
+            f'Beartype configuration parameter "claw_loop_sample" '
+            f'value {repr(claw_loop_sample)} '
+            f'neither "None" nor 2-tuple "(first, every)" of '
+            f'non-negative integer "first" and positive integer "every".'
+        )
+    # Else, "claw_loop_sample" is either "None" *OR* such a 2-tuple.
+
+
 def die_if_conf_kwargs_invalid(conf_kwargs: DictStrToAny) -> None:
     '''
     Raise an exception if one or more configuration parameters in the passed
@@ -85,6 +181,14 @@ def die_if_conf_kwargs_invalid(conf_kwargs: DictStrToAny) -> None:
         )
     # Else, "claw_is_pep526" is a boolean.
     #
+    # If "claw_is_pyc_hash" is *NOT* a boolean, raise an exception.
+    elif not isinstance(conf_kwargs['claw_is_pyc_hash'], bool):
+        raise BeartypeConfParamException(
+            f'Beartype configuration parameter "claw_is_pyc_hash" '
+            f'value {repr(conf_kwargs["claw_is_pyc_hash"])} not boolean.'
+        )
+    # Else, "claw_is_pyc_hash" is a boolean.
+    #
     # If "hint_overrides" is *NOT* a frozen dict, raise an exception.
     elif not isinstance(conf_kwargs['hint_overrides'], BeartypeHintOverrides):
         raise BeartypeConfParamException(
@@ -112,6 +216,14 @@ def die_if_conf_kwargs_invalid(conf_kwargs: DictStrToAny) -> None:
         )
     # Else, "is_debug" is a boolean.
     #
+    # If "is_lazy" is *NOT* a boolean, raise an exception.
+    elif not isinstance(conf_kwargs['is_lazy'], bool):
+        raise BeartypeConfParamException(
+            f'Beartype configuration parameter "is_lazy" '
+            f'value {repr(conf_kwargs["is_lazy"])} not boolean.'
+        )
+    # Else, "is_lazy" is a boolean.
+    #
     # If "is_pep484_tower" is *NOT* a boolean, raise an exception.
     elif not isinstance(conf_kwargs['is_pep484_tower'], bool):
         raise BeartypeConfParamException(
@@ -129,6 +241,23 @@ def die_if_conf_kwargs_invalid(conf_kwargs: DictStrToAny) -> None:
         )
     # Else, "strategy" is an enumeration member.
     #
+    # If "union_reorder_threshold" is neither "None" *NOR* a positive integer,
+    # raise an exception. Note that booleans are integers and thus explicitly
+    # excluded.
+    elif not (
+        conf_kwargs['union_reorder_threshold'] is None or (
+            isinstance(conf_kwargs['union_reorder_threshold'], int) and
+            not isinstance(conf_kwargs['union_reorder_threshold'], bool) and
+            conf_kwargs['union_reorder_threshold'] > 0
+        )
+    ):
+        raise BeartypeConfParamException(
+            f'Beartype configuration parameter "union_reorder_threshold" '
+            f'value {repr(conf_kwargs["union_reorder_threshold"])} '
+            f'neither "None" nor positive integer.'
+        )
+    # Else, "union_reorder_threshold" is either "None" *OR* a positive integer.
+    #
     # If "violation_verbosity" is *NOT* an enumeration member, raise an
     # exception.
     elif not isinstance(
@@ -22,8 +22,11 @@ from beartype._cave._cavefast import (
     MethodDecoratorBuiltinTypes,
 )
 from ast import (
+    AsyncFor,
     ClassDef,
+    For,
     FunctionDef,
+    While,
 )
 from collections.abc import (
     Set as SetABC,
@@ -62,6 +65,18 @@ Note that the :class:`Set` abstract base class (ABC) rather than the concrete
 '''
 
 # ....................{ TYPES ~ ast                        }....................
+TYPES_AST_LOOP = frozenset((
+    AsyncFor,
+    For,
+    While,
+))
+'''
+Frozen set of all **looping abstract syntax tree (AST) node types** (i.e.,
+types of all AST nodes whose declaration defines a loop body executed zero or
+more times).
+'''
+
+
 TYPES_AST_SCOPE = frozenset((
     ClassDef,
     FunctionDef,
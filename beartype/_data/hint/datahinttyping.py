@@ -177,6 +177,24 @@ object satisfies an arbitrary constraint *or* :data:`False` otherwise).
 '''
 
 
+CallableRaiserMany = Callable[[Iterable[object]], None]
+'''
+PEP-compliant type hint matching a **batch raiser callable** (i.e., arbitrary
+callable accepting a single iterable of arbitrary objects and either raising an
+exception or emitting a warning for objects of that iterable rather than
+returning any value).
+'''
+
+
+CallableTesterMany = Callable[[Iterable[object]], List[bool]]
+'''
+PEP-compliant type hint matching a **batch tester callable** (i.e., arbitrary
+callable accepting a single iterable of arbitrary objects and returning a list
+of booleans, each of which is either :data:`True` if the corresponding object of
+that iterable satisfies an arbitrary constraint *or* :data:`False` otherwise).
+'''
+
+
 Codeobjable = Union[Callable, CodeType, FrameType, GeneratorType]
 '''
 PEP-compliant type hint matching a **codeobjable** (i.e., pure-Python object
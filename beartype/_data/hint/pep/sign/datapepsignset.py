@@ -179,6 +179,67 @@ This set necessarily excludes:
 '''
 
 
+HINT_SIGNS_MAPPING = frozenset((
+    # ..................{ PEP (484|585)                      }..................
+    HintSignChainMap,
+    HintSignDefaultDict,
+    HintSignDict,
+    HintSignMapping,
+    HintSignMutableMapping,
+    HintSignOrderedDict,
+))
+'''
+Frozen set of all **standard mapping signs** (i.e., arbitrary objects uniquely
+identifying PEP-compliant type hints accepting exactly two subscripted type
+hint arguments constraining *all* keys and values (respectively) of compliant
+mappings, which necessarily satisfy the :class:`collections.abc.Mapping`
+protocol).
+
+This set intentionally excludes the:
+
+* :obj:`typing.Counter` sign, which accepts only one subscripted type hint
+  argument constraining *all* keys of compliant counters (whose values are
+  integers).
+* :obj:`typing.TypedDict` sign, which embeds a variadic number of
+  PEP-compliant field type hints and thus requires special-cased handling.
+'''
+
+
+HINT_SIGNS_REITERABLE_ARGS_1 = frozenset((
+    # ..................{ PEP (484|585)                      }..................
+    HintSignAbstractSet,
+    HintSignCollection,
+    HintSignDeque,
+    HintSignFrozenSet,
+    HintSignKeysView,
+    HintSignMutableSet,
+    HintSignSet,
+    HintSignValuesView,
+))
+'''
+Frozen set of all **standard reiterable signs** (i.e., arbitrary objects
+uniquely identifying PEP-compliant type hints accepting exactly one subscripted
+type hint argument constraining *all* items of compliant **reiterables** (i.e.,
+containers that are safely iterable multiple times but do *not* necessarily
+support ``O(1)`` indexation across all items, which necessarily satisfy the
+:class:`collections.abc.Collection` protocol)).
+
+Items of these reiterables are deeply type-checked under the default
+constant-time strategy by the
+:func:`beartype._check.checkreiter.get_reiterable_nonempty_item_next` getter.
+
+This set intentionally excludes the:
+
+* :obj:`typing.Container` sign, whose compliant objects are *not* guaranteed to
+  be iterable.
+* :obj:`typing.Iterable`, :obj:`typing.Iterator`, and :obj:`typing.Reversible`
+  signs, whose compliant objects are *not* guaranteed to be safely iterable
+  multiple times (e.g., generators).
+* :obj:`typing.Counter` sign, whose compliant objects are mappings already
+  handled by our fallback logic for supported PEP-compliant type hints.
+'''
+
+
 HINT_SIGNS_SEQUENCE_ARGS_1 = frozenset((
     # ..................{ PEP (484|585)                      }..................
     HintSignByteString,
@@ -533,13 +594,27 @@ HINT_SIGNS_SUPPORTED_DEEP = frozenset((
     HintSignUnion,
 
     # ..................{ PEP (484|585)                      }..................
+    HintSignAbstractSet,
     HintSignByteString,
+    HintSignChainMap,
+    HintSignCollection,
+    HintSignDefaultDict,
+    HintSignDeque,
+    HintSignDict,
+    HintSignFrozenSet,
     HintSignGeneric,
+    HintSignKeysView,
     HintSignList,
+    HintSignMapping,
+    HintSignMutableMapping,
     HintSignMutableSequence,
+    HintSignMutableSet,
+    HintSignOrderedDict,
     HintSignSequence,
+    HintSignSet,
     HintSignTuple,
     HintSignType,
+    HintSignValuesView,
 
     # ..................{ PEP 544                            }..................
     HintSignProtocol,
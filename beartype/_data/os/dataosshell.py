@@ -42,3 +42,94 @@ configuration environment variable** (i.e., whose name is
 :data:`.CONF_IS_COLOR_NAME`) to the corresponding value of the
 :attr:`beartype.BeartypeConf.is_color` tri-state boolean.
 '''
+
+# ....................{ VARS ~ claw                        }....................
+# @beartype-specific environment variables configuring beartype import hooks
+# (i.e., the "beartype.claw" subpackage).
+
+SHELL_VAR_CLAW_PROFILE_NAME = 'BEARTYPE_CLAW_PROFILE'
+'''
+Name of the **import hook profile environment variable** (i.e.,
+:mod:`beartype`-specific environment variable officially recognized by
+:mod:`beartype` as globally enabling the :func:`beartype.claw.profile_imports`
+import profiler when set to the format in which that profiler dumps its
+profile at interpreter exit).
+'''
+
+
+SHELL_VAR_CLAW_PROFILE_VALUES = frozenset(('json', 'text'))
+'''
+Frozen set of all permissible string values for the **import hook profile
+environment variable** (i.e., whose name is
+:data:`.SHELL_VAR_CLAW_PROFILE_NAME`), each the name of a format accepted by
+the :func:`beartype.claw.profile_imports` import profiler.
+'''
+
+# ....................{ VARS ~ cache                       }....................
+# @beartype-specific environment variables configuring both in-memory caches
+# and caches shared between Python processes.
+
+SHELL_VAR_CODE_CACHE_DIR_NAME = 'BEARTYPE_CODE_CACHE_DIR'
+'''
+Name of the **code cache directory environment variable** (i.e.,
+:mod:`beartype`-specific environment variable officially recognized by
+:mod:`beartype` as globally enabling the on-disk cache of code objects compiled
+from the type-checking code generated by :mod:`beartype` when set to the
+absolute or relative dirname of the directory to persist that cache to).
+
+See Also
+--------
+:func:`beartype._util.cache.utilcachecode.compile_func_code`
+    Further details.
+'''
+
+
+SHELL_VAR_CACHE_POLICY_NAME = 'BEARTYPE_CACHE_POLICY'
+'''
+Name of the **cache policy environment variable** (i.e.,
+:mod:`beartype`-specific environment variable officially recognized by
+:mod:`beartype` as globally configuring the eviction policy of the in-memory
+caches internally memoizing type hints and type hint wrappers when set to one
+of the strings in the :data:`.SHELL_VAR_CACHE_POLICY_VALUES` set).
+
+See Also
+--------
+:func:`beartype._util.cache.utilcachepolicy.make_cache`
+    Further details.
+'''
+
+
+SHELL_VAR_CACHE_POLICY_VALUES = frozenset(('lru', 'strong', 'weak'))
+'''
+Frozen set of all permissible string values for the **cache policy environment
+variable** (i.e., whose name is :data:`.SHELL_VAR_CACHE_POLICY_NAME`), each the
+name of a cache eviction policy. Specifically:
+
+* ``"strong"``, the default policy caching all entries strongly and
+  indefinitely.
+* ``"lru"``, caching at most ``${BEARTYPE_CACHE_SIZE_MAX}`` entries per cache
+  and evicting the least recently used entry on exceeding that size.
+* ``"weak"``, caching type hints and type hint wrappers weakly such that each
+  entry is evicted as soon as its value is garbage-collected.
+
+Caveats
+-------
+**Non-default policies break identity guarantees.** Under both ``"lru"`` and
+``"weak"``, memoized factories (e.g., validator factories) recreate objects
+whose entries were evicted (e.g., ``IsInstance[int] is IsInstance[int]`` may be
+:data:`False`). Under ``"lru"``, type hint wrappers are likewise recreated
+(e.g., ``TypeHint(hint) is TypeHint(hint)`` may be :data:`False`).
+
+**The "weak" policy disables the type hint cache for hints that are not weakly
+referenceable** (e.g., :pep:`604`-compliant unions under Python < 3.12), which
+are then silently *not* deduplicated.
+'''
+
+
+SHELL_VAR_CACHE_SIZE_MAX_NAME = 'BEARTYPE_CACHE_SIZE_MAX'
+'''
+Name of the **cache size environment variable** (i.e., :mod:`beartype`-specific
+environment variable officially recognized by :mod:`beartype` as globally
+configuring the maximum number of entries per bounded in-memory cache when set
+to a positive integer under a cache policy other than ``"strong"``).
+'''
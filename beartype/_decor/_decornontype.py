@@ -17,7 +17,11 @@ from beartype.roar import (
     BeartypeDecorWrappeeException,
     BeartypeDecorWrapperException,
 )
-from beartype.typing import no_type_check
+from beartype.typing import (
+    Callable,
+    Optional,
+    no_type_check,
+)
 from beartype._cave._cavefast import (
     MethodBoundInstanceOrClassType,
     MethodDecoratorClassType,
@@ -31,7 +35,16 @@ from beartype._conf.confenum import BeartypeStrategy
 from beartype._data.hint.datahinttyping import (
     BeartypeableT,
 )
+from beartype._decor.wrap.wraplazy import (
+    make_func_lazy,
+    set_func_lazy_wrapped,
+    set_func_lazy_wrapper,
+)
 from beartype._decor.wrap.wrapmain import generate_code
+from beartype._decor.wrap.wrapunion import (
+    make_func_union_hits,
+    set_func_union_reorderer,
+)
 from beartype._util.cache.pool.utilcachepoolobjecttyped import (
     release_object_typed)
 from beartype._util.func.mod.utilbeartypefunc import (
@@ -43,7 +56,11 @@ from beartype._util.func.mod.utilfuncmodtest import (
     is_func_functools_lru_cache,
 )
 from beartype._util.func.utilfuncmake import make_func
-from beartype._util.func.utilfunctest import is_func_python
+from beartype._util.func.utilfunctest import (
+    is_func_async,
+    is_func_python,
+    is_func_sync_generator,
+)
 from beartype._util.func.utilfuncwrap import unwrap_func_once
 from beartype._util.py.utilpyversion import IS_PYTHON_3_8
 from contextlib import contextmanager
@@ -202,7 +219,11 @@ def beartype_func(
     Returns
     ----------
     BeartypeableT
-        New pure-Python callable wrapping this callable with type-checking.
+        New pure-Python callable wrapping this callable with type-checking. If
+        this configuration enables the :attr:`beartype.BeartypeConf.is_lazy`
+        option *and* this callable is synchronous, this is a lazy trampoline
+        generating that type-checking on its first call. See the
+        :func:`._beartype_func_lazy` decorator for further details.
     '''
     assert callable(func), f'{repr(func)} uncallable.'
     # assert isinstance(conf, BeartypeConf), f'{repr(conf)} not configuration.'
@@ -235,65 +256,15 @@ def beartype_func(
         return func  # type: ignore[return-value]
     # Else, that callable is beartypeable. Let's do this, folks.
 
-    # Beartype call metadata describing that callable.
-    bear_call = make_beartype_call(func, conf, **kwargs)  # pyright: ignore[reportGeneralTypeIssues]
-
-    # Generate the raw string of Python statements implementing this wrapper.
-    func_wrapper_code = generate_code(bear_call)
-
-    # If that callable requires *NO* type-checking, silently reduce to a noop
-    # and thus the identity decorator by returning that callable as is.
-    if not func_wrapper_code:
-        return func  # type: ignore[return-value]
-    # Else, that callable requires type-checking. Let's *REALLY* do this, fam.
-
-    # Function wrapping that callable with type-checking to be returned.
-    #
-    # For efficiency, this wrapper accesses *ONLY* local rather than global
-    # attributes. The latter incur a minor performance penalty, since local
-    # attributes take precedence over global attributes, implying all global
-    # attributes are *ALWAYS* first looked up as local attributes before falling
-    # back to being looked up as global attributes.
-    func_wrapper = make_func(
-        func_name=bear_call.func_wrapper_name,
-        func_code=func_wrapper_code,
-        func_locals=bear_call.func_wrapper_scope,
-
-        #FIXME: String formatting is infamously slow. As an optimization, it'd
-        #be strongly preferable to instead pass a lambda function accepting *NO*
-        #parameters and returning the desired string, which make_func() should
-        #then internally call on an as-needed basis to make this string: e.g.,
-        #    func_label_factory=lambda: f'@beartyped {bear_call.func_wrapper_name}() wrapper',
-        #
-        #This is trivial. The only question then is: "Which is actually faster?"
-        #Before finalizing this refactoring, let's profile both, adopt whichever
-        #outperforms the other, and then document this choice in make_func().
-        #FIXME: *WAIT.* We don't need a lambda at all. All we need is to:
-        #* Define a new BeartypeCall.label_func_wrapper() method resembling:
-        #      def label_func_wrapper(self) -> str:
-        #          return f'@beartyped {self.func_wrapper_name}() wrapper'
-        #* Refactor make_func() to accept a new optional keyword-only
-        #  "func_label_factory" parameter, passed here as:
-        #      func_label_factory=bear_call.label_func_wrapper,
-        #
-        #That's absolutely guaranteed to be the fastest approach.
-        func_label=f'@beartyped {bear_call.func_wrapper_name}() wrapper',
-
-        func_wrapped=func,
-        is_debug=conf.is_debug,
-        exception_cls=BeartypeDecorWrapperException,
-    )
-
-    # Declare this wrapper to be generated by @beartype, which tests for the
-    # existence of this attribute above to avoid re-decorating callables
-    # already decorated by @beartype by efficiently reducing to a noop.
-    set_func_beartyped(func_wrapper)
-
-    # Release this beartype call metadata back to its object pool.
-    release_object_typed(bear_call)
+    # If this configuration defers wrapper generation until first call *AND*
+    # that callable is lazily beartypeable, return a lazy trampoline doing so.
+    if conf.is_lazy and _is_func_lazy_beartypeable(func):
+        return _beartype_func_lazy(func, conf, **kwargs)  # type: ignore[return-value]
+    # Else, this configuration generates wrappers at decoration time *OR* that
+    # callable is *NOT* lazily beartypeable. In either case, do so now.
 
-    # Return this wrapper.
-    return func_wrapper  # type: ignore[return-value]
+    # Return a new wrapper type-checking that callable.
+    return _beartype_func_eager(func, conf, None, **kwargs)  # type: ignore[return-value]
 
 
 def beartype_func_contextlib_contextmanager(
@@ -480,6 +451,47 @@ def beartype_descriptor_decorator_builtin(
         f'(i.e., neither property, class method, nor static method descriptor).'
     )
 
+# ....................{ PRIVATE ~ testers                  }....................
+def _is_func_lazy_beartypeable(func: Callable) -> bool:
+    '''
+    :data:`True` only if the passed callable is **lazily beartypeable** (i.e.,
+    safely decoratable by the :func:`._beartype_func_lazy` decorator).
+
+    A callable is lazily beartypeable only if that callable is neither:
+
+    * Asynchronous *nor* a synchronous generator. Since introspection of these
+      callables (e.g., by the standard :func:`inspect.iscoroutinefunction` and
+      :func:`inspect.isgeneratorfunction` testers) inspects the code objects of
+      these callables, lazy trampolines masquerading as these callables would
+      be misclassified as non-generator synchronous callables until first
+      called.
+    * Declared in the body of another callable. Since forward references in
+      the type hints annotating these callables are resolved against the
+      local scopes of the parent callables lexically containing these
+      callables by introspecting the call stack at decoration time, these
+      references are unresolvable from the call stack of the first call to
+      these callables (by which time these parent callables have typically
+      returned).
+
+    Parameters
+    ----------
+    func : Callable
+        Callable to be inspected.
+
+    Returns
+    -------
+    bool
+        :data:`True` only if this callable is lazily beartypeable.
+    '''
+
+    # Return true only if that callable is neither asynchronous, a synchronous
+    # generator, *NOR* declared in the body of another callable.
+    return not (
+        is_func_async(func) or
+        is_func_sync_generator(func) or
+        '<locals>' in func.__qualname__
+    )
+
 # ....................{ PRIVATE ~ decorators               }....................
 def _beartype_descriptor_method_bound(
     descriptor: BeartypeableT, **kwargs) -> BeartypeableT:
@@ -558,6 +570,230 @@ def _beartype_descriptor_method_bound(
     # Return this new descriptor, implicitly destroying the prior descriptor.
     return descriptor_new  # type: ignore[return-value]
 
+
+def _beartype_func_eager(
+    # Mandatory parameters.
+    func: Callable,
+    conf: BeartypeConf,
+    func_lazy: Optional[Callable],
+
+    # Variadic keyword parameters.
+    **kwargs
+) -> Callable:
+    '''
+    Decorate the passed callable with dynamically generated type-checking
+    generated immediately.
+
+    Parameters
+    ----------
+    func : Callable
+        Callable to be decorated by :func:`beartype.beartype`.
+    conf : BeartypeConf
+        Beartype configuration configuring :func:`beartype.beartype` uniquely
+        specific to this callable.
+    func_lazy : Optional[Callable]
+        Either:
+
+        * If this callable was previously decorated lazily, the lazy
+          trampoline masquerading as this callable created by the
+          :func:`._beartype_func_lazy` decorator. In this case, this trampoline
+          is replaced in-place by the wrapper generated by this decorator.
+        * Else, :data:`None`.
+
+    All remaining keyword parameters are passed as is to the
+    :meth:`beartype._check.checkcall.BeartypeCall.reinit` method.
+
+    Returns
+    ----------
+    Callable
+        Either:
+
+        * If this callable requires *no* type-checking, either this trampoline
+          if any *or* this callable as is otherwise.
+        * Else, either this trampoline replaced by a new wrapper if any *or* a
+          new wrapper otherwise.
+    '''
+
+    # Beartype call metadata describing that callable.
+    bear_call = make_beartype_call(func, conf, **kwargs)  # pyright: ignore[reportGeneralTypeIssues]
+
+    # Generate the raw string of Python statements implementing this wrapper.
+    func_wrapper_code = generate_code(bear_call)
+
+    # If that callable requires *NO* type-checking...
+    if not func_wrapper_code:
+        # If a lazy trampoline masquerades as that callable, redirect that
+        # trampoline to that callable and return that trampoline.
+        if func_lazy is not None:
+            set_func_lazy_wrapped(func_lazy, func)
+            return func_lazy
+        # Else, *NO* lazy trampoline masquerades as that callable.
+
+        # Silently reduce to a noop and thus the identity decorator by
+        # returning that callable as is.
+        return func
+    # Else, that callable requires type-checking. Let's *REALLY* do this, fam.
+
+    # Dictionary mapping from the name to value of each union branch hit
+    # counter specific to this wrapper if this configuration enables adaptive
+    # union reordering *OR* "None" otherwise. Since counter templates are
+    # shared between all wrappers type-checking the same unions, these
+    # templates are cloned *BEFORE* creating this wrapper.
+    union_hits = (
+        make_func_union_hits(bear_call.func_wrapper_scope)
+        if conf.union_reorder_threshold is not None else
+        None
+    )
+
+    # Function wrapping that callable with type-checking to be returned.
+    #
+    # For efficiency, this wrapper accesses *ONLY* local rather than global
+    # attributes. The latter incur a minor performance penalty, since local
+    # attributes take precedence over global attributes, implying all global
+    # attributes are *ALWAYS* first looked up as local attributes before falling
+    # back to being looked up as global attributes.
+    func_wrapper = make_func(
+        func_name=bear_call.func_wrapper_name,
+        func_code=func_wrapper_code,
+        func_locals=bear_call.func_wrapper_scope,
+
+        #FIXME: String formatting is infamously slow. As an optimization, it'd
+        #be strongly preferable to instead pass a lambda function accepting *NO*
+        #parameters and returning the desired string, which make_func() should
+        #then internally call on an as-needed basis to make this string: e.g.,
+        #    func_label_factory=lambda: f'@beartyped {bear_call.func_wrapper_name}() wrapper',
+        #
+        #This is trivial. The only question then is: "Which is actually faster?"
+        #Before finalizing this refactoring, let's profile both, adopt whichever
+        #outperforms the other, and then document this choice in make_func().
+        #FIXME: *WAIT.* We don't need a lambda at all. All we need is to:
+        #* Define a new BeartypeCall.label_func_wrapper() method resembling:
+        #      def label_func_wrapper(self) -> str:
+        #          return f'@beartyped {self.func_wrapper_name}() wrapper'
+        #* Refactor make_func() to accept a new optional keyword-only
+        #  "func_label_factory" parameter, passed here as:
+        #      func_label_factory=bear_call.label_func_wrapper,
+        #
+        #That's absolutely guaranteed to be the fastest approach.
+        func_label=f'@beartyped {bear_call.func_wrapper_name}() wrapper',
+
+        func_wrapped=func,
+        is_debug=conf.is_debug,
+        exception_cls=BeartypeDecorWrapperException,
+    )
+
+    # If a lazy trampoline masquerades as that callable, replace that
+    # trampoline in-place by this wrapper. That trampoline was already declared
+    # to be generated by @beartype when created.
+    if func_lazy is not None:
+        set_func_lazy_wrapper(func_lazy, func_wrapper)
+        func_wrapper = func_lazy
+    # Else, *NO* lazy trampoline masquerades as that callable. In this case,
+    # declare this wrapper to be generated by @beartype, which tests for the
+    # existence of this attribute above to avoid re-decorating callables
+    # already decorated by @beartype by efficiently reducing to a noop.
+    else:
+        set_func_beartyped(func_wrapper)
+
+    # If this wrapper counts the branches of one or more unions, register a
+    # union reorderer regenerating this wrapper after these counters reach
+    # their thresholds.
+    if union_hits:
+        set_func_union_reorderer(func_wrapper, func_wrapper_code, union_hits)
+    # Else, this wrapper counts *NO* branches of unions.
+
+    # Release this beartype call metadata back to its object pool.
+    release_object_typed(bear_call)
+
+    # Return this wrapper.
+    return func_wrapper
+
+
+def _beartype_func_lazy(
+    # Mandatory parameters.
+    func: Callable,
+    conf: BeartypeConf,
+
+    # Variadic keyword parameters.
+    **kwargs
+) -> Callable:
+    '''
+    Decorate the passed callable with type-checking generated on the first call
+    to that callable.
+
+    This decorator returns a **lazy trampoline** (i.e., placeholder function
+    masquerading as this callable, cheaply created without generating code)
+    that, when first called, generates the wrapper that the
+    :func:`._beartype_func_eager` decorator would have generated, replaces
+    itself in-place by that wrapper, and forwards that call to that wrapper.
+    This decorator thus defers the cost of generating type-checking code for
+    callables that are never called (e.g., by short-lived processes calling
+    only a small subset of the callables defined by the modules they import).
+
+    Parameters
+    ----------
+    func : Callable
+        Callable to be decorated by :func:`beartype.beartype`.
+    conf : BeartypeConf
+        Beartype configuration configuring :func:`beartype.beartype` uniquely
+        specific to this callable.
+
+    All remaining keyword parameters are passed as is to the
+    :meth:`beartype._check.checkcall.BeartypeCall.reinit` method.
+
+    Returns
+    ----------
+    Callable
+        Lazy trampoline masquerading as this callable.
+    '''
+
+    # Lazy initializer called by this trampoline on its first call.
+    def beartype_func_lazy_init(*args, **kwargs_call):
+        '''
+        Replace the lazy trampoline masquerading as the callable decorated by
+        the parent decorator in-place by a new wrapper type-checking that
+        callable *and* return the value of calling that wrapper with the passed
+        parameters.
+        '''
+
+        # Avoid circular import dependencies.
+        from beartype._decor.decorcore import warn_beartype_object_exception
+
+        # Attempt to replace this trampoline in-place by a new wrapper.
+        try:
+            _beartype_func_eager(func, conf, func_lazy, **kwargs)
+        # If doing so raises an exception...
+        except Exception as exception:
+            # If this configuration requests that decoration exceptions be
+            # raised, raise this exception as is. Since this trampoline is
+            # preserved as is, subsequent calls reattempt this replacement.
+            if conf.warning_cls_on_decorator_exception is None:
+                raise
+            # Else, this configuration requests that decoration exceptions be
+            # coerced into warnings.
+
+            # Coerce this exception into a warning.
+            warn_beartype_object_exception(
+                obj=func, conf=conf, exception=exception)
+
+            # Redirect this trampoline to that callable, which is thereafter
+            # *NOT* type-checked.
+            set_func_lazy_wrapped(func_lazy, func)
+
+        # Call this trampoline, which has now been replaced.
+        return func_lazy(*args, **kwargs_call)
+
+    # Trampoline masquerading as that callable.
+    func_lazy = make_func_lazy(func, beartype_func_lazy_init)
+
+    # Declare this trampoline to be generated by @beartype, which tests for
+    # the existence of this attribute to avoid re-decorating callables already
+    # decorated by @beartype by efficiently reducing to a noop.
+    set_func_beartyped(func_lazy)
+
+    # Return this trampoline.
+    return func_lazy
+
 # ....................{ DECORATORS ~ pseudo-callable       }....................
 def beartype_pseudofunc(pseudofunc: BeartypeableT, **kwargs) -> BeartypeableT:
     '''
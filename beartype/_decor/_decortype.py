@@ -19,7 +19,7 @@ from beartype.typing import (
     Set,
 )
 from beartype._cave._cavemap import NoneTypeOr
-from beartype._check.checkcache import clear_checker_caches
+from beartype._check.checkcache import clear_checker_caches_module
 from beartype._conf.confcls import BeartypeConf
 from beartype._data.cls.datacls import TYPES_BEARTYPEABLE
 from beartype._data.hint.datahinttyping import (
@@ -317,9 +317,9 @@ of all classes in that module decorated by that decorator).
 # ....................{ PRIVATE ~ globals                  }....................
 def _uncache_beartype_if_type_redefined(cls: type) -> None:
     '''
-    Clear *all* :mod:`beartype`-specific internal caches that have been shown to
-    fail when a class is redefined if the passed class is detected as having
-    been redefined in its module.
+    Clear all entries of :mod:`beartype`-specific internal caches that depend on
+    the module defining the passed class if this class is detected as having
+    been redefined in that module.
 
     If a class with the same unqualified basename defined in a module with the
     same fully-qualified name has already been marked as decorated by this
@@ -345,12 +345,13 @@ def _uncache_beartype_if_type_redefined(cls: type) -> None:
          @beartype
          def MuhClass(object): ...   # <-- this makes me squint
 
-    In either case, this class has been redefined. Since :mod:`beartype` has no
-    efficient means of deciding which internal caches to clear in response,
-    :mod:`beartype` instead now unconditionally clears *all* internal caches.
-    Doing so incurs a minor performance penalty whenever a module reload occurs
-    while preserving user-facing usability across module reloads. In short, the
-    minor performance penalty is worth this major usability gain.
+    In either case, this class has been redefined. Since cached references to
+    objects declared by that module (e.g., forward referees, type hints
+    subscripted by classes declared by that module) may now refer to prior
+    definitions of those objects, :mod:`beartype` now clears *only* the
+    internal cache entries depending on that module. Cache entries depending
+    only on other modules remain valid and are thus preserved, avoiding full
+    cache rebuilds under hot reloading and repeatedly rerun Jupyter cells.
     '''
 
     # Fully-qualified name of the module defining this class if this class is
@@ -370,8 +371,8 @@ def _uncache_beartype_if_type_redefined(cls: type) -> None:
         # If a class with the same unqualified basename defined in a module with
         # the same fully-qualified name has already been marked as decorated by
         # this decorator, then this class is currently being redefined. In this
-        # case, clear *ALL* beartype-specific internal caches that have been
-        # shown to fail when classes are redefined.
+        # case, clear all beartype-specific internal cache entries depending on
+        # that module.
         if type_name in type_names_beartyped:
             #FIXME: Consider emitting a logging message instead if this branch
             #ever becomes computationally intensive, please.
@@ -379,22 +380,20 @@ def _uncache_beartype_if_type_redefined(cls: type) -> None:
 
             # Clear the previously accessed set of the unqualified basenames of
             # *ALL* classes in that module previously decorated by this
-            # decorator. Technically, this is optional. Pragmatically, this
-            # *SHOULD* significantly improve the space and time constraints
-            # associated with this class redefinition. Why? Because this class
-            # being redefined implies that the module defining this class is
-            # being redefined, which implies that all classes in that module are
-            # being redefined as well. If we did *NOT* clear this set here, then
-            # this set would continue to contain the unqualified basenames of
-            # those other classes in that module; each @beartype-decorated
-            # redefinition of those other classes would then unnecessarily clear
-            # the same caches already cleared by the first @beartype-decorated
-            # redefinition of a class in that module. Since doing so would be
-            # overly aggressive and thus inefficient, avoiding doing so improves
-            # efficiency in the common case of module redefinition.
-            _BEARTYPED_MODULE_TO_TYPE_NAME.clear()
-
-            # Clear *ALL* type-checking caches. Notably:
+            # decorator. Why? Because this class being redefined implies that
+            # the module defining this class is being redefined, which implies
+            # that all classes in that module are being redefined as well. If
+            # we did *NOT* clear this set here, then this set would continue to
+            # contain the unqualified basenames of those other classes in that
+            # module; each @beartype-decorated redefinition of those other
+            # classes would then unnecessarily clear the same cache entries
+            # already cleared by the first @beartype-decorated redefinition of
+            # a class in that module. Note that the sets of all other modules
+            # are preserved, as those modules have *NOT* been redefined.
+            type_names_beartyped.clear()
+
+            # Clear all type-checking cache entries depending on that module.
+            # Notably:
             # * The forward reference referee cache (i.e., private
             #   "beartype._check.forward.reference.fwdrefmeta._forwardref_to_referee"
             #   dictionary) is problematic, due to mapping from forward
@@ -413,17 +412,17 @@ def _uncache_beartype_if_type_redefined(cls: type) -> None:
             # If any of these caches contain such desynchronized key-value
             # pairs, there now exists a discrepancy between the current
             # definition of this class and existing references in these caches
-            # to the prior definition of this class. For safety, all caches
-            # possibly containing those references must now be assumed to be
-            # invalid. Failing to clear these caches causes @beartype-decorated
-            # wrapper functions to raise erroneous type-checking violations.
-            clear_checker_caches()
+            # to the prior definition of this class. Failing to clear these
+            # entries causes @beartype-decorated wrapper functions to raise
+            # erroneous type-checking violations.
+            clear_checker_caches_module(module_name)
         # Else, this is the first decoration of this class by this decorator.
-        # In this case...
-        else:
-            # Record that this class has now been decorated by this decorator.
-            # Technically, this should (probably) be performed *AFTER* this
-            # decorator has actually successfully decorated this class.
-            # Pragmatically, doing so here is simply faster and... simpler.
-            type_names_beartyped.add(type_name)
+
+        # Record that this class has now been decorated by this decorator,
+        # enabling a subsequent redefinition of this class (e.g., by a
+        # subsequent reload of that module) to be detected as well.
+        # Technically, this should (probably) be performed *AFTER* this
+        # decorator has actually successfully decorated this class.
+        # Pragmatically, doing so here is simply faster and... simpler.
+        type_names_beartyped.add(type_name)
     # Else, this class is *NOT* defined by a module.
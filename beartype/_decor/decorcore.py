@@ -91,6 +91,81 @@ def beartype_object(
         _beartype_object_nonfatal(obj, conf=conf, **kwargs)
     )
 
+# ....................{ WARNERS                            }....................
+def warn_beartype_object_exception(
+    obj: BeartypeableT,  # pyright: ignore[reportInvalidTypeVarUse]
+    conf: BeartypeConf,
+    exception: Exception,
+) -> None:
+    '''
+    Coerce the passed exception raised while decorating the passed
+    beartypeable into a non-fatal warning of the category configured by the
+    passed beartype configuration.
+
+    This function is intended to be called *only* from within the ``except``
+    block handling this exception, as this function may embed the traceback
+    of the exception currently being handled into this warning.
+
+    Parameters
+    ----------
+    obj : BeartypeableT
+        Beartypeable (i.e., pure-Python callable or class) that
+        :func:`beartype.beartype` failed to decorate.
+    conf : BeartypeConf
+        **Beartype configuration** whose
+        :attr:`beartype.BeartypeConf.warning_cls_on_decorator_exception` option
+        is the category of this warning.
+    exception : Exception
+        Exception raised while decorating this beartypeable.
+
+    Warns
+    ----------
+    warning_category
+        Unconditionally.
+    '''
+
+    # Category of warning to be emitted.
+    warning_category = conf.warning_cls_on_decorator_exception
+    assert is_type_subclass(warning_category, Warning), (
+        f'{repr(warning_category)} not warning category.')
+
+    # Original lower-level error message to be embedded in the higher-level
+    # warning message to be emitted below, defined as either...
+    error_message = (
+        # If this exception is beartype-specific, this exception's message
+        # is probably human-readable as is. In this case, maximize brevity
+        # and readability by coercing *ONLY* this message (rather than both
+        # this message *AND* traceback) truncated to a reasonable maximum
+        # length into a warning message.
+        truncate_str(text=label_exception(exception), max_len=1024)
+        if isinstance(exception, BeartypeException) else
+        # Else, this exception is *NOT* beartype-specific. In this case,
+        # this exception's message is probably *NOT* human-readable as is.
+        # Prepend that non-human-readable message by this exception's
+        # traceback for disambiguity and debuggability. Note that the
+        # format_exc() function appends this exception's message to this
+        # traceback and thus suffices as is.
+        format_exc()
+    )
+
+    # Indent this message by globally replacing *EVERY* newline in this
+    # message with a newline followed by four spaces. Doing so visually
+    # offsets this lower-level exception message from the higher-level
+    # warning message embedding this exception message below.
+    error_message = f'\n{error_message}'.replace('\n', '\n    ')
+
+    # Warning message to be emitted, consisting of:
+    # * A human-readable label contextually describing this beartypeable,
+    #   capitalized such that the first character is uppercase.
+    # * This indented exception message.
+    warning_message = uppercase_str_char_first(
+        f'{prefix_beartypeable(obj)}{label_object_context(obj)}:'
+        f'{error_message}'
+    )
+
+    # Emit this message under this category.
+    warn(warning_message, warning_category)
+
 # ....................{ PRIVATE ~ decorators               }....................
 def _beartype_object_fatal(obj: BeartypeableT, **kwargs) -> BeartypeableT:
     '''
@@ -211,47 +286,8 @@ def _beartype_object_nonfatal(
     # If doing so unexpectedly raises an exception, coerce that fatal exception
     # into a non-fatal warning for nebulous safety.
     except Exception as exception:
-        # Category of warning to be emitted.
-        warning_category = conf.warning_cls_on_decorator_exception
-        assert is_type_subclass(warning_category, Warning), (
-            f'{repr(warning_category)} not warning category.')
-
-        # Original lower-level error message to be embedded in the higher-level
-        # warning message to be emitted below, defined as either...
-        error_message = (
-            # If this exception is beartype-specific, this exception's message
-            # is probably human-readable as is. In this case, maximize brevity
-            # and readability by coercing *ONLY* this message (rather than both
-            # this message *AND* traceback) truncated to a reasonable maximum
-            # length into a warning message.
-            truncate_str(text=label_exception(exception), max_len=1024)
-            if isinstance(exception, BeartypeException) else
-            # Else, this exception is *NOT* beartype-specific. In this case,
-            # this exception's message is probably *NOT* human-readable as is.
-            # Prepend that non-human-readable message by this exception's
-            # traceback for disambiguity and debuggability. Note that the
-            # format_exc() function appends this exception's message to this
-            # traceback and thus suffices as is.
-            format_exc()
-        )
-
-        # Indent this message by globally replacing *EVERY* newline in this
-        # message with a newline followed by four spaces. Doing so visually
-        # offsets this lower-level exception message from the higher-level
-        # warning message embedding this exception message below.
-        error_message = f'\n{error_message}'.replace('\n', '\n    ')
-
-        # Warning message to be emitted, consisting of:
-        # * A human-readable label contextually describing this beartypeable,
-        #   capitalized such that the first character is uppercase.
-        # * This indented exception message.
-        warning_message = uppercase_str_char_first(
-            f'{prefix_beartypeable(obj)}{label_object_context(obj)}:'
-            f'{error_message}'
-        )
-
-        # Emit this message under this category.
-        warn(warning_message, warning_category)
+        warn_beartype_object_exception(
+            obj=obj, conf=conf, exception=exception)
 
     # Return this object unmodified, as @beartype failed to successfully wrap
     # this object with a type-checking class or callable. So it goes, fam.
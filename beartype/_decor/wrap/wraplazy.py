@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2024 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Beartype decorator **lazy trampolines** (i.e., low-level callables creating and
+finalizing placeholder functions deferring the generation of
+:func:`beartype.beartype`-generated wrapper functions until first called under
+configurations enabling the :attr:`beartype.BeartypeConf.is_lazy` option).
+
+Each trampoline is a new function cheaply instantiated from the code object of a
+single prototype function compiled once at import time of this submodule rather
+than dynamically generated and compiled per decorated callable. When first
+called, a trampoline calls an initializer generating the wrapper function that
+would have been generated by an eager decoration, replaces its own code object
+and default parameters by those of that wrapper in-place, and forwards that call
+to itself. Since the trampoline object itself is preserved, *all* existing
+references to that trampoline (e.g., by modules that have already imported that
+trampoline) transparently become that wrapper without any further indirection.
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                            }....................
+from beartype.typing import Callable
+from beartype._util.py.utilpyversion import IS_PYTHON_AT_LEAST_3_11
+from builtins import __dict__ as builtins_dict  # type: ignore[attr-defined]
+from functools import update_wrapper
+from types import FunctionType
+
+# ....................{ FACTORIES                          }....................
+def make_func_lazy(func: Callable, func_init: Callable) -> Callable:
+    '''
+    Create and return a new **lazy trampoline** (i.e., placeholder function
+    forwarding all calls to the passed initializer until that initializer
+    replaces the code object of this trampoline by calling the
+    :func:`.set_func_lazy_wrapper` function) masquerading as the passed
+    callable.
+
+    Parameters
+    ----------
+    func : Callable
+        Pure-Python callable to be decorated, whose dunder attributes (e.g.,
+        ``__name__``, ``__doc__``, ``__wrapped__``) are propagated onto this
+        trampoline.
+    func_init : Callable
+        **Lazy initializer** (i.e., callable passed all positional and keyword
+        arguments passed to this trampoline, expected to both replace this
+        trampoline in-place *and* return the value of calling this trampoline
+        with those arguments).
+
+    Returns
+    -------
+    Callable
+        Lazy trampoline masquerading as this callable.
+    '''
+    assert callable(func), f'{repr(func)} uncallable.'
+    assert callable(func_init), f'{repr(func_init)} uncallable.'
+
+    # Code object of this trampoline, renamed to that of this callable to
+    # preserve the readability of tracebacks.
+    func_lazy_codeobj = (
+        _FUNC_LAZY_CODEOBJ.replace(
+            co_name=func.__name__, co_qualname=func.__qualname__)
+        if IS_PYTHON_AT_LEAST_3_11 else
+        _FUNC_LAZY_CODEOBJ.replace(co_name=func.__name__)
+    )
+
+    # Trampoline instantiated from this code object. Note that doing so is
+    # substantially faster than dynamically generating and compiling a new
+    # function (e.g., with the make_func() factory).
+    func_lazy = FunctionType(func_lazy_codeobj, _FUNC_LAZY_GLOBALS)
+
+    # Forward all calls to this trampoline to this initializer.
+    func_lazy.__kwdefaults__ = {_ARG_NAME_FUNC_LAZY_INIT: func_init}
+
+    # Propagate dunder attributes from this callable onto this trampoline.
+    update_wrapper(wrapper=func_lazy, wrapped=func)
+
+    # Return this trampoline.
+    return func_lazy
+
+# ....................{ SETTERS                            }....................
+def set_func_lazy_wrapper(func_lazy: Callable, func_wrapper: Callable) -> None:
+    '''
+    Replace the passed lazy trampoline in-place by the passed
+    :func:`beartype.beartype`-generated wrapper function.
+
+    This setter replaces the code object and default parameters of this
+    trampoline by those of this wrapper. Since both this trampoline and this
+    wrapper are closure-less functions whose global scopes contain only
+    builtins, this trampoline thereafter behaves exactly as this wrapper.
+
+    Parameters
+    ----------
+    func_lazy : Callable
+        Lazy trampoline to be replaced, previously created by the
+        :func:`.make_func_lazy` factory.
+    func_wrapper : Callable
+        Wrapper to replace this trampoline by.
+    '''
+
+    # Default keyword-only parameters of this trampoline, guaranteed to be a
+    # dictionary passing at least the initializer of this trampoline.
+    func_lazy_kwdefaults = func_lazy.__kwdefaults__  # type: ignore[attr-defined]
+    assert isinstance(func_lazy_kwdefaults, dict), (
+        f'{repr(func_lazy)} not lazy trampoline.')
+
+    # Default keyword-only parameters of this wrapper.
+    func_wrapper_kwdefaults = func_wrapper.__kwdefaults__  # type: ignore[attr-defined]
+
+    # Replace this trampoline in three steps, ensuring that this trampoline
+    # remains callable by other threads between each step:
+    # 1. Extend the default keyword-only parameters of this trampoline by those
+    #    of this wrapper. Since functions ignore defaults of keyword-only
+    #    parameters they do *NOT* declare, both the code object of this
+    #    trampoline and that of this wrapper accept these defaults.
+    # 2. Replace the code object of this trampoline by that of this wrapper.
+    # 3. Replace these defaults by those of this wrapper.
+    func_lazy.__kwdefaults__ = {  # type: ignore[attr-defined]
+        **func_lazy_kwdefaults, **(func_wrapper_kwdefaults or {})}
+    func_lazy.__defaults__ = func_wrapper.__defaults__  # type: ignore[attr-defined]
+    func_lazy.__code__ = func_wrapper.__code__  # type: ignore[attr-defined]
+    func_lazy.__kwdefaults__ = func_wrapper_kwdefaults  # type: ignore[attr-defined]
+
+
+def set_func_lazy_wrapped(func_lazy: Callable, func: Callable) -> None:
+    '''
+    Redirect all subsequent calls to the passed lazy trampoline to the passed
+    callable this trampoline masquerades as.
+
+    This setter is intended to be called when that callable requires *no*
+    type-checking (e.g., due to being annotated only by ignorable type hints)
+    *or* when generating a wrapper for that callable failed non-fatally.
+
+    Parameters
+    ----------
+    func_lazy : Callable
+        Lazy trampoline to be redirected, previously created by the
+        :func:`.make_func_lazy` factory.
+    func : Callable
+        Callable to redirect this trampoline to.
+    '''
+
+    # Forward all subsequent calls to this trampoline to this callable.
+    func_lazy.__kwdefaults__ = {_ARG_NAME_FUNC_LAZY_INIT: func}  # type: ignore[attr-defined]
+
+# ....................{ PRIVATE ~ prototypes               }....................
+def _func_lazy_prototype(*args, __beartype_func_lazy_init, **kwargs):
+    '''
+    **Lazy trampoline prototype** (i.e., function whose code object is shared
+    by all lazy trampolines created by the :func:`.make_func_lazy` factory).
+    '''
+
+    # Forward this call to the lazy initializer of this trampoline.
+    return __beartype_func_lazy_init(*args, **kwargs)
+
+# ....................{ PRIVATE ~ constants                }....................
+_ARG_NAME_FUNC_LAZY_INIT = '__beartype_func_lazy_init'
+'''
+Name of the hidden keyword-only parameter of all lazy trampolines whose default
+value is the lazy initializer of that trampoline.
+'''
+
+
+_FUNC_LAZY_CODEOBJ = _func_lazy_prototype.__code__
+'''
+Code object shared by all lazy trampolines.
+'''
+
+
+_FUNC_LAZY_GLOBALS = {'__builtins__': builtins_dict, '__name__': __name__}
+'''
+Global scope shared by all lazy trampolines, containing *only* builtins and
+the fully-qualified name of this submodule.
+
+Since :func:`beartype.beartype`-generated wrapper functions are generated in a
+global scope containing only builtins and access *all* other attributes as
+hidden parameters, this global scope suffices for wrappers replacing lazy
+trampolines by the :func:`.set_func_lazy_wrapper` setter.
+'''
@@ -36,6 +36,7 @@ from beartype.typing import NoReturn
 from beartype._check.checkcall import BeartypeCall
 from beartype._check.checkmagic import (
     ARG_NAME_FUNC,
+    ARG_NAME_STREAM_CHECKER,
     CODE_PITH_ROOT_NAME_PLACEHOLDER,
 )
 from beartype._check.checkmake import (
@@ -60,11 +61,13 @@ from beartype._decor.wrap.wrapsnip import (
     CODE_INIT_ARGS_LEN,
     CODE_RETURN_CHECK_PREFIX,
     CODE_RETURN_CHECK_SUFFIX,
+    CODE_RETURN_CHECK_SUFFIX_STREAM,
     CODE_RETURN_UNCHECKED,
     CODE_SIGNATURE,
     PARAM_KIND_TO_CODE_LOCALIZE,
     PEP484_CODE_CHECK_NORETURN,
 )
+from beartype._decor.wrap.wrapstream import make_stream_checker
 from beartype._util.error.utilerrorraise import (
     EXCEPTION_PLACEHOLDER,
     reraise_exception_placeholder,
@@ -671,15 +674,42 @@ def _code_check_return(bear_call: BeartypeCall) -> str:
                 code_return_check_prefix = CODE_RETURN_CHECK_PREFIX.format(
                     func_call_prefix=bear_call.func_wrapper_code_call_prefix)
 
+                # Stream checker lazily type-checking the values streamed
+                # through the iterator or generator returned by this callable
+                # if both this configuration enables stream type-checking *AND*
+                # this hint is an iterator or generator hint subscripted by one
+                # or more unignorable child hints *OR* "None" otherwise.
+                stream_checker = make_stream_checker(
+                    func=bear_call.func_wrappee,
+                    hint=hint,
+                    conf=bear_call.conf,
+                )
+
+                # Code snippet returning this return from this wrapper function,
+                # defaulting to returning this return as is.
+                code_return_check_suffix = CODE_RETURN_CHECK_SUFFIX
+
+                # If this return is to be streamed through a stream checker...
+                if stream_checker is not None:
+                    # Pass this checker to this wrapper function as a hidden
+                    # parameter.
+                    bear_call.func_wrapper_scope[ARG_NAME_STREAM_CHECKER] = (
+                        stream_checker)
+
+                    # Return this return wrapped by this checker instead.
+                    code_return_check_suffix = CODE_RETURN_CHECK_SUFFIX_STREAM
+                # Else, this return is returned as is.
+
                 # Full code snippet to be returned, consisting of:
                 # * Calling the decorated callable and localize its return
                 #   *AND*...
                 # * Type-checking this return *AND*...
-                # * Returning this return from this wrapper function.
+                # * Returning this return (possibly wrapped by a stream checker)
+                #   from this wrapper function.
                 func_wrapper_code = (
                     f'{code_return_check_prefix}'
                     f'{code_return_check}'
-                    f'{CODE_RETURN_CHECK_SUFFIX}'
+                    f'{code_return_check_suffix}'
                 )
             # Else, this hint is ignorable.
             # if not func_wrapper_code: print(f'Ignoring {bear_call.func_name} return hint {repr(hint)}...')
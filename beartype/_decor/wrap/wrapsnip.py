@@ -18,6 +18,7 @@ from beartype._check.checkmagic import (
     ARG_NAME_CLS_STACK,
     ARG_NAME_FUNC,
     ARG_NAME_GET_VIOLATION,
+    ARG_NAME_STREAM_CHECKER,
     VAR_NAME_ARGS_LEN,
     VAR_NAME_PITH_ROOT,
     VAR_NAME_RANDOM_INT,
@@ -155,6 +156,16 @@ Code snippet returning from the wrapper function the successfully type-checked
 value returned from the decorated callable.
 '''
 
+
+CODE_RETURN_CHECK_SUFFIX_STREAM = f'''
+    return {ARG_NAME_STREAM_CHECKER}({VAR_NAME_PITH_ROOT})'''
+'''
+Code snippet returning from the wrapper function the successfully type-checked
+iterator, generator, or asynchronous generator returned from the decorated
+callable wrapped in a proxy lazily type-checking the values streamed through
+that object.
+'''
+
 # ....................{ CODE ~ return ~ check ~ noreturn   }....................
 #FIXME: *FALSE.* The following comment is entirely wrong, sadly. Although that
 #comment does, in fact, apply to asynchronous generators, that comment does
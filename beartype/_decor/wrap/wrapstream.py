@@ -0,0 +1,780 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2024 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Beartype decorator **stream checkers** (i.e., low-level classes lazily
+type-checking the values streamed through iterators, generators, and
+asynchronous generators returned by :func:`beartype.beartype`-decorated
+callables under configurations enabling the
+:attr:`beartype.BeartypeConf.check_stream_rate` option).
+
+Iterators and generators are **streams** (i.e., objects producing values on
+demand). Deeply type-checking the values produced by a stream at the time that
+stream is returned would require consuming that stream, which is infeasible.
+Instead, this submodule wraps each such stream in a thin proxy type-checking
+each value as that value streams through that proxy.
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                            }....................
+from beartype.roar import BeartypeDecorHintForwardRefException
+from beartype.typing import (
+    Callable,
+    Optional,
+)
+from beartype._check.checkmake import make_func_tester
+from beartype._check.error.errorget import get_hint_object_violation
+from beartype._check.error._util.errorutiltext import (
+    prefix_beartypeable_return_stream_value)
+from beartype._conf.confcls import BeartypeConf
+from beartype._data.func.datafuncarg import ARG_NAME_RETURN
+from beartype._data.hint.datahinttyping import CallableTester
+from beartype._data.hint.pep.sign.datapepsigns import (
+    HintSignAsyncGenerator,
+    HintSignGenerator,
+)
+from beartype._data.hint.pep.sign.datapepsignset import (
+    HINT_SIGNS_RETURN_GENERATOR_ASYNC,
+    HINT_SIGNS_RETURN_GENERATOR_SYNC,
+)
+from beartype._util.hint.pep.utilpepget import (
+    get_hint_pep_args,
+    get_hint_pep_sign_or_none,
+)
+from beartype._util.hint.utilhinttest import is_hint_ignorable
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterator,
+    Generator,
+    Iterator,
+)
+from warnings import warn
+
+# ....................{ CLASSES                            }....................
+class StreamChecker(object):
+    '''
+    **Stream checker** (i.e., low-level callable wrapping each iterator,
+    generator, or asynchronous generator returned by a
+    :func:`beartype.beartype`-decorated callable in a proxy lazily
+    type-checking the values streamed through that object).
+
+    Each :func:`beartype.beartype`-generated wrapper function type-checking a
+    callable annotated by an iterator or generator return hint under a
+    configuration enabling the :attr:`beartype.BeartypeConf.check_stream_rate`
+    option is passed a single instance of this class as a hidden parameter,
+    which that wrapper then calls on each object returned by that callable.
+
+    Attributes
+    ----------
+    conf : BeartypeConf
+        **Beartype configuration** (i.e., self-caching dataclass encapsulating
+        all settings configuring type-checking for the decorated callable).
+    func : Callable
+        Decorated callable returning these streams.
+    hint_return : object
+        Type hint validating values returned by these streams.
+    hint_send : object
+        Type hint validating values sent to these streams.
+    hint_yield : object
+        Type hint validating values yielded by these streams.
+    is_return_valid : Optional[CallableTester]
+        Tester validating values returned by these streams against the
+        :attr:`hint_return` hint if that hint is unignorable *or* :data:`None`
+        otherwise.
+    is_send_valid : Optional[CallableTester]
+        Tester validating values sent to these streams against the
+        :attr:`hint_send` hint if that hint is unignorable *or* :data:`None`
+        otherwise.
+    is_yield_valid : Optional[CallableTester]
+        Tester validating values yielded by these streams against the
+        :attr:`hint_yield` hint if that hint is unignorable *or* :data:`None`
+        otherwise.
+    stream_rate : float
+        **Stream sampling rate** (i.e., fraction of the values yielded by and
+        sent to these streams to be type-checked), localized from the
+        :attr:`beartype.BeartypeConf.check_stream_rate` option for efficiency.
+    '''
+
+    # ..................{ CLASS VARIABLES                    }..................
+    # Slot all instance variables defined on this object to minimize the time
+    # complexity of both reading and writing variables across frequently
+    # called @beartype decorations. Slotting has been shown to reduce read and
+    # write costs by approximately ~10%, which is non-trivial.
+    __slots__ = (
+        'conf',
+        'func',
+        'hint_return',
+        'hint_send',
+        'hint_yield',
+        'is_return_valid',
+        'is_send_valid',
+        'is_yield_valid',
+        'stream_rate',
+    )
+
+    # ..................{ INITIALIZERS                       }..................
+    def __init__(
+        self,
+        conf: BeartypeConf,
+        func: Callable,
+        hint_yield: object,
+        hint_send: object,
+        hint_return: object,
+    ) -> None:
+        '''
+        Initialize this stream checker.
+
+        Parameters
+        ----------
+        conf : BeartypeConf
+            **Beartype configuration** (i.e., self-caching dataclass
+            encapsulating all settings configuring type-checking for the
+            decorated callable).
+        func : Callable
+            Decorated callable returning these streams.
+        hint_yield : object
+            Type hint validating values yielded by these streams.
+        hint_send : object
+            Type hint validating values sent to these streams.
+        hint_return : object
+            Type hint validating values returned by these streams.
+        '''
+        assert isinstance(conf, BeartypeConf), (
+            f'{repr(conf)} not configuration.')
+        assert isinstance(conf.check_stream_rate, (float, int)) and not (
+            isinstance(conf.check_stream_rate, bool)), (
+            f'{repr(conf.check_stream_rate)} not stream sampling rate.')
+        assert callable(func), f'{repr(func)} uncallable.'
+
+        # Classify all passed parameters.
+        self.conf = conf
+        self.func = func
+        self.hint_return = hint_return
+        self.hint_send = hint_send
+        self.hint_yield = hint_yield
+
+        # Localize this rate for efficiency.
+        self.stream_rate = float(conf.check_stream_rate)  # type: ignore[arg-type]
+
+        # Testers validating these hints if these hints are unignorable.
+        self.is_return_valid = _make_stream_tester(hint_return, conf)
+        self.is_send_valid = _make_stream_tester(hint_send, conf)
+        self.is_yield_valid = _make_stream_tester(hint_yield, conf)
+
+    # ..................{ DUNDERS                            }..................
+    def __call__(self, stream: object) -> object:
+        '''
+        Proxy lazily type-checking the values streamed through the passed
+        iterator, generator, or asynchronous generator returned by the decorated
+        callable if this object is such a stream *or* this object as is
+        otherwise (e.g., if this object is a container returned by a callable
+        annotated by a :class:`collections.abc.Iterable` hint).
+
+        Parameters
+        ----------
+        stream : object
+            Object returned by the decorated callable.
+
+        Returns
+        -------
+        object
+            Either this stream proxy *or* this object as is.
+        '''
+
+        # Return either...
+        return (
+            # If this object is a generator, a generator proxy. Note that
+            # generators are iterators and thus *MUST* be tested first.
+            StreamGeneratorProxy(stream, self)  # type: ignore[arg-type]
+            if isinstance(stream, Generator) else
+            # If this object is an iterator, an iterator proxy.
+            StreamIteratorProxy(stream, self)
+            if isinstance(stream, Iterator) else
+            # If this object is an asynchronous generator, an asynchronous
+            # generator proxy. Again, this *MUST* be tested first.
+            StreamAsyncGeneratorProxy(stream, self)  # type: ignore[arg-type]
+            if isinstance(stream, AsyncGenerator) else
+            # If this object is an asynchronous iterator, an asynchronous
+            # iterator proxy.
+            StreamAsyncIteratorProxy(stream, self)
+            if isinstance(stream, AsyncIterator) else
+            # Else, this object is *NOT* a stream. Return this object as is.
+            stream
+        )
+
+    # ..................{ CHECKERS                           }..................
+    def check_return(self, value: object) -> None:
+        '''
+        Type-check the passed value returned by a stream against the
+        :attr:`hint_return` hint.
+
+        Parameters
+        ----------
+        value : object
+            Value returned by a stream.
+
+        Raises
+        ------
+        :attr:`beartype.BeartypeConf.violation_return_type`
+            If this value violates this hint.
+        '''
+
+        # If this hint is unignorable *AND* this value violates this hint,
+        # raise or emit the appropriate violation.
+        if self.is_return_valid is not None and not self.is_return_valid(
+            value):
+            self._handle_violation(value, self.hint_return, 'returned', False)
+        # Else, this value satisfies this hint.
+
+
+    def check_send(self, value: object) -> None:
+        '''
+        Type-check the passed value sent to a stream against the
+        :attr:`hint_send` hint.
+
+        Parameters
+        ----------
+        value : object
+            Value sent to a stream.
+
+        Raises
+        ------
+        :attr:`beartype.BeartypeConf.violation_param_type`
+            If this value violates this hint.
+        '''
+
+        # If this value violates this hint, raise or emit the appropriate
+        # violation. Callers guarantee this hint to be unignorable (i.e., this
+        # tester to be non-"None").
+        if not self.is_send_valid(value):  # type: ignore[misc]
+            self._handle_violation(value, self.hint_send, 'sent', True)
+        # Else, this value satisfies this hint.
+
+
+    def check_yield(self, value: object) -> None:
+        '''
+        Type-check the passed value yielded by a stream against the
+        :attr:`hint_yield` hint.
+
+        Parameters
+        ----------
+        value : object
+            Value yielded by a stream.
+
+        Raises
+        ------
+        :attr:`beartype.BeartypeConf.violation_return_type`
+            If this value violates this hint.
+        '''
+
+        # If this value violates this hint, raise or emit the appropriate
+        # violation. Callers guarantee this hint to be unignorable (i.e., this
+        # tester to be non-"None").
+        if not self.is_yield_valid(value):  # type: ignore[misc]
+            self._handle_violation(value, self.hint_yield, 'yielded', False)
+        # Else, this value satisfies this hint.
+
+    # ..................{ PRIVATE ~ handlers                 }..................
+    def _handle_violation(
+        self,
+        value: object,
+        hint: object,
+        stream_verb: str,
+        is_param: bool,
+    ) -> None:
+        '''
+        Either raise a fatal exception or emit a non-fatal warning describing
+        the failure of the passed value streamed through a stream to satisfy
+        the passed type hint, depending on this configuration.
+
+        Parameters
+        ----------
+        value : object
+            Value streamed through a stream violating this hint.
+        hint : object
+            Type hint violated by this value.
+        stream_verb : str
+            Past-tense verb describing how this value streamed through that
+            stream (e.g., ``"yielded"``).
+        is_param : bool
+            :data:`True` only if this value was passed *into* that stream (i.e.,
+            sent), in which case this violation is treated as a parameter
+            violation rather than a return violation.
+        '''
+
+        # Violation describing this failure.
+        violation = get_hint_object_violation(
+            obj=value,
+            hint=hint,
+            conf=self.conf,
+            func=self.func,
+            pith_name='value' if is_param else ARG_NAME_RETURN,
+            exception_prefix=prefix_beartypeable_return_stream_value(
+                func=self.func, stream_verb=stream_verb, stream_value=value),
+        )
+
+        # If this configuration emits non-fatal warnings on this kind of
+        # violation, do so.
+        if (
+            self.conf._is_violation_param_warn if is_param else
+            self.conf._is_violation_return_warn
+        ):
+            warn(str(violation), type(violation))  # type: ignore[arg-type]
+        # Else, this configuration raises fatal exceptions on this kind of
+        # violation. Do so.
+        else:
+            raise violation
+
+# ....................{ CLASSES ~ proxy : mixin            }....................
+class _StreamProxySampler(object):
+    '''
+    **Stream proxy sampler** (i.e., mixin shared by all synchronous and
+    asynchronous stream proxies, deciding which values streamed through those
+    proxies are to be type-checked).
+
+    Attributes
+    ----------
+    _stream_checker : StreamChecker
+        Stream checker type-checking the values streamed through this proxy.
+    _stream_debt : float
+        Sampling debt accrued by the values streamed through this proxy.
+    '''
+
+    # ..................{ CLASS VARIABLES                    }..................
+    # Slot all instance variables defined on this object to minimize the time
+    # complexity of both reading and writing variables across frequently
+    # streamed values.
+    __slots__ = (
+        '_stream',
+        '_stream_checker',
+        '_stream_debt',
+    )
+
+    # Squelch false negatives from static type checkers.
+    _stream_checker: StreamChecker
+    _stream_debt: float
+
+    # ..................{ PRIVATE ~ testers                  }..................
+    def _is_stream_sampled(self) -> bool:
+        '''
+        :data:`True` only if the current value streamed through this proxy is
+        to be type-checked, accruing sampling debt as a side effect.
+        '''
+
+        # Accrue the debt of the current value.
+        self._stream_debt += self._stream_checker.stream_rate
+
+        # If this debt is at least one unit, repay one unit and sample this
+        # value.
+        if self._stream_debt >= 1.0:
+            self._stream_debt -= 1.0
+            return True
+        # Else, this debt is less than one unit. Skip this value.
+        return False
+
+# ....................{ CLASSES ~ proxy : sync             }....................
+class StreamIteratorProxy(_StreamProxySampler, Iterator):
+    '''
+    **Iterator proxy** (i.e., iterator wrapping another iterator returned by a
+    :func:`beartype.beartype`-decorated callable, lazily type-checking a sample
+    of the values yielded by that iterator).
+
+    Values are sampled deterministically rather than pseudo-randomly. Each
+    value streamed through this proxy accrues the stream sampling rate as
+    "debt"; each value accruing at least one unit of debt is type-checked,
+    repaying that unit. The first value is thus always type-checked, after which
+    one of every ``1 / rate`` values is type-checked.
+
+    Attributes
+    ----------
+    _stream : Iterator
+        Iterator wrapped by this proxy.
+    _stream_checker : StreamChecker
+        Stream checker type-checking the values yielded by that iterator.
+    _stream_debt : float
+        Sampling debt accrued by the values yielded by that iterator.
+    '''
+
+    # ..................{ CLASS VARIABLES                    }..................
+    # Slot nothing, as the superclass already slots all instance variables.
+    __slots__ = ()
+
+    # ..................{ INITIALIZERS                       }..................
+    def __init__(self, stream: Iterator, stream_checker: StreamChecker) -> None:
+        '''
+        Initialize this iterator proxy.
+
+        Parameters
+        ----------
+        stream : Iterator
+            Iterator wrapped by this proxy.
+        stream_checker : StreamChecker
+            Stream checker type-checking the values yielded by that iterator.
+        '''
+
+        # Classify all passed parameters.
+        self._stream = stream
+        self._stream_checker = stream_checker
+
+        # Initialize this debt such that the first value is always checked.
+        self._stream_debt = 1.0 - stream_checker.stream_rate
+
+    # ..................{ DUNDERS                            }..................
+    def __iter__(self) -> 'StreamIteratorProxy':
+        return self
+
+
+    def __next__(self) -> object:
+
+        # Next value yielded by this iterator.
+        value = next(self._stream)
+
+        # If sampling this value, type-check this value.
+        if (
+            self._stream_checker.is_yield_valid is not None and
+            self._is_stream_sampled()
+        ):
+            self._stream_checker.check_yield(value)
+        # Else, this value is unsampled.
+
+        # Return this value.
+        return value
+
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({repr(self._stream)})'
+
+
+class StreamGeneratorProxy(StreamIteratorProxy, Generator):
+    '''
+    **Generator proxy** (i.e., generator wrapping another generator returned by
+    a :func:`beartype.beartype`-decorated callable, lazily type-checking a
+    sample of the values yielded by and sent to that generator as well as the
+    value returned by that generator).
+
+    See Also
+    --------
+    :class:`.StreamIteratorProxy`
+        Further details.
+    '''
+
+    # ..................{ CLASS VARIABLES                    }..................
+    # Slot nothing, as the superclass already slots all instance variables.
+    __slots__ = ()
+
+    # ..................{ DUNDERS                            }..................
+    def __iter__(self) -> 'StreamGeneratorProxy':
+        return self
+
+
+    def __next__(self) -> object:
+        return self._step(self._stream.__next__)  # type: ignore[arg-type]
+
+    # ..................{ METHODS                            }..................
+    def send(self, value: object) -> object:
+
+        # If sending this value to a generator whose send hint is unignorable
+        # *AND* sampling this value, type-check this value.
+        if (
+            self._stream_checker.is_send_valid is not None and
+            self._is_stream_sampled()
+        ):
+            self._stream_checker.check_send(value)
+        # Else, this value is unsampled.
+
+        # Send this value to this generator.
+        return self._step(self._stream.send, value)  # type: ignore[attr-defined]
+
+
+    def throw(self, *args) -> object:
+        return self._step(self._stream.throw, *args)  # type: ignore[attr-defined]
+
+
+    def close(self) -> None:
+        return self._stream.close()  # type: ignore[attr-defined]
+
+    # ..................{ PRIVATE ~ methods                  }..................
+    def _step(self, stream_method: Callable, *args) -> object:
+        '''
+        Resume the generator wrapped by this proxy by calling the passed bound
+        method of that generator passed the passed positional arguments,
+        type-checking the value yielded or returned by that generator.
+        '''
+
+        # Attempt to resume this generator.
+        try:
+            value = stream_method(*args)
+        # If this generator returned a value, unconditionally type-check this
+        # value *BEFORE* propagating the return of this generator.
+        except StopIteration as exception:
+            self._stream_checker.check_return(exception.value)
+            raise
+
+        # If sampling this value, type-check this value.
+        if (
+            self._stream_checker.is_yield_valid is not None and
+            self._is_stream_sampled()
+        ):
+            self._stream_checker.check_yield(value)
+        # Else, this value is unsampled.
+
+        # Return this value.
+        return value
+
+# ....................{ CLASSES ~ proxy : async            }....................
+class StreamAsyncIteratorProxy(_StreamProxySampler, AsyncIterator):
+    '''
+    **Asynchronous iterator proxy** (i.e., asynchronous iterator wrapping
+    another asynchronous iterator returned by a
+    :func:`beartype.beartype`-decorated callable, lazily type-checking a sample
+    of the values yielded by that iterator).
+
+    See Also
+    --------
+    :class:`.StreamIteratorProxy`
+        Further details.
+    '''
+
+    # ..................{ CLASS VARIABLES                    }..................
+    # Slot nothing, as the superclass already slots all instance variables.
+    __slots__ = ()
+
+    # ..................{ INITIALIZERS                       }..................
+    def __init__(
+        self, stream: AsyncIterator, stream_checker: StreamChecker) -> None:
+
+        # Classify all passed parameters.
+        self._stream = stream
+        self._stream_checker = stream_checker
+
+        # Initialize this debt such that the first value is always checked.
+        self._stream_debt = 1.0 - stream_checker.stream_rate
+
+    # ..................{ DUNDERS                            }..................
+    def __aiter__(self) -> 'StreamAsyncIteratorProxy':
+        return self
+
+
+    async def __anext__(self) -> object:
+
+        # Next value yielded by this iterator.
+        value = await self._stream.__anext__()
+
+        # If sampling this value, type-check this value.
+        if (
+            self._stream_checker.is_yield_valid is not None and
+            self._is_stream_sampled()
+        ):
+            self._stream_checker.check_yield(value)
+        # Else, this value is unsampled.
+
+        # Return this value.
+        return value
+
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({repr(self._stream)})'
+
+
+class StreamAsyncGeneratorProxy(StreamAsyncIteratorProxy, AsyncGenerator):
+    '''
+    **Asynchronous generator proxy** (i.e., asynchronous generator wrapping
+    another asynchronous generator returned by a
+    :func:`beartype.beartype`-decorated callable, lazily type-checking a sample
+    of the values yielded by and sent to that generator).
+
+    Unlike synchronous generators, asynchronous generators *cannot* return
+    values and thus require *no* return type-checking.
+
+    See Also
+    --------
+    :class:`.StreamIteratorProxy`
+        Further details.
+    '''
+
+    # ..................{ CLASS VARIABLES                    }..................
+    # Slot nothing, as the superclass already slots all instance variables.
+    __slots__ = ()
+
+    # ..................{ METHODS                            }..................
+    async def asend(self, value: object) -> object:
+
+        # If sending this value to a generator whose send hint is unignorable
+        # *AND* sampling this value, type-check this value.
+        if (
+            self._stream_checker.is_send_valid is not None and
+            self._is_stream_sampled()
+        ):
+            self._stream_checker.check_send(value)
+        # Else, this value is unsampled.
+
+        # Send this value to this generator.
+        return self._check_yield(await self._stream.asend(value))  # type: ignore[attr-defined]
+
+
+    async def athrow(self, *args) -> object:
+        return self._check_yield(await self._stream.athrow(*args))  # type: ignore[attr-defined]
+
+
+    async def aclose(self) -> None:
+        return await self._stream.aclose()  # type: ignore[attr-defined]
+
+    # ..................{ PRIVATE ~ checkers                 }..................
+    def _check_yield(self, value: object) -> object:
+        '''
+        Type-check the passed value yielded by the asynchronous generator
+        wrapped by this proxy if sampling this value and return this value.
+        '''
+
+        # If sampling this value, type-check this value.
+        if (
+            self._stream_checker.is_yield_valid is not None and
+            self._is_stream_sampled()
+        ):
+            self._stream_checker.check_yield(value)
+        # Else, this value is unsampled.
+
+        # Return this value.
+        return value
+
+# ....................{ FACTORIES                          }....................
+def make_stream_checker(
+    func: Callable, hint: object, conf: BeartypeConf) -> Optional[StreamChecker]:
+    '''
+    **Stream checker** lazily type-checking the values streamed through the
+    iterators, generators, and asynchronous generators returned by the passed
+    decorated callable annotated by the passed return hint under the passed
+    beartype configuration if this configuration enables the
+    :attr:`beartype.BeartypeConf.check_stream_rate` option *and* this hint is
+    an iterator or generator hint subscripted by one or more unignorable child
+    hints *or* :data:`None` otherwise.
+
+    Parameters
+    ----------
+    func : Callable
+        Decorated callable to be type-checked.
+    hint : object
+        Sanitized type hint annotating the return of this callable.
+    conf : BeartypeConf
+        **Beartype configuration** (i.e., self-caching dataclass encapsulating
+        all settings configuring type-checking for this callable).
+
+    Returns
+    -------
+    Optional[StreamChecker]
+        Either:
+
+        * If this configuration enables stream type-checking *and* this hint is
+          an iterator or generator hint subscripted by one or more unignorable
+          child hints, a stream checker type-checking these child hints.
+        * Else, :data:`None`.
+    '''
+    assert isinstance(conf, BeartypeConf), f'{repr(conf)} not configuration.'
+
+    # If this configuration disables stream type-checking, silently reduce to a
+    # noop.
+    if conf.check_stream_rate is None:
+        return None
+    # Else, this configuration enables stream type-checking.
+
+    # Sign uniquely identifying this hint if any *OR* "None" otherwise.
+    hint_sign = get_hint_pep_sign_or_none(hint)
+
+    # If this hint is neither an iterator nor generator hint, silently reduce to
+    # a noop.
+    if not (
+        hint_sign in HINT_SIGNS_RETURN_GENERATOR_SYNC or
+        hint_sign in HINT_SIGNS_RETURN_GENERATOR_ASYNC
+    ):
+        return None
+    # Else, this hint is an iterator or generator hint.
+
+    # Tuple of all child hints subscripting this hint, padded with ignorable
+    # hints to the maximum number of child hints subscripting *ANY* iterator or
+    # generator hint (i.e., "Generator[YieldType, SendType, ReturnType]").
+    hint_childs = get_hint_pep_args(hint) + (object, object, object)
+
+    # Yield child hint, subscripting *ALL* iterator and generator hints.
+    hint_yield = hint_childs[0]
+
+    # Send child hint, subscripting *ONLY* synchronous and asynchronous
+    # generator hints.
+    hint_send = (
+        hint_childs[1]
+        if hint_sign is HintSignGenerator or
+           hint_sign is HintSignAsyncGenerator else
+        object
+    )
+
+    # Return child hint, subscripting *ONLY* synchronous generator hints.
+    hint_return = hint_childs[2] if hint_sign is HintSignGenerator else object
+
+    # Stream checker type-checking these child hints.
+    stream_checker = StreamChecker(
+        conf=conf,
+        func=func,
+        hint_yield=hint_yield,
+        hint_send=hint_send,
+        hint_return=hint_return,
+    )
+
+    # Return either...
+    return (
+        # If this checker type-checks *NO* child hints (e.g., due to all child
+        # hints being ignorable), "None".
+        None
+        if (
+            stream_checker.is_yield_valid is None and
+            stream_checker.is_send_valid is None and
+            stream_checker.is_return_valid is None
+        ) else
+        # Else, this checker.
+        stream_checker
+    )
+
+# ....................{ PRIVATE ~ factories                }....................
+def _make_stream_tester(
+    hint: object, conf: BeartypeConf) -> Optional[CallableTester]:
+    '''
+    Tester validating arbitrary objects against the passed child hint
+    subscripting an iterator or generator hint under the passed beartype
+    configuration if this hint is unignorable *or* :data:`None` otherwise.
+
+    Parameters
+    ----------
+    hint : object
+        Child hint to be validated.
+    conf : BeartypeConf
+        **Beartype configuration** (i.e., self-caching dataclass encapsulating
+        all settings configuring type-checking for this hint).
+
+    Returns
+    -------
+    Optional[CallableTester]
+        Either:
+
+        * If this hint is ignorable, :data:`None`.
+        * If this hint is or contains a **relative forward reference** (i.e.,
+          string referring to a type relative to the module declaring the
+          decorated callable), :data:`None`. Testers are agnostic of the
+          modules declaring decorated callables and thus *cannot* resolve such
+          references. Values streamed through these streams are thus silently
+          left unchecked rather than failing to decorate that callable.
+        * Else, a tester validating this hint.
+    '''
+
+    # If this hint is ignorable, return "None".
+    if is_hint_ignorable(hint):
+        return None
+    # Else, this hint is unignorable.
+
+    # Attempt to return a memoized tester validating this hint.
+    try:
+        return make_func_tester(hint, conf)
+    # If this hint contains one or more relative forward references, silently
+    # return "None". See above.
+    except BeartypeDecorHintForwardRefException:
+        return None
@@ -0,0 +1,456 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2024 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Beartype decorator **union reorderers** (i.e., low-level callables adaptively
+regenerating :func:`beartype.beartype`-generated wrapper functions to
+type-check the most frequently satisfied branches of each union type hint first
+under configurations enabling the
+:attr:`beartype.BeartypeConf.union_reorder_threshold` option).
+
+Wrappers generated under such configurations initially count the hits of each
+branch of each union they type-check with
+:class:`beartype._check.checkunion.UnionBranchHits` counters. After any such
+counter reaches that threshold, this submodule parses the code of that wrapper
+into an abstract syntax tree (AST), reorders the branches of each counted union
+in descending order of hits, strips all calls to these counters, recompiles
+that tree, and replaces the code object of that wrapper in-place. Since the
+wrapper object itself is preserved, *all* existing references to that wrapper
+(e.g., by callers that have already imported that wrapper) transparently
+benefit from this reordering.
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                            }....................
+from ast import (
+    AST,
+    And,
+    BoolOp,
+    Call,
+    Constant,
+    Name,
+    NodeTransformer,
+    Or,
+    expr,
+    fix_missing_locations,
+    parse,
+)
+from beartype.typing import (
+    Callable,
+    Dict,
+    Optional,
+    Tuple,
+)
+from beartype._check.checkunion import UnionBranchHits
+from beartype._data.hint.datahinttyping import LexicalScope
+from types import CodeType
+
+# ....................{ MAKERS                             }....................
+def make_func_union_hits(
+    func_wrapper_scope: LexicalScope) -> Dict[str, UnionBranchHits]:
+    '''
+    Replace each **union branch hit counter template** (i.e.,
+    :class:`.UnionBranchHits` object memoized with code type-checking a union
+    shared between all wrappers type-checking that union) in the passed local
+    scope of a :func:`beartype.beartype`-generated wrapper function to be
+    subsequently created with a new counter specific to that wrapper *and*
+    return a dictionary mapping from the name to value of each such new counter.
+
+    Since code type-checking each type hint is memoized, all wrappers
+    type-checking the same union share the same template. Cloning that template
+    here ensures that each wrapper counts *only* its own hits.
+
+    Parameters
+    ----------
+    func_wrapper_scope : LexicalScope
+        Local scope of the wrapper to be subsequently created.
+
+    Returns
+    -------
+    Dict[str, UnionBranchHits]
+        Dictionary mapping from the name to value of each new counter in this
+        scope, which is empty if this wrapper type-checks *no* counted unions.
+    '''
+    assert isinstance(func_wrapper_scope, dict), (
+        f'{repr(func_wrapper_scope)} not dictionary.')
+
+    # Dictionary mapping from the name to value of each new counter.
+    union_hits: Dict[str, UnionBranchHits] = {}
+
+    # For the name and value of each hidden parameter of this wrapper...
+    for attr_name, attr in func_wrapper_scope.items():
+        # If this value is a counter template, clone this template.
+        if attr.__class__ is UnionBranchHits:
+            union_hits[attr_name] = attr.copy()
+        # Else, this value is *NOT* a counter template.
+
+    # Replace these templates by these clones *AFTER* iterating over this
+    # scope, avoiding modifying this scope while iterating over this scope.
+    func_wrapper_scope.update(union_hits)
+
+    # Return these clones.
+    return union_hits
+
+
+def set_func_union_reorderer(
+    func_wrapper: Callable,
+    func_wrapper_code: str,
+    union_hits: Dict[str, UnionBranchHits],
+) -> None:
+    '''
+    Register a new **union reorderer** (i.e., :class:`._UnionReorderer` object)
+    regenerating the passed :func:`beartype.beartype`-generated wrapper function
+    after any of the passed counters reaches its threshold *and* expose these
+    counters as the ``__beartype_union_hits`` attribute of that wrapper.
+
+    Parameters
+    ----------
+    func_wrapper : Callable
+        Wrapper to be subsequently regenerated.
+    func_wrapper_code : str
+        Code snippet declaring this wrapper.
+    union_hits : Dict[str, UnionBranchHits]
+        Dictionary mapping from the name to value of each counter in the local
+        scope of this wrapper, as returned by the :func:`.make_func_union_hits`
+        function.
+    '''
+    assert callable(func_wrapper), f'{repr(func_wrapper)} uncallable.'
+    assert isinstance(func_wrapper_code, str), (
+        f'{repr(func_wrapper_code)} not string.')
+
+    # Union reorderer regenerating this wrapper.
+    union_reorderer = _UnionReorderer(
+        func_wrapper=func_wrapper,
+        func_wrapper_code=func_wrapper_code,
+        union_hits=union_hits,
+    )
+
+    # Register this reorderer with each counter of this wrapper.
+    for hits in union_hits.values():
+        hits.on_threshold = union_reorderer
+
+    # Expose these counters for inspection.
+    func_wrapper.__beartype_union_hits = tuple(  # type: ignore[attr-defined]
+        union_hits.values())
+
+# ....................{ PRIVATE ~ classes                  }....................
+class _UnionReorderer(object):
+    '''
+    **Union reorderer** (i.e., callable regenerating a
+    :func:`beartype.beartype`-generated wrapper function with the branches of
+    each union type-checked by that wrapper reordered in descending order of
+    hits when called by any :class:`.UnionBranchHits` counter of that wrapper
+    reaching its threshold).
+
+    Attributes
+    ----------
+    _func_wrapper : Callable
+        Wrapper to be regenerated.
+    _func_wrapper_code : Optional[str]
+        Code snippet declaring this wrapper if this wrapper has yet to be
+        regenerated *or* :data:`None` otherwise.
+    _union_hits : Dict[str, UnionBranchHits]
+        Dictionary mapping from the name to value of each counter in the local
+        scope of this wrapper.
+    '''
+
+    # ..................{ CLASS VARIABLES                    }..................
+    # Slot all instance variables defined on this object to minimize the time
+    # complexity of both reading and writing variables across frequently called
+    # @beartype decorations. Slotting has been shown to reduce read and write
+    # costs by approximately ~10%, which is non-trivial.
+    __slots__ = (
+        '_func_wrapper',
+        '_func_wrapper_code',
+        '_union_hits',
+    )
+
+    # ..................{ INITIALIZERS                       }..................
+    def __init__(
+        self,
+        func_wrapper: Callable,
+        func_wrapper_code: str,
+        union_hits: Dict[str, UnionBranchHits],
+    ) -> None:
+        '''
+        Initialize this union reorderer.
+
+        Parameters
+        ----------
+        func_wrapper : Callable
+            Wrapper to be regenerated.
+        func_wrapper_code : str
+            Code snippet declaring this wrapper.
+        union_hits : Dict[str, UnionBranchHits]
+            Dictionary mapping from the name to value of each counter in the
+            local scope of this wrapper.
+        '''
+
+        # Classify all passed parameters.
+        self._func_wrapper = func_wrapper
+        self._func_wrapper_code: Optional[str] = func_wrapper_code
+        self._union_hits = union_hits
+
+    # ..................{ DUNDERS                            }..................
+    def __call__(self, hits: UnionBranchHits) -> None:
+        '''
+        Regenerate this wrapper with the branches of each union type-checked by
+        this wrapper reordered in descending order of hits *and* all calls to
+        counters removed.
+
+        Parameters
+        ----------
+        hits : UnionBranchHits
+            Counter reaching its threshold, triggering this regeneration.
+            Since this regeneration reorders the branches of *all* unions
+            type-checked by this wrapper, this counter is ignored.
+        '''
+
+        # Localize the code declaring this wrapper.
+        func_wrapper_code = self._func_wrapper_code
+
+        # If this wrapper has already been regenerated (e.g., by another
+        # counter of this wrapper concurrently reaching its threshold in
+        # another thread), silently reduce to a noop.
+        if func_wrapper_code is None:
+            return
+        # Else, this wrapper has yet to be regenerated.
+
+        # Prevent this wrapper from being regenerated again *BEFORE*
+        # regenerating this wrapper.
+        self._func_wrapper_code = None
+
+        # Localize attributes of this wrapper for efficiency.
+        func_wrapper = self._func_wrapper
+        func_wrapper_codeobj = func_wrapper.__code__
+
+        # Abstract syntax tree (AST) of the module declaring this wrapper,
+        # transformed to reorder these branches and remove these calls.
+        module_node = parse(func_wrapper_code)
+        _UnionBranchReorderer(self._union_hits).visit(module_node)
+        fix_missing_locations(module_node)
+
+        # Code object of this module, compiled under the same fake filename as
+        # the original wrapper to preserve the consistency of tracebacks.
+        module_codeobj = compile(
+            module_node, func_wrapper_codeobj.co_filename, 'exec')
+
+        # For each constant of this module...
+        for module_const in module_codeobj.co_consts:
+            # If this constant is the code object of this wrapper, replace the
+            # code object of this wrapper in-place and halt iteration.
+            if (
+                isinstance(module_const, CodeType) and
+                module_const.co_name == func_wrapper_codeobj.co_name
+            ):
+                func_wrapper.__code__ = module_const
+                break
+        # Else, this module unexpectedly fails to declare this wrapper. In this
+        # case, silently preserve this wrapper as is. Since the counters of
+        # this wrapper have already reached their thresholds, these counters
+        # will *NOT* attempt to regenerate this wrapper again.
+
+        # Record all counters of this wrapper to have been reordered.
+        for hits in self._union_hits.values():
+            hits.is_reordered = True
+
+# ....................{ PRIVATE ~ classes : ast            }....................
+class _UnionBranchReorderer(NodeTransformer):
+    '''
+    **Union branch reorderer** (i.e., abstract syntax tree (AST) transformer
+    reordering the counted branches of each union in the code of a
+    :func:`beartype.beartype`-generated wrapper function in descending order of
+    hits *and* removing all calls to the counters counting those hits).
+
+    Each counted branch is an ``and`` expression whose last operand is a call
+    ``{hits_name}({branch_index})`` to a counter in the local scope of that
+    wrapper (e.g., ``(isinstance(pith, (int, str)) and hits(0))``), generated
+    by the :data:`beartype._check.code.codesnip.PEP484_CODE_HINT_UNION_HITS_CHILD_PEP`
+    and :data:`beartype._check.code.codesnip.PEP484_CODE_HINT_UNION_HITS_CHILD_NONPEP`
+    snippets. The counted branches of each union are the operands of the same
+    ``or`` expression.
+
+    Attributes
+    ----------
+    _union_hits : Dict[str, UnionBranchHits]
+        Dictionary mapping from the name to value of each counter in the local
+        scope of this wrapper.
+    '''
+
+    # ..................{ INITIALIZERS                       }..................
+    def __init__(self, union_hits: Dict[str, UnionBranchHits]) -> None:
+        '''
+        Initialize this union branch reorderer.
+
+        Parameters
+        ----------
+        union_hits : Dict[str, UnionBranchHits]
+            Dictionary mapping from the name to value of each counter in the
+            local scope of this wrapper.
+        '''
+
+        # Initialize our superclass.
+        super().__init__()
+
+        # Classify all passed parameters.
+        self._union_hits = union_hits
+
+    # ..................{ VISITORS                           }..................
+    def visit_BoolOp(self, node: BoolOp) -> AST:
+        '''
+        Reorder the counted branches of the passed ``or`` expression (if any)
+        *and* remove all calls to counters from those branches.
+
+        Parameters
+        ----------
+        node : BoolOp
+            Boolean expression to be transformed.
+
+        Returns
+        -------
+        AST
+            This boolean expression transformed in-place.
+        '''
+
+        # If this is an "and" expression, this expression is *NOT* a union.
+        # Since this expression is *NOT* a branch of a union either (as this
+        # visitor would have already stripped that branch when visiting the
+        # parent "or" expression of that branch), preserve this expression.
+        if not isinstance(node.op, Or):
+            self.generic_visit(node)
+            return node
+        # Else, this is an "or" expression.
+
+        # Counter counting the hits of the branches of this expression if any
+        # *OR* "None" otherwise.
+        hits: Optional[UnionBranchHits] = None
+
+        # Dictionary mapping from the 0-based index of each counted branch of
+        # this expression to the 0-based index of that branch in the operands
+        # of this expression.
+        branch_index_to_value_index: Dict[int, int] = {}
+
+        # For the 0-based index of each operand of this expression and that
+        # operand...
+        for value_index, value in enumerate(node.values):
+            # Counter and 0-based branch index counting this operand if this
+            # operand is a counted branch *OR* "None" otherwise.
+            branch = self._get_branch_hits(value)
+
+            # If this operand is *NOT* a counted branch, continue to the next.
+            if branch is None:
+                continue
+            # Else, this operand is a counted branch.
+
+            # Replace this branch by the same branch *WITHOUT* this call.
+            hits, branch_index = branch
+            node.values[value_index] = _strip_branch_hits(value)  # type: ignore[arg-type]
+            branch_index_to_value_index[branch_index] = value_index
+
+        # Transform all child expressions of this expression *AFTER* stripping
+        # these calls, reordering the branches of any nested unions.
+        self.generic_visit(node)
+
+        # If this expression is a union whose branches are *ALL* counted by
+        # the same counter...
+        if (
+            hits is not None and
+            len(branch_index_to_value_index) == len(hits.hits)
+        ):
+            # Sorted list of the 0-based indices of the operands of this
+            # expression that are these branches.
+            value_indices = sorted(branch_index_to_value_index.values())
+
+            # List of these branches, indexed by branch index.
+            branch_values = [
+                node.values[branch_index_to_value_index[branch_index]]
+                for branch_index in range(len(hits.hits))
+            ]
+
+            # Reorder these branches in descending order of hits, preserving
+            # all other operands (e.g., the operand localizing the current pith)
+            # in-place.
+            for value_index, branch_index in zip(
+                value_indices, hits.get_branch_indices_by_hits()):
+                node.values[value_index] = branch_values[branch_index]
+        # Else, this expression is *NOT* such a union.
+
+        # Return this expression.
+        return node
+
+    # ..................{ PRIVATE ~ getters                  }..................
+    def _get_branch_hits(
+        self, node: AST) -> Optional[Tuple[UnionBranchHits, int]]:
+        '''
+        2-tuple ``(hits, branch_index)`` of the counter and 0-based branch index
+        counting the passed node if this node is a counted branch *or*
+        :data:`None` otherwise.
+
+        Parameters
+        ----------
+        node : AST
+            Node to be inspected.
+
+        Returns
+        -------
+        Optional[Tuple[UnionBranchHits, int]]
+            Either this 2-tuple or :data:`None`.
+        '''
+
+        # If this node is *NOT* an "and" expression, this node is *NOT* a
+        # counted branch.
+        if not (isinstance(node, BoolOp) and isinstance(node.op, And)):
+            return None
+        # Else, this node is an "and" expression.
+
+        # Last operand of this expression.
+        node_last = node.values[-1]
+
+        # If this operand is *NOT* a call to a counter passed a constant
+        # integer, this node is *NOT* a counted branch.
+        if not (
+            isinstance(node_last, Call) and
+            isinstance(node_last.func, Name) and
+            node_last.func.id in self._union_hits and
+            len(node_last.args) == 1 and
+            not node_last.keywords and
+            isinstance(node_last.args[0], Constant) and
+            isinstance(node_last.args[0].value, int)
+        ):
+            return None
+        # Else, this operand is such a call.
+
+        # Return this counter and branch index.
+        return (
+            self._union_hits[node_last.func.id], node_last.args[0].value)
+
+# ....................{ PRIVATE ~ strippers                }....................
+def _strip_branch_hits(node: BoolOp) -> expr:
+    '''
+    Passed counted branch *without* its trailing call to its counter.
+
+    Parameters
+    ----------
+    node : BoolOp
+        Counted branch to be stripped.
+
+    Returns
+    -------
+    expr
+        Either:
+
+        * If this branch has only one other operand, that operand.
+        * Else, a new ``and`` expression of all other operands.
+    '''
+
+    # Return either...
+    return (
+        # If this branch has only one other operand, that operand;
+        node.values[0]
+        if len(node.values) == 2 else
+        # Else, a new "and" expression of all other operands.
+        BoolOp(op=And(), values=node.values[:-1])
+    )
@@ -13,11 +13,37 @@ This private submodule is *not* intended for importation by downstream callers.
 # ....................{ IMPORTS                            }....................
 from ast import (
     AST,
+    AsyncFor,
+    AsyncFunctionDef,
+    ClassDef,
+    Del,
+    DictComp,
+    ExceptHandler,
+    For,
+    FunctionDef,
+    GeneratorExp,
+    Import,
+    ImportFrom,
+    Lambda,
+    ListComp,
+    Name,
+    SetComp,
+    Store,
+    While,
+    arg,
     dump as ast_dump,
+    iter_child_nodes,
+)
+from beartype.typing import (
+    FrozenSet,
+    List,
+    Optional,
+    Set,
+    Tuple,
 )
 from beartype._util.py.utilpyversion import IS_PYTHON_AT_LEAST_3_9
 
-# ....................{ TESTERS                            }....................
+# ....................{ GETTERS                            }....................
 #FIXME: Unit test us up, please.
 def get_node_repr_indented(node: AST) -> str:
     '''
@@ -47,3 +73,197 @@ def get_node_repr_indented(node: AST) -> str:
         # case, the non-pretty-printed contents of this AST as a single line.
         ast_dump(node)
     )
+
+
+def get_node_names_unstable(node: AST) -> Optional[FrozenSet[str]]:
+    '''
+    Frozen set of the unqualified names of *all* **unstable attributes** (i.e.,
+    attributes that may refer to different objects at different times or in
+    different lexical scopes) bound (e.g., assigned, declared, deleted,
+    imported, matched, or passed as parameters) in the passed abstract syntax
+    tree (AST) if these names are decidable *or* :data:`None` otherwise (i.e.,
+    if *all* attributes are unstable).
+
+    An attribute is unstable if that attribute is bound either:
+
+    * In any **nested lexical scope** (i.e., class, callable, comprehension, or
+      lambda body) of this AST and thus possibly local to that scope.
+    * In the body of any loop of this AST.
+    * More than once anywhere in this AST.
+
+    *All* attributes are unstable if this AST either:
+
+    * Performs a **star import** (e.g., ``from muh_module import *``), binding
+      an undecidable set of names.
+    * Refers to the :func:`globals` or :func:`vars` builtins, whose
+      dictionaries enable arbitrary global attributes to be bound by name
+      (e.g., ``globals()['muh_attr'] = muh_value``).
+
+    This getter conservatively over-approximates the set of unstable names.
+    Any name *not* in this set is guaranteed to refer to either a builtin or
+    global attribute bound at most once everywhere in this AST, enabling
+    callers to safely evaluate expressions referring only to such names once
+    (after that binding) and reuse the result everywhere in this AST. This
+    guarantee excludes only attributes bound by external code (e.g.,
+    ``setattr(sys.modules[__name__], 'muh_attr', muh_value)``), which no static
+    analysis can detect.
+
+    Parameters
+    ----------
+    node : AST
+        AST to be inspected, typically a module node.
+
+    Returns
+    -------
+    Optional[FrozenSet[str]]
+        Either:
+
+        * If all attributes are unstable, :data:`None`.
+        * Else, a frozen set of the names of all unstable attributes.
+    '''
+    assert isinstance(node, AST), f'{repr(node)} not AST.'
+
+    # Set of the names of all attributes bound at least once in this AST.
+    names_bound: Set[str] = set()
+
+    # Set of the names of all unstable attributes bound in this AST.
+    names_unstable: Set[str] = set()
+
+    # Stack of 2-tuples "(node_curr, is_unstable)" of each node to be visited
+    # and whether that node resides in a nested lexical scope or loop body.
+    nodes_stack: List[Tuple[AST, bool]] = [(node, False)]
+
+    # While one or more nodes remain to be visited...
+    while nodes_stack:
+        # Node to be visited *AND* whether that node resides in a nested
+        # lexical scope or loop body.
+        node_curr, is_unstable = nodes_stack.pop()
+
+        # Name bound by this node if any *OR* "None" otherwise.
+        name_bound: Optional[str] = None
+
+        # If this node binds a name, localize that name.
+        if isinstance(node_curr, Name):
+            # If this node either assigns or deletes this name, this node binds
+            # this name.
+            if isinstance(node_curr.ctx, _TYPES_NODE_CONTEXT_BIND):
+                name_bound = node_curr.id
+            # Else, this node loads this name. If this name refers to a builtin
+            # enabling arbitrary global attributes to be bound by name, *ALL*
+            # attributes are unstable.
+            elif node_curr.id in _NAMES_GLOBALS_GETTER:
+                return None
+            # Else, this node loads an innocuous name.
+        elif isinstance(node_curr, arg):
+            name_bound = node_curr.arg
+        elif isinstance(node_curr, _TYPES_NODE_NAMED):
+            name_bound = node_curr.name  # type: ignore[attr-defined]
+        elif isinstance(node_curr, (Import, ImportFrom)):
+            # For each name imported by this import...
+            for node_alias in node_curr.names:
+                # If this is a star import, this import binds an undecidable
+                # set of names. In this case, *ALL* attributes are unstable.
+                if node_alias.name == '*':
+                    return None
+                # Else, this is *NOT* a star import.
+
+                # Name bound by this import.
+                name_import = (
+                    node_alias.asname or node_alias.name.partition('.')[0])
+
+                # Record this name as bound, possibly unstably.
+                if is_unstable or name_import in names_bound:
+                    names_unstable.add(name_import)
+                names_bound.add(name_import)
+        # Else, this node is none of the above. In this case...
+        else:
+            # Name of the instance variable of this node providing the name
+            # bound by this node if this node is a pattern of a "match"
+            # statement capturing a name *OR* "None" otherwise.
+            #
+            # Note that these node types are intentionally identified by name.
+            # Since these node types only exist under Python >= 3.10, importing
+            # these node types would be non-portable.
+            name_bound_attr_name = _NODE_TYPE_NAME_TO_NAME_ATTR_NAME.get(
+                node_curr.__class__.__name__)
+
+            # If this node is such a pattern, localize the name captured by
+            # this pattern if any *OR* "None" otherwise (e.g., the wildcard
+            # pattern "case _:").
+            if name_bound_attr_name:
+                name_bound = getattr(node_curr, name_bound_attr_name)
+            # Else, this node binds *NO* name.
+
+        # If this node binds a name, record this name as bound. If this name
+        # was already bound *OR* this node resides in a nested lexical scope or
+        # loop body, this name is unstable.
+        if name_bound:
+            if is_unstable or name_bound in names_bound:
+                names_unstable.add(name_bound)
+            names_bound.add(name_bound)
+        # Else, this node binds *NO* name.
+
+        # Children of this node reside in a nested lexical scope or loop body
+        # if either this node does *OR* this node declares either.
+        is_unstable_child = is_unstable or isinstance(
+            node_curr, _TYPES_NODE_UNSTABLE)
+
+        # Push all children of this node onto this stack.
+        for node_child in iter_child_nodes(node_curr):
+            nodes_stack.append((node_child, is_unstable_child))
+
+    # Return a frozen set of these names.
+    return frozenset(names_unstable)
+
+# ....................{ PRIVATE ~ constants                }....................
+_NAMES_GLOBALS_GETTER = frozenset(('globals', 'vars'))
+'''
+Frozen set of the names of all builtins returning dictionaries enabling
+arbitrary global attributes to be bound by name.
+'''
+
+
+_NODE_TYPE_NAME_TO_NAME_ATTR_NAME = {
+    'MatchAs': 'name',
+    'MatchMapping': 'rest',
+    'MatchStar': 'name',
+}
+'''
+Dictionary mapping from the unqualified name of each :pep:`634`-compliant
+``match`` statement pattern node type capturing a name (e.g., ``case [*rest]``,
+``case {**rest}``, ``case int() as muh_int``) to the name of the instance
+variable of that node type providing that name if any *or* :data:`None`.
+'''
+
+
+_TYPES_NODE_CONTEXT_BIND = (Del, Store)
+'''
+Tuple of all node context types binding (i.e., either assigning or deleting)
+the names of the :class:`ast.Name` nodes they contextualize.
+'''
+
+
+_TYPES_NODE_NAMED = (AsyncFunctionDef, ClassDef, ExceptHandler, FunctionDef)
+'''
+Tuple of all node types binding the name given by their ``name`` instance
+variables in their parent lexical scopes.
+'''
+
+
+_TYPES_NODE_UNSTABLE = (
+    AsyncFor,
+    AsyncFunctionDef,
+    ClassDef,
+    DictComp,
+    For,
+    FunctionDef,
+    GeneratorExp,
+    Lambda,
+    ListComp,
+    SetComp,
+    While,
+)
+'''
+Tuple of all node types declaring either nested lexical scopes or loop bodies,
+such that attributes bound in their children may be rebound.
+'''
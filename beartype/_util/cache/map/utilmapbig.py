@@ -245,3 +245,25 @@ class CacheUnboundedStrong(object):
 
         # Clear your head and be at peace, one-liner.
         self._key_to_value.clear()
+
+
+    def clear_if(self, is_stale: Callable[[Hashable, object], bool]) -> None:
+        '''
+        Remove *all* key-value pairs from this cache for which the passed
+        tester returns :data:`True`, preserving all other key-value pairs.
+
+        Parameters
+        ----------
+        is_stale : Callable[[Hashable, object], bool]
+            Tester passed each key and value cached by this cache, returning
+            :data:`True` only if that key-value pair is to be removed.
+        '''
+
+        # With this cache locked, remove all stale key-value pairs. Note that
+        # this dictionary is iterated over a copy of its items, as removing
+        # items from a dictionary while iterating over that dictionary raises
+        # a "RuntimeError".
+        with self._lock:
+            for key, value in tuple(self._key_to_value.items()):
+                if is_stale(key, value):
+                    del self._key_to_value[key]
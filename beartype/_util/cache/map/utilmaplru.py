@@ -30,7 +30,14 @@ This private submodule is *not* intended for importation by downstream callers.
 
 # ....................{ IMPORTS                            }....................
 from beartype.roar._roarexc import _BeartypeUtilCacheLruException
-from beartype.typing import Hashable
+from beartype.typing import (
+    Callable,
+    Hashable,
+    Union,
+)
+from beartype._util.cache.map.utilmapbig import CacheUnboundedStrong
+from beartype._util.utilobject import SENTINEL
+from collections import OrderedDict
 from threading import Lock
 
 # ....................{ CLASSES                            }....................
@@ -245,3 +252,198 @@ class CacheLruStrong(dict):
                 return True
 
             return False
+
+
+class CacheBoundedStrong(CacheUnboundedStrong):
+    '''
+    **Thread-safe strongly bounded cache** (i.e., mapping limited to some
+    maximum capacity of strongly referenced arbitrary keys onto strongly
+    referenced arbitrary values, evicting the least recently used key-value
+    pair on exceeding that capacity, whose methods are guaranteed to behave
+    thread-safely).
+
+    This cache is a drop-in replacement for the comparable
+    :class:`.CacheUnboundedStrong` cache, sharing the same thread-safe API.
+    Unlike the lower-level :class:`.CacheLruStrong` cache, this cache
+    intentionally exposes *no* thread-unsafe dunder methods.
+
+    Attributes
+    ----------
+    _key_to_value_move_to_end : Callable
+        The :meth:`self._key_to_value.move_to_end` method, classified for
+        efficiency.
+    _size_max : int
+        **Cache capacity** (i.e., maximum number of key-value pairs persisted
+        by this cache).
+
+    See Also
+    --------
+    :class:`.CacheUnboundedStrong`
+        Further details.
+    '''
+
+    # ..................{ CLASS VARIABLES                    }..................
+    # Slot all instance variables defined on this object to minimize the time
+    # complexity of both reading and writing variables.
+    __slots__ = (
+        '_key_to_value_move_to_end',
+        '_size_max',
+    )
+
+    # ..................{ INITIALIZER                        }..................
+    def __init__(
+        self,
+
+        # Mandatory parameters.
+        size_max: int,
+
+        # Optional parameters.
+        lock_type: Union[type, Callable[[], object]] = Lock,
+    ) -> None:
+        '''
+        Initialize this cache to an empty cache with the passed capacity.
+
+        Parameters
+        ----------
+        size_max : int
+            **Cache capacity** (i.e., maximum number of key-value pairs held in
+            this cache).
+        lock_type : Union[type, Callable[[], object]]
+            Type of thread-safe lock to internally use. Defaults to
+            :class:`Lock` (i.e., the type of the standard non-reentrant lock)
+            for efficiency.
+
+        Raises
+        ------
+        _BeartypeUtilCacheLruException
+            If this capacity is *not* a positive integer.
+        '''
+
+        # If this capacity is *NOT* a positive integer, raise an exception.
+        if not isinstance(size_max, int):
+            raise _BeartypeUtilCacheLruException(
+                f'LRU cache capacity {repr(size_max)} not integer.')
+        elif size_max < 1:
+            raise _BeartypeUtilCacheLruException(
+                f'LRU cache capacity {size_max} not positive.')
+        # Else, this capacity is a positive integer.
+
+        # Initialize our superclass.
+        super().__init__(lock_type=lock_type)
+
+        # Replace the dictionary backing this cache by an ordered dictionary,
+        # whose C-based move_to_end() method refreshes keys in O(1) time.
+        self._key_to_value = OrderedDict()  # type: ignore[assignment]
+        self._key_to_value_get = self._key_to_value.get
+        self._key_to_value_set = self._key_to_value.__setitem__
+        self._key_to_value_move_to_end = (
+            self._key_to_value.move_to_end)  # type: ignore[attr-defined]
+        self._size_max = size_max
+
+    # ..................{ GETTERS                            }..................
+    def cache_or_get_cached_value(
+        self,
+
+        # Mandatory parameters.
+        key: Hashable,
+        value: object,
+
+        # Hidden parameters, localized for negligible efficiency.
+        _SENTINEL=SENTINEL,
+    ) -> object:
+        '''
+        **Statically** associate the passed key with the passed value if this
+        cache has yet to cache this key and, in any case, return the value
+        associated with this key.
+
+        See Also
+        --------
+        :meth:`.CacheUnboundedStrong.cache_or_get_cached_value`
+            Further details.
+        '''
+
+        # Thread-safely (but non-reentrantly)...
+        with self._lock:
+            # Value previously cached under this key if any *OR* the sentinel
+            # placeholder otherwise.
+            value_old = self._key_to_value_get(key, _SENTINEL)
+
+            # If this key has already been cached, refresh this key as the most
+            # recently used key and return this value as is.
+            if value_old is not _SENTINEL:
+                self._key_to_value_move_to_end(key)
+                return value_old
+            # Else, this key has yet to be cached.
+
+            # Cache this key with this value, evicting the least recently used
+            # key-value pair if this cache now exceeds its capacity.
+            self._cache_value(key, value)
+
+            # Return this value.
+            return value
+
+
+    def cache_or_get_cached_func_return_passed_arg(
+        self,
+
+        # Mandatory parameters.
+        key: Hashable,
+        value_factory: Callable[[object], object],
+        arg: object,
+
+        # Hidden parameters, localized for negligible efficiency.
+        _SENTINEL=SENTINEL,
+    ) -> object:
+        '''
+        Dynamically associate the passed key with the value returned by the
+        passed **value factory** if this cache has yet to cache this key and, in
+        any case, return the value associated with this key.
+
+        See Also
+        --------
+        :meth:`.CacheUnboundedStrong.cache_or_get_cached_func_return_passed_arg`
+            Further details.
+        '''
+
+        # Thread-safely (but non-reentrantly)...
+        with self._lock:
+            # Value previously cached under this key if any *OR* the sentinel
+            # placeholder otherwise.
+            value_old = self._key_to_value_get(key, _SENTINEL)
+
+            # If this key has already been cached, refresh this key as the most
+            # recently used key and return this value as is.
+            if value_old is not _SENTINEL:
+                self._key_to_value_move_to_end(key)
+                return value_old
+            # Else, this key has yet to be cached.
+
+            # Value created by this factory function.
+            value = value_factory(arg)
+
+            # Cache this key with this value, evicting the least recently used
+            # key-value pair if this cache now exceeds its capacity.
+            self._cache_value(key, value)
+
+            # Return this value.
+            return value
+
+    # ..................{ PRIVATE                            }..................
+    def _cache_value(self, key: Hashable, value: object) -> None:
+        '''
+        Cache the passed key with the passed value, evicting the least recently
+        used key-value pairs while this cache exceeds its capacity.
+
+        This method is intended to be called *only* with this cache locked.
+        '''
+
+        # Cache this key with this value.
+        self._key_to_value_set(key, value)
+
+        # While this cache exceeds its capacity, evict the least recently used
+        # key-value pair. Note that the value factory passed to the
+        # cache_or_get_cached_func_return_passed_arg() method may have
+        # reentrantly cached other key-value pairs under a reentrant lock; this
+        # cache may thus exceed its capacity by more than one key-value pair.
+        while len(self._key_to_value) > self._size_max:
+            self._key_to_value.popitem(last=False)  # type: ignore[call-arg]
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2024 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Project-wide **weak-valued cache** utilities.
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                            }....................
+from beartype.typing import (
+    Callable,
+    Hashable,
+    Union,
+)
+from beartype._util.cache.map.utilmapbig import CacheUnboundedStrong
+from beartype._util.utilobject import SENTINEL
+from threading import Lock
+from weakref import WeakValueDictionary
+
+# ....................{ CLASSES                            }....................
+class CacheUnboundedWeak(CacheUnboundedStrong):
+    '''
+    **Thread-safe weakly unbounded cache** (i.e., mapping of unlimited size from
+    strongly referenced arbitrary keys onto weakly referenced arbitrary values,
+    whose methods are guaranteed to behave thread-safely).
+
+    This cache is a drop-in replacement for the comparable
+    :class:`.CacheUnboundedStrong` cache, sharing the same thread-safe API.
+    Unlike that cache, this cache silently evicts each key-value pair as soon as
+    the value of that pair is garbage-collected (i.e., is no longer strongly
+    referenced elsewhere), preventing this cache from prolonging the lifetimes
+    of dynamically created objects (e.g., type hints subscripted by classes
+    dynamically created at runtime).
+
+    Caveats
+    -------
+    **This cache does not cache values that are not weakly referenceable.**
+    Since some objects cannot be weakly referenced (e.g., :pep:`604`-compliant
+    unions under Python < 3.12), the methods of this cache silently return
+    these values *without* caching these values.
+
+    See Also
+    --------
+    :class:`.CacheUnboundedStrong`
+        Further details.
+    '''
+
+    # ..................{ CLASS VARIABLES                    }..................
+    # Slot all instance variables defined on this object to minimize the time
+    # complexity of both reading and writing variables.
+    __slots__ = ()
+
+    # ..................{ INITIALIZER                        }..................
+    def __init__(
+        self,
+
+        # Optional parameters.
+        lock_type: Union[type, Callable[[], object]] = Lock,
+    ) -> None:
+        '''
+        Initialize this cache to an empty cache.
+
+        Parameters
+        ----------
+        lock_type : Union[type, Callable[[], object]]
+            Type of thread-safe lock to internally use. Defaults to
+            :class:`Lock` (i.e., the type of the standard non-reentrant lock)
+            for efficiency.
+        '''
+
+        # Initialize our superclass.
+        super().__init__(lock_type=lock_type)
+
+        # Replace the dictionary backing this cache by a weak-valued dictionary.
+        self._key_to_value = WeakValueDictionary()  # type: ignore[assignment]
+        self._key_to_value_get = self._key_to_value.get
+        self._key_to_value_set = self._key_to_value.__setitem__
+
+    # ..................{ GETTERS                            }..................
+    def cache_or_get_cached_value(
+        self,
+
+        # Mandatory parameters.
+        key: Hashable,
+        value: object,
+
+        # Hidden parameters, localized for negligible efficiency.
+        _SENTINEL=SENTINEL,
+    ) -> object:
+        '''
+        **Statically** associate the passed key with the passed value if this
+        cache has yet to cache this key and this value is weakly referenceable
+        and, in any case, return the value associated with this key.
+
+        See Also
+        --------
+        :meth:`.CacheUnboundedStrong.cache_or_get_cached_value`
+            Further details.
+        '''
+
+        # Thread-safely (but non-reentrantly)...
+        with self._lock:
+            # Value previously cached under this key if any *OR* the sentinel
+            # placeholder otherwise.
+            value_old = self._key_to_value_get(key, _SENTINEL)
+
+            # If this key has already been cached, return this value as is.
+            if value_old is not _SENTINEL:
+                return value_old
+            # Else, this key has yet to be cached.
+
+            # Cache this key with this value if this value is weakly
+            # referenceable.
+            self._cache_value(key, value)
+
+            # Return this value.
+            return value
+
+
+    def cache_or_get_cached_func_return_passed_arg(
+        self,
+
+        # Mandatory parameters.
+        key: Hashable,
+        value_factory: Callable[[object], object],
+        arg: object,
+
+        # Hidden parameters, localized for negligible efficiency.
+        _SENTINEL=SENTINEL,
+    ) -> object:
+        '''
+        Dynamically associate the passed key with the value returned by the
+        passed **value factory** if this cache has yet to cache this key and
+        that value is weakly referenceable and, in any case, return the value
+        associated with this key.
+
+        See Also
+        --------
+        :meth:`.CacheUnboundedStrong.cache_or_get_cached_func_return_passed_arg`
+            Further details.
+        '''
+
+        # Thread-safely (but non-reentrantly)...
+        with self._lock:
+            # Value previously cached under this key if any *OR* the sentinel
+            # placeholder otherwise.
+            value_old = self._key_to_value_get(key, _SENTINEL)
+
+            # If this key has already been cached, return this value as is.
+            if value_old is not _SENTINEL:
+                return value_old
+            # Else, this key has yet to be cached.
+
+            # Value created by this factory function.
+            value = value_factory(arg)
+
+            # Cache this key with this value if this value is weakly
+            # referenceable.
+            self._cache_value(key, value)
+
+            # Return this value.
+            return value
+
+    # ..................{ PRIVATE                            }..................
+    def _cache_value(self, key: Hashable, value: object) -> None:
+        '''
+        Cache the passed key with the passed value if this value is weakly
+        referenceable *or* silently reduce to a noop otherwise.
+
+        This method is intended to be called *only* with this cache locked.
+        '''
+
+        # Attempt to cache this key with this value.
+        try:
+            self._key_to_value_set(key, value)
+        # If this value is *NOT* weakly referenceable, silently avoid caching
+        # this value. Doing so merely prevents this value from being reused.
+        except TypeError:
+            pass
@@ -24,6 +24,10 @@ from beartype.typing import (
     Dict,
     TypeVar,
 )
+from beartype._util.cache.utilcachepolicy import (
+    get_cache_size_max_or_none,
+    uncache_dict_oldest,
+)
 from beartype._util.func.arg.utilfuncargtest import (
     die_unless_func_args_len_flexible_equal,
     is_func_arg_variadic,
@@ -142,6 +146,20 @@ def callable_cached(func: _CallableT) -> _CallableT:
     8Kb of overhead is sufficiently negligible to obviate any space concerns
     that would warrant an LRU cache in the first place.
 
+    Long-lived processes dynamically creating unbounded numbers of type hints
+    (e.g., :pep:`586`-compliant literals generated at runtime) violate these
+    assumptions. If the global cache policy configured by the
+    ``${BEARTYPE_CACHE_POLICY}`` environment variable is *not* ``"strong"``,
+    this decorator instead bounds the number of memoized calls by the
+    ``${BEARTYPE_CACHE_SIZE_MAX}`` environment variable, evicting the least
+    recently memoized call on exceeding that bound. Since evicting the least
+    recently *memoized* rather than *used* call requires *no* bookkeeping on
+    cache hits, doing so preserves the efficiency of cache hits. Since evicted
+    calls are recomputed, callables relying on this decorator to return the
+    same object for the same parameters (e.g., validator factories guaranteeing
+    that ``IsInstance[int] is IsInstance[int]``) only do so until those calls
+    are evicted.
+
     Parameters
     ----------
     func : _CallableT
@@ -181,6 +199,10 @@ def callable_cached(func: _CallableT) -> _CallableT:
     # get() method of this dictionary, localized for efficiency.
     args_flat_to_exception_get = args_flat_to_exception.get
 
+    # Maximum number of items in each of these dictionaries if the global cache
+    # policy bounds caches *OR* "None" otherwise (i.e., if caches are unbounded).
+    args_flat_len_max = get_cache_size_max_or_none()
+
     @wraps(func)
     def _callable_cached(*args):
         f'''
@@ -255,8 +277,22 @@ def callable_cached(func: _CallableT) -> _CallableT:
                 # Cache this exception to these parameters.
                 args_flat_to_exception[args_flat] = exception
 
+                # If caches are bounded, evict the least recently cached
+                # exceptions exceeding that bound.
+                if args_flat_len_max:
+                    uncache_dict_oldest(
+                        args_flat_to_exception, args_flat_len_max)
+                # Else, caches are unbounded.
+
                 # Re-raise this exception.
                 raise exception
+
+            # If caches are bounded, evict the least recently cached values
+            # exceeding that bound.
+            if args_flat_len_max:
+                uncache_dict_oldest(
+                    args_flat_to_return_value, args_flat_len_max)
+            # Else, caches are unbounded.
         # If one or more objects either passed to *OR* returned from this call
         # are unhashable, perform this call as is *WITHOUT* memoization. While
         # non-ideal, stability is better than raising a fatal exception.
@@ -404,6 +440,19 @@ def method_cached_arg_by_id(func: _CallableT) -> _CallableT:
     # get() method of this dictionary, localized for efficiency.
     args_flat_to_exception_get = args_flat_to_exception.get
 
+    # Maximum number of items in each of these dictionaries if the global cache
+    # policy bounds caches *OR* "None" otherwise (i.e., if caches are unbounded).
+    args_flat_len_max = get_cache_size_max_or_none()
+
+    # Dictionary mapping a tuple of the object identifiers of all parameters
+    # passed to each prior call of the decorated callable with a tuple of those
+    # parameters. If caches are unbounded, this dictionary remains empty. Else,
+    # this dictionary both strongly refers to those parameters (preventing
+    # those parameters from being garbage-collected and their object
+    # identifiers from being reused while cached) *AND* records the order in
+    # which those calls were cached (enabling the oldest calls to be evicted).
+    args_flat_to_args: Dict[tuple, tuple] = {}
+
     @wraps(func)
     def _method_cached(self_or_cls, arg):
         f'''
@@ -468,8 +517,44 @@ def method_cached_arg_by_id(func: _CallableT) -> _CallableT:
                 # Cache this exception to these parameters.
                 args_flat_to_exception[args_flat] = exception
 
+                # If caches are bounded, pin these parameters *AND* evict the
+                # least recently cached calls exceeding that bound.
+                if args_flat_len_max:
+                    _pin_args_flat(
+                        args_flat_to_args,
+                        args_flat_to_return_value,
+                        args_flat_to_exception,
+                        args_flat,
+                        (self_or_cls, arg),
+                        args_flat_len_max,
+                    )
+                # Else, caches are unbounded.
+
                 # Re-raise this exception.
                 raise exception
+
+            # If caches are bounded, pin these parameters *AND* evict the least
+            # recently cached calls exceeding that bound.
+            #
+            # Note that this is intentionally performed *AFTER* calling the
+            # decorated method. Since that method may recursively call itself
+            # (e.g., TypeHint.is_subhint() calling itself on child hints), doing
+            # so beforehand could evict this call *BEFORE* its result is cached,
+            # leaving that result cached without pinning these parameters. The
+            # object identifiers of these parameters could then be reused by
+            # other objects, silently returning the wrong result for those
+            # objects. Conversely, these parameters remain alive throughout this
+            # call and thus need *NOT* be pinned until now.
+            if args_flat_len_max:
+                _pin_args_flat(
+                    args_flat_to_args,
+                    args_flat_to_return_value,
+                    args_flat_to_exception,
+                    args_flat,
+                    (self_or_cls, arg),
+                    args_flat_len_max,
+                )
+            # Else, caches are unbounded.
         # If one or more objects either passed to *OR* returned from this call
         # are unhashable, perform this call as is *WITHOUT* memoization. While
         # non-ideal, stability is better than raising a fatal exception.
@@ -672,3 +757,51 @@ Alternatives include (in order of decreasing efficiency):
 #FIXME: Uncomment to debug memoization-specific issues. *sigh*
 # def callable_cached(func: _CallableT) -> _CallableT: return func
 # def property_cached(func: _CallableT) -> _CallableT: return func
+
+# ....................{ PRIVATE ~ pinners                  }....................
+def _pin_args_flat(
+    args_flat_to_args: Dict[tuple, tuple],
+    args_flat_to_return_value: Dict[tuple, object],
+    args_flat_to_exception: Dict[tuple, Exception],
+    args_flat: tuple,
+    args: tuple,
+    args_flat_len_max: int,
+) -> None:
+    '''
+    Strongly refer to the passed parameters of a call memoized by the
+    :func:`method_cached_arg_by_id` decorator for as long as that call remains
+    cached *and* evict the least recently cached calls exceeding the passed
+    bound from the passed dictionaries.
+
+    Parameters
+    ----------
+    args_flat_to_args : Dict[tuple, tuple]
+        Dictionary mapping from the object identifiers of the parameters of
+        each cached call to those parameters.
+    args_flat_to_return_value : Dict[tuple, object]
+        Dictionary mapping from the object identifiers of the parameters of
+        each cached call to the value returned by that call.
+    args_flat_to_exception : Dict[tuple, Exception]
+        Dictionary mapping from the object identifiers of the parameters of
+        each cached call to the exception raised by that call.
+    args_flat : tuple
+        Object identifiers of the parameters of the call to be pinned.
+    args : tuple
+        Parameters of the call to be pinned.
+    args_flat_len_max : int
+        Maximum number of cached calls.
+    '''
+
+    # Pin these parameters, moving these parameters to the end of this
+    # dictionary if previously pinned (e.g., by a recursive call passed the
+    # same parameters). Since assigning an existing key preserves the original
+    # position of that key, this key is first popped.
+    args_flat_to_args.pop(args_flat, None)
+    args_flat_to_args[args_flat] = args
+
+    # Evict the least recently cached calls exceeding that bound.
+    while len(args_flat_to_args) > args_flat_len_max:
+        args_flat_oldest = next(iter(args_flat_to_args))
+        args_flat_to_return_value.pop(args_flat_oldest, None)
+        args_flat_to_exception.pop(args_flat_oldest, None)
+        args_flat_to_args.pop(args_flat_oldest, None)
@@ -0,0 +1,555 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2024 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Project-wide **code object caches** (i.e., low-level callables caching the code
+objects compiled from code snippets dynamically generated by :mod:`beartype`,
+skipping compilation of identical snippets both within the active Python
+process *and* across Python processes).
+
+These caches skip *only* compilation. :mod:`beartype` still generates each
+snippet (and the local scope accessed by that snippet) on each decoration, as
+that scope contains live objects that *cannot* be cached across processes.
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                            }....................
+from beartype.meta import VERSION
+from beartype.typing import (
+    Dict,
+    Optional,
+    Tuple,
+)
+from beartype._data.os.dataosshell import SHELL_VAR_CODE_CACHE_DIR_NAME
+from beartype._util.cache.map.utilmaplru import CacheLruStrong
+from beartype._util.cache.utilcachepolicy import get_cache_size_max
+from beartype._util.func.utilfuncscope import _ATTR_NAME_PREFIX_ID_POSITIVE
+from beartype._util.os.utilosshell import get_shell_var_value_or_none
+from beartype._util.py.utilpyversion import IS_PYTHON_AT_LEAST_3_11
+from hashlib import sha256
+from importlib.util import MAGIC_NUMBER
+from marshal import (
+    dumps as marshal_dumps,
+    loads as marshal_loads,
+)
+from os import (
+    getpid,
+    makedirs,
+    replace,
+)
+from os.path import (
+    dirname,
+    join,
+)
+from re import compile as re_compile
+from threading import get_ident
+from types import CodeType
+
+# ....................{ COMPILERS                          }....................
+def compile_func_code(
+    func_code: str, func_name: str, func_filename: str) -> CodeType:
+    '''
+    Code object of the module declaring the function with the passed name
+    defined by the passed code snippet dynamically generated by
+    :mod:`beartype`, either reused from a cache if a code snippet equivalent to
+    that snippet was previously compiled *or* compiled from that snippet
+    otherwise.
+
+    This compiler caches code objects in two layers:
+
+    * A **process-wide code cache** (i.e., in-memory dictionary), which is
+      unconditionally enabled. Since the type-checking code generated for
+      callables sharing the same signature and type hints (e.g., thousands of
+      methods annotated as ``(self, x: int) -> None``) is equivalent, this
+      cache avoids recompiling that code for each such callable.
+    * An **on-disk code cache** (i.e., directory of marshalled code objects
+      shared between Python processes), which is enabled only if the caller
+      set the ``${BEARTYPE_CODE_CACHE_DIR}`` environment variable to the
+      dirname of the directory to persist that cache to. Since code objects
+      loaded from that directory are subsequently executed, that directory
+      *must* be trusted to the same extent as ``__pycache__`` directories.
+
+    Each code object cached by this compiler is keyed on the **canonical form**
+    of that snippet, in which:
+
+    * The names of all attributes uniquified by object identifier (i.e., the
+      names synthesized by the
+      :func:`beartype._util.func.utilfuncscope.add_func_scope_attr` function)
+      are replaced by names uniquified instead by order of first appearance in
+      that snippet. Since object identifiers vary between Python processes,
+      the original snippets generated for the same callable by different
+      processes typically differ; the canonical forms of those snippets do
+      *not*.
+    * The name of that function is replaced by an arbitrary constant name.
+
+    Code objects in the on-disk code cache are additionally keyed on the magic
+    number of the bytecode emitted by the active Python interpreter *and* the
+    version of :mod:`beartype` that generated that snippet. Since that snippet
+    is fully determined by the callable, type hints, and beartype
+    configuration it was generated for, these keys implicitly capture all of
+    these inputs as well.
+
+    Each cached code object is then cheaply copied into a new code object
+    specific to that function, in which the names of that function and all
+    attributes and the passed fake filename are restored. Copies share all
+    unchanged constants with that cached code object.
+
+    Caveats
+    -------
+    **This compiler only skips compiling that snippet.** The caller is still
+    responsible for generating that snippet and the local scope accessed by
+    that snippet. That scope contains arbitrary objects (e.g., type hints,
+    user-defined types, callables) that are infeasible to serialize to disk and
+    thus cannot be cached by this compiler.
+
+    **This compiler intentionally avoids sharing the same code object between
+    functions.** Doing so would prevent each function from embedding its own
+    fake filename and name in its code object, which the
+    :func:`beartype._util.func.utilfuncmake.make_func` factory requires to
+    preserve the readability of tracebacks and the uniqueness of functions
+    identified by profilers.
+
+    Parameters
+    ----------
+    func_code : str
+        Code snippet declaring that function.
+    func_name : str
+        Unqualified name of that function.
+    func_filename : str
+        Fake filename to be embedded in the returned code object.
+
+    Returns
+    -------
+    CodeType
+        Code object of the module declaring that function.
+
+    Raises
+    ------
+    SyntaxError
+        If that snippet is syntactically invalid.
+    '''
+    assert isinstance(func_code, str), f'{repr(func_code)} not string.'
+    assert isinstance(func_name, str), f'{repr(func_name)} not string.'
+    assert isinstance(func_filename, str), f'{repr(func_filename)} not string.'
+
+    # Canonical form of that snippet and dictionary mapping from each canonical
+    # name in that form to the corresponding original name in that snippet.
+    func_code_canonical, name_canonical_to_name = _canonicalize_func_code(
+        func_code, func_name)
+
+    # Code object compiled from that form if previously cached by the
+    # process-wide code cache *OR* "None" otherwise.
+    #
+    # Note that this cache is intentionally subscripted rather than accessed
+    # with the dict.get() method, which would bypass the overridden
+    # __getitem__() dunder method marking this form as most recently used.
+    try:
+        module_codeobj: Optional[CodeType] = _FUNC_CODE_CANONICAL_TO_CODEOBJ[
+            func_code_canonical]  # type: ignore[assignment]
+    except KeyError:
+        module_codeobj = None
+
+    # If that code object has yet to be cached by that cache...
+    if module_codeobj is None:
+        # Dirname of the directory persisting the on-disk code cache if the
+        # caller enabled that cache *OR* "None" otherwise.
+        cache_dirname = get_shell_var_value_or_none(
+            SHELL_VAR_CODE_CACHE_DIR_NAME)
+
+        # If the caller enabled the on-disk code cache...
+        if cache_dirname:
+            # Filename of the file caching the code object compiled from that
+            # form.
+            cache_filename = join(
+                cache_dirname,
+                sha256(
+                    _CODE_CACHE_KEY_PREFIX + func_code_canonical.encode()
+                ).hexdigest() + _CODE_CACHE_FILETYPE,
+            )
+
+            # Code object compiled from that form if previously cached by the
+            # on-disk code cache *OR* "None" otherwise.
+            module_codeobj = _read_codeobj_or_none(cache_filename)
+
+            # If that code object has yet to be cached by that cache, compile
+            # and cache that form.
+            if module_codeobj is None:
+                module_codeobj = compile(
+                    func_code_canonical, func_filename, 'exec')
+                _write_codeobj(cache_filename, module_codeobj)
+            # Else, that code object was previously cached by that cache.
+        # Else, the caller disabled the on-disk code cache. In this case,
+        # compile that form.
+        else:
+            module_codeobj = compile(func_code_canonical, func_filename, 'exec')
+
+        # Cache that code object with the process-wide code cache.
+        _FUNC_CODE_CANONICAL_TO_CODEOBJ[func_code_canonical] = module_codeobj
+    # Else, that code object was previously cached by that cache.
+
+    # Return a copy of that code object with all canonical names restored to
+    # their original names *AND* that filename embedded.
+    return _rename_codeobj(
+        module_codeobj, name_canonical_to_name, func_filename)
+
+# ....................{ PRIVATE ~ canonicalizers           }....................
+def _canonicalize_func_code(
+    func_code: str, func_name: str) -> Tuple[str, Dict[str, str]]:
+    '''
+    2-tuple ``(func_code_canonical, name_canonical_to_name)`` canonicalizing
+    the passed code snippet declaring the function with the passed name, where:
+
+    * ``func_code_canonical`` is the **canonical form** of that snippet (i.e.,
+      that snippet with the name of that function replaced by an arbitrary
+      constant name *and* the name of each attribute uniquified by object
+      identifier replaced by a name uniquified by order of first appearance).
+    * ``name_canonical_to_name`` is a dictionary mapping from each such
+      canonical name to the original name it replaced.
+
+    Parameters
+    ----------
+    func_code : str
+        Code snippet to be canonicalized.
+    func_name : str
+        Unqualified name of the function declared by that snippet.
+
+    Returns
+    -------
+    Tuple[str, Dict[str, str]]
+        2-tuple ``(func_code_canonical, name_canonical_to_name)``.
+    '''
+
+    # Dictionaries mapping between original and canonical names.
+    name_to_name_canonical: Dict[str, str] = {}
+    name_canonical_to_name: Dict[str, str] = {}
+
+    def _canonicalize_name(name_match) -> str:
+        '''
+        Canonical name replacing the original name matched by the passed match.
+        '''
+
+        # Original name matched by this match.
+        name = name_match.group()
+
+        # Canonical name previously replacing this name if any *OR* "None".
+        name_canonical = name_to_name_canonical.get(name)
+
+        # If this name has yet to be replaced, synthesize a new canonical name
+        # uniquified by the number of names previously replaced.
+        if name_canonical is None:
+            name_canonical = (
+                f'{_NAME_CANONICAL_PREFIX}{len(name_to_name_canonical)}')
+            name_to_name_canonical[name] = name_canonical
+            name_canonical_to_name[name_canonical] = name
+        # Else, this name was previously replaced.
+
+        # Return this canonical name.
+        return name_canonical
+
+    # Canonicalize the names of all attributes uniquified by object identifier.
+    func_code_canonical = _NAME_ID_REGEX.sub(_canonicalize_name, func_code)
+
+    # Substring declaring the signature of that function in that snippet.
+    func_def = f'def {func_name}('
+
+    # 0-based index of the first such substring in that snippet if any *OR* -1
+    # otherwise. Since only decorators precede this signature, the first such
+    # substring is guaranteed to be this signature rather than (say) an
+    # arbitrary string embedded in the body of that function.
+    func_def_index = func_code_canonical.find(func_def)
+
+    # If that snippet declares that function as expected, canonicalize the name
+    # of that function.
+    if func_def_index >= 0:
+        func_code_canonical = (
+            f'{func_code_canonical[:func_def_index]}'
+            f'{_FUNC_DEF_CANONICAL}'
+            f'{func_code_canonical[func_def_index + len(func_def):]}'
+        )
+        name_canonical_to_name[_FUNC_NAME_CANONICAL] = func_name
+    # Else, that snippet fails to declare that function as expected. In this
+    # case, silently preserve the name of that function as is. Since the
+    # canonical form of that snippet then embeds that name, that form is
+    # guaranteed to be cached separately from those of other snippets.
+
+    # Return this canonical form and this dictionary.
+    return func_code_canonical, name_canonical_to_name
+
+
+def _rename_codeobj(
+    codeobj: CodeType, name_to_name_new: Dict[str, str], filename: str,
+) -> CodeType:
+    '''
+    Copy of the passed code object with all names in the passed dictionary
+    replaced by the corresponding names in that dictionary *and* the passed
+    filename embedded, recursively applied to all nested code objects.
+
+    Parameters
+    ----------
+    codeobj : CodeType
+        Code object to be copied.
+    name_to_name_new : Dict[str, str]
+        Dictionary mapping from each name to be replaced to its replacement.
+    filename : str
+        Filename to be embedded.
+
+    Returns
+    -------
+    CodeType
+        Copy of this code object.
+    '''
+
+    # Copy of this code object with all names replaced. Note that:
+    # * Global and attribute names are stored in "co_names".
+    # * Local variable and parameter names are stored in "co_varnames".
+    # * Closure variable names are stored in "co_cellvars" and "co_freevars".
+    # * Names of keyword-only parameters with defaults are stored as string
+    #   items of tuple constants of the parent code object (e.g., the module
+    #   declaring this function), accessed by the "BUILD_CONST_KEY_MAP"
+    #   instruction building the "__kwdefaults__" dictionary of that function.
+    # * The name of this code object is stored in "co_name" and, under Python
+    #   >= 3.11, as the last component of "co_qualname".
+    codeobj_renamed = codeobj.replace(
+        co_consts=_rename_codeobj_const(  # type: ignore[arg-type]
+            codeobj.co_consts, name_to_name_new, filename),
+        co_filename=filename,
+        co_name=name_to_name_new.get(codeobj.co_name, codeobj.co_name),
+        co_names=_rename_names(codeobj.co_names, name_to_name_new),
+        co_varnames=_rename_names(codeobj.co_varnames, name_to_name_new),
+        co_cellvars=_rename_names(codeobj.co_cellvars, name_to_name_new),
+        co_freevars=_rename_names(codeobj.co_freevars, name_to_name_new),
+    )
+
+    # If the active Python interpreter targets Python >= 3.11, replace all
+    # names in the fully-qualified name of this code object as well. Sadly,
+    # the "co_qualname" instance variable was first introduced by Python 3.11.
+    if IS_PYTHON_AT_LEAST_3_11:
+        codeobj_renamed = codeobj_renamed.replace(
+            co_qualname='.'.join(_rename_names(
+                codeobj.co_qualname.split('.'),  # type: ignore[attr-defined]
+                name_to_name_new,
+            )),
+        )
+    # Else, the active Python interpreter targets Python < 3.11.
+
+    # Return this copy.
+    return codeobj_renamed
+
+
+def _rename_names(names, name_to_name_new: Dict[str, str]):
+    '''
+    Tuple of the passed names with all names in the passed dictionary replaced
+    by the corresponding names in that dictionary if any such name was replaced
+    *or* the passed sequence as is otherwise.
+
+    Preserving unchanged sequences as is enables copies of the same code object
+    to share those sequences, reducing the space consumed by those copies.
+
+    See Also
+    --------
+    :func:`._rename_codeobj`
+        Further details.
+    '''
+
+    # Tuple of these names with all names in this dictionary replaced.
+    names_new = tuple(name_to_name_new.get(name, name) for name in names)
+
+    # Return these names as is if unchanged *OR* this tuple otherwise.
+    return names if names_new == tuple(names) else names_new
+
+
+def _rename_codeobj_const(
+    const: object, name_to_name_new: Dict[str, str], filename: str) -> object:
+    '''
+    Copy of the passed constant of a code object with all names in the passed
+    dictionary replaced by the corresponding names in that dictionary.
+
+    See Also
+    --------
+    :func:`._rename_codeobj`
+        Further details.
+    '''
+
+    # If this constant is a nested code object, rename that code object.
+    if isinstance(const, CodeType):
+        return _rename_codeobj(const, name_to_name_new, filename)
+    # Else if this constant is a string, replace that string if a name.
+    elif isinstance(const, str):
+        return name_to_name_new.get(const, const)
+    # Else if this constant is a tuple, rename all items of that tuple.
+    elif isinstance(const, tuple):
+        # Tuple of all renamed items of that tuple.
+        const_new = tuple(
+            _rename_codeobj_const(const_item, name_to_name_new, filename)
+            for const_item in const
+        )
+
+        # Return that tuple as is if no items were renamed *OR* this tuple
+        # otherwise, enabling copies of the same code object to share
+        # unchanged tuples. Note that items are intentionally compared by
+        # identity rather than equality, as code objects compare equal
+        # regardless of their filenames.
+        return (
+            const
+            if all(
+                const_item_new is const_item
+                for const_item_new, const_item in zip(const_new, const)
+            ) else
+            const_new
+        )
+    # Else, this constant is unrelated to names. Preserve this constant as is.
+
+    # Return this constant as is.
+    return const
+
+# ....................{ PRIVATE ~ io                       }....................
+def _read_codeobj_or_none(cache_filename: str) -> Optional[CodeType]:
+    '''
+    Code object marshalled to the file with the passed filename if that file
+    exists and is a valid marshalled code object *or* :data:`None` otherwise.
+
+    Parameters
+    ----------
+    cache_filename : str
+        Filename of the file to be read.
+
+    Returns
+    -------
+    Optional[CodeType]
+        Either this code object if readable *or* :data:`None` otherwise.
+    '''
+
+    # Attempt to read and unmarshal this code object.
+    try:
+        with open(cache_filename, 'rb') as cache_file:
+            codeobj = marshal_loads(cache_file.read())
+    # If doing so fails for any reason (e.g., due to this file not existing or
+    # being truncated), silently treat this file as a cache miss.
+    except (OSError, EOFError, TypeError, ValueError):
+        return None
+
+    # Return this code object if this object is a code object *OR* "None".
+    return codeobj if isinstance(codeobj, CodeType) else None
+
+
+def _write_codeobj(cache_filename: str, codeobj: CodeType) -> None:
+    '''
+    Marshal the passed code object to the file with the passed filename.
+
+    This writer is atomic *and* non-fatal. This code object is first written to
+    a temporary file unique to the current thread, which then atomically
+    replaces this file; concurrent processes thus never read partially written
+    files. If doing so fails for any reason (e.g., due to the parent directory
+    being unwritable), this writer silently reduces to a noop.
+
+    Parameters
+    ----------
+    cache_filename : str
+        Filename of the file to be written.
+    codeobj : CodeType
+        Code object to be written.
+    '''
+
+    # Filename of the temporary file unique to the current thread.
+    cache_filename_temp = f'{cache_filename}.{getpid()}.{get_ident()}.tmp'
+
+    # Marshalled code object to be written.
+    codeobj_bytes = marshal_dumps(codeobj)
+
+    # Attempt to write and atomically rename this temporary file.
+    try:
+        # Attempt to open this temporary file for writing.
+        try:
+            cache_file = open(cache_filename_temp, 'wb')
+        # If the parent directory of this file has yet to be created, create
+        # that directory *BEFORE* reattempting to do so. Since that directory
+        # typically exists, this is substantially faster than unconditionally
+        # attempting to create that directory.
+        except FileNotFoundError:
+            makedirs(dirname(cache_filename), exist_ok=True)
+            cache_file = open(cache_filename_temp, 'wb')
+
+        # Write and atomically rename this temporary file.
+        with cache_file:
+            cache_file.write(codeobj_bytes)
+        replace(cache_filename_temp, cache_filename)
+    # If doing so fails, silently ignore this failure. This cache is merely an
+    # optimization; failing to cache this code object is *NOT* fatal.
+    except OSError:
+        pass
+
+# ....................{ PRIVATE ~ constants                }....................
+_CODE_CACHE_FILETYPE = '.marshal'
+'''
+Filetype of each file persisting a code object in the on-disk code cache.
+'''
+
+
+_CODE_CACHE_KEY_PREFIX = f'{MAGIC_NUMBER.hex()}:{VERSION}:'.encode()
+'''
+Byte string prefixing the canonical form of each code snippet hashed to the
+key of the code object compiled from that snippet in the on-disk code cache,
+invalidating that cache across both bytecode and :mod:`beartype` versions.
+'''
+
+
+_FUNC_NAME_CANONICAL = '__beartype_func_cached'
+'''
+**Canonical function name** (i.e., arbitrary constant name replacing the name
+of the function declared by a code snippet in the canonical form of that
+snippet).
+'''
+
+
+_FUNC_DEF_CANONICAL = f'def {_FUNC_NAME_CANONICAL}('
+'''
+Substring declaring the signature of the function declared by a code snippet in
+the canonical form of that snippet.
+'''
+
+
+_FUNC_CODE_CANONICAL_LEN_MAX = get_cache_size_max()
+'''
+Maximum number of code objects persisted by the process-wide code cache.
+'''
+
+
+_FUNC_CODE_CANONICAL_TO_CODEOBJ = CacheLruStrong(
+    size=_FUNC_CODE_CANONICAL_LEN_MAX)
+'''
+**Process-wide code cache** (i.e., thread-safe Least Recently Used (LRU)
+dictionary mapping from the canonical form of each code snippet previously
+compiled by the :func:`.compile_func_code` function to the module code object
+compiled from that form).
+
+This cache is intentionally bounded regardless of the global cache policy.
+Since the canonical forms of code snippets embed their type-checking code,
+applications dynamically generating type hints (e.g., ``Literal[...]`` hints
+parametrized by runtime values) would otherwise grow this cache indefinitely.
+Concurrent cache misses for the same form merely compile that form
+redundantly, which is harmless.
+'''
+
+
+_NAME_CANONICAL_PREFIX = '__beartype_cached_'
+'''
+Substring prefixing each **canonical name** (i.e., name uniquified by order of
+first appearance replacing the name of an attribute uniquified by object
+identifier in the canonical form of a code snippet).
+
+This prefix intentionally differs from that of the names synthesized by the
+:func:`beartype._util.func.utilfuncscope.add_func_scope_attr` function,
+avoiding collisions between canonical and original names.
+'''
+
+
+_NAME_ID_REGEX = re_compile(rf'{_ATTR_NAME_PREFIX_ID_POSITIVE}\w+')
+'''
+Compiled regular expression matching the name of each attribute uniquified by
+object identifier (i.e., synthesized by the
+:func:`beartype._util.func.utilfuncscope.add_func_scope_attr` function) in a
+code snippet.
+'''
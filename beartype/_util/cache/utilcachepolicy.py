@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2024 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Project-wide **cache policy** utilities (i.e., low-level callables creating
+in-memory caches conforming to the global memory policy configured by the
+``${BEARTYPE_CACHE_POLICY}`` and ``${BEARTYPE_CACHE_SIZE_MAX}`` environment
+variables).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                            }....................
+from beartype.roar._roarexc import BeartypeConfShellVarException
+from beartype.typing import (
+    Callable,
+    Optional,
+    Union,
+)
+from beartype._data.os.dataosshell import (
+    SHELL_VAR_CACHE_POLICY_NAME,
+    SHELL_VAR_CACHE_POLICY_VALUES,
+    SHELL_VAR_CACHE_SIZE_MAX_NAME,
+)
+from beartype._util.cache.map.utilmapbig import CacheUnboundedStrong
+from beartype._util.cache.map.utilmaplru import CacheBoundedStrong
+from beartype._util.cache.map.utilmapweak import CacheUnboundedWeak
+from beartype._util.os.utilosshell import get_shell_var_value_or_none
+from beartype._util.text.utiltextjoin import join_delimited_disjunction
+from threading import Lock
+
+# ....................{ GETTERS                            }....................
+def get_cache_policy() -> str:
+    '''
+    Name of the **global cache policy** (i.e., eviction policy of in-memory
+    caches internally memoizing type hints and type hint wrappers) configured
+    by the ``${BEARTYPE_CACHE_POLICY}`` environment variable if set *or*
+    ``"strong"`` otherwise.
+
+    Returns
+    -------
+    str
+        Name of this policy, guaranteed to be an item of the
+        :data:`beartype._data.os.dataosshell.SHELL_VAR_CACHE_POLICY_VALUES`
+        set.
+
+    Raises
+    ------
+    BeartypeConfShellVarException
+        If this environment variable is set to an unrecognized string.
+    '''
+
+    # String value of this environment variable if set *OR* "None" otherwise.
+    cache_policy = get_shell_var_value_or_none(SHELL_VAR_CACHE_POLICY_NAME)
+
+    # If this environment variable is unset, default to the strong policy.
+    if cache_policy is None:
+        return _CACHE_POLICY_DEFAULT
+    # Else, this environment variable is set.
+    #
+    # If the value of this environment variable is unrecognized, raise an
+    # exception.
+    elif cache_policy not in SHELL_VAR_CACHE_POLICY_VALUES:
+        # Human-readable string listing the names of all valid string values
+        # of this environment variable, double-quoting each such name for
+        # additional readability.
+        CACHE_POLICY_VALUES = join_delimited_disjunction(
+            strs=sorted(SHELL_VAR_CACHE_POLICY_VALUES),
+            is_double_quoted=True,
+        )
+
+        # Raise an exception embedding this string.
+        raise BeartypeConfShellVarException(
+            f'Beartype cache environment variable '
+            f'"${{{SHELL_VAR_CACHE_POLICY_NAME}}}" '
+            f'value {repr(cache_policy)} invalid '
+            f'(i.e., neither {CACHE_POLICY_VALUES}).'
+        )
+    # Else, the value of this environment variable is recognized.
+
+    # Return this value.
+    return cache_policy
+
+
+def get_cache_size_max_or_none() -> Optional[int]:
+    '''
+    **Global cache capacity** (i.e., maximum number of entries persisted by
+    each bounded in-memory cache) configured by the
+    ``${BEARTYPE_CACHE_SIZE_MAX}`` environment variable if the global cache
+    policy is *not* ``"strong"`` *or* :data:`None` otherwise (i.e., if caches
+    are unbounded).
+
+    If the global cache policy is *not* ``"strong"`` but this environment
+    variable is unset, this getter defaults to :data:`._CACHE_SIZE_MAX_DEFAULT`.
+
+    Returns
+    -------
+    Optional[int]
+        Either:
+
+        * If caches are bounded, the maximum number of entries per cache.
+        * Else, :data:`None`.
+
+    Raises
+    ------
+    BeartypeConfShellVarException
+        If either:
+
+        * The ``${BEARTYPE_CACHE_POLICY}`` environment variable is set to an
+          unrecognized string.
+        * This environment variable is set to a string that is *not* the
+          decimal representation of a positive integer.
+    '''
+
+    # If the global cache policy is the strong policy, caches are unbounded.
+    if get_cache_policy() == _CACHE_POLICY_DEFAULT:
+        return None
+    # Else, the global cache policy is *NOT* the strong policy.
+
+    # String value of this environment variable if set *OR* "None" otherwise.
+    cache_size_max_str = get_shell_var_value_or_none(
+        SHELL_VAR_CACHE_SIZE_MAX_NAME)
+
+    # If this environment variable is unset, default to the default capacity.
+    if cache_size_max_str is None:
+        return _CACHE_SIZE_MAX_DEFAULT
+    # Else, this environment variable is set.
+
+    # If the value of this environment variable is the decimal representation of
+    # a positive integer, return that integer.
+    if cache_size_max_str.isdigit():
+        cache_size_max = int(cache_size_max_str)
+        if cache_size_max > 0:
+            return cache_size_max
+    # Else, the value of this environment variable is invalid.
+
+    # Raise an exception.
+    raise BeartypeConfShellVarException(
+        f'Beartype cache environment variable '
+        f'"${{{SHELL_VAR_CACHE_SIZE_MAX_NAME}}}" '
+        f'value {repr(cache_size_max_str)} invalid '
+        f'(i.e., not positive integer).'
+    )
+
+def get_cache_size_max() -> int:
+    '''
+    **Global cache capacity** (i.e., maximum number of entries persisted by
+    each bounded in-memory cache) configured by the
+    ``${BEARTYPE_CACHE_SIZE_MAX}`` environment variable if the global cache
+    policy is *not* ``"strong"`` *or* :data:`._CACHE_SIZE_MAX_DEFAULT`
+    otherwise.
+
+    This getter is intended to be called *only* by caches that must be bounded
+    regardless of the global cache policy. These are caches keyed on objects
+    that callers may trivially create in unbounded numbers *without* those
+    objects outliving their use (e.g., unhashable type hints like
+    ``Annotated[int, [i]]`` created in a loop), which would otherwise leak
+    memory even under the default ``"strong"`` policy.
+
+    Returns
+    -------
+    int
+        Maximum number of entries per cache.
+
+    Raises
+    ------
+    BeartypeConfShellVarException
+        If either the ``${BEARTYPE_CACHE_POLICY}`` or
+        ``${BEARTYPE_CACHE_SIZE_MAX}`` environment variable is set to an
+        invalid value.
+    '''
+
+    # Return either the global cache capacity if caches are bounded *OR* the
+    # default capacity otherwise.
+    return get_cache_size_max_or_none() or _CACHE_SIZE_MAX_DEFAULT
+
+# ....................{ FACTORIES                          }....................
+def make_cache(
+    lock_type: Union[type, Callable[[], object]] = Lock,
+) -> CacheUnboundedStrong:
+    '''
+    Create and return a new thread-safe in-memory cache conforming to the
+    global cache policy configured by the ``${BEARTYPE_CACHE_POLICY}`` and
+    ``${BEARTYPE_CACHE_SIZE_MAX}`` environment variables.
+
+    Specifically, this factory returns either:
+
+    * If ``${BEARTYPE_CACHE_POLICY}`` is either unset *or* ``"strong"``, a new
+      :class:`.CacheUnboundedStrong` instance strongly caching all entries
+      indefinitely. This is the default.
+    * If ``${BEARTYPE_CACHE_POLICY}`` is ``"lru"``, a new
+      :class:`.CacheBoundedStrong` instance caching at most
+      ``${BEARTYPE_CACHE_SIZE_MAX}`` entries and evicting the least recently
+      used entry on exceeding that capacity.
+    * If ``${BEARTYPE_CACHE_POLICY}`` is ``"weak"``, a new
+      :class:`.CacheUnboundedWeak` instance evicting each entry as soon as its
+      value is garbage-collected.
+
+    All of these caches share the same API. Since these environment variables
+    are only inspected when creating caches, these environment variables should
+    be set *before* importing :mod:`beartype`.
+
+    Caveats
+    -------
+    **Bounded caches break the identity guarantees of unbounded caches.** Caches
+    guaranteeing that equal keys map to the same singleton value (e.g., the
+    type hint wrapper cache guaranteeing that ``TypeHint(hint) is
+    TypeHint(hint)``) only guarantee this until that value is evicted.
+
+    **Weak caches silently decline to cache values that are not weakly
+    referenceable** (e.g., :pep:`604`-compliant unions under Python < 3.12).
+    See :class:`.CacheUnboundedWeak` for further details.
+
+    Parameters
+    ----------
+    lock_type : Union[type, Callable[[], object]]
+        Type of thread-safe lock to internally use. Defaults to :class:`Lock`
+        (i.e., the type of the standard non-reentrant lock) for efficiency.
+
+    Returns
+    -------
+    CacheUnboundedStrong
+        New cache conforming to this policy.
+
+    Raises
+    ------
+    BeartypeConfShellVarException
+        If either of these environment variables is set to an invalid value.
+    '''
+
+    # Name of the global cache policy.
+    cache_policy = get_cache_policy()
+
+    # Create and return a new cache conforming to this policy.
+    if cache_policy == 'lru':
+        return CacheBoundedStrong(
+            size_max=get_cache_size_max_or_none(),  # type: ignore[arg-type]
+            lock_type=lock_type,
+        )
+    elif cache_policy == 'weak':
+        return CacheUnboundedWeak(lock_type=lock_type)
+    return CacheUnboundedStrong(lock_type=lock_type)
+
+# ....................{ UNCACHERS                          }....................
+def uncache_dict_oldest(key_to_value: dict, len_max: int) -> None:
+    '''
+    Evict the least recently cached items from the passed dictionary serving
+    as a cache until this dictionary contains at most the passed number of
+    items.
+
+    Since dictionaries preserve insertion order, the first key of this
+    dictionary is the least recently cached key.
+
+    Parameters
+    ----------
+    key_to_value : dict
+        Dictionary to be bounded.
+    len_max : int
+        Maximum number of items in this dictionary.
+    '''
+
+    # While this dictionary exceeds this bound...
+    while len(key_to_value) > len_max:
+        # Attempt to evict the least recently cached item of this dictionary.
+        try:
+            key_to_value.pop(next(iter(key_to_value)), None)
+        # If another thread concurrently emptied this dictionary, halt.
+        except StopIteration:
+            break
+
+# ....................{ PRIVATE ~ constants                }....................
+_CACHE_POLICY_DEFAULT = 'strong'
+'''
+Name of the default global cache policy, strongly caching all entries
+indefinitely.
+'''
+
+
+_CACHE_SIZE_MAX_DEFAULT = 4096
+'''
+Default maximum number of entries persisted by each bounded in-memory cache
+when the ``${BEARTYPE_CACHE_SIZE_MAX}`` environment variable is unset.
+'''
@@ -17,6 +17,7 @@ from beartype._data.hint.datahinttyping import (
     LexicalScope,
     TypeException,
 )
+from beartype._util.cache.utilcachecode import compile_func_code
 from beartype._util.text.utiltextlabel import label_exception
 from beartype._util.text.utiltextmunge import number_str_lines
 from beartype._util.utilobject import get_object_name
@@ -233,7 +234,19 @@ def make_func(
         # willing to constrain the passed "func_code" to a single statement. In
         # casual testing, there is very little performance difference between
         # the two (with an imperceptibly slight edge going to "single").
-        func_code_compiled = compile(func_code, func_filename, 'exec')
+        #
+        # If debugging this function, compile this snippet as is. Debuggable
+        # snippets embed the representations of arbitrary objects (including
+        # memory addresses) and are thus uncacheable. Otherwise, defer to a
+        # lower-level compiler reusing the code object previously compiled
+        # from an equivalent snippet (e.g., generated for another callable
+        # sharing the same signature and type hints) if any *OR* compiling
+        # this snippet as is otherwise.
+        func_code_compiled = (
+            compile(func_code, func_filename, 'exec')
+            if is_debug else
+            compile_func_code(func_code, func_name, func_filename)
+        )
         assert func_name not in func_locals
 
         # Define that function. For obscure and likely uninteresting reasons,
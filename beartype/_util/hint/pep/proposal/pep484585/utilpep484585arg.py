@@ -88,6 +88,66 @@ def get_hint_pep484585_args_1(hint: object, exception_prefix: str) -> object:
     return hint_args[0]
 
 
+def get_hint_pep484585_args_2(
+    hint: object, exception_prefix: str) -> Tuple[object, object]:
+    '''
+    2-tuple of the two arguments subscripting the passed :pep:`484`- or
+    :pep:`585`-compliant **two-argument type hint** (i.e., hint semantically
+    subscriptable (indexable) by exactly two arguments).
+
+    This getter is intentionally *not* memoized (e.g., by the
+    :func:`callable_cached` decorator), as the implementation trivially reduces
+    to an efficient one-liner.
+
+    Parameters
+    ----------
+    hint : Any
+        PEP-compliant type hint to be inspected.
+    exception_prefix : str
+        Human-readable label prefixing the representation of this object in the
+        exception message.
+
+    Returns
+    ----------
+    Tuple[object, object]
+        2-tuple of the two arguments subscripting this hint.
+
+    Raises
+    ----------
+    BeartypeDecorHintPep585Exception
+        If this hint is subscripted by either:
+
+        * *No* arguments.
+        * One argument.
+        * Three or more arguments.
+
+    See Also
+    ----------
+    :func:`get_hint_pep484585_args_1`
+        Further details.
+    '''
+
+    # Avoid circular import dependencies.
+    from beartype._util.hint.pep.utilpepget import get_hint_pep_args
+
+    # Tuple of all arguments subscripting this hint.
+    hint_args = get_hint_pep_args(hint)
+
+    # If this hint is *NOT* subscripted by two arguments, raise an exception.
+    if len(hint_args) != 2:
+        assert isinstance(exception_prefix, str), (
+            f'{repr(exception_prefix)} not string.')
+        raise BeartypeDecorHintPep585Exception(
+            f'{exception_prefix}PEP 585 type hint {repr(hint)} '
+            f'not subscripted (indexed) by two arguments (i.e., '
+            f'subscripted by {len(hint_args)} != 2 arguments).'
+        )
+    # Else, this hint is subscripted by two arguments.
+
+    # Return this tuple of arguments as is.
+    return hint_args  # type: ignore[return-value]
+
+
 def get_hint_pep484585_args_3(
     hint: object, exception_prefix: str) -> Tuple[object, object, object]:
     '''
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2024 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Project-wide **sequence iterators** (i.e., low-level callables iterating over
+pseudo-random subsets of the items of passed sequences in various
+general-purpose ways).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                            }....................
+from beartype.typing import Iterator
+from collections.abc import Sequence
+
+# ....................{ ITERATORS                          }....................
+def iter_sequence_indices_ologn(
+    sequence_len: int, random_int: int) -> Iterator[int]:
+    '''
+    Generator yielding a pseudo-random subset of approximately ``log2(n)``
+    distinct 0-based indices of a sequence of length ``n``, deterministically
+    derived from the passed pseudo-random integer.
+
+    This generator yields exactly ``sequence_len.bit_length()`` indices (i.e.,
+    ``floor(log2(n)) + 1`` indices for non-empty sequences, which is either
+    ``ceil(log2(n))`` or ``ceil(log2(n)) + 1`` and thus at least one) and no
+    indices for empty sequences. The ``k``-th such index is given by
+    ``(random_int + k * STRIDE) % n``, where ``STRIDE`` is a large prime. Since
+    that prime is coprime to all lengths of practical interest, these indices
+    are guaranteed to be distinct.
+
+    This generator is shared between :func:`beartype.beartype`-generated
+    wrapper functions configured by the logarithmic-time strategy
+    :attr:`beartype.BeartypeStrategy.Ologn` *and* the violation finders
+    subsequently describing type-checking violations raised by those
+    functions. Both thus derive the *same* indices from the *same* pseudo-random
+    integer, enabling the latter to re-check only the items previously checked
+    by the former.
+
+    Parameters
+    ----------
+    sequence_len : int
+        Length of the sequence to be indexed.
+    random_int : int
+        Non-negative pseudo-random integer from which to derive these indices,
+        typically the ``__beartype_random_int`` integer generated once per call
+        to a :func:`beartype.beartype`-generated wrapper function.
+
+    Yields
+    ------
+    int
+        0-based index of an item of this sequence.
+    '''
+    assert isinstance(sequence_len, int), f'{repr(sequence_len)} not integer.'
+    assert isinstance(random_int, int), f'{repr(random_int)} not integer.'
+
+    # For the 0-based index of each index to be yielded...
+    for index_index in range(sequence_len.bit_length()):
+        # Yield the index of the next item to be type-checked.
+        yield (random_int + index_index * _SEQUENCE_INDEX_STRIDE) % sequence_len
+
+
+def iter_sequence_items_ologn(
+    sequence: Sequence, random_int: int) -> Iterator[object]:
+    '''
+    Generator yielding a pseudo-random subset of approximately ``log2(n)`` items
+    of the passed sequence of length ``n``, deterministically derived from the
+    passed pseudo-random integer.
+
+    Parameters
+    ----------
+    sequence : Sequence
+        Sequence to be iterated.
+    random_int : int
+        Non-negative pseudo-random integer from which to derive these items.
+
+    Yields
+    ------
+    object
+        Item of this sequence.
+
+    See Also
+    --------
+    :func:`.iter_sequence_indices_ologn`
+        Further details.
+    '''
+
+    # For the 0-based index of each item to be yielded, yield that item.
+    for sequence_index in iter_sequence_indices_ologn(len(sequence), random_int):
+        yield sequence[sequence_index]
+
+# ....................{ PRIVATE ~ constants                }....................
+_SEQUENCE_INDEX_STRIDE = 2654435761
+'''
+Large prime integer separating consecutive pseudo-random indices yielded by the
+:func:`.iter_sequence_indices_ologn` generator.
+
+This prime is Knuth's multiplicative hashing constant (i.e., the prime closest
+to ``2**32`` divided by the golden ratio), which scatters consecutive multiples
+of itself modulo any length across the entire range of that length rather than
+clustering those multiples.
+'''
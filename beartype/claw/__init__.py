@@ -33,6 +33,11 @@ from beartype.claw._clawmain import (
     beartype_packages as beartype_packages,
     beartype_this_package as beartype_this_package,
 )
+from beartype.claw._clawprofile import (
+    format_import_profiles as format_import_profiles,
+    get_import_profiles as get_import_profiles,
+    profile_imports as profile_imports,
+)
 from beartype.claw._pkg.clawpkgcontext import (
     beartyping as beartyping,
 )
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2024 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype import hook command-line interface (CLI)** (i.e., submodule run by
+``python -m beartype.claw``).
+
+This submodule currently implements only the ``compile`` subcommand, which
+byte-compiles all submodules of the passed packages ahead of time into the same
+beartype-specific bytecode files subsequently loaded by :mod:`beartype.claw`
+import hooks: e.g.,
+
+.. code-block:: bash
+
+   # Precompile all submodules of the "muh_package" package under the default
+   # beartype configuration with one worker process per processor.
+   $ python -m beartype.claw compile muh_package
+
+   # Precompile under a non-default beartype configuration, which should be
+   # equal to that passed to the import hook registering that package.
+   $ python -m beartype.claw compile muh_package \
+         --conf 'BeartypeConf(strategy=BeartypeStrategy.On)'
+
+   # Precompile to hash-based bytecode files reusable across builds and
+   # machines regardless of source modification times.
+   $ python -m beartype.claw compile muh_package \
+         --conf 'BeartypeConf(claw_is_pyc_hash=True)'
+'''
+
+# ....................{ IMPORTS                            }....................
+from argparse import ArgumentParser
+from beartype.claw._clawcompile import (
+    CONF_EXPR_DEFAULT,
+    compile_packages,
+)
+from beartype.roar import BeartypeClawHookException
+from beartype.typing import (
+    List,
+    Optional,
+)
+from sys import (
+    exit as sys_exit,
+    stderr,
+)
+
+# ....................{ FUNCTIONS                          }....................
+def main(args: Optional[List[str]] = None) -> int:
+    '''
+    Run the ``python -m beartype.claw`` command-line interface (CLI) with the
+    passed command-line arguments.
+
+    Parameters
+    ----------
+    args : Optional[List[str]], optional
+        List of command-line arguments (excluding the command name). Defaults
+        to :data:`None`, in which case these arguments default to the
+        arguments passed to the active Python process.
+
+    Returns
+    -------
+    int
+        Exit status of this CLI, where ``0`` signifies success, ``1`` signifies
+        that one or more submodules failed to byte-compile, and ``2`` signifies
+        invalid arguments.
+    '''
+
+    # Command-line argument parser parsing these arguments.
+    parser = ArgumentParser(
+        prog='python -m beartype.claw',
+        description='Beartype import hook utilities.',
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    # Subparser parsing the "compile" subcommand.
+    parser_compile = subparsers.add_parser(
+        'compile',
+        help=(
+            'byte-compile all submodules of packages ahead of time into '
+            'the bytecode files loaded by beartype import hooks'
+        ),
+    )
+    parser_compile.add_argument(
+        'package_names',
+        metavar='package',
+        nargs='+',
+        help='fully-qualified name of a package or module to byte-compile',
+    )
+    parser_compile.add_argument(
+        '--conf',
+        default=CONF_EXPR_DEFAULT,
+        dest='conf_expr',
+        help=(
+            'Python expression evaluating to the beartype configuration passed '
+            'to the import hook registering these packages, with all public '
+            f'"beartype" attributes in scope (default: "{CONF_EXPR_DEFAULT}")'
+        ),
+    )
+    parser_compile.add_argument(
+        '--processes',
+        type=int,
+        default=None,
+        help='number of worker processes (default: number of processors)',
+    )
+    parser_compile.add_argument(
+        '-q', '--quiet',
+        action='store_true',
+        help='only print submodules that failed to byte-compile',
+    )
+
+    # Parse these arguments.
+    args_parsed = parser.parse_args(args)
+
+    # Attempt to byte-compile these packages.
+    try:
+        module_name_to_error = compile_packages(
+            package_names=args_parsed.package_names,
+            conf_expr=args_parsed.conf_expr,
+            processes=args_parsed.processes,
+        )
+    # If these arguments are invalid, print this exception and fail.
+    except BeartypeClawHookException as exception:
+        print(f'error: {exception}', file=stderr)
+        return 2
+
+    # Number of submodules that failed to byte-compile.
+    modules_failed = 0
+
+    # For the name of each submodule and the description of the exception
+    # raised by byte-compiling that submodule if any...
+    for module_name, module_error in module_name_to_error.items():
+        # If that submodule failed to byte-compile, print that failure.
+        if module_error is not None:
+            modules_failed += 1
+            print(f'{module_name}: {module_error}', file=stderr)
+        # Else, that submodule byte-compiled. Print that success if desired.
+        elif not args_parsed.quiet:
+            print(module_name)
+
+    # If *NOT* quiet, print a summary.
+    if not args_parsed.quiet:
+        print(
+            f'Byte-compiled {len(module_name_to_error) - modules_failed} '
+            f'submodule(s) ({modules_failed} failed).'
+        )
+
+    # Return an exit status signifying whether any submodule failed.
+    return 1 if modules_failed else 0
+
+
+# ....................{ MAIN                               }....................
+if __name__ == '__main__':
+    sys_exit(main())
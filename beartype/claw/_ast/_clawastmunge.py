@@ -13,27 +13,52 @@ This private submodule is *not* intended for importation by downstream callers.
 # ....................{ IMPORTS                            }....................
 from ast import (
     AST,
+    Add,
+    Assign,
     Attribute,
+    AugAssign,
+    BinOp,
+    BoolOp,
     Call,
+    Compare,
+    Constant,
+    If,
     Index,
+    List as ListNode,
+    LtE,
+    Mod,
+    Mult,
     Name,
+    Not,
+    Or,
     Subscript,
+    UnaryOp,
     expr,
+    expr_context,
     keyword,
+    stmt,
 )
 from beartype.claw._clawmagic import (
     NODE_CONTEXT_LOAD,
+    NODE_CONTEXT_STORE,
     BEARTYPE_CLAW_STATE_OBJ_NAME,
     BEARTYPE_CLAW_STATE_CONF_CACHE_VAR_NAME,
     BEARTYPE_DECORATOR_FUNC_NAME,
+    BEARTYPE_LOOP_COUNTS_VAR_NAME,
 )
 from beartype.claw._clawtyping import (
     NodeDecoratable,
 )
+from beartype.typing import (
+    List,
+    Optional,
+    Tuple,
+)
 from beartype._conf.confcls import (
     BEARTYPE_CONF_DEFAULT,
     BeartypeConf,
 )
+from beartype._util.ast.utilastmake import make_node_name_store
 from beartype._util.ast.utilastmunge import copy_node_metadata
 from beartype._util.py.utilpyversion import IS_PYTHON_AT_LEAST_3_9
 
@@ -200,3 +225,234 @@ def make_node_keyword_conf(node_sibling: AST) -> keyword:
 
     # Return this "conf" keyword node.
     return node_keyword_conf
+
+
+#FIXME: Unit test us up, please.
+def make_node_assign_list(
+    name: str, item: Optional[int], list_len: int, node_sibling: AST) -> Assign:
+    '''
+    Create and return a new **list assignment node** (i.e., abstract syntax
+    tree (AST) node assigning a new list of the passed length whose items are
+    all the passed constant to a global or local variable with the passed name).
+
+    Specifically, this factory creates a node resembling:
+
+    .. code-block:: python
+
+       {name} = [{item}] * {list_len}
+
+    Parameters
+    ----------
+    name : str
+        Unqualified basename of the variable to be assigned.
+    item : Optional[int]
+        Constant (e.g., :data:`None`, ``0``) to initialize all list items to.
+    list_len : int
+        Length of this list.
+    node_sibling : AST
+        Sibling node to copy source code metadata from.
+
+    Returns
+    -------
+    Assign
+        Assignment node assigning this list to this variable.
+    '''
+    assert isinstance(list_len, int), f'{repr(list_len)} not integer.'
+
+    # Nodes encapsulating the list "[{item}] * {list_len}".
+    node_item = Constant(value=item)
+    node_list_item = ListNode(elts=[node_item], ctx=NODE_CONTEXT_LOAD)
+    node_list_len = Constant(value=list_len)
+    node_list = BinOp(left=node_list_item, op=Mult(), right=node_list_len)
+
+    # Node assigning this list to this variable.
+    node_assign = Assign(
+        targets=[make_node_name_store(name=name, node_sibling=node_sibling)],
+        value=node_list,
+    )
+
+    # Copy all source code metadata (e.g., line numbers) from this sibling node
+    # onto these new nodes.
+    copy_node_metadata(
+        node_src=node_sibling,
+        node_trg=(
+            node_item,
+            node_list_item,
+            node_list_len,
+            node_list,
+            node_assign,
+        ),
+    )
+
+    # Return this assignment node.
+    return node_assign
+
+
+#FIXME: Unit test us up, please.
+def make_nodes_loop_sampled(
+    node_check: stmt,
+    loop_count_index: int,
+    loop_sample: Tuple[int, int],
+    node_sibling: AST,
+) -> List[stmt]:
+    '''
+    Create and return a new list of **loop-sampled type-check nodes** (i.e.,
+    abstract syntax tree (AST) nodes performing the passed type-check residing
+    in a loop body only on a sample of the executions of that type-check, as
+    configured by the :attr:`beartype.BeartypeConf.claw_loop_sample` option).
+
+    Specifically, this factory creates nodes resembling:
+
+    .. code-block:: python
+
+       __loop_counts_beartype__[{loop_count_index}] += 1
+       if (
+           __loop_counts_beartype__[{loop_count_index}] <= {first} or
+           not __loop_counts_beartype__[{loop_count_index}] % {every}
+       ):
+           {node_check}
+
+    Parameters
+    ----------
+    node_check : stmt
+        Statement node performing this type-check.
+    loop_count_index : int
+        0-based index of the counter counting executions of this type-check in
+        the module-scoped list of all loop sampling counters.
+    loop_sample : Tuple[int, int]
+        2-tuple ``(first, every)`` configuring this sample.
+    node_sibling : AST
+        Sibling node to copy source code metadata from.
+
+    Returns
+    -------
+    List[stmt]
+        2-list of the statement node incrementing this counter followed by the
+        statement node conditionally performing this type-check.
+    '''
+    assert isinstance(node_check, stmt), f'{repr(node_check)} not statement.'
+
+    # Number of initial executions to unconditionally type-check *AND* period
+    # of subsequent executions to type-check.
+    loop_sample_first, loop_sample_every = loop_sample
+
+    # Node incrementing this counter.
+    node_count_incr_value = Constant(value=1)
+    node_count_incr = AugAssign(
+        target=_make_node_loop_count(
+            loop_count_index=loop_count_index,
+            node_context=NODE_CONTEXT_STORE,
+            node_sibling=node_sibling,
+        ),
+        op=Add(),
+        value=node_count_incr_value,
+    )
+
+    # Node testing whether this execution is one of the first executions.
+    node_first = Constant(value=loop_sample_first)
+    node_is_first = Compare(
+        left=_make_node_loop_count(
+            loop_count_index=loop_count_index,
+            node_context=NODE_CONTEXT_LOAD,
+            node_sibling=node_sibling,
+        ),
+        ops=[LtE()],
+        comparators=[node_first],
+    )
+
+    # Node testing whether this execution is an "every"-th execution.
+    node_every = Constant(value=loop_sample_every)
+    node_count_mod = BinOp(
+        left=_make_node_loop_count(
+            loop_count_index=loop_count_index,
+            node_context=NODE_CONTEXT_LOAD,
+            node_sibling=node_sibling,
+        ),
+        op=Mod(),
+        right=node_every,
+    )
+    node_is_every = UnaryOp(op=Not(), operand=node_count_mod)
+
+    # Node conditionally performing this type-check.
+    node_is_sampled = BoolOp(op=Or(), values=[node_is_first, node_is_every])
+    node_if_sampled = If(test=node_is_sampled, body=[node_check], orelse=[])
+
+    # Copy all source code metadata (e.g., line numbers) from this sibling node
+    # onto these new nodes.
+    copy_node_metadata(
+        node_src=node_sibling,
+        node_trg=(
+            node_count_incr_value,
+            node_count_incr,
+            node_first,
+            node_is_first,
+            node_every,
+            node_count_mod,
+            node_is_every,
+            node_is_sampled,
+            node_if_sampled,
+        ),
+    )
+
+    # Return these nodes.
+    return [node_count_incr, node_if_sampled]
+
+# ....................{ PRIVATE ~ factories                }....................
+def _make_node_loop_count(
+    loop_count_index: int,
+    node_context: expr_context,
+    node_sibling: AST,
+) -> Subscript:
+    '''
+    Create and return a new **loop sampling counter node** (i.e., abstract
+    syntax tree (AST) node accessing the item with the passed index of the
+    module-scoped list of all loop sampling counters in the passed context).
+
+    Parameters
+    ----------
+    loop_count_index : int
+        0-based index of this counter in that list.
+    node_context : expr_context
+        Node context in which this counter is accessed (e.g., load, store).
+    node_sibling : AST
+        Sibling node to copy source code metadata from.
+
+    Returns
+    -------
+    Subscript
+        Subscript node accessing this counter.
+    '''
+
+    # Node encapsulating the module-scoped list of all loop sampling counters.
+    node_loop_counts = Name(
+        id=BEARTYPE_LOOP_COUNTS_VAR_NAME, ctx=NODE_CONTEXT_LOAD)
+
+    # Node encapsulating the index of this counter in that list.
+    node_loop_count_index: expr = Constant(value=loop_count_index)
+
+    # Copy all source code metadata (e.g., line numbers) from this sibling node
+    # onto these new nodes.
+    copy_node_metadata(
+        node_src=node_sibling,
+        node_trg=(node_loop_counts, node_loop_count_index),
+    )
+
+    # If the active Python interpreter targets Python 3.8, wrap this index in
+    # the additional intermediary node required by Python 3.8 to subscript
+    # objects. See also the make_node_keyword_conf() factory.
+    if not IS_PYTHON_AT_LEAST_3_9:  # pragma: no cover
+        node_loop_count_index = Index(value=node_loop_count_index)
+        copy_node_metadata(
+            node_src=node_sibling, node_trg=node_loop_count_index)
+    # Else, the active Python interpreter targets Python >= 3.9.
+
+    # Node accessing this counter in this context.
+    node_loop_count = Subscript(
+        value=node_loop_counts,
+        slice=node_loop_count_index,
+        ctx=node_context,
+    )
+    copy_node_metadata(node_src=node_sibling, node_trg=node_loop_count)
+
+    # Return this node.
+    return node_loop_count
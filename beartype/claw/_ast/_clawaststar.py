@@ -40,7 +40,13 @@ beartype control, some level of obfuscation is effectively mandatory.
 
 # Import our beartype decorator to be applied by our AST transformer to all
 # applicable callables and classes in third-party modules.
-from beartype._decor.decorcache import beartype as __beartype__
+#
+# Note that we intentionally import a thin wrapper of the @beartype decorator
+# additionally recording decoration times when the import hook profiler is
+# enabled. Since this name is bound at module execution time rather than AST
+# transformation time, modules loaded from cached bytecode files are profiled
+# as well.
+from beartype.claw._clawprofile import beartype_profiled as __beartype__
 
 # Import our beartype import hook state (i.e., non-thread-safe singleton
 # centralizing *all* global state maintained by beartype import hooks).
@@ -62,6 +68,14 @@ from beartype.claw._clawstate import claw_state as __claw_state_beartype__
 from beartype.door._doorcheck import (
     die_if_unbearable as __die_if_unbearable_beartype__)
 
+# Import our annotated variable checker factory (i.e., function creating and
+# caching the exception-raiser type-checking all annotated variable assignments
+# annotated by the same type hint in the same lexical scope, applied by our AST
+# transformer to all applicable PEP 526-compliant annotated variable
+# assignments).
+from beartype.claw._clawcheck import (
+    make_pep526_checker as __make_pep526_checker_beartype__)
+
 # ....................{ IMPORTS ~ pep : 695                }....................
 # Imports required by PEP 695-compliant nodes injected into the current AST by
 # "beartype.claw._ast.pep.clawastpep695.BeartypeNodeTransformerPep695Mixin".
@@ -79,6 +93,7 @@ __all__ = [
     '__claw_state_beartype__',
     '__die_if_unbearable_beartype__',
     '__iter_hint_pep695_forwardref_beartype__',
+    '__make_pep526_checker_beartype__',
 ]
 '''
 Special list global of the unqualified names of all public submodule attributes
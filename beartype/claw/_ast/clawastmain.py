@@ -57,18 +57,31 @@ from beartype.claw._ast.pep.clawastpep526 import (
     BeartypeNodeTransformerPep526Mixin)
 from beartype.claw._ast.pep.clawastpep695 import (
     BeartypeNodeTransformerPep695Mixin)
-from beartype.claw._ast._clawastmunge import decorate_node
+from beartype.claw._ast._clawastmunge import (
+    decorate_node,
+    make_node_assign_list,
+)
+from beartype.claw._clawmagic import (
+    BEARTYPE_LOOP_COUNTS_VAR_NAME,
+    BEARTYPE_PEP526_CHECKERS_VAR_NAME,
+)
 from beartype.claw._clawtyping import (
     NodeCallable,
     NodeT,
 )
 from beartype.typing import (
+    Dict,
+    FrozenSet,
     List,
     Optional,
     Type,
 )
-from beartype._data.cls.datacls import TYPES_AST_SCOPE
+from beartype._data.cls.datacls import (
+    TYPES_AST_LOOP,
+    TYPES_AST_SCOPE,
+)
 from beartype._conf.confcls import BeartypeConf
+from beartype._util.ast.utilastget import get_node_names_unstable
 # from beartype._util.ast.utilastget import get_node_repr_indented
 from beartype._util.ast.utilastmake import make_node_importfrom
 from beartype._util.ast.utilasttest import is_node_callable_typed
@@ -132,6 +145,15 @@ class BeartypeNodeTransformer(
         **Beartype configuration** (i.e., dataclass configuring the
         :mod:`beartype.beartype` decorator for *all* decoratable objects
         recursively decorated by this node transformer).
+    _is_loop_beartype : bool
+        :data:`True` only if the node being recursively visited by this node
+        transformer resides in the body of a ``for`` or ``while`` loop of the
+        current lexical scope.
+    _loop_counts_len_beartype : int
+        Number of type-checks residing in loop bodies of the current module
+        sampled by the :attr:`beartype.BeartypeConf.claw_loop_sample` option
+        and thus the length of the module-scoped list of loop sampling
+        counters counting executions of those type-checks.
     _scope_stack_beartype : list[type[AST]]
         **Current lexical scope stack** (i.e., list of the zero or more types of
         parent nodes of the node being recursively visited by this node
@@ -194,8 +216,25 @@ class BeartypeNodeTransformer(
         self._conf_beartype = conf_beartype
 
         # Nullify all remaining instance variables for safety.
+        self._is_loop_beartype = False
+        self._loop_counts_len_beartype = 0
         self._scope_stack_beartype: List[Type[AST]] = []
 
+        # Dictionary mapping from the machine-readable representation of each
+        # type hint expression annotating one or more annotated assignments in
+        # the currently visited module to the 0-based index of the checker
+        # type-checking those assignments in the module-scoped list of all
+        # such checkers. See the "BeartypeNodeTransformerPep526Mixin" mixin.
+        self._pep526_hint_repr_to_checker_index_beartype: Dict[str, int] = {}
+
+        # Frozen set of the names of all unstable attributes (e.g., attributes
+        # bound in nested lexical scopes or bound more than once) of the
+        # currently visited module if decidable *OR* "None" otherwise (i.e., if
+        # all attributes of that module are unstable), initialized by
+        # visit_Module() below.
+        self._pep526_names_unstable_beartype: Optional[FrozenSet[str]] = (
+            frozenset())
+
     # ..................{ SUPERCLASS                         }..................
     # Overridden methods first defined by the "NodeTransformer" superclass.
 
@@ -220,10 +259,16 @@ class BeartypeNodeTransformer(
 
         # If this parent node declares a new lexical scope...
         if node_type in TYPES_AST_SCOPE:
+            # True only if this parent node resides in a loop body.
+            is_loop = self._is_loop_beartype
+
             # Add the type of this parent node to the top of the stack of all
             # current lexical scopes *BEFORE* visiting any child nodes of this
-            # parent node.
+            # parent node. Since the body of this scope is a new lexical scope,
+            # child nodes of this parent node do *NOT* reside in a loop body of
+            # this scope (even if this parent node resides in a loop body).
             self._scope_stack_beartype.append(node_type)
+            self._is_loop_beartype = False
 
             # Recursively visit *ALL* child nodes of this parent node.
             super().generic_visit(node)
@@ -232,6 +277,25 @@ class BeartypeNodeTransformer(
             # all current lexical scopes *AFTER* visiting all child nodes of
             # this parent node.
             self._scope_stack_beartype.pop()
+            self._is_loop_beartype = is_loop
+        # Else if this parent node declares a loop...
+        elif node_type in TYPES_AST_LOOP:
+            # True only if this parent node resides in a loop body.
+            is_loop = self._is_loop_beartype
+
+            # Note that child nodes of this parent node reside in a loop body.
+            #
+            # Note that this includes child nodes residing in the "else:"
+            # clause of this loop, which executes at most once per execution of
+            # this loop. Since this clause is rarely annotated, this
+            # simplification is harmless.
+            self._is_loop_beartype = True
+
+            # Recursively visit *ALL* child nodes of this parent node.
+            super().generic_visit(node)
+
+            # Restore the prior loop state *AFTER* visiting these child nodes.
+            self._is_loop_beartype = is_loop
         # Else, this parent node does *NOT* declare a new lexical scope. In this
         # case...
         else:
@@ -263,6 +327,19 @@ class BeartypeNodeTransformer(
             That same module node.
         '''
 
+        # Frozen set of the names of all unstable attributes of this module if
+        # decidable *OR* "None" otherwise, required by the visit_AnnAssign()
+        # method to decide which annotated assignments may safely share cached
+        # checkers.
+        #
+        # Note that these names are intentionally decided *BEFORE* injecting
+        # the star import of beartype-specific attributes below. Since star
+        # imports bind an undecidable set of names, deciding these names
+        # afterward would erroneously mark *ALL* attributes as unstable. Since
+        # that star import only binds obfuscated beartype-specific names never
+        # referenced by annotations, ignoring that import here is safe.
+        self._pep526_names_unstable_beartype = get_node_names_unstable(node)
+
         # 0-based index of an early child node of this parent module node
         # immediately *BEFORE* which to insert one or more statements importing
         # beartype-specific attributes, defaulting to the first child node of
@@ -405,6 +482,43 @@ class BeartypeNodeTransformer(
         # Recursively transform *ALL* child nodes of this parent module node.
         node = self.generic_visit(node)
 
+        # Number of checkers type-checking annotated assignments in this module,
+        # reserved by the visit_AnnAssign() method while visiting those
+        # assignments above.
+        checkers_len = len(self._pep526_hint_repr_to_checker_index_beartype)
+
+        # If this module contains one or more such assignments, insert a new
+        # child node immediately *AFTER* the import node inserted above
+        # declaring the module-scoped list of these checkers, initialized to
+        # "None" and thus lazily created on the first execution of each.
+        if checkers_len:
+            node.body.insert(
+                node_index_import_beartype_attrs + 1,
+                make_node_assign_list(
+                    name=BEARTYPE_PEP526_CHECKERS_VAR_NAME,
+                    item=None,
+                    list_len=checkers_len,
+                    node_sibling=node_prev,
+                ),
+            )
+        # Else, this module contains *NO* such assignments.
+
+        # If one or more type-checks in loop bodies of this module are sampled
+        # by the "claw_loop_sample" option, insert a new child node immediately
+        # *AFTER* the import node inserted above declaring the module-scoped
+        # list of the counters counting executions of these type-checks.
+        if self._loop_counts_len_beartype:
+            node.body.insert(
+                node_index_import_beartype_attrs + 1,
+                make_node_assign_list(
+                    name=BEARTYPE_LOOP_COUNTS_VAR_NAME,
+                    item=0,
+                    list_len=self._loop_counts_len_beartype,
+                    node_sibling=node_prev,
+                ),
+            )
+        # Else, *NO* type-checks of this module are sampled.
+
         # #FIXME: Conditionally perform this logic if "conf.is_debug", please.
         # print(
         #     f'Module abstract syntax tree (AST) transformed by @beartype to:\n\n'
@@ -17,17 +17,39 @@ from ast import (
     AST,
     AnnAssign,
     Attribute,
+    BoolOp,
+    Call,
+    Constant,
+    Expr,
+    Index,
     Name,
+    Or,
+    Subscript,
+    dump,
+    expr,
+    walk,
+)
+from beartype.claw._clawmagic import (
+    BEARTYPE_PEP526_CHECKER_MAKER_FUNC_NAME,
+    BEARTYPE_PEP526_CHECKERS_VAR_NAME,
+    BEARTYPE_RAISER_FUNC_NAME,
+)
+from beartype.claw._ast._clawastmunge import (
+    make_node_keyword_conf,
+    make_nodes_loop_sampled,
 )
-from beartype.claw._clawmagic import BEARTYPE_RAISER_FUNC_NAME
-from beartype.claw._ast._clawastmunge import make_node_keyword_conf
 from beartype.claw._clawtyping import NodeVisitResult
+from beartype.typing import List
 from beartype._conf.confcls import BEARTYPE_CONF_DEFAULT
+from beartype._data.ast.dataast import NODE_CONTEXT_LOAD
 from beartype._util.ast.utilastmake import (
     make_node_attribute_load,
+    make_node_call,
     make_node_call_expr,
     make_node_name_load,
 )
+from beartype._util.ast.utilastmunge import copy_node_metadata
+from beartype._util.py.utilpyversion import IS_PYTHON_AT_LEAST_3_9
 
 # ....................{ SUBCLASSES                         }....................
 #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
@@ -53,8 +75,28 @@ class BeartypeNodeTransformerPep526Mixin(object):
         node signifying the assignment of an attribute annotated by a
         :pep:`526`-compliant type hint) inserting a subsequent statement
         following that annotated assignment type-checking that attribute against
-        that type hint by passing both to our :func:`beartype.door.is_bearable`
-        tester.
+        that type hint by passing that attribute to a **checker** (i.e.,
+        type-checking raiser function) cached in the module-scoped
+        :data:`beartype.claw._clawmagic.BEARTYPE_PEP526_CHECKERS_VAR_NAME` list.
+
+        All annotated assignments annotated by the same type hint expression in
+        the same module share the same checker, lazily created by the first
+        execution of any of these assignments by calling the
+        :func:`beartype.claw._clawcheck.make_pep526_checker` factory. Each
+        subsequent execution of these assignments thus reduces to a list lookup
+        and a call to that checker, avoiding both re-evaluating that expression
+        *and* looking up that checker in a memoization cache.
+
+        This checker is created lazily rather than at module scope, as that
+        expression may refer to attributes defined *after* the callable
+        containing these assignments is defined (e.g., classes defined later in
+        the same module). Assignments annotated by expressions referring to
+        **unstable names** (i.e., names bound in any nested lexical scope or
+        loop body of that module *or* bound more than once in that module, such
+        as classes local to a callable) are instead type-checked as before by
+        passing both that attribute and that expression to our
+        :func:`beartype.door.die_if_unbearable` raiser, as that expression may
+        refer to different attributes on different executions.
 
         Note that the :class:`.AnnAssign` subclass defines these instance
         variables:
@@ -122,8 +164,14 @@ class BeartypeNodeTransformerPep526Mixin(object):
               attribute in question is simply annotated with a type hint rather
               than both annotated with a type hint *and* assigned to), that same
               parent node unmodified.
+            * If this annotated assignment node resides in a loop body *and*
+              the :attr:`beartype.BeartypeConf.claw_loop_sample` option is
+              enabled, a 3-list comprising that node, a new adjacent
+              :class:`AugAssign` node incrementing the loop sampling counter of
+              this type-check, and a new adjacent :class:`If` node performing
+              this type-check only on sampled executions.
             * Else, a 2-list comprising both that node and a new adjacent
-              :class:`Call` node performing this type-check.
+              :class:`Expr` node performing this type-check.
 
         See Also
         --------
@@ -208,7 +256,7 @@ class BeartypeNodeTransformerPep526Mixin(object):
 
         # Child node passing the value newly assigned to this attribute by this
         # assignment as the first parameter to die_if_unbearable().
-        node_func_arg_pith: AST = None  # type: ignore[assignment]
+        node_func_arg_pith: expr = None  # type: ignore[assignment]
 
         # Child node referencing the target variable being assigned to,
         # localized purely as a negligible optimization.
@@ -256,8 +304,8 @@ class BeartypeNodeTransformerPep526Mixin(object):
             return node
 
         # List of all nodes encapsulating keyword arguments passed to
-        # die_if_unbearable(), defaulting to the empty list and thus *NO* such
-        # keyword arguments.
+        # make_pep526_checker(), defaulting to the empty list and thus *NO*
+        # such keyword arguments.
         node_func_kwargs = []
 
         # If the current beartype configuration is *NOT* the default beartype
@@ -265,34 +313,228 @@ class BeartypeNodeTransformerPep526Mixin(object):
         # configuration which *MUST* be passed as well. In this case...
         if self._conf_beartype != BEARTYPE_CONF_DEFAULT:  # type: ignore[attr-defined]
             # Node encapsulating the passing of this configuration as
-            # the "conf" keyword argument to die_if_unbearable().
+            # the "conf" keyword argument to make_pep526_checker().
             node_func_kwarg_conf = make_node_keyword_conf(node_sibling=node)
 
             # Append this node to the list of all keyword arguments passed to
-            # die_if_unbearable().
+            # make_pep526_checker().
             node_func_kwargs.append(node_func_kwarg_conf)
         # Else, this configuration is simply the default beartype
         # configuration. In this case, avoid passing that configuration to
         # the beartype decorator for both efficiency and simplicity.
 
-        # Child node type-checking this newly assigned attribute against the
-        # type hint annotating this assignment via our die_if_unbearable().
-        node_func = make_node_call_expr(
-            func_name=BEARTYPE_RAISER_FUNC_NAME,
-            nodes_args=[
-                # Child node passing the value newly assigned to this
-                # attribute by this assignment as the first parameter.
-                node_func_arg_pith,
-                # Child node passing the type hint annotating this assignment as
-                # the second parameter.
-                node.annotation,
-            ],
-            nodes_kwargs=node_func_kwargs,
-            node_sibling=node,
-        )
+        # Frozen set of the names of all unstable attributes (e.g., attributes
+        # bound in nested lexical scopes or bound more than once) of the
+        # currently visited module if decidable *OR* "None" otherwise (i.e., if
+        # all attributes of that module are unstable).
+        names_unstable = self._pep526_names_unstable_beartype  # type: ignore[attr-defined]
+
+        # If either all attributes of this module are unstable (e.g., due to a
+        # star import) *OR* the type hint expression annotating this assignment
+        # refers to one or more such names, this expression may refer to
+        # different attributes in different lexical scopes or at different
+        # times (e.g., a class local to a callable). Since caching a checker
+        # for this expression would then be unsafe, type-check this newly
+        # assigned attribute against this expression as is via our
+        # die_if_unbearable() raiser.
+        if names_unstable is None or any(
+            isinstance(node_hint_child, Name) and
+            node_hint_child.id in names_unstable
+            for node_hint_child in walk(node.annotation)
+        ):
+            node_func = make_node_call_expr(
+                func_name=BEARTYPE_RAISER_FUNC_NAME,
+                nodes_args=[
+                    # Child node passing the value newly assigned to this
+                    # attribute by this assignment as the first parameter.
+                    node_func_arg_pith,
+                    # Child node passing the type hint annotating this
+                    # assignment as the second parameter.
+                    node.annotation,
+                ],
+                nodes_kwargs=node_func_kwargs,
+                node_sibling=node,
+            )
+        # Else, this expression refers only to builtin and global attributes
+        # bound at most once and thus refers to the same attributes everywhere
+        # in this module. In
+        # this case, type-check this attribute via a cached checker shared
+        # between all assignments annotated by this expression in this module.
+        else:
+            # Dictionary mapping from the machine-readable representation of
+            # each such expression to the 0-based index of the checker
+            # type-checking assignments annotated by that expression,
+            # localized purely as a negligible optimization.
+            hint_repr_to_checker_index = (
+                self._pep526_hint_repr_to_checker_index_beartype)  # type: ignore[attr-defined]
+
+            # Machine-readable representation of this expression, ignoring
+            # source code metadata (e.g., line numbers) by default.
+            hint_repr = dump(node.annotation)
+
+            # 0-based index of the checker type-checking this assignment if a
+            # prior assignment annotated by the same expression has already
+            # been visited *OR* "None" otherwise.
+            checker_index = hint_repr_to_checker_index.get(hint_repr)
+
+            # If this is the first such assignment, reserve a new checker.
+            if checker_index is None:
+                checker_index = hint_repr_to_checker_index[hint_repr] = len(
+                    hint_repr_to_checker_index)
+            # Else, a prior such assignment already reserved this checker.
+
+            # Child node type-checking this newly assigned attribute against
+            # this type hint via this checker.
+            node_func = _make_node_pep526_checker_call(
+                node_pith=node_func_arg_pith,
+                node_hint=node.annotation,
+                nodes_kwargs=node_func_kwargs,
+                checker_index=checker_index,
+                node_sibling=node,
+            )
+
+        # Loop sampling schedule configured by the current configuration.
+        loop_sample = self._conf_beartype.claw_loop_sample  # type: ignore[attr-defined]
+
+        # If this assignment resides in a loop body *AND* this configuration
+        # samples type-checks in loop bodies *AND* this schedule skips one or
+        # more executions of this type-check (i.e., is *NOT* "every 1st")...
+        if (
+            loop_sample is not None and
+            loop_sample[1] > 1 and
+            self._is_loop_beartype  # type: ignore[attr-defined]
+        ):
+            # 0-based index of the counter counting executions of this
+            # type-check in the module-scoped list of all such counters.
+            loop_count_index = self._loop_counts_len_beartype  # type: ignore[attr-defined]
+            self._loop_counts_len_beartype += 1  # type: ignore[attr-defined]
+
+            # List comprising this node followed by the nodes performing this
+            # type-check only on sampled executions.
+            nodes: List[AST] = [node]
+            nodes.extend(make_nodes_loop_sampled(
+                node_check=node_func,
+                loop_count_index=loop_count_index,
+                loop_sample=loop_sample,
+                node_sibling=node,
+            ))
+
+            # Return this list.
+            return nodes
+        # Else, this type-check is performed on every execution.
 
         # Return a list comprising these two adjacent nodes.
         #
         # Note that order is *EXTREMELY* significant. This order ensures that
         # this attribute is type-checked after being assigned to, as expected.
         return [node, node_func]
+
+# ....................{ PRIVATE ~ factories                }....................
+def _make_node_pep526_checker_call(
+    node_pith: expr,
+    node_hint: expr,
+    nodes_kwargs: list,
+    checker_index: int,
+    node_sibling: AST,
+) -> Expr:
+    '''
+    Create and return a new **annotated variable checker call node** (i.e.,
+    abstract syntax tree (AST) node type-checking the passed pith against the
+    passed type hint by calling the checker cached at the passed index of the
+    module-scoped checker list, creating that checker if needed).
+
+    Specifically, this factory creates a node resembling:
+
+    .. code-block:: python
+
+       (__pep526_checkers_beartype__[{checker_index}] or
+        __make_pep526_checker_beartype__(
+            __pep526_checkers_beartype__, {checker_index}, {node_hint},
+            {nodes_kwargs}))({node_pith})
+
+    Parameters
+    ----------
+    node_pith : expr
+        Node evaluating to the object to be type-checked.
+    node_hint : expr
+        Node evaluating to the type hint to type-check that object against.
+    nodes_kwargs : list[keyword]
+        List of zero or more keyword nodes to be passed to the
+        :func:`beartype.claw._clawcheck.make_pep526_checker` factory.
+    checker_index : int
+        0-based index of this checker in the module-scoped checker list.
+    node_sibling : AST
+        Sibling node to copy source code metadata from.
+
+    Returns
+    -------
+    Expr
+        Expression node performing this type-check.
+    '''
+
+    # Nodes encapsulating the 0-based index of this checker, both passed to
+    # make_pep526_checker() and subscripting the module-scoped checker list.
+    # Since nodes should *NOT* be shared between parent nodes, two are needed.
+    node_checker_index_arg = Constant(value=checker_index)
+    node_checker_index_slice: expr = Constant(value=checker_index)
+
+    # If the active Python interpreter targets Python 3.8, wrap the latter node
+    # in the additional intermediary node required by Python 3.8 to subscript
+    # objects. See also the make_node_keyword_conf() factory.
+    if not IS_PYTHON_AT_LEAST_3_9:  # pragma: no cover
+        copy_node_metadata(
+            node_src=node_sibling, node_trg=node_checker_index_slice)
+        node_checker_index_slice = Index(value=node_checker_index_slice)
+    # Else, the active Python interpreter targets Python >= 3.9.
+
+    # Node encapsulating the checker previously cached at this index of the
+    # module-scoped checker list if any *OR* "None" otherwise.
+    node_checker_cached = Subscript(
+        value=make_node_name_load(
+            name=BEARTYPE_PEP526_CHECKERS_VAR_NAME, node_sibling=node_sibling),
+        slice=node_checker_index_slice,
+        ctx=NODE_CONTEXT_LOAD,
+    )
+
+    # Node creating, caching, and returning this checker.
+    node_checker_make = make_node_call(
+        func_name=BEARTYPE_PEP526_CHECKER_MAKER_FUNC_NAME,
+        nodes_args=[
+            make_node_name_load(
+                name=BEARTYPE_PEP526_CHECKERS_VAR_NAME,
+                node_sibling=node_sibling,
+            ),
+            node_checker_index_arg,
+            node_hint,
+        ],
+        nodes_kwargs=nodes_kwargs,
+        node_sibling=node_sibling,
+    )
+
+    # Node encapsulating this checker, created only if *NOT* already cached.
+    # Since checkers are functions and thus truthy, this short-circuits on all
+    # executions of this node *EXCEPT* the first.
+    node_checker = BoolOp(
+        op=Or(), values=[node_checker_cached, node_checker_make])
+
+    # Node calling this checker on this pith.
+    node_checker_call = Call(func=node_checker, args=[node_pith], keywords=[])
+
+    # Node expressing this call as a Python statement.
+    node_checker_expr = Expr(node_checker_call)
+
+    # Copy source code metadata from this sibling node onto these new nodes.
+    copy_node_metadata(
+        node_src=node_sibling,
+        node_trg=(
+            node_checker_index_arg,
+            node_checker_index_slice,
+            node_checker_cached,
+            node_checker,
+            node_checker_call,
+            node_checker_expr,
+        ),
+    )
+
+    # Return this expression node.
+    return node_checker_expr
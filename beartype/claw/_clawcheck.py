@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2024 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Beartype **import hook statement-level checkers** (i.e., low-level callables
+called at runtime by code dynamically injected into otherwise beartype-agnostic
+user code by the :class:`beartype.claw._ast.clawastmain.BeartypeNodeTransformer`
+subclass to type-check statements of that code).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                            }....................
+from beartype.typing import (
+    List,
+    Optional,
+)
+from beartype._check.checkmake import make_func_raiser
+from beartype._conf.confcls import (
+    BEARTYPE_CONF_DEFAULT,
+    BeartypeConf,
+)
+from beartype._data.hint.datahinttyping import CallableRaiser
+
+# ....................{ FACTORIES                          }....................
+def make_pep526_checker(
+    # Mandatory parameters.
+    checkers: List[Optional[CallableRaiser]],
+    checker_index: int,
+    hint: object,
+
+    # Optional parameters.
+    conf: BeartypeConf = BEARTYPE_CONF_DEFAULT,
+) -> CallableRaiser:
+    '''
+    Create, cache, and return a new :pep:`526`-compliant **annotated variable
+    checker** (i.e., type-checking raiser function either raising an exception
+    or emitting a warning only if the object passed to that function violates
+    the passed type hint under the passed configuration).
+
+    The :class:`beartype.claw._ast.clawastmain.BeartypeNodeTransformer`
+    subclass replaces each annotated variable assignment with a subsequent call
+    to the checker cached at a fixed index of a module-scoped list, lazily
+    calling this factory to create that checker on the first execution of any
+    assignment annotated by the same type hint in the same lexical scope:
+
+    .. code-block:: python
+
+       # Annotated variable assignment in user code.
+       muh_var: list[int] = muh_value
+
+       # Subsequent call injected by that transformer.
+       (__pep526_checkers_beartype__[0] or __make_pep526_checker_beartype__(
+           __pep526_checkers_beartype__, 0, list[int]))(muh_var)
+
+    Subsequent executions of that assignment thus reduce to a list lookup and
+    a call to that checker, avoiding both re-evaluating the expression
+    declaring that hint *and* looking up that checker in the memoization cache
+    of the :func:`beartype.door.die_if_unbearable` raiser.
+
+    Parameters
+    ----------
+    checkers : List[Optional[CallableRaiser]]
+        Module-scoped list of all checkers of the calling module.
+    checker_index : int
+        0-based index of the checker to be created in this list.
+    hint : object
+        Type hint annotating the assignment calling this factory.
+    conf : BeartypeConf, optional
+        **Beartype configuration** (i.e., self-caching dataclass encapsulating
+        all settings configuring type-checking for the passed object). Defaults
+        to ``BeartypeConf()``, the default ``O(1)`` constant-time
+        configuration.
+
+    Returns
+    -------
+    CallableRaiser
+        Checker type-checking objects against this hint under this
+        configuration.
+
+    Raises
+    ------
+    All exceptions raised by the lower-level
+    :func:`beartype._check.checkmake.make_func_raiser` factory.
+    '''
+
+    # Checker type-checking objects against this hint under this configuration.
+    #
+    # Note that parameters are intentionally passed positionally for efficiency.
+    # Since make_func_raiser() is memoized, passing parameters by keyword would
+    # raise a non-fatal
+    # "_BeartypeUtilCallableCachedKwargsWarning" warning.
+    checker = make_func_raiser(hint, conf)
+
+    # Cache this checker for subsequent executions of these assignments.
+    checkers[checker_index] = checker
+
+    # Return this checker.
+    return checker
@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2024 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Beartype **import hook precompiler** (i.e., low-level callables byte-compiling
+all submodules of packages ahead of time into the same beartype-specific
+bytecode files subsequently loaded by :mod:`beartype.claw` import hooks,
+avoiding the cost of transforming and byte-compiling those submodules on their
+first importation).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                            }....................
+from beartype.claw._importlib._clawimpload import BeartypeSourceFileLoader
+from beartype.claw._pkg._clawpkgmake import make_conf_hookable
+from beartype.roar import BeartypeClawHookException
+from beartype.typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+from beartype._conf.confcls import BeartypeConf
+from beartype._util.text.utiltextlabel import label_exception
+from concurrent.futures import ProcessPoolExecutor
+from importlib.util import find_spec
+from os import (
+    sep,
+    walk,
+)
+from os.path import (
+    join as path_join,
+    relpath,
+)
+import sys
+
+# ....................{ CONSTANTS                          }....................
+CONF_EXPR_DEFAULT = 'BeartypeConf()'
+'''
+Default **beartype configuration expression** (i.e., Python expression
+evaluating to the beartype configuration with which to precompile packages).
+'''
+
+# ....................{ COMPILERS                          }....................
+def compile_packages(
+    # Mandatory parameters.
+    package_names: Iterable[str],
+
+    # Optional parameters.
+    conf_expr: str = CONF_EXPR_DEFAULT,
+    processes: Optional[int] = None,
+) -> Dict[str, Optional[str]]:
+    '''
+    Byte-compile all submodules of all packages with the passed names ahead of
+    time under the beartype configuration evaluated from the passed expression,
+    writing the same beartype-specific bytecode files (i.e., files whose
+    filenames are suffixed by the
+    :data:`beartype.claw._clawmagic.BEARTYPE_OPTIMIZATION_MARKER` optimization
+    marker) subsequently loaded by :mod:`beartype.claw` import hooks
+    registering those packages under that configuration.
+
+    Submodules whose bytecode files are already up-to-date are silently
+    skipped, as the :mod:`importlib` machinery invoked by this function only
+    rewrites bytecode files whose source files have since been modified.
+
+    Caveats
+    -------
+    **The passed configuration should be equal to the configuration passed to
+    the import hooks subsequently registering these packages** (e.g.,
+    ``beartype_this_package(conf=BeartypeConf(...))``). Bytecode files are
+    *not* uniquified by configuration. Import hooks registered under a
+    different configuration would silently reuse bytecode files transformed
+    under this configuration.
+
+    Parameters
+    ----------
+    package_names : Iterable[str]
+        Iterable of the fully-qualified names of all packages and modules to be
+        byte-compiled.
+    conf_expr : str, optional
+        **Beartype configuration expression** (i.e., Python expression
+        evaluating to the beartype configuration with which to transform these
+        submodules, evaluated with *all* public attributes of the
+        :mod:`beartype` package in scope). This configuration is passed as an
+        expression rather than an object, as this expression is re-evaluated
+        by each worker process. Defaults to :data:`CONF_EXPR_DEFAULT`.
+    processes : Optional[int], optional
+        Number of worker processes with which to byte-compile these submodules
+        in parallel. If ``1``, these submodules are byte-compiled in the active
+        process. Defaults to :data:`None`, in which case this number defaults
+        to the number of processors of the active platform.
+
+    Returns
+    -------
+    Dict[str, Optional[str]]
+        Dictionary mapping from the fully-qualified name of each submodule of
+        these packages to either:
+
+        * If that submodule was successfully byte-compiled (or was already
+          up-to-date), :data:`None`.
+        * Else, a human-readable string describing the exception raised by
+          attempting to byte-compile that submodule (e.g., a syntax error).
+
+    Raises
+    ------
+    BeartypeClawHookException
+        If either:
+
+        * This expression is invalid or fails to evaluate to a beartype
+          configuration.
+        * Any of these packages either is unfindable *or* is the
+          :mod:`beartype` package itself.
+        * ``processes`` is neither :data:`None` *nor* a positive integer.
+    '''
+
+    # If this number of processes is invalid, raise an exception.
+    if not (
+        processes is None or (
+            isinstance(processes, int) and
+            not isinstance(processes, bool) and
+            processes > 0
+        )
+    ):
+        raise BeartypeClawHookException(
+            f'Beartype precompiler process count {repr(processes)} '
+            f'neither "None" nor positive integer.'
+        )
+    # Else, this number of processes is valid.
+
+    # Validate this expression *BEFORE* spawning any worker processes.
+    _make_conf(conf_expr)
+
+    # List of 2-tuples "(module_name, module_filename)" describing all
+    # submodules of these packages in a deterministic order.
+    modules = [
+        module
+        for package_name in package_names
+        for module in _iter_package_modules(package_name)
+    ]
+
+    # List of 2-tuples "(module_name, exception_label)" describing the results
+    # of byte-compiling these submodules.
+    module_results: List[Tuple[str, Optional[str]]] = []
+
+    # If byte-compiling in the active process, do so.
+    if processes == 1:
+        _init_worker(conf_expr)
+        module_results.extend(_compile_module(module) for module in modules)
+    # Else, byte-compile in a pool of worker processes.
+    elif modules:
+        with ProcessPoolExecutor(
+            max_workers=processes,
+            initializer=_init_worker,
+            initargs=(conf_expr,),
+        ) as executor:
+            module_results.extend(executor.map(
+                _compile_module, modules, chunksize=_CHUNKSIZE))
+    # Else, there are *NO* submodules to byte-compile.
+
+    # Return a dictionary of these results.
+    return dict(module_results)
+
+# ....................{ PRIVATE ~ constants                }....................
+_CHUNKSIZE = 16
+'''
+Number of submodules dispatched to each worker process at a time, amortizing
+the cost of inter-process communication across several submodules.
+'''
+
+# ....................{ PRIVATE ~ globals                  }....................
+_worker_conf: Optional[BeartypeConf] = None
+'''
+Hookable beartype configuration with which the active worker process
+byte-compiles submodules, initialized by the :func:`_init_worker` function.
+'''
+
+# ....................{ PRIVATE ~ workers                  }....................
+def _init_worker(conf_expr: str) -> None:
+    '''
+    Initialize the active worker process to byte-compile submodules under the
+    beartype configuration evaluated from the passed expression.
+
+    Parameters
+    ----------
+    conf_expr : str
+        Beartype configuration expression. See :func:`compile_packages`.
+    '''
+
+    # Globalize this configuration for subsequent use by _compile_module().
+    global _worker_conf
+    _worker_conf = make_conf_hookable(_make_conf(conf_expr))
+
+
+def _compile_module(module: Tuple[str, str]) -> Tuple[str, Optional[str]]:
+    '''
+    Byte-compile the submodule described by the passed 2-tuple in the active
+    worker process.
+
+    Parameters
+    ----------
+    module : Tuple[str, str]
+        2-tuple ``(module_name, module_filename)`` describing this submodule.
+
+    Returns
+    -------
+    Tuple[str, Optional[str]]
+        2-tuple ``(module_name, exception_label)``, where ``exception_label`` is
+        either :data:`None` on success *or* a human-readable string describing
+        the exception raised on failure.
+    '''
+
+    # Fully-qualified name and absolute filename of this submodule.
+    module_name, module_filename = module
+
+    # True only if the active Python process prohibits writing bytecode files
+    # (e.g., due to the ${PYTHONDONTWRITEBYTECODE} environment variable).
+    is_dont_write_bytecode = sys.dont_write_bytecode
+
+    # Attempt to transform and byte-compile this submodule exactly as our
+    # import hooks would, writing the resulting bytecode file.
+    #
+    # Note that this temporarily permits writing bytecode files. Since the
+    # caller explicitly requested that bytecode files be written, this mirrors
+    # the standard "compileall" module, which also ignores that prohibition.
+    try:
+        sys.dont_write_bytecode = False
+        BeartypeSourceFileLoader(
+            module_name, module_filename)._get_code_conf_beartype(
+                fullname=module_name, conf=_worker_conf)
+    # If doing so raises *ANY* exception, return a description of that
+    # exception rather than halting all remaining byte-compilation.
+    except Exception as exception:
+        return (module_name, label_exception(exception))
+    # Regardless of whether doing so raised an exception, restore the prior
+    # prohibition (if any).
+    finally:
+        sys.dont_write_bytecode = is_dont_write_bytecode
+
+    # Else, doing so succeeded.
+    return (module_name, None)
+
+# ....................{ PRIVATE ~ factories                }....................
+def _make_conf(conf_expr: str) -> BeartypeConf:
+    '''
+    Beartype configuration evaluated from the passed expression.
+
+    Parameters
+    ----------
+    conf_expr : str
+        Beartype configuration expression. See :func:`compile_packages`.
+
+    Returns
+    -------
+    BeartypeConf
+        Beartype configuration evaluated from this expression.
+
+    Raises
+    ------
+    BeartypeClawHookException
+        If this expression either is invalid *or* evaluates to an object that
+        is *not* a beartype configuration.
+    '''
+
+    # Avoid circular import dependencies.
+    import beartype
+
+    # Dictionary mapping from the names to values of all public attributes of
+    # the "beartype" package, enabling this expression to refer to those
+    # attributes (e.g., "BeartypeConf", "BeartypeStrategy") unqualified.
+    conf_globals = {
+        attr_name: attr_value
+        for attr_name, attr_value in vars(beartype).items()
+        if not attr_name.startswith('_')
+    }
+    conf_globals['beartype'] = beartype
+
+    # Attempt to evaluate this expression.
+    try:
+        conf = eval(conf_expr, conf_globals)
+    # If doing so raises *ANY* exception, wrap that exception in a
+    # human-readable exception.
+    except Exception as exception:
+        raise BeartypeClawHookException(
+            f'Beartype configuration expression "{conf_expr}" invalid:\n\t'
+            f'{label_exception(exception)}'
+        ) from exception
+
+    # If this expression evaluated to a non-configuration, raise an exception.
+    if not isinstance(conf, BeartypeConf):
+        raise BeartypeClawHookException(
+            f'Beartype configuration expression "{conf_expr}" value '
+            f'{repr(conf)} not "beartype.BeartypeConf" instance.'
+        )
+    # Else, this expression evaluated to a configuration.
+
+    # Return this configuration.
+    return conf
+
+# ....................{ PRIVATE ~ iterators                }....................
+def _iter_package_modules(package_name: str) -> Iterator[Tuple[str, str]]:
+    '''
+    Generator iteratively yielding one 2-tuple ``(module_name,
+    module_filename)`` for each pure-Python submodule transitively contained in
+    the package with the passed name (including that package itself) *or* only
+    that module if that name is that of a module rather than a package.
+
+    Parameters
+    ----------
+    package_name : str
+        Fully-qualified name of that package or module.
+
+    Yields
+    ------
+    Tuple[str, str]
+        2-tuple of the fully-qualified name and absolute filename of each such
+        submodule, in sorted order.
+
+    Raises
+    ------
+    BeartypeClawHookException
+        If that package either is unfindable *or* is the :mod:`beartype`
+        package itself, which our import hooks unconditionally ignore.
+    '''
+
+    # If that package is "beartype" itself, raise an exception. Our import
+    # hooks intentionally avoid type-checking "beartype" by "beartype".
+    if package_name == 'beartype' or package_name.startswith('beartype.'):
+        raise BeartypeClawHookException(
+            f'Package "{package_name}" unprecompilable, as '
+            f'@beartype import hooks ignore "beartype" itself.'
+        )
+    # Else, that package is *NOT* "beartype" itself.
+
+    # Attempt to find the module spec describing that package. Note that doing
+    # so imports (but does *NOT* transform) the parent packages of that package.
+    try:
+        package_spec = find_spec(package_name)
+    # If doing so raises *ANY* exception, wrap that exception.
+    except Exception as exception:
+        raise BeartypeClawHookException(
+            f'Package "{package_name}" unfindable:\n\t'
+            f'{label_exception(exception)}'
+        ) from exception
+
+    # If that package is unfindable *OR* is not backed by a file (e.g., is a
+    # builtin module), raise an exception.
+    if package_spec is None or (
+        package_spec.origin is None and
+        not package_spec.submodule_search_locations
+    ):
+        raise BeartypeClawHookException(
+            f'Package "{package_name}" not found.')
+    # Else, that package is findable.
+
+    # If that name is that of a module rather than a package, yield only that
+    # module if that module is pure-Python *AND* halt.
+    if package_spec.submodule_search_locations is None:
+        if package_spec.origin.endswith('.py'):  # type: ignore[union-attr]
+            yield (package_name, package_spec.origin)  # type: ignore[misc]
+        return
+    # Else, that name is that of a package.
+
+    # For each directory containing that package (of which namespace packages
+    # may have several)...
+    for package_dirname in package_spec.submodule_search_locations:
+        # For each subdirectory of that directory...
+        for dirname, subdirnames, filenames in walk(package_dirname):
+            # Prune subdirectories whose basenames are *NOT* valid Python
+            # identifiers and thus *NOT* importable subpackages (e.g.,
+            # ".git", "test-data"). Sorting these basenames in-place also
+            # ensures this walk visits subdirectories in a deterministic order.
+            subdirnames[:] = sorted(
+                subdirname
+                for subdirname in subdirnames
+                if subdirname.isidentifier()
+            )
+
+            # Fully-qualified name of the subpackage in this subdirectory.
+            subpackage_dirname_relative = relpath(dirname, package_dirname)
+            subpackage_name = (
+                package_name
+                if subpackage_dirname_relative == '.' else
+                f'{package_name}.{subpackage_dirname_relative.replace(sep, ".")}'
+            )
+
+            # For each pure-Python submodule of this subpackage...
+            for filename in sorted(filenames):
+                # Unqualified basename of this submodule.
+                module_basename = filename[:-3]
+
+                # If this file is *NOT* an importable pure-Python submodule,
+                # skip to the next file.
+                if not (
+                    filename.endswith('.py') and module_basename.isidentifier()
+                ):
+                    continue
+                # Else, this file is an importable pure-Python submodule.
+
+                # Yield the name and filename of this submodule.
+                yield (
+                    (
+                        subpackage_name
+                        if module_basename == '__init__' else
+                        f'{subpackage_name}.{module_basename}'
+                    ),
+                    path_join(dirname, filename),
+                )
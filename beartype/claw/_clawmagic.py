@@ -104,6 +104,41 @@ trie to the beartype configuration configuring type-checking by the
 beartype import hook state, which contains this cache.
 '''
 
+# ....................{ STRINGS ~ names : loop             }....................
+BEARTYPE_LOOP_COUNTS_VAR_NAME = '__loop_counts_beartype__'
+'''
+Unqualified basename of the **loop sampling counters** (i.e., module-scoped
+list of one integer for each statement-level type-check residing in a loop body
+counting the number of executions of that type-check, enabling the
+:attr:`beartype.BeartypeConf.claw_loop_sample` option to type-check only a
+sample of those executions) as globally defined in the current user-defined
+module being imported and thus transformed by the
+:class:`beartype.claw._ast.clawastmain.BeartypeNodeTransformer` subclass.
+'''
+
+# ....................{ STRINGS ~ names : pep : 526        }....................
+BEARTYPE_PEP526_CHECKER_MAKER_FUNC_NAME = '__make_pep526_checker_beartype__'
+'''
+Unqualified basename of the :pep:`526`-compliant **annotated variable checker
+factory** (i.e., function creating, caching, and returning the type-checking
+raiser function type-checking all annotated variable assignments annotated by
+the same type hint in the same module) as imported into the current
+user-defined module being imported and thus transformed by the
+:class:`beartype.claw._ast.clawastmain.BeartypeNodeTransformer` subclass.
+'''
+
+
+BEARTYPE_PEP526_CHECKERS_VAR_NAME = '__pep526_checkers_beartype__'
+'''
+Unqualified basename of the :pep:`526`-compliant **annotated variable checker
+cache** (i.e., module-scoped list of either the type-checking raiser function
+previously created by the annotated variable checker factory *or*
+:data:`None` for each distinct type hint annotating one or more annotated
+variable assignments of a module) as globally defined in the current
+user-defined module being imported and thus transformed by the
+:class:`beartype.claw._ast.clawastmain.BeartypeNodeTransformer` subclass.
+'''
+
 # ....................{ STRINGS ~ names : pep : 695        }....................
 BEARTYPE_HINT_PEP695_FORWARDREF_ITER_FUNC_NAME = (
     '__iter_hint_pep695_forwardref_beartype__')
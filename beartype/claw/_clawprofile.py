@@ -0,0 +1,524 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2024 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype import hook profiler** (i.e., public-facing functions and low-level
+callables recording the import-time overhead of abstract syntax tree (AST)
+transformation and :func:`beartype.beartype` decoration incurred by each module
+imported under beartype import hooks).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                            }....................
+from atexit import (
+    register as atexit_register,
+    unregister as atexit_unregister,
+)
+from beartype.claw._clawstate import claw_state
+from beartype.roar import BeartypeClawHookException
+from beartype.typing import (
+    List,
+    Optional,
+)
+from beartype._conf.confcls import (
+    BEARTYPE_CONF_DEFAULT,
+    BeartypeConf,
+)
+from beartype._data.hint.datahinttyping import (
+    BeartypeReturn,
+    BeartypeableT,
+    DictStrToAny,
+)
+from beartype._data.os.dataosshell import (
+    SHELL_VAR_CLAW_PROFILE_NAME,
+    SHELL_VAR_CLAW_PROFILE_VALUES,
+)
+from beartype._decor.decorcache import beartype
+from beartype._util.os.utilosshell import get_shell_var_value_or_none
+from beartype._util.text.utiltextjoin import join_delimited_disjunction
+from json import dumps as json_dumps
+from sys import stderr
+from time import perf_counter
+
+# ....................{ CLASSES                            }....................
+class BeartypeClawModuleProfile(object):
+    '''
+    **Beartype import hook module profile** (i.e., import-time overhead
+    incurred by beartype import hooks when importing a single module).
+
+    Times are measured in fractional seconds. Modules loaded from bytecode files
+    previously cached by beartype import hooks are neither parsed, transformed,
+    nor compiled and thus record *no* transformation overhead; only the overhead
+    of decorating the callables and classes of those modules at module
+    execution time is recorded for those modules.
+
+    Attributes
+    ----------
+    decorate_callables : int
+        Number of callables decorated by :func:`beartype.beartype` in that
+        module at module execution time.
+    decorate_classes : int
+        Number of classes decorated by :func:`beartype.beartype` in that module
+        at module execution time.
+    decorate_time : float
+        Time spent decorating those callables and classes.
+    module_name : str
+        Fully-qualified name of that module.
+    source_to_code_time : float
+        Time spent in the
+        :meth:`beartype.claw._importlib._clawimpload.BeartypeSourceFileLoader.source_to_code`
+        method parsing, transforming, and compiling that module.
+    transform_time : float
+        Subset of the :attr:`source_to_code_time` spent in the
+        :class:`beartype.claw._ast.clawastmain.BeartypeNodeTransformer`
+        transforming the AST of that module.
+    '''
+
+    # ..................{ CLASS VARIABLES                    }..................
+    # Slot all instance variables defined on this object to minimize the time
+    # complexity of both reading and writing variables across frequently called
+    # cache dunder methods. Slotting has been shown to reduce read and write
+    # costs by approximately ~10%, which is non-trivial.
+    __slots__ = (
+        'decorate_callables',
+        'decorate_classes',
+        'decorate_time',
+        'module_name',
+        'source_to_code_time',
+        'transform_time',
+    )
+
+    # ..................{ INITIALIZERS                       }..................
+    def __init__(self, module_name: str) -> None:
+        '''
+        Initialize this module profile.
+
+        Parameters
+        ----------
+        module_name : str
+            Fully-qualified name of the profiled module.
+        '''
+        assert isinstance(module_name, str), f'{repr(module_name)} not string.'
+
+        # Classify all passed parameters.
+        self.module_name = module_name
+
+        # Nullify all remaining instance variables.
+        self.decorate_callables = 0
+        self.decorate_classes = 0
+        self.decorate_time = 0.0
+        self.source_to_code_time = 0.0
+        self.transform_time = 0.0
+
+    # ..................{ DUNDERS                            }..................
+    def __repr__(self) -> str:
+
+        return (
+            f'{self.__class__.__name__}('
+            f'module_name={repr(self.module_name)}, '
+            f'source_to_code_time={repr(self.source_to_code_time)}, '
+            f'transform_time={repr(self.transform_time)}, '
+            f'decorate_time={repr(self.decorate_time)}, '
+            f'decorate_callables={repr(self.decorate_callables)}, '
+            f'decorate_classes={repr(self.decorate_classes)}'
+            f')'
+        )
+
+    # ..................{ PROPERTIES                         }..................
+    @property
+    def total_time(self) -> float:
+        '''
+        Total import-time overhead incurred by beartype import hooks when
+        importing this module (i.e., the sum of the time spent parsing,
+        transforming, and compiling this module *and* the time spent
+        decorating the callables and classes of this module).
+        '''
+
+        return self.source_to_code_time + self.decorate_time
+
+    # ..................{ EXPORTERS                          }..................
+    def to_dict(self) -> DictStrToAny:
+        '''
+        Dictionary mapping from the name to value of each field of this module
+        profile, including the :attr:`total_time` property, suitable for
+        serialization as JSON.
+        '''
+
+        return {
+            'module_name': self.module_name,
+            'total_time': self.total_time,
+            'source_to_code_time': self.source_to_code_time,
+            'transform_time': self.transform_time,
+            'decorate_time': self.decorate_time,
+            'decorate_callables': self.decorate_callables,
+            'decorate_classes': self.decorate_classes,
+        }
+
+# ....................{ PROFILERS                          }....................
+def profile_imports(dump_format: Optional[str] = 'text') -> None:
+    '''
+    Enable the **beartype import hook profiler** (i.e., recording of the
+    import-time overhead incurred by beartype import hooks when importing each
+    subsequently imported module).
+
+    For each module subsequently imported under a beartype import hook (e.g.,
+    :func:`beartype.claw.beartype_this_package`), this profiler records the
+    time spent parsing, transforming, and compiling that module, the subset of
+    that time spent transforming that module, the number of callables and
+    classes decorated by :func:`beartype.beartype` in that module, and the time
+    spent decorating those callables and classes at module execution time. See
+    the :func:`get_import_profiles` getter for further details.
+
+    This profiler should be enabled *before* calling those import hooks: e.g.,
+
+    .. code-block:: python
+
+       # In your "{your_package}.__init__" submodule:
+       from beartype.claw import beartype_this_package, profile_imports
+       profile_imports()         # <-- print a text profile at exit
+       beartype_this_package()
+
+    Alternately, this profiler may be enabled *without* modifying code by
+    setting the ``${BEARTYPE_CLAW_PROFILE}`` environment variable to either
+    ``"text"`` or ``"json"``, which this function is then implicitly passed by
+    the first beartype import hook to be called.
+
+    This function is idempotent. Subsequent calls preserve profiles recorded
+    by prior calls but replace the dump format passed to those calls.
+
+    Parameters
+    ----------
+    dump_format : Optional[str], optional
+        Format of the profile printed to standard error at interpreter exit as
+        returned by the :func:`format_import_profiles` function if any *or*
+        :data:`None` if *no* profile is to be printed at exit. Defaults to
+        ``"text"``.
+
+    Raises
+    ------
+    BeartypeClawHookException
+        If ``dump_format`` is neither :data:`None`, ``"text"``, *nor*
+        ``"json"``.
+    '''
+
+    # If this format is unrecognized, raise an exception.
+    if not (dump_format is None or dump_format in SHELL_VAR_CLAW_PROFILE_VALUES):
+        raise BeartypeClawHookException(
+            f'Import profile format {repr(dump_format)} invalid '
+            f'(i.e., neither "None" nor '
+            f'{_CLAW_PROFILE_FORMATS_STR}).'
+        )
+    # Else, this format is recognized.
+
+    # If this profiler has yet to be enabled, do so.
+    if claw_state.module_name_to_profile is None:
+        claw_state.module_name_to_profile = {}
+    # Else, this profiler has already been enabled.
+
+    # Record this format for subsequent reference at interpreter exit.
+    claw_state.profile_dump_format = dump_format
+
+    # Register our exit handler dumping these profiles at interpreter exit,
+    # first unregistering that handler if already registered by a prior call to
+    # this function to avoid dumping these profiles multiple times.
+    atexit_unregister(_dump_import_profiles)
+    atexit_register(_dump_import_profiles)
+
+
+def profile_imports_if_shell_var() -> None:
+    '''
+    Enable the **beartype import hook profiler** with the format that the
+    ``${BEARTYPE_CLAW_PROFILE}`` environment variable is set to if the caller
+    set that variable *or* silently reduce to a noop otherwise.
+
+    This function is intended to be called by the first beartype import hook
+    to be called.
+
+    Raises
+    ------
+    BeartypeClawHookException
+        If that environment variable is set to neither ``"text"`` *nor*
+        ``"json"``.
+    '''
+
+    # String value of this environment variable if the caller set this
+    # environment variable *OR* "None" otherwise.
+    dump_format = get_shell_var_value_or_none(SHELL_VAR_CLAW_PROFILE_NAME)
+
+    # If the caller set this environment variable...
+    if dump_format is not None:
+        # If the string value of this environment variable is unrecognized,
+        # raise an exception.
+        if dump_format not in SHELL_VAR_CLAW_PROFILE_VALUES:
+            raise BeartypeClawHookException(
+                f'Beartype import hook environment variable '
+                f'"${{{SHELL_VAR_CLAW_PROFILE_NAME}}}" '
+                f'value {repr(dump_format)} invalid '
+                f'(i.e., neither {_CLAW_PROFILE_FORMATS_STR}).'
+            )
+        # Else, the string value of this environment variable is recognized.
+
+        # Enable this profiler with this format.
+        profile_imports(dump_format)
+    # Else, the caller did *NOT* set this environment variable.
+
+# ....................{ GETTERS                            }....................
+def get_import_profiles() -> List[BeartypeClawModuleProfile]:
+    '''
+    List of all **beartype import hook module profiles** (i.e.,
+    :class:`.BeartypeClawModuleProfile` instances describing the import-time
+    overhead incurred by beartype import hooks when importing each module
+    imported since the :func:`profile_imports` function was first called)
+    sorted in descending order of total overhead.
+
+    Returns
+    -------
+    List[BeartypeClawModuleProfile]
+        List of all module profiles sorted by descending total overhead. If the
+        :func:`profile_imports` function has yet to be called, this list is
+        empty.
+    '''
+
+    # If this profiler has yet to be enabled, return the empty list.
+    if claw_state.module_name_to_profile is None:
+        return []
+    # Else, this profiler has been enabled.
+
+    # Return these profiles sorted by descending total overhead.
+    return sorted(
+        claw_state.module_name_to_profile.values(),
+        key=lambda module_profile: module_profile.total_time,
+        reverse=True,
+    )
+
+
+def get_import_profile(module_name: str) -> BeartypeClawModuleProfile:
+    '''
+    **Beartype import hook module profile** (i.e.,
+    :class:`.BeartypeClawModuleProfile` instance) describing the module with
+    the passed fully-qualified name, created and recorded on the first call to
+    this getter passed that name.
+
+    Caveats
+    -------
+    **The caller is expected to have enabled this profiler** (i.e., by a prior
+    call to the :func:`profile_imports` function).
+
+    Parameters
+    ----------
+    module_name : str
+        Fully-qualified name of that module.
+
+    Returns
+    -------
+    BeartypeClawModuleProfile
+        Module profile describing that module.
+    '''
+    assert claw_state.module_name_to_profile is not None, (
+        'Beartype import hook profiler disabled.')
+
+    # Module profile describing that module if recorded *OR* "None" otherwise.
+    module_profile = claw_state.module_name_to_profile.get(module_name)
+
+    # If this profile has yet to be recorded, do so.
+    if module_profile is None:
+        module_profile = claw_state.module_name_to_profile[module_name] = (
+            BeartypeClawModuleProfile(module_name))
+    # Else, this profile has already been recorded.
+
+    # Return this profile.
+    return module_profile
+
+# ....................{ FORMATTERS                         }....................
+def format_import_profiles(dump_format: str = 'text') -> str:
+    '''
+    Human- or machine-readable string formatting all **beartype import hook
+    module profiles** (i.e., as returned by the :func:`get_import_profiles`
+    getter) sorted in descending order of total overhead.
+
+    Parameters
+    ----------
+    dump_format : str, optional
+        Either:
+
+        * ``"text"``, in which case this string is a human-readable table with
+          one row per module (reporting all times in milliseconds) followed by
+          a row summarizing all modules.
+        * ``"json"``, in which case this string is a JSON-formatted list of
+          dictionaries as returned by the
+          :meth:`.BeartypeClawModuleProfile.to_dict` method (reporting all
+          times in seconds).
+
+        Defaults to ``"text"``.
+
+    Returns
+    -------
+    str
+        String formatting these profiles.
+
+    Raises
+    ------
+    BeartypeClawHookException
+        If ``dump_format`` is neither ``"text"`` *nor* ``"json"``.
+    '''
+
+    # List of all module profiles sorted by descending total overhead.
+    module_profiles = get_import_profiles()
+
+    # If formatting JSON, return these profiles as JSON.
+    if dump_format == 'json':
+        return json_dumps(
+            [module_profile.to_dict() for module_profile in module_profiles],
+            indent=2,
+        )
+    # Else, if this format is unrecognized, raise an exception.
+    elif dump_format != 'text':
+        raise BeartypeClawHookException(
+            f'Import profile format {repr(dump_format)} invalid '
+            f'(i.e., neither {_CLAW_PROFILE_FORMATS_STR}).'
+        )
+    # Else, we are formatting text.
+
+    # Summary profile accumulating the overhead of all modules.
+    module_profile_total = BeartypeClawModuleProfile('(total)')
+    for module_profile in module_profiles:
+        module_profile_total.source_to_code_time += (
+            module_profile.source_to_code_time)
+        module_profile_total.transform_time += module_profile.transform_time
+        module_profile_total.decorate_time += module_profile.decorate_time
+        module_profile_total.decorate_callables += (
+            module_profile.decorate_callables)
+        module_profile_total.decorate_classes += module_profile.decorate_classes
+
+    # List of all rows of this table, including the summary row.
+    module_profiles_row = module_profiles + [module_profile_total]
+
+    # Width of the module name column, sufficient to contain the longest
+    # fully-qualified module name.
+    module_name_len = max(
+        [len('module')] + [
+            len(module_profile.module_name)
+            for module_profile in module_profiles_row
+        ])
+
+    # List of all lines of this table, initialized to its header.
+    lines = [
+        f'{"module":<{module_name_len}} {"total ms":>10} '
+        f'{"source ms":>10} {"ast ms":>10} {"decor ms":>10} '
+        f'{"funcs":>6} {"classes":>7}'
+    ]
+
+    # Append one row per module followed by the summary row.
+    for module_profile in module_profiles_row:
+        lines.append(
+            f'{module_profile.module_name:<{module_name_len}} '
+            f'{module_profile.total_time * 1e3:>10.2f} '
+            f'{module_profile.source_to_code_time * 1e3:>10.2f} '
+            f'{module_profile.transform_time * 1e3:>10.2f} '
+            f'{module_profile.decorate_time * 1e3:>10.2f} '
+            f'{module_profile.decorate_callables:>6} '
+            f'{module_profile.decorate_classes:>7}'
+        )
+
+    # Return this table.
+    return '\n'.join(lines)
+
+# ....................{ DECORATORS                         }....................
+def beartype_profiled(
+    # Optional positional or keyword parameters.
+    obj: Optional[BeartypeableT] = None,
+
+    # Optional keyword-only parameters.
+    *,
+    conf: BeartypeConf = BEARTYPE_CONF_DEFAULT,
+) -> BeartypeReturn:
+    '''
+    :func:`beartype.beartype` decorator applied by beartype import hooks to all
+    applicable callables and classes of hooked modules, additionally recording
+    the time spent decorating those callables and classes if the
+    :func:`profile_imports` function has been called.
+
+    If that function has *not* been called, this decorator reduces to the
+    :func:`beartype.beartype` decorator. Since this decorator is bound to the
+    same name in hooked modules regardless of whether that function has been
+    called, modules loaded from bytecode files cached by beartype import hooks
+    are profiled as well.
+
+    Parameters
+    ----------
+    obj : Optional[BeartypeableT], optional
+        Beartypeable to be decorated if this decorator is in decoration mode
+        *or* :data:`None` if this decorator is in configuration mode. Defaults
+        to :data:`None`.
+    conf : BeartypeConf, optional
+        Beartype configuration. Defaults to the default configuration.
+
+    Returns
+    -------
+    BeartypeReturn
+        Either:
+
+        * If passed a beartypeable, that beartypeable decorated by
+          :func:`beartype.beartype` under this configuration.
+        * Else, a decorator decorating beartypeables under this configuration.
+    '''
+
+    # If this profiler is disabled, defer to the @beartype decorator as is.
+    if claw_state.module_name_to_profile is None:
+        return beartype(obj, conf=conf)  # type: ignore[call-overload]
+    # Else, this profiler is enabled.
+    #
+    # If passed *NO* beartypeable, this decorator is in configuration mode. In
+    # this case, return a decorator profiling decorations under this
+    # configuration.
+    elif obj is None:
+        return lambda obj: beartype_profiled(obj, conf=conf)  # type: ignore[return-value]
+    # Else, this decorator is in decoration mode.
+
+    # Decorate this beartypeable, measuring the time spent doing so.
+    decorate_time_start = perf_counter()
+    obj_beartyped = beartype(obj, conf=conf)  # type: ignore[call-overload]
+    decorate_time = perf_counter() - decorate_time_start
+
+    # Record this time against the module declaring this beartypeable.
+    module_profile = get_import_profile(getattr(obj, '__module__', '?'))
+    module_profile.decorate_time += decorate_time
+    if isinstance(obj, type):
+        module_profile.decorate_classes += 1
+    else:
+        module_profile.decorate_callables += 1
+
+    # Return this decorated beartypeable.
+    return obj_beartyped
+
+# ....................{ PRIVATE ~ constants                }....................
+_CLAW_PROFILE_FORMATS_STR = join_delimited_disjunction(
+    strs=sorted(SHELL_VAR_CLAW_PROFILE_VALUES), is_double_quoted=True)
+'''
+Human-readable string listing the names of all import profile formats, double-
+quoting each such name for additional readability.
+'''
+
+# ....................{ PRIVATE ~ dumpers                  }....................
+def _dump_import_profiles() -> None:
+    '''
+    Print all **beartype import hook module profiles** to standard error in
+    the format previously passed to the :func:`profile_imports` function if
+    that format is non-:data:`None` *or* silently reduce to a noop otherwise.
+
+    This exit handler is registered by the :func:`profile_imports` function.
+    '''
+
+    # If the caller requested a profile be printed at exit, do so.
+    if (
+        claw_state.module_name_to_profile is not None and
+        claw_state.profile_dump_format is not None
+    ):
+        print(
+            format_import_profiles(claw_state.profile_dump_format),
+            file=stderr,
+        )
+    # Else, the caller requested *NO* profile be printed at exit.
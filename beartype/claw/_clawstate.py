@@ -15,10 +15,21 @@ This private submodule is *not* intended for importation by downstream callers.
 # ....................{ IMPORTS                            }....................
 from beartype.claw._importlib.clawimpcache import ModuleNameToBeartypeConf
 from beartype.claw._pkg.clawpkgtrie import PackagesTrie
-from beartype.typing import Optional
+from beartype.typing import (
+    TYPE_CHECKING,
+    Dict,
+    Optional,
+)
 from beartype._data.hint.datahinttyping import ImportPathHook
 from threading import RLock
 
+# If an external static type-checker (e.g., "mypy") is currently subjecting
+# "beartype" to static analysis, import the class typing the import hook
+# profile cache. Since the submodule declaring that class imports this
+# submodule, avoid circular import dependencies at runtime.
+if TYPE_CHECKING:
+    from beartype.claw._clawprofile import BeartypeClawModuleProfile
+
 # ....................{ CLASSES                            }....................
 class BeartypeClawState(object):
     '''
@@ -50,6 +61,14 @@ class BeartypeClawState(object):
         imported submodule of each package previously registered in our global
         package trie to the beartype configuration configuring type-checking by
         the :func:`beartype.beartype` decorator of that submodule).
+    module_name_to_profile : Optional[Dict[str, BeartypeClawModuleProfile]]
+        **Import hook profile cache** (i.e., dictionary mapping from the
+        fully-qualified name of each module imported under beartype import
+        hooks to the :class:`beartype.claw._clawprofile.BeartypeClawModuleProfile`
+        recording the import-time overhead of that module) if the
+        :func:`beartype.claw.profile_imports` function has been called *or*
+        :data:`None` otherwise (i.e., if the import hook profiler is disabled).
+        Initialized to :data:`None`.
     packages_trie : PackagesTrie
         **Package configuration trie** (i.e., non-thread-safe recursively nested
         dictionary implementing a prefix tree such that each key-value pair maps
@@ -57,6 +76,12 @@ class BeartypeClawState(object):
         the first importation of that subpackage to another instance of the
         :class:`.PackagesTrie` class similarly describing the sub-subpackages of
         that subpackage).
+    profile_dump_format : Optional[str]
+        Format in which the import hook profiler prints all import hook
+        profiles at interpreter exit (as previously passed to the
+        :func:`beartype.claw.profile_imports` function) *or* :data:`None` if
+        those profiles are *not* to be printed at exit. Initialized to
+        :data:`None`.
     '''
 
     # ..................{ CLASS VARIABLES                    }..................
@@ -73,7 +98,9 @@ class BeartypeClawState(object):
     __slots__ = (
         'beartype_pathhook',
         'module_name_to_beartype_conf',
+        'module_name_to_profile',
         'packages_trie',
+        'profile_dump_format',
     )
 
     # ....................{ INITIALIZERS                   }....................
@@ -100,7 +127,10 @@ class BeartypeClawState(object):
 
         # One one-liner to reinitialize them all.
         self.module_name_to_beartype_conf = ModuleNameToBeartypeConf()
+        self.module_name_to_profile: Optional[
+            Dict[str, 'BeartypeClawModuleProfile']] = None
         self.packages_trie = PackagesTrie(package_basename=None)
+        self.profile_dump_format: Optional[str] = None
 
 
     def reinit(self) -> None:
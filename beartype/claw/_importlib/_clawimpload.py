@@ -21,17 +21,20 @@ from beartype.claw._ast.clawastmain import BeartypeNodeTransformer
 from beartype.claw._importlib.clawimpcache import (  # type: ignore[attr-defined]
     cache_from_source_beartype,
     cache_from_source_original,
+    make_pyc_hash,
 )
 from beartype.roar import BeartypeClawImportAstException
 from beartype.typing import Optional
 from beartype._conf.confcls import BeartypeConf
 from beartype._util.ast.utilastget import get_node_repr_indented
 from beartype._util.text.utiltextlabel import label_exception
+from functools import partial
 from importlib import (  # type: ignore[attr-defined]
     _bootstrap_external,  # pyright: ignore
 )
 from importlib.machinery import SourceFileLoader
 from importlib.util import decode_source
+from time import perf_counter
 from types import CodeType
 
 # ....................{ CLASSES                            }....................
@@ -314,7 +317,6 @@ class BeartypeSourceFileLoader(SourceFileLoader):
         '''
 
         # Avoid circular import dependencies.
-        from beartype.claw._clawstate import claw_state
         from beartype.claw._pkg.clawpkgtrie import get_package_conf_or_none
 
         # Beartype configuration with which to type-check that module if that
@@ -340,6 +342,48 @@ class BeartypeSourceFileLoader(SourceFileLoader):
         )
         # print(f'Imported module "{fullname}" package "{package_name}" conf: {repr(self._module_conf_beartype)}')
 
+        # Create and return the code object underlying that module under this
+        # configuration.
+        return self._get_code_conf_beartype(fullname=fullname, conf=conf)
+
+    # ..................{ PRIVATE ~ getters                  }..................
+    def _get_code_conf_beartype(
+        self, fullname: str, conf: Optional[BeartypeConf]) -> (
+        Optional[CodeType]):
+        '''
+        Create and return the code object underlying the module with the passed
+        name type-checked under the passed beartype configuration.
+
+        This lower-level getter is called by the higher-level :meth:`get_code`
+        method *after* that method decides the beartype configuration with
+        which to type-check that module. Unlike that method, this getter does
+        *not* consult our global package trie and thus also enables callers to
+        byte-compile modules residing in packages *not* previously registered
+        by a public :mod:`beartype.claw` import hook (e.g., the
+        :func:`beartype.claw._clawcompile.compile_packages` function
+        precompiling packages ahead of time). See the :meth:`get_code` method
+        for further details.
+
+        Parameters
+        ----------
+        fullname : str
+            Fully-qualified name of the module currently being imported.
+        conf : Optional[BeartypeConf]
+            Either:
+
+            * If that module is to be type-checked, the beartype configuration
+              with which to type-check that module.
+            * Else, :data:`None`.
+
+        Returns
+        ----------
+        Optional[CodeType]
+            Code object underlying that module.
+        '''
+
+        # Avoid circular import dependencies.
+        from beartype.claw._clawstate import claw_state
+
         # If that module is unhooked, preserve that module as is by simply
         # deferring to the superclass method *WITHOUT* monkey-patching
         # cache_from_source(). This isn't only an optimization, though it is
@@ -364,11 +408,14 @@ class BeartypeSourceFileLoader(SourceFileLoader):
             # Expose this configuration to the "beartype.claw._ast" subpackage.
             claw_state.module_name_to_beartype_conf[fullname] = conf
 
-            # Temporarily monkey-patch away the cache_from_source() function.
+            # Temporarily monkey-patch away the cache_from_source() function,
+            # passing this configuration to our variant of that function to
+            # uniquify hash-based bytecode filenames by this configuration.
             #
             # Note that @agronholm (Alex Grönholm) claims that "the import lock
             # should make this monkey patch safe." We're trusting you here, man!
-            _bootstrap_external.cache_from_source = cache_from_source_beartype
+            _bootstrap_external.cache_from_source = partial(
+                cache_from_source_beartype, conf=conf)
 
             # Attempt to defer to the superclass method.
             try:
@@ -442,6 +489,10 @@ class BeartypeSourceFileLoader(SourceFileLoader):
                 data=data, path=path, _optimize=_optimize)  # pyright: ignore
         # Else, that module has been registered for type-checking.
 
+        # Time at which this method started transforming that module, recorded
+        # for the import hook profiler if enabled.
+        source_to_code_time_start = perf_counter()
+
         # Plaintext decoded contents of that module.
         module_source = decode_source(data)
 
@@ -462,7 +513,9 @@ class BeartypeSourceFileLoader(SourceFileLoader):
             conf_beartype=self._module_conf_beartype)
 
         # Abstract syntax tree (AST) modified by this transformer.
+        transform_time_start = perf_counter()
         module_ast_beartyped = ast_beartyper.visit(module_ast)
+        transform_time = perf_counter() - transform_time_start
 
         #FIXME: Conditionally perform this logic if "conf.is_debug", please.
         #Note that printing to "stderr" is pivotal. For some reason, Python
@@ -504,5 +557,69 @@ class BeartypeSourceFileLoader(SourceFileLoader):
                 f'{label_exception(exception)}'
             ) from exception
 
+        # Avoid circular import dependencies.
+        from beartype.claw._clawprofile import get_import_profile
+        from beartype.claw._clawstate import claw_state
+
+        # If the import hook profiler is enabled, record the time spent
+        # transforming that module against that module.
+        if claw_state.module_name_to_profile is not None:
+            module_profile = get_import_profile(self._module_name_beartype)
+            module_profile.source_to_code_time += (
+                perf_counter() - source_to_code_time_start)
+            module_profile.transform_time += transform_time
+        # Else, the import hook profiler is disabled.
+
         # Return this code object.
         return module_codeobj
+
+    # ..................{ PRIVATE ~ cachers                  }..................
+    def _cache_bytecode(
+        self, source_path: str, bytecode_path: str, data: bytes) -> None:
+        '''
+        Cache the passed bytecode compiled from the source file with the passed
+        filename to the bytecode file with the passed filename.
+
+        This override of the private superclass
+        :meth:`SourceFileLoader._cache_bytecode` method (called by the
+        superclass :meth:`SourceLoader.get_code` method after compiling a
+        module) converts timestamp-based bytecode compiled from modules
+        type-checked under beartype configurations enabling the
+        :attr:`beartype.BeartypeConf.claw_is_pyc_hash` option into
+        :pep:`552`-compliant checked hash-based bytecode *before* caching that
+        bytecode. Why? Because the superclass :meth:`SourceLoader.get_code`
+        method only caches hash-based bytecode when the existing bytecode file
+        was already hash-based. After this override caches the first such
+        bytecode file for a module, that method then validates that file
+        against the hash of that module's source on subsequent imports *and*
+        caches hash-based bytecode on subsequent recompilations.
+
+        Parameters
+        ----------
+        source_path : str
+            Absolute filename of the source file of that module.
+        bytecode_path : str
+            Absolute filename of the bytecode file to be cached.
+        data : bytes
+            Bytecode to be cached.
+        '''
+
+        # If...
+        if (
+            # That module is type-checked *AND*...
+            self._module_conf_beartype is not None and
+            # The configuration type-checking that module enables hash-based
+            # bytecode files *AND*...
+            self._module_conf_beartype.claw_is_pyc_hash and
+            # This bytecode is timestamp-based (i.e., the first bit of the bit
+            # field following the 4-byte magic number is unset)...
+            not data[4] & 0b1
+        ):
+            # Convert this bytecode into hash-based bytecode keyed on the hash
+            # of that module's source.
+            data = make_pyc_hash(data=data, source=self.get_data(source_path))
+        # Else, preserve this bytecode as is.
+
+        # Defer to the superclass method to cache this bytecode.
+        super()._cache_bytecode(  # type: ignore[misc]
+            source_path, bytecode_path, data)  # pyright: ignore
@@ -15,8 +15,14 @@ This private submodule is *not* intended for importation by downstream callers.
 # ....................{ IMPORTS                            }....................
 from beartype.claw._clawmagic import BEARTYPE_OPTIMIZATION_MARKER
 from beartype.roar import BeartypeClawImportConfException
-from beartype.typing import Dict
+from beartype.typing import (
+    Dict,
+    Optional,
+)
 from beartype._conf.confcls import BeartypeConf
+from beartype._util.cache.utilcachecall import callable_cached
+from hashlib import sha256
+from importlib.util import source_hash
 from pprint import pformat
 
 # Original cache_from_source() function defined by the private (*gulp*)
@@ -202,7 +208,8 @@ class ModuleNameToBeartypeConf(Dict[str, 'BeartypeConf']):
 
 # ....................{ CACHERS                            }....................
 #FIXME: Unit test us up, please.
-def cache_from_source_beartype(*args, **kwargs) -> str:
+def cache_from_source_beartype(
+    *args, conf: Optional[BeartypeConf] = None, **kwargs) -> str:
     '''
     Beartype-specific variant of the
     :func:`importlib._bootstrap_external.cache_from_source` function applying a
@@ -214,6 +221,21 @@ def cache_from_source_beartype(*args, **kwargs) -> str:
     ``".pyc{optimization}_{BEARTYPE_OPTIMIZATION_MARKER}"``, where
     ``{optimization}`` is the original ``optimization`` parameter passed to this
     function call.
+
+    Parameters
+    ----------
+    conf : Optional[BeartypeConf], optional
+        Beartype configuration with which those submodules are type-checked.
+        If this configuration enables the
+        :attr:`beartype.BeartypeConf.claw_is_pyc_hash` option, that marker is
+        additionally suffixed by a digest of this configuration (as returned by
+        the :func:`get_conf_digest` getter), ensuring that submodules compiled
+        to hash-based bytecode files under distinct configurations are compiled
+        to distinct files. Defaults to :data:`None`, in which case that marker
+        is *not* suffixed.
+
+    All remaining parameters are passed as is to the original
+    :func:`importlib._bootstrap_external.cache_from_source` function.
     '''
 
     # Original optimization parameter passed to this function call if any *OR*
@@ -225,5 +247,113 @@ def cache_from_source_beartype(*args, **kwargs) -> str:
     kwargs['optimization'] = (
         f'{NONBEARTYPE_OPTIMIZATION_MARKER}{BEARTYPE_OPTIMIZATION_MARKER}')
 
+    # If this configuration caches hash-based bytecode files, further uniquify
+    # that parameter with a digest of this configuration. Since the digest is
+    # hexadecimal and the "h" delimiter is alphabetic, that parameter remains
+    # alphanumeric as required by that function.
+    if conf is not None and conf.claw_is_pyc_hash:
+        kwargs['optimization'] += f'h{get_conf_digest(conf)}'
+    # Else, this configuration caches timestamp-based bytecode files.
+
     # Defer to the implementation of the original cache_from_source() function.
     return cache_from_source_original(*args, **kwargs)
+
+
+def make_pyc_hash(data: bytes, source: bytes) -> bytes:
+    '''
+    :pep:`552`-compliant **checked hash-based bytecode** (i.e., contents of a
+    ``.pyc`` file validated against a hash of the source of its module) converted
+    from the passed bytecode compiled from the passed source.
+
+    This function is intended to be called immediately before caching the
+    bytecode compiled from a module transformed by :mod:`beartype.claw` import
+    hooks configured by the :attr:`beartype.BeartypeConf.claw_is_pyc_hash`
+    option. Since the standard :class:`importlib.machinery.SourceFileLoader`
+    superclass of those hooks only writes hash-based bytecode files when
+    recompiling a module whose existing bytecode file was already hash-based,
+    this function converts the timestamp-based bytecode that superclass
+    otherwise writes. Subsequent imports of that module are then validated by
+    that superclass against this hash, regardless of source modification times.
+
+    Parameters
+    ----------
+    data : bytes
+        Bytecode to be converted, prefixed by either a timestamp-based or
+        hash-based :pep:`552`-compliant 16-byte header.
+    source : bytes
+        Source from which that bytecode was compiled.
+
+    Returns
+    -------
+    bytes
+        Checked hash-based bytecode converted from this bytecode.
+    '''
+
+    # Return this bytecode, replacing its header by a header consisting of:
+    # * The magic number identifying the active Python interpreter.
+    # * A bit field whose first bit signifies a hash-based bytecode file and
+    #   whose second bit signifies that this hash is to be checked on import.
+    # * The hash of this source keyed on that magic number.
+    # * The marshalled code object compiled from this source.
+    return b''.join((
+        data[:4],
+        _PYC_FLAGS_HASH_CHECKED,
+        source_hash(source),
+        data[_PYC_HEADER_LEN:],
+    ))
+
+# ....................{ GETTERS                            }....................
+@callable_cached
+def get_conf_digest(conf: BeartypeConf) -> str:
+    '''
+    **Configuration digest** (i.e., hexadecimal string stably hashing the
+    passed beartype configuration across Python processes) of the passed
+    beartype configuration.
+
+    This getter is memoized for efficiency.
+
+    Caveats
+    -------
+    **This digest is computed from the machine-readable representation of this
+    configuration** rather than the :func:`hash` builtin, whose hashes of the
+    types and enumeration members with which configurations are typically
+    parametrized vary across Python processes. This digest is thus stable
+    across processes and machines for configurations parametrized only by
+    objects whose representations are stable (e.g., types, numbers, strings),
+    which includes all configurations parametrized by built-in objects. Objects
+    whose representations embed memory addresses reduce this digest to a
+    per-process digest; bytecode files keyed on that digest are then safely
+    recompiled rather than reused by each process.
+
+    Parameters
+    ----------
+    conf : BeartypeConf
+        Beartype configuration to be digested.
+
+    Returns
+    -------
+    str
+        Configuration digest of this configuration.
+    '''
+
+    # Return the first 16 hexadecimal digits of the SHA-256 digest of the
+    # machine-readable representation of this configuration, trading a
+    # negligible likelihood of collision for shorter bytecode filenames.
+    return sha256(repr(conf).encode()).hexdigest()[:16]
+
+# ....................{ PRIVATE ~ constants                }....................
+_PYC_FLAGS_HASH_CHECKED = (0b11).to_bytes(4, 'little')
+'''
+:pep:`552`-compliant bit field of a **checked hash-based bytecode file** (i.e.,
+little-endian 32-bit integer whose first bit signifies a hash-based bytecode
+file and whose second bit signifies that the hash embedded in that file is to
+be checked against the source of its module on import).
+'''
+
+
+_PYC_HEADER_LEN = 16
+'''
+Length in bytes of the :pep:`552`-compliant header prefixing *all* bytecode
+files, consisting of a 4-byte magic number, a 4-byte bit field, and an 8-byte
+source timestamp and size *or* source hash.
+'''
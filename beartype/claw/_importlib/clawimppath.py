@@ -63,6 +63,7 @@ def add_beartype_pathhook() -> None:
     '''
 
     # Avoid circular import dependencies.
+    from beartype.claw._clawprofile import profile_imports_if_shell_var
     from beartype.claw._clawstate import claw_state
 
     # If this function has already been called under the active Python
@@ -71,6 +72,10 @@ def add_beartype_pathhook() -> None:
         return
     # Else, this function has *NOT* yet been called under this interpreter.
 
+    # Enable the import hook profiler if the caller set the
+    # ${BEARTYPE_CLAW_PROFILE} environment variable.
+    profile_imports_if_shell_var()
+
     # Closure instantiating a new "FileFinder" instance invoking this loader.
     #
     # Note that we intentionally ignore mypy complaints here. Why? Because mypy
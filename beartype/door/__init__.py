@@ -36,10 +36,17 @@ standardized by the :mod:`typing` module.
 #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
 from beartype.door._cls.doorsuper import (
     TypeHint as TypeHint)
+from beartype.door._doorchecker import (
+    TypeChecker as TypeChecker,
+    compile_checker as compile_checker,
+)
 from beartype.door._doorcheck import (
     die_if_unbearable as die_if_unbearable,
+    die_if_unbearable_many as die_if_unbearable_many,
     is_bearable as is_bearable,
+    is_bearable_many as is_bearable_many,
     is_subhint as is_subhint,
+    is_subhint_matrix as is_subhint_matrix,
 )
 from beartype.door._cls.pep.doorpep484604 import (
     UnionTypeHint as UnionTypeHint)
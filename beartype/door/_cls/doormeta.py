@@ -16,7 +16,7 @@ This private submodule is *not* intended for importation by downstream callers.
 from abc import ABCMeta
 from beartype.typing import Any
 from beartype._cave._cavefast import NoneType
-from beartype._util.cache.map.utilmapbig import CacheUnboundedStrong
+from beartype._util.cache.utilcachepolicy import make_cache
 from beartype._util.hint.utilhinttest import is_hint_uncached
 from threading import RLock
 
@@ -115,6 +115,9 @@ class _TypeHintMeta(ABCMeta):
         # Else, this hint is *NOT* already a wrapper.
 
         # ................{ CACHING                            }................
+        # True only if this hint is *NOT* self-caching.
+        is_hint_key_repr = is_hint_uncached(hint)
+
         # Key uniquely identifying this hint, defined as either...
         hint_key = (
             # If this hint is *NOT* self-caching (i.e., *NOT* already internally
@@ -132,7 +135,7 @@ class _TypeHintMeta(ABCMeta):
             # * "typing.ParamSpec".
             # * "typing.TypeVar".
             repr(hint)
-            if is_hint_uncached(hint) else
+            if is_hint_key_repr else
             # Else, this hint is self-caching and thus already reduced to a
             # singleton object. In this case, the identifier identifying this
             # singleton object.
@@ -153,6 +156,20 @@ class _TypeHintMeta(ABCMeta):
                 arg=hint,
             ))
 
+        # If this key is the machine-readable representation of this hint *AND*
+        # the hint wrapped by this wrapper is neither this hint nor equal to
+        # this hint, that hint merely shares the same representation as this
+        # hint. Since representations are *NOT* unique, unequal hints may share
+        # the same representation (e.g., hints subscripted by distinct classes
+        # locally redefined by each call to the same function with the same
+        # fully-qualified name). In this case, wrap this hint by a new uncached
+        # wrapper rather than silently returning the wrong wrapper.
+        if is_hint_key_repr:
+            hint_wrapped = wrapper._hint  # type: ignore[attr-defined]
+            if not (hint_wrapped is hint or hint_wrapped == hint):
+                wrapper = cls._make_wrapper(hint)
+        # Else, this wrapper wraps either this hint or a hint equal to this hint.
+
         # Return this wrapper.
         return wrapper
 
@@ -228,7 +245,7 @@ class _TypeHintMeta(ABCMeta):
         return wrapper
 
 # ....................{ PRIVATE ~ mappings                 }....................
-_HINT_KEY_TO_WRAPPER = CacheUnboundedStrong(
+_HINT_KEY_TO_WRAPPER = make_cache(
     # Prefer the slower reentrant lock type for safety. As the subpackage name
     # implies, the DOOR API is fundamentally recursive and requires reentrancy.
     lock_type=RLock,
@@ -264,6 +281,12 @@ rather than the :func:`functools.lru_cache` decorator. Why? Because:
   temporarily caching hints in an LRU cache is pointless, as there are *no*
   space savings in dropping stale references to unused hints.
 
+  Long-lived processes dynamically creating type hints at runtime (e.g.,
+  :pep:`586`-compliant literals) violate these assumptions. This cache is thus
+  created by the :func:`beartype._util.cache.utilcachepolicy.make_cache`
+  factory, which instead bounds or weakens this cache when the
+  ``${BEARTYPE_CACHE_POLICY}`` environment variable is set.
+
 **This dictionary intentionally caches machine-readable representation strings
 hashes rather than alternative keys** (e.g., actual hashes). Why? Disambiguity.
 Although comparatively less efficient in both space and time to construct than
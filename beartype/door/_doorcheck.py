@@ -18,14 +18,22 @@ process).
 # whereas the API defined by this submodule is expected to unconditionally
 # operate as expected regardless of the current context.
 #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+from beartype.typing import (
+    Dict,
+    Iterable,
+    List,
+)
 from beartype._check.checkmake import (
     make_func_raiser,
+    make_func_raiser_many,
     make_func_tester,
+    make_func_tester_many,
 )
 from beartype._conf.confcls import (
     BEARTYPE_CONF_DEFAULT,
     BeartypeConf,
 )
+from beartype.door._doorsubhint import is_subhint_indexed
 
 #FIXME: Consider:
 #* Once we've gone that far, though, *EVERYBODY* (including us) will then
@@ -100,6 +108,88 @@ def die_if_unbearable(
     # violates this hint.
     func_raiser(obj)  # pyright: ignore[reportUnboundVariable]
 
+
+def die_if_unbearable_many(
+    # Mandatory flexible parameters.
+    objs: Iterable[object],
+    hint: object,
+
+    # Optional keyword-only parameters.
+    *,
+    conf: BeartypeConf = BEARTYPE_CONF_DEFAULT,
+) -> None:
+    '''
+    Raise an exception if any object of the passed iterable violates the passed
+    type hint under the passed beartype configuration.
+
+    This validator is a batch variant of the :func:`.die_if_unbearable`
+    validator. Rather than repeatedly calling that validator once for each
+    object, this validator resolves the type-checking function for this hint
+    exactly once and then type-checks all objects of this iterable in a single
+    loop generated for and specialized to this hint. This validator is thus
+    substantially faster than the equivalent ``for obj in objs:
+    die_if_unbearable(obj, hint)`` loop.
+
+    This validator streams this iterable (i.e., iterates over this iterable
+    exactly once *without* materializing this iterable into an intermediary
+    container), stopping at the first object violating this hint. This iterable
+    may thus be an arbitrarily large (or even infinite) iterator or generator.
+    Sequences and one-dimensional NumPy arrays with ``object`` dtype are
+    supported as is.
+
+    Parameters
+    ----------
+    objs : Iterable[object]
+        Iterable of arbitrary objects to be tested against this hint.
+    hint : object
+        Type hint to test these objects against.
+    conf : BeartypeConf, optional
+        **Beartype configuration** (i.e., self-caching dataclass encapsulating
+        all settings configuring type-checking for the passed objects).
+        Defaults to ``BeartypeConf()``, the default :math:`O(1)` constant-time
+        configuration.
+
+    Raises
+    ------
+    beartype.roar.BeartypeDecorHintNonpepException
+        If this hint is *not* PEP-compliant (i.e., complies with *no* Python
+        Enhancement Proposals (PEPs) currently supported by :mod:`beartype`).
+    beartype.roar.BeartypeDecorHintPepUnsupportedException
+        If this hint is currently unsupported by :mod:`beartype`.
+    beartype.roar.BeartypeDoorHintViolation
+        If any object of this iterable violates this hint. The message of this
+        violation is prefixed by the 0-based index of the first such object.
+
+    Warns
+    -----
+    beartype.roar.BeartypeDoorHintViolation
+        If this configuration emits warnings rather than raising exceptions on
+        violations, once for each object of this iterable violating this hint.
+
+    Examples
+    --------
+        >>> from beartype.door import die_if_unbearable_many
+        >>> die_if_unbearable_many([0, 1, 2], int)
+        >>> die_if_unbearable_many((n for n in (0, '1', 2)), int)
+        beartype.roar.BeartypeDoorHintViolation: Item 1 violates type hint
+        <class 'int'>, as str '1' not instance of int.
+    '''
+
+    # Memoized low-level batch type-checking raiser function either raising an
+    # exception or emitting a warning for objects of the passed iterable
+    # violating the type hint passed to this high-level batch type-checking
+    # raiser function.
+    #
+    # Note that parameters are intentionally passed positionally for efficiency.
+    # Since make_func_raiser_many() is memoized, passing parameters by keyword
+    # would raise a non-fatal
+    # "_BeartypeUtilCallableCachedKwargsWarning" warning.
+    func_raiser_many = make_func_raiser_many(hint, conf)
+
+    # Either raise an exception or emit a warning only if an object of the
+    # passed iterable violates this hint.
+    func_raiser_many(objs)
+
 # ....................{ TESTERS                            }....................
 def is_subhint(subhint: object, superhint: object) -> bool:
     '''
@@ -164,8 +254,111 @@ def is_subhint(subhint: object, superhint: object) -> bool:
     # Avoid circular import dependencies.
     from beartype.door._cls.doorsuper import TypeHint
 
-    # The one-liner is mightier than the... many-liner.
-    return TypeHint(subhint).is_subhint(TypeHint(superhint))
+    # Defer to the process-wide subhint relation index, which first attempts to
+    # reuse the relation previously decided for these hints before deferring
+    # to the TypeHint.is_subhint() method.
+    return is_subhint_indexed(TypeHint(subhint), TypeHint(superhint))
+
+
+def is_subhint_matrix(
+    hints_sub: Iterable[object],
+    hints_super: Iterable[object],
+) -> List[List[bool]]:
+    '''
+    Matrix (i.e., list of lists) of booleans, each of which is :data:`True` only
+    if the hint of the first passed iterable with the same row index is a
+    **subhint** of the hint of the second passed iterable with the same column
+    index.
+
+    This tester is a batch variant of the :func:`.is_subhint` tester. Calling
+    ``is_subhint_matrix(hints_sub, hints_super)[i][j]`` is equivalent to calling
+    ``is_subhint(hints_sub[i], hints_super[j])``. Rather than repeatedly calling
+    that tester once for each pair of hints, this tester:
+
+    * Wraps each hint of these iterables in a :class:`beartype.door.TypeHint`
+      wrapper exactly once.
+    * Decides the relation between each distinct pair of wrappers exactly once,
+      reusing that decision for all duplicate rows and columns (i.e., hints
+      whose wrappers are the same wrapper, as with equal hints).
+    * Shares work across calls via the process-wide subhint relation index also
+      underlying the :func:`.is_subhint` tester. Relations decided by prior
+      calls to either tester are reused as is.
+
+    Parameters
+    ----------
+    hints_sub : Iterable[object]
+        Iterable of type hints or types to be tested as subhints.
+    hints_super : Iterable[object]
+        Iterable of type hints or types to be tested as superhints.
+
+    Returns
+    -------
+    List[List[bool]]
+        Matrix of booleans, whose rows correspond to the hints of the first
+        iterable and whose columns correspond to the hints of the second
+        iterable.
+
+    Raises
+    ------
+    beartype.roar.BeartypeDoorNonpepException
+        If any of these hints is *not* PEP-compliant.
+
+    Examples
+    --------
+        >>> from beartype.door import is_subhint_matrix
+        >>> is_subhint_matrix((bool, int, str), (int, object))
+        [[True, True], [True, True], [False, True]]
+    '''
+
+    # Avoid circular import dependencies.
+    from beartype.door._cls.doorsuper import TypeHint
+
+    # Lists of the wrappers wrapping these hints.
+    wrappers_sub = [TypeHint(hint_sub) for hint_sub in hints_sub]
+    wrappers_super = [TypeHint(hint_super) for hint_super in hints_super]
+
+    # Dictionary mapping from the object identifier of each distinct subhint
+    # wrapper to the row of this matrix previously computed for that wrapper.
+    wrapper_sub_id_to_row: Dict[int, List[bool]] = {}
+
+    # Matrix to be returned.
+    matrix: List[List[bool]] = []
+
+    # For each subhint wrapper...
+    for wrapper_sub in wrappers_sub:
+        # Row previously computed for this wrapper if any *OR* "None".
+        row = wrapper_sub_id_to_row.get(id(wrapper_sub))
+
+        # If this row has yet to be computed...
+        if row is None:
+            # Dictionary mapping from the object identifier of each distinct
+            # superhint wrapper to the relation decided for that wrapper.
+            wrapper_super_id_to_is_subhint: Dict[int, bool] = {}
+
+            # Compute this row, deciding each distinct relation exactly once.
+            row = []
+            for wrapper_super in wrappers_super:
+                wrapper_super_id = id(wrapper_super)
+                is_subhint_cell = wrapper_super_id_to_is_subhint.get(
+                    wrapper_super_id)
+                if is_subhint_cell is None:
+                    is_subhint_cell = wrapper_super_id_to_is_subhint[
+                        wrapper_super_id] = is_subhint_indexed(
+                            wrapper_sub, wrapper_super)
+                row.append(is_subhint_cell)
+
+            # Record this row for reuse by duplicate subhints.
+            wrapper_sub_id_to_row[id(wrapper_sub)] = row
+        # Else, this row was previously computed. In this case, copy this row
+        # to prevent callers modifying one row from modifying another.
+        else:
+            row = row.copy()
+
+        # Append this row to this matrix.
+        matrix.append(row)
+
+    # Return this matrix.
+    return matrix
 
 # ....................{ TESTERS ~ is_bearable              }....................
 def is_bearable(
@@ -232,3 +425,87 @@ def is_bearable(
 
     # Return true only if the passed object satisfies this hint.
     return func_tester(obj)  # pyright: ignore[reportUnboundVariable]
+
+
+def is_bearable_many(
+    # Mandatory flexible parameters.
+    objs: Iterable[object],
+    hint: object,
+
+    # Optional keyword-only parameters.
+    *,
+    conf: BeartypeConf = BEARTYPE_CONF_DEFAULT,
+) -> List[bool]:
+    '''
+    List of booleans, each of which is :data:`True` only if the object with the
+    same index of the passed iterable satisfies the passed type hint under the
+    passed beartype configuration.
+
+    This tester is a batch variant of the :func:`.is_bearable` tester. Rather
+    than repeatedly calling that tester once for each object, this tester
+    resolves the type-checking function for this hint exactly once and then
+    type-checks all objects of this iterable in a single list comprehension
+    generated for and specialized to this hint. This tester is thus
+    substantially faster than the equivalent ``[is_bearable(obj, hint) for obj
+    in objs]`` comprehension.
+
+    This tester streams this iterable (i.e., iterates over this iterable exactly
+    once *without* materializing this iterable into an intermediary container).
+    This iterable may thus be an arbitrarily large iterator or generator.
+    Sequences and one-dimensional NumPy arrays with ``object`` dtype are
+    supported as is. The returned list may be trivially converted into a NumPy
+    boolean mask (e.g., ``numpy.array(is_bearable_many(objs, hint))``).
+
+    Parameters
+    ----------
+    objs : Iterable[object]
+        Iterable of arbitrary objects to be tested against this hint.
+    hint : object
+        Type hint to test these objects against.
+    conf : BeartypeConf, optional
+        **Beartype configuration** (i.e., self-caching dataclass encapsulating
+        all settings configuring type-checking for the passed objects).
+        Defaults to ``BeartypeConf()``, the default constant-time configuration.
+
+    Returns
+    -------
+    List[bool]
+        List of booleans, each of which is :data:`True` only if the object with
+        the same index of this iterable satisfies this hint.
+
+    Raises
+    ------
+    beartype.roar.BeartypeConfException
+        If this configuration is *not* a :class:`BeartypeConf` instance.
+    beartype.roar.BeartypeDecorHintForwardRefException
+        If this hint contains one or more relative forward references, which
+        this tester explicitly prohibits to improve both the efficiency and
+        portability of calls to this tester.
+    beartype.roar.BeartypeDecorHintNonpepException
+        If this hint is *not* PEP-compliant (i.e., complies with *no* Python
+        Enhancement Proposals (PEPs) currently supported by :mod:`beartype`).
+    beartype.roar.BeartypeDecorHintPepUnsupportedException
+        If this hint is currently unsupported by :mod:`beartype`.
+
+    Examples
+    --------
+        >>> from beartype.door import is_bearable_many
+        >>> is_bearable_many([['Mere'], ['anarchy'], [1, 2]], list[str])
+        [True, True, False]
+        >>> is_bearable_many(iter(('is', b'loosed', 'upon')), str)
+        [True, False, True]
+    '''
+
+    # Memoized low-level batch type-checking tester function returning a list
+    # of booleans, each true only if the corresponding object of the iterable
+    # passed to that tester satisfies the type hint passed to this high-level
+    # batch type-checking tester function.
+    #
+    # Note that parameters are intentionally passed positionally for efficiency.
+    # Since make_func_tester_many() is memoized, passing parameters by keyword
+    # would raise a non-fatal
+    # "_BeartypeUtilCallableCachedKwargsWarning" warning.
+    func_tester_many = make_func_tester_many(hint, conf)
+
+    # Return this list of booleans.
+    return func_tester_many(objs)
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2024 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype Decidedly Object-Oriented Runtime-checking (DOOR) compiled
+type-checkers** (i.e., high-level objects encapsulating the low-level
+type-checking functions dynamically generated for a type hint under a beartype
+configuration, enabling callers to type-check arbitrary objects against that
+hint *without* repeatedly looking up those functions).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                            }....................
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+# CAUTION: This submodule intentionally does *not* import the
+# @beartype.beartype decorator. See the "beartype.door._doorcheck" submodule.
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+from beartype.typing import (
+    TYPE_CHECKING,
+    Iterable,
+    List,
+    Optional,
+)
+from beartype._check.checkmake import (
+    make_func_raiser,
+    make_func_raiser_many,
+    make_func_tester,
+    make_func_tester_many,
+)
+from beartype._conf.confcls import (
+    BEARTYPE_CONF_DEFAULT,
+    BeartypeConf,
+)
+from beartype._data.hint.datahinttyping import (
+    CallableRaiser,
+    CallableRaiserMany,
+    CallableTester,
+    CallableTesterMany,
+)
+
+# ....................{ CLASSES                            }....................
+class TypeChecker(object):
+    '''
+    **Compiled type-checker** (i.e., object encapsulating the type-checking
+    functions dynamically generated for a type hint under a beartype
+    configuration).
+
+    Each call to the :func:`beartype.door.is_bearable` and
+    :func:`beartype.door.die_if_unbearable` functions looks up the memoized
+    type-checking function previously generated for the passed type hint and
+    configuration by hashing both. Each compiled type-checker instead performs
+    that lookup exactly once at instantiation time and then holds direct
+    references to the resulting type-checking functions. The :attr:`test` and
+    :attr:`check` attributes of each compiled type-checker *are* those
+    functions, which callers may call directly *without* additional lookups or
+    indirection. Hot code paths should thus instantiate compiled type-checkers
+    once (e.g., at module scope) and then repeatedly call their attributes.
+
+    Compiled type-checkers are created by the :func:`.compile_checker` factory.
+
+    Attributes
+    ----------
+    check : CallableRaiser
+        **Type-checking raiser function** (i.e., function accepting a single
+        arbitrary object and either raising an exception or emitting a warning
+        if that object violates this hint). Calling ``checker.check(obj)`` is
+        equivalent to calling ``die_if_unbearable(obj, hint, conf=conf)``.
+    test : CallableTester
+        **Type-checking tester function** (i.e., function accepting a single
+        arbitrary object and returning :data:`True` only if that object
+        satisfies this hint). Calling ``checker.test(obj)`` is equivalent to
+        calling ``is_bearable(obj, hint, conf=conf)``.
+    _conf : BeartypeConf
+        Beartype configuration configuring these type-checking functions.
+    _func_raiser_many : Optional[CallableRaiserMany]
+        **Batch type-checking raiser function** if the :meth:`check_many`
+        method has been called at least once *or* :data:`None` otherwise.
+    _func_tester_many : Optional[CallableTesterMany]
+        **Batch type-checking tester function** if the :meth:`test_many` method
+        has been called at least once *or* :data:`None` otherwise.
+    _hint : object
+        Type hint type-checked by these type-checking functions.
+    '''
+
+    # ..................{ CLASS VARIABLES                    }..................
+    # Slot all instance variables defined on this object to minimize the time
+    # complexity of both reading and writing variables.
+    __slots__ = (
+        'check',
+        'test',
+        '_conf',
+        '_func_raiser_many',
+        '_func_tester_many',
+        '_hint',
+    )
+
+    # Squelch false negatives from mypy. This is absurd. This is mypy. See:
+    #     https://github.com/python/mypy/issues/5941
+    if TYPE_CHECKING:
+        check: CallableRaiser
+        test: CallableTester
+        _conf: BeartypeConf
+        _func_raiser_many: Optional[CallableRaiserMany]
+        _func_tester_many: Optional[CallableTesterMany]
+        _hint: object
+
+    # ..................{ INITIALIZERS                       }..................
+    def __init__(
+        self,
+
+        # Mandatory parameters.
+        hint: object,
+
+        # Optional parameters.
+        conf: BeartypeConf = BEARTYPE_CONF_DEFAULT,
+    ) -> None:
+        '''
+        Initialize this compiled type-checker.
+
+        Parameters
+        ----------
+        hint : object
+            Type hint to be type-checked.
+        conf : BeartypeConf, optional
+            **Beartype configuration** (i.e., self-caching dataclass
+            encapsulating all settings configuring type-checking for the passed
+            object). Defaults to ``BeartypeConf()``, the default :math:`O(1)`
+            constant-time configuration.
+
+        Raises
+        ------
+        See :func:`.compile_checker`.
+        '''
+
+        # Classify all passed parameters.
+        self._hint = hint
+        self._conf = conf
+
+        # Memoized low-level type-checking tester and raiser functions for this
+        # hint under this configuration.
+        #
+        # Note that parameters are intentionally passed positionally for
+        # efficiency. Since these factories are memoized, passing parameters by
+        # keyword would raise a non-fatal
+        # "_BeartypeUtilCallableCachedKwargsWarning" warning.
+        self.test = make_func_tester(hint, conf)
+        self.check = make_func_raiser(hint, conf)
+
+        # Nullify all remaining instance variables. Since batch type-checking
+        # functions are only rarely required, these functions are only lazily
+        # generated on the first call to the methods requiring these functions.
+        self._func_raiser_many = None
+        self._func_tester_many = None
+
+    # ..................{ DUNDERS                            }..................
+    def __repr__(self) -> str:
+        '''
+        Machine-readable representation of this compiled type-checker.
+        '''
+
+        # Represent this type-checker as the expression creating this
+        # type-checker, avoiding needlessly representing the default
+        # configuration.
+        return (
+            f'compile_checker({repr(self._hint)})'
+            if self._conf == BEARTYPE_CONF_DEFAULT else
+            f'compile_checker({repr(self._hint)}, conf={repr(self._conf)})'
+        )
+
+    # ..................{ PROPERTIES                         }..................
+    @property
+    def conf(self) -> BeartypeConf:
+        '''
+        Beartype configuration configuring this compiled type-checker.
+        '''
+
+        return self._conf
+
+
+    @property
+    def hint(self) -> object:
+        '''
+        Type hint type-checked by this compiled type-checker.
+        '''
+
+        return self._hint
+
+    # ..................{ CHECKERS ~ many                    }..................
+    def check_many(self, objs: Iterable[object]) -> None:
+        '''
+        Raise an exception if any object of the passed iterable violates the
+        type hint type-checked by this compiled type-checker.
+
+        Calling ``checker.check_many(objs)`` is equivalent to calling
+        ``die_if_unbearable_many(objs, hint, conf=conf)``.
+
+        Parameters
+        ----------
+        objs : Iterable[object]
+            Iterable of arbitrary objects to be type-checked against this hint.
+
+        Raises
+        ------
+        beartype.roar.BeartypeDoorHintViolation
+            If any object of this iterable violates this hint.
+
+        See Also
+        --------
+        :func:`beartype.door.die_if_unbearable_many`
+            Further details.
+        '''
+
+        # Batch type-checking raiser function, lazily generated if needed.
+        func_raiser_many = self._func_raiser_many
+        if func_raiser_many is None:
+            func_raiser_many = self._func_raiser_many = make_func_raiser_many(
+                self._hint, self._conf)
+
+        # Either raise an exception or emit a warning only if an object of the
+        # passed iterable violates this hint.
+        func_raiser_many(objs)
+
+
+    def test_many(self, objs: Iterable[object]) -> List[bool]:
+        '''
+        List of booleans, each of which is :data:`True` only if the object with
+        the same index of the passed iterable satisfies the type hint
+        type-checked by this compiled type-checker.
+
+        Calling ``checker.test_many(objs)`` is equivalent to calling
+        ``is_bearable_many(objs, hint, conf=conf)``.
+
+        Parameters
+        ----------
+        objs : Iterable[object]
+            Iterable of arbitrary objects to be tested against this hint.
+
+        Returns
+        -------
+        List[bool]
+            List of booleans, each of which is :data:`True` only if the object
+            with the same index of this iterable satisfies this hint.
+
+        See Also
+        --------
+        :func:`beartype.door.is_bearable_many`
+            Further details.
+        '''
+
+        # Batch type-checking tester function, lazily generated if needed.
+        func_tester_many = self._func_tester_many
+        if func_tester_many is None:
+            func_tester_many = self._func_tester_many = make_func_tester_many(
+                self._hint, self._conf)
+
+        # Return this list of booleans.
+        return func_tester_many(objs)
+
+# ....................{ FACTORIES                          }....................
+def compile_checker(
+    # Mandatory flexible parameters.
+    hint: object,
+
+    # Optional keyword-only parameters.
+    *,
+    conf: BeartypeConf = BEARTYPE_CONF_DEFAULT,
+) -> TypeChecker:
+    '''
+    **Compiled type-checker** (i.e., :class:`.TypeChecker` object holding direct
+    references to the type-checking functions dynamically generated for the
+    passed type hint under the passed beartype configuration).
+
+    Parameters
+    ----------
+    hint : object
+        Type hint to be type-checked.
+    conf : BeartypeConf, optional
+        **Beartype configuration** (i.e., self-caching dataclass encapsulating
+        all settings configuring type-checking for the passed object). Defaults
+        to ``BeartypeConf()``, the default :math:`O(1)` constant-time
+        configuration.
+
+    Returns
+    -------
+    TypeChecker
+        Compiled type-checker type-checking this hint under this configuration.
+
+    Raises
+    ------
+    beartype.roar.BeartypeConfException
+        If this configuration is *not* a :class:`BeartypeConf` instance.
+    beartype.roar.BeartypeDecorHintForwardRefException
+        If this hint contains one or more relative forward references, which
+        this factory explicitly prohibits to improve both the efficiency and
+        portability of calls to the returned type-checker.
+    beartype.roar.BeartypeDecorHintNonpepException
+        If this hint is *not* PEP-compliant (i.e., complies with *no* Python
+        Enhancement Proposals (PEPs) currently supported by :mod:`beartype`).
+    beartype.roar.BeartypeDecorHintPepUnsupportedException
+        If this hint is currently unsupported by :mod:`beartype`.
+
+    Examples
+    --------
+        >>> from beartype.door import compile_checker
+        >>> is_strs = compile_checker(list[str])
+        >>> is_strs.test(['Surely', 'some', 'revelation', 'is', 'at', 'hand;'])
+        True
+        >>> is_strs.test_many([['Surely'], ['the'], [2]])
+        [True, True, False]
+        >>> is_strs.check(['Surely', 'the', 'Second', 'Coming', 'is', 'at', 2])
+        beartype.roar.BeartypeDoorHintViolation: Object ['Surely', 'the',
+        'Second', 'Coming', 'is', 'at', 2] violates type hint list[str], as
+        list index 6 item int 2 not instance of str.
+    '''
+
+    # Create and return a new compiled type-checker.
+    return TypeChecker(hint, conf)
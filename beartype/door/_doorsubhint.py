@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2024 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+**Beartype Decidedly Object-Oriented Runtime-checking (DOOR) subhint relation
+index** (i.e., process-wide table memoizing whether arbitrary type hint
+wrappers are subhints of other type hint wrappers).
+
+This private submodule is *not* intended for importation by downstream callers.
+'''
+
+# ....................{ IMPORTS                            }....................
+from beartype.typing import (
+    TYPE_CHECKING,
+    Dict,
+    Set,
+)
+from beartype._util.cache.utilcachepolicy import get_cache_size_max
+from threading import RLock
+
+# Avoid circular import dependencies.
+if TYPE_CHECKING:
+    from beartype.door._cls.doorsuper import TypeHint
+
+# ....................{ TESTERS                            }....................
+def is_subhint_indexed(subhint: 'TypeHint', superhint: 'TypeHint') -> bool:
+    '''
+    :data:`True` only if the first passed type hint wrapper is a **subhint** of
+    the second passed type hint wrapper, memoized by the process-wide subhint
+    relation index.
+
+    This tester is semantically equivalent to the
+    :meth:`beartype.door.TypeHint.is_subhint` method, but first attempts to
+    reuse the relation previously decided for these wrappers in constant time
+    *without* calling that method. Only if this relation has yet to be decided
+    does this tester defer to that method and then record the resulting
+    relation for subsequent reuse.
+
+    Since type hint wrappers are singletons uniquely identified by
+    canonicalizations of the type hints they wrap (i.e., ``TypeHint(hint) is
+    TypeHint(hint_copy)`` for all copies ``hint_copy`` of the same hint), this
+    index identifies type hint wrappers by object identity. To prevent object
+    identifiers from being recycled, this index pins each indexed wrapper until
+    that wrapper is evicted from this index.
+
+    Caveats
+    -------
+    **This index intentionally infers no relations.** Although subhint
+    relations are transitive in theory, the subhint relations decided by the
+    :meth:`beartype.door.TypeHint.is_subhint` method are *not* in practice
+    (e.g., ``list`` is a subhint of ``object`` and ``object`` is a subhint of
+    :class:`collections.abc.Hashable`, but ``list`` is *not* a subhint of
+    :class:`collections.abc.Hashable`). Inferring relations from previously
+    decided relations would thus silently return erroneous relations.
+
+    **This index only canonicalizes hints cached by the type hint wrapper
+    cache.** If the global cache policy evicts a wrapper from that cache, a
+    subsequently created wrapper wrapping an equal hint is a distinct object
+    with a distinct object identifier. Relations involving that wrapper are
+    then decided anew rather than reused, which is inefficient but correct.
+
+    Parameters
+    ----------
+    subhint : TypeHint
+        Type hint wrapper to be tested as the subhint.
+    superhint : TypeHint
+        Type hint wrapper to be tested as the superhint.
+
+    Returns
+    -------
+    bool
+        :data:`True` only if this first hint is a subhint of this second hint.
+    '''
+
+    # Relation previously decided for these hints if any *OR* "None" otherwise.
+    #
+    # Note that this lookup is intentionally performed *WITHOUT* acquiring the
+    # lock guarding this index. Dictionary lookups are atomic under CPython.
+    is_subhint = _hint_id_to_superhint_id_to_is_subhint.get(
+        id(subhint), _DICT_EMPTY).get(id(superhint))
+
+    # If this relation has yet to be decided, decide this relation by deferring
+    # to the memoized subclass-specific implementation of this test *AND*
+    # record this relation for subsequent reuse.
+    #
+    # Note that this relation is intentionally decided *BEFORE* acquiring this
+    # lock. Deciding this relation is potentially slow and thus should *NOT*
+    # block other threads from querying this index. Note also that exceptions
+    # raised while deciding this relation are intentionally *NOT* recorded,
+    # preserving the exception caching of that method as is.
+    if is_subhint is None:
+        is_subhint = subhint.is_subhint(superhint)
+        _index_relation(subhint, superhint, is_subhint)
+    # Else, this relation was previously decided.
+
+    # Return this relation.
+    return is_subhint
+
+# ....................{ CLEARERS                           }....................
+def clear_subhint_index() -> None:
+    '''
+    Clear (i.e., empty) the process-wide subhint relation index, releasing all
+    type hint wrappers pinned by that index.
+    '''
+
+    # Thread-safely empty all dictionaries comprising this index.
+    with _lock:
+        _hint_id_to_hint.clear()
+        _hint_id_to_subhint_ids.clear()
+        _hint_id_to_superhint_id_to_is_subhint.clear()
+
+# ....................{ PRIVATE ~ globals                  }....................
+_lock = RLock()
+'''
+Reentrant thread-safe lock guarding all dictionaries comprising the
+process-wide subhint relation index.
+'''
+
+
+_HINTS_LEN_MAX = get_cache_size_max()
+'''
+Maximum number of type hint wrappers pinned by the process-wide subhint
+relation index.
+
+This index is intentionally bounded regardless of the global cache policy.
+Since this index pins each indexed wrapper, an unbounded index would leak every
+wrapper ever tested by a long-running process comparing evolving hints (e.g.,
+hints dynamically created at runtime).
+'''
+
+
+_DICT_EMPTY: Dict[int, bool] = {}
+'''
+Empty dictionary, returned by lookups into the
+:data:`._hint_id_to_superhint_id_to_is_subhint` dictionary on failing to find a
+hint.
+
+This dictionary is intentionally *never* modified.
+'''
+
+# ....................{ PRIVATE ~ globals : dict           }....................
+_hint_id_to_hint: Dict[int, 'TypeHint'] = {}
+'''
+Dictionary mapping from the object identifier of each type hint wrapper indexed
+by the process-wide subhint relation index to that wrapper.
+
+This dictionary pins these wrappers, preventing their object identifiers from
+being recycled while indexed. Since dictionaries preserve insertion order, the
+first key of this dictionary is the identifier of the least recently indexed
+wrapper and thus the first to be evicted on exceeding the bound of this index.
+'''
+
+
+_hint_id_to_superhint_id_to_is_subhint: Dict[int, Dict[int, bool]] = {}
+'''
+Dictionary mapping from the object identifier of each indexed type hint wrapper
+to a nested dictionary mapping from the object identifier of each indexed
+wrapper previously tested as a superhint of that wrapper to :data:`True` only
+if that wrapper is a subhint of that superhint.
+'''
+
+
+_hint_id_to_subhint_ids: Dict[int, Set[int]] = {}
+'''
+Dictionary mapping from the object identifier of each indexed type hint wrapper
+to the set of the identifiers of all indexed wrappers previously tested as
+subhints of that wrapper (i.e., the inverse of the
+:data:`._hint_id_to_superhint_id_to_is_subhint` dictionary).
+
+This dictionary enables relations involving evicted wrappers to be removed from
+that dictionary in time linear in the number of those relations.
+'''
+
+# ....................{ PRIVATE ~ indexers                 }....................
+def _index_relation(
+    subhint: 'TypeHint', superhint: 'TypeHint', is_subhint: bool) -> None:
+    '''
+    Record the passed relation between the passed type hint wrappers in the
+    process-wide subhint relation index, evicting the least recently indexed
+    wrappers if this index now exceeds its bound.
+
+    Parameters
+    ----------
+    subhint : TypeHint
+        Type hint wrapper tested as the subhint.
+    superhint : TypeHint
+        Type hint wrapper tested as the superhint.
+    is_subhint : bool
+        :data:`True` only if this subhint is a subhint of this superhint.
+    '''
+
+    # Object identifiers of these hints.
+    subhint_id = id(subhint)
+    superhint_id = id(superhint)
+
+    # Thread-safely...
+    with _lock:
+        # Pin these hints, moving these hints to the end of this dictionary if
+        # previously pinned. Since assigning an existing key preserves the
+        # original position of that key, these keys are first popped.
+        _hint_id_to_hint.pop(subhint_id, None)
+        _hint_id_to_hint.pop(superhint_id, None)
+        _hint_id_to_hint[subhint_id] = subhint
+        _hint_id_to_hint[superhint_id] = superhint
+
+        # Record this relation in both directions.
+        _hint_id_to_superhint_id_to_is_subhint.setdefault(subhint_id, {})[
+            superhint_id] = is_subhint
+        _hint_id_to_subhint_ids.setdefault(superhint_id, set()).add(subhint_id)
+
+        # Evict the least recently indexed hints exceeding that bound. Since
+        # the two hints indexed above are now the most recently indexed hints,
+        # these hints are *NEVER* evicted here.
+        while len(_hint_id_to_hint) > max(_HINTS_LEN_MAX, 2):
+            _unindex_hint_id(next(iter(_hint_id_to_hint)))
+
+
+def _unindex_hint_id(hint_id: int) -> None:
+    '''
+    Remove the type hint wrapper with the passed object identifier *and* all
+    relations involving that wrapper from the process-wide subhint relation
+    index.
+
+    This function is intended to be called *only* with the lock guarding this
+    index acquired.
+
+    Parameters
+    ----------
+    hint_id : int
+        Object identifier of the type hint wrapper to be removed.
+    '''
+
+    # Unpin this hint.
+    _hint_id_to_hint.pop(hint_id, None)
+
+    # For each superhint previously tested against this hint as a subhint,
+    # remove this hint from the subhints of that superhint.
+    for superhint_id in _hint_id_to_superhint_id_to_is_subhint.pop(
+        hint_id, _DICT_EMPTY):
+        subhint_ids = _hint_id_to_subhint_ids.get(superhint_id)
+        if subhint_ids is not None:
+            subhint_ids.discard(hint_id)
+
+    # For each subhint previously tested against this hint as a superhint,
+    # remove all relations between that subhint and this hint.
+    for subhint_id in _hint_id_to_subhint_ids.pop(hint_id, ()):
+        superhint_id_to_is_subhint = (
+            _hint_id_to_superhint_id_to_is_subhint.get(subhint_id))
+        if superhint_id_to_is_subhint is not None:
+            superhint_id_to_is_subhint.pop(hint_id, None)
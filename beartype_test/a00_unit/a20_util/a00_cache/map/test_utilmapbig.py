@@ -64,3 +64,11 @@ def test_cacheunboundedstrong() -> None:
     # value).
     assert cache_unbounded.cache_or_get_cached_func_return_passed_arg(
         key=KEY_B, value_factory=value_factory, arg=KEY_B) == hash(KEY_B)
+
+    # Assert that conditionally clearing this cache removes *ONLY* the key-value
+    # pairs satisfying the passed tester.
+    cache_unbounded.clear_if(lambda key, value: key is KEY_A)
+    assert cache_unbounded.cache_or_get_cached_value(
+        key=KEY_A, value=VALUE_B) is VALUE_B
+    assert cache_unbounded.cache_or_get_cached_value(
+        key=KEY_B, value=VALUE_A) == hash(KEY_B)
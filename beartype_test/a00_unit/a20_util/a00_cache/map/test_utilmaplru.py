@@ -138,3 +138,51 @@ def test_lrucachestrong_fail() -> None:
     # Confirm behaviour for a non-positive size.
     with raises(_BeartypeUtilCacheLruException):
         CacheLruStrong(size=0)
+
+
+def test_cacheboundedstrong() -> None:
+    """
+    Test both successful and unsuccessful usage of the
+    :class:`beartype._util.cache.map.utilmaplru.CacheBoundedStrong` class.
+    """
+
+    # Defer test-specific imports.
+    from beartype._util.cache.map.utilmaplru import CacheBoundedStrong
+
+    # Bounded cache caching at most two key-value pairs.
+    cache_bounded = CacheBoundedStrong(size_max=2)
+
+    # Arbitrary key-value pairs.
+    KEY_A =   'Thou art the path of that unresting sound'
+    VALUE_A = 'Dizzy Ravine! and when I gaze on thee'
+    KEY_B =   'I seem as in a trance sublime and strange'
+    VALUE_B = 'To muse on my own separate fantasy,'
+    KEY_C =   'My own, my human mind, which passively'
+    VALUE_C = 'Now renders and receives fast influencings,'
+
+    # Cache the first two key-value pairs.
+    assert cache_bounded.cache_or_get_cached_value(
+        key=KEY_A, value=VALUE_A) is VALUE_A
+    assert cache_bounded.cache_or_get_cached_func_return_passed_arg(
+        key=KEY_B, value_factory=lambda arg: VALUE_B, arg=None) is VALUE_B
+
+    # Refresh the first key-value pair as the most recently used pair.
+    assert cache_bounded.cache_or_get_cached_value(
+        key=KEY_A, value=VALUE_C) is VALUE_A
+
+    # Cache the third key-value pair, evicting the least recently used pair.
+    assert cache_bounded.cache_or_get_cached_value(
+        key=KEY_C, value=VALUE_C) is VALUE_C
+
+    # Assert that the first pair was preserved *AND* the least recently used
+    # pair was evicted.
+    assert cache_bounded.cache_or_get_cached_value(
+        key=KEY_A, value=VALUE_C) is VALUE_A
+    assert cache_bounded.cache_or_get_cached_value(
+        key=KEY_B, value=VALUE_C) is VALUE_C
+
+    # Assert that invalid capacities raise the expected exception.
+    with raises(_BeartypeUtilCacheLruException):
+        CacheBoundedStrong(size_max='Has seen a cloud, whose silvery sides')
+    with raises(_BeartypeUtilCacheLruException):
+        CacheBoundedStrong(size_max=0)
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2024 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Project-wide **weak-valued cache** utility unit tests.
+
+This submodule unit tests the public API of the private
+:mod:`beartype._util.cache.map.utilmapweak` submodule.
+'''
+
+# ....................{ IMPORTS                            }....................
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+# WARNING: To raise human-readable test errors, avoid importing from
+# package-specific submodules at module scope.
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+
+# ....................{ TESTS                              }....................
+def test_cacheunboundedweak() -> None:
+    '''
+    Test successful usage of the
+    :class:`beartype._util.cache.map.utilmapweak.CacheUnboundedWeak` class.
+    '''
+
+    # Defer test-specific imports.
+    from beartype._util.cache.map.utilmapweak import CacheUnboundedWeak
+    from gc import collect
+
+    # ....................{ CLASSES                        }....................
+    class Ravine(object):
+        '''
+        Arbitrary weakly referenceable class.
+        '''
+
+        pass
+
+    # ....................{ LOCALS                         }....................
+    # Initially empty weak-valued cache.
+    cache_weak = CacheUnboundedWeak()
+
+    # Arbitrary key.
+    KEY = 'Dizzy Ravine! and when I gaze on thee'
+
+    # Arbitrary weakly referenceable values.
+    value_old = Ravine()
+    value_new = Ravine()
+
+    # ....................{ PASS                           }....................
+    # Assert that getting an uncached key caches that key with that value.
+    assert cache_weak.cache_or_get_cached_value(
+        key=KEY, value=value_old) is value_old
+    assert cache_weak.cache_or_get_cached_func_return_passed_arg(
+        key=KEY, value_factory=lambda arg: value_new, arg=None) is value_old
+
+    # Assert that garbage-collecting that value evicts that key.
+    del value_old
+    collect()
+    assert cache_weak.cache_or_get_cached_value(
+        key=KEY, value=value_new) is value_new
+
+    # Assert that getting an uncached key with a value that is *NOT* weakly
+    # referenceable returns that value *WITHOUT* caching that value.
+    KEY_UNWEAKREFABLE = 'I seem as in a trance sublime and strange'
+    VALUE_UNWEAKREFABLE = ('To muse on my own separate fantasy,',)
+    assert cache_weak.cache_or_get_cached_value(
+        key=KEY_UNWEAKREFABLE, value=VALUE_UNWEAKREFABLE) is (
+        VALUE_UNWEAKREFABLE)
+    assert cache_weak.cache_or_get_cached_func_return_passed_arg(
+        key=KEY_UNWEAKREFABLE, value_factory=lambda arg: arg, arg=KEY) is KEY
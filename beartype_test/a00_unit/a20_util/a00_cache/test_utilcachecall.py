@@ -118,11 +118,17 @@ def test_callable_cached() -> None:
         from_savage_men(bitter, twisted, *lies))
 
 
-def test_method_cached_arg_by_id() -> None:
+def test_method_cached_arg_by_id(monkeypatch) -> None:
     '''
     Test the
     :func:`beartype._util.cache.utilcachecall.method_cached_arg_by_id`
     decorator.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.MonkeyPatch
+        Fixture temporarily bounding the size of caches created by this
+        decorator.
     '''
 
     # ..................{ IMPORTS                            }..................
@@ -198,6 +204,51 @@ def test_method_cached_arg_by_id() -> None:
     # succeeds with the expected return value.
     assert like_air.just_like_moons(hopes) == [id(like_air), hopes]
 
+    # ..................{ PASS ~ bounded                     }..................
+    # Temporarily bound caches created by this decorator to two calls.
+    monkeypatch.setenv('BEARTYPE_CACHE_POLICY', 'lru')
+    monkeypatch.setenv('BEARTYPE_CACHE_SIZE_MAX', '2')
+
+    class LikeGold(object):
+        '''
+        Arbitrary class containing an arbitrary recursive callable memoized by
+        this decorator when caches are bounded.
+        '''
+
+        @method_cached_arg_by_id
+        def with_the_sweet_rose(self, and_the_sun):
+            '''
+            Arbitrary recursive callable memoized by this decorator, whose
+            recursive calls exceed the bound of its cache.
+            '''
+
+            # Recursively call this callable on several other objects, evicting
+            # all prior calls from this cache.
+            if isinstance(and_the_sun, int) and and_the_sun:
+                for _ in range(3):
+                    self.with_the_sweet_rose(and_the_sun - 1)
+
+            # Return a value depending on these parameters.
+            return [id(self), and_the_sun]
+
+    # Instance of this class.
+    like_fire = LikeGold()
+
+    # Objects to be passed as parameters below.
+    sun = 3
+    rose = ['And', 'the', 'sweet', 'rose']
+
+    # Assert that this recursive call caches and returns the expected value
+    # *AND* pins its parameters despite the recursive calls it performs.
+    sun_value = like_fire.with_the_sweet_rose(sun)
+    assert sun_value == [id(like_fire), sun]
+    assert like_fire.with_the_sweet_rose(sun) is sun_value
+
+    # Assert that evicting that call via subsequent calls recomputes that call.
+    like_fire.with_the_sweet_rose(rose)
+    like_fire.with_the_sweet_rose(rose.copy())
+    assert like_fire.with_the_sweet_rose(sun) is not sun_value
+
     # ..................{ FAIL                               }..................
     # Assert that attempting to memoize a callable accepting *NO* parameters
     # fails with the expected exception.
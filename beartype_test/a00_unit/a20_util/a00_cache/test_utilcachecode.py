@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2024 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Project-wide **code object cache** unit tests.
+
+This submodule unit tests the public API of the private
+:mod:`beartype._util.cache.utilcachecode` submodule.
+'''
+
+# ....................{ IMPORTS                            }....................
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+# WARNING: To raise human-readable test errors, avoid importing from
+# package-specific submodules at module scope.
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+
+# ....................{ TESTS                              }....................
+def test_compile_func_code(monkeypatch) -> None:
+    '''
+    Test the :func:`beartype._util.cache.utilcachecode.compile_func_code`
+    function with the on-disk code cache disabled.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.MonkeyPatch
+        Fixture unsetting the ``${BEARTYPE_CODE_CACHE_DIR}`` environment
+        variable and emptying the process-wide code cache.
+    '''
+
+    # Defer test-specific imports.
+    from beartype._util.cache import utilcachecode
+    from beartype._util.cache.utilcachecode import compile_func_code
+    from beartype._util.py.utilpyversion import IS_PYTHON_AT_LEAST_3_11
+    from pytest import raises
+
+    # ....................{ LOCALS                         }....................
+    # Disable the on-disk code cache *AND* empty the process-wide code cache.
+    monkeypatch.delenv('BEARTYPE_CODE_CACHE_DIR', raising=False)
+    monkeypatch.setattr(utilcachecode, '_FUNC_CODE_CANONICAL_TO_CODEOBJ', {})
+
+    # ....................{ PASS                           }....................
+    # Code objects compiled from equivalent snippets declaring differently
+    # named functions accessing differently named attributes.
+    module_codeobj = compile_func_code(
+        _FUNC_CODE, 'round_the_lone_couch', _FUNC_FILENAME)
+    module_codeobj_other = compile_func_code(
+        _FUNC_CODE_OTHER.replace(
+            'round_the_lone_couch', 'of_his_everlasting_sleep'),
+        'of_his_everlasting_sleep',
+        '<gentle and brave>',
+    )
+
+    # Assert that these snippets were compiled only once.
+    assert len(utilcachecode._FUNC_CODE_CANONICAL_TO_CODEOBJ) == 1
+
+    # Functions declared by these code objects.
+    func = _exec_func(
+        module_codeobj,
+        'round_the_lone_couch',
+        {'__beartype_object_1234': int, '__beartype_object_5678': 'Gentle'},
+    )
+    func_other = _exec_func(
+        module_codeobj_other,
+        'of_his_everlasting_sleep',
+        {'__beartype_object_8765': str, '__beartype_object_4321': 'and brave'},
+    )
+
+    # Assert that these functions behave as expected.
+    assert func(0) == (True, 'Gentle')
+    assert func_other('and generous') == (True, 'and brave')
+
+    # Assert that these functions preserve their original names, filenames,
+    # and the original names of the attributes they access.
+    assert func.__code__.co_name == 'round_the_lone_couch'
+    assert func_other.__code__.co_name == 'of_his_everlasting_sleep'
+    assert func.__code__.co_filename == _FUNC_FILENAME
+    assert func_other.__code__.co_filename == '<gentle and brave>'
+    assert set(func.__kwdefaults__) == {
+        '__beartype_object_1234', '__beartype_object_5678'}
+    assert set(func_other.__kwdefaults__) == {
+        '__beartype_object_8765', '__beartype_object_4321'}
+
+    # If the active Python interpreter targets Python >= 3.11, assert that
+    # these functions also preserve their original fully-qualified names.
+    if IS_PYTHON_AT_LEAST_3_11:
+        assert func.__code__.co_qualname == 'round_the_lone_couch'
+        assert func_other.__code__.co_qualname == 'of_his_everlasting_sleep'
+    # Else, the active Python interpreter targets Python < 3.11.
+
+    # Assert that these functions share the same bytecode.
+    assert func.__code__.co_code == func_other.__code__.co_code
+
+    # ....................{ FAIL                           }....................
+    # Assert that compiling a syntactically invalid snippet raises the
+    # expected exception.
+    with raises(SyntaxError):
+        compile_func_code('def (', 'and_generous', _FUNC_FILENAME)
+
+
+def test_compile_func_code_bounded(monkeypatch) -> None:
+    '''
+    Test that the :func:`beartype._util.cache.utilcachecode.compile_func_code`
+    function bounds the process-wide code cache.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.MonkeyPatch
+        Fixture unsetting the ``${BEARTYPE_CODE_CACHE_DIR}`` environment
+        variable and replacing the process-wide code cache.
+    '''
+
+    # Defer test-specific imports.
+    from beartype._util.cache import utilcachecode
+    from beartype._util.cache.map.utilmaplru import CacheLruStrong
+    from beartype._util.cache.utilcachecode import compile_func_code
+
+    # Disable the on-disk code cache *AND* replace the process-wide code cache
+    # with an empty cache persisting at most one code object.
+    monkeypatch.delenv('BEARTYPE_CODE_CACHE_DIR', raising=False)
+    monkeypatch.setattr(
+        utilcachecode, '_FUNC_CODE_CANONICAL_TO_CODEOBJ', CacheLruStrong(1))
+
+    # Compile two non-equivalent snippets.
+    compile_func_code(_FUNC_CODE, 'round_the_lone_couch', _FUNC_FILENAME)
+    compile_func_code(
+        'def and_generous(lament):\n    return lament\n',
+        'and_generous',
+        _FUNC_FILENAME,
+    )
+
+    # Assert that this cache evicted the code object compiled from the first
+    # snippet on compiling the second snippet.
+    assert len(utilcachecode._FUNC_CODE_CANONICAL_TO_CODEOBJ) == 1
+
+
+def test_compile_func_code_dir(tmp_path, monkeypatch) -> None:
+    '''
+    Test the :func:`beartype._util.cache.utilcachecode.compile_func_code`
+    function with the on-disk code cache enabled.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Temporary directory to persist the on-disk code cache to.
+    monkeypatch : pytest.MonkeyPatch
+        Fixture setting the ``${BEARTYPE_CODE_CACHE_DIR}`` environment
+        variable and emptying the process-wide code cache.
+    '''
+
+    # Defer test-specific imports.
+    from beartype import beartype
+    from beartype.roar import BeartypeCallHintParamViolation
+    from beartype._util.cache import utilcachecode
+    from beartype._util.cache.utilcachecode import compile_func_code
+    from pytest import raises
+
+    # ....................{ LOCALS                         }....................
+    # Directory persisting the on-disk code cache.
+    cache_dir = tmp_path / 'cache'
+
+    # Enable the on-disk code cache *AND* empty the process-wide code cache.
+    monkeypatch.setenv('BEARTYPE_CODE_CACHE_DIR', str(cache_dir))
+    monkeypatch.setattr(utilcachecode, '_FUNC_CODE_CANONICAL_TO_CODEOBJ', {})
+
+    # ....................{ PASS ~ miss                    }....................
+    # Assert that compiling a snippet on a cache miss writes one cache file.
+    module_codeobj = compile_func_code(
+        _FUNC_CODE, 'round_the_lone_couch', _FUNC_FILENAME)
+    cache_files = list(cache_dir.iterdir())
+    assert len(cache_files) == 1
+
+    # Assert that the function declared by that code object behaves as
+    # expected.
+    func = _exec_func(
+        module_codeobj,
+        'round_the_lone_couch',
+        {'__beartype_object_1234': int, '__beartype_object_5678': 'Gentle'},
+    )
+    assert func(0) == (True, 'Gentle')
+
+    # ....................{ PASS ~ hit                     }....................
+    # Empty the process-wide code cache, as if in a different process.
+    monkeypatch.setattr(utilcachecode, '_FUNC_CODE_CANONICAL_TO_CODEOBJ', {})
+
+    # Assert that compiling an equivalent snippet on a cache hit writes *NO*
+    # additional cache files.
+    module_codeobj = compile_func_code(
+        _FUNC_CODE_OTHER, 'round_the_lone_couch', _FUNC_FILENAME)
+    assert list(cache_dir.iterdir()) == cache_files
+
+    # Assert that the function declared by that code object behaves as
+    # expected and accesses the names of attributes in that snippet.
+    func = _exec_func(
+        module_codeobj,
+        'round_the_lone_couch',
+        {'__beartype_object_8765': str, '__beartype_object_4321': 'and brave'},
+    )
+    assert func('and generous') == (True, 'and brave')
+    assert set(func.__kwdefaults__) == {
+        '__beartype_object_8765', '__beartype_object_4321'}
+
+    # ....................{ PASS ~ corrupt                 }....................
+    # Empty the process-wide code cache *AND* corrupt that cache file.
+    monkeypatch.setattr(utilcachecode, '_FUNC_CODE_CANONICAL_TO_CODEOBJ', {})
+    cache_files[0].write_bytes(b'No mourning maiden decked')
+
+    # Assert that a corrupted cache file is silently treated as a cache miss
+    # and overwritten.
+    func = _exec_func(
+        compile_func_code(_FUNC_CODE, 'round_the_lone_couch', _FUNC_FILENAME),
+        'round_the_lone_couch',
+        {'__beartype_object_1234': int, '__beartype_object_5678': 'Gentle'},
+    )
+    assert func(0) == (True, 'Gentle')
+    assert cache_files[0].read_bytes() != b'No mourning maiden decked'
+
+    # ....................{ PASS ~ decorator               }....................
+    @beartype
+    def with_weeping_flowers(or_votive_cypress_wreath: list) -> int:
+        '''
+        Arbitrary callable decorated with this cache enabled.
+        '''
+
+        return len(or_votive_cypress_wreath)
+
+    # Assert that this callable behaves as expected.
+    assert with_weeping_flowers(['The lone couch']) == 1
+
+    # ....................{ FAIL                           }....................
+    # Assert that this callable raises the expected exception when passed an
+    # invalid parameter.
+    with raises(BeartypeCallHintParamViolation):
+        with_weeping_flowers('of his everlasting sleep')
+
+# ....................{ PRIVATE ~ constants                }....................
+_FUNC_CODE = (
+    'def round_the_lone_couch(\n'
+    '    *args,\n'
+    '    __beartype_object_1234=__beartype_object_1234,\n'
+    '    __beartype_object_5678=__beartype_object_5678,\n'
+    '):\n'
+    '    return (\n'
+    '        isinstance(args[0], __beartype_object_1234),\n'
+    '        (lambda: __beartype_object_5678)(),\n'
+    '    )\n'
+)
+'''
+Code snippet declaring a function accessing two attributes uniquified by object
+identifier, one of which is accessed only from a nested closure.
+'''
+
+
+_FUNC_CODE_OTHER = _FUNC_CODE.replace('1234', '8765').replace('5678', '4321')
+'''
+Code snippet equivalent to :data:`._FUNC_CODE` accessing attributes with
+different names, as if generated for the same callable by a different Python
+process.
+'''
+
+
+_FUNC_FILENAME = '<of his everlasting sleep>'
+'''
+Fake filename to be embedded in code objects compiled from these snippets.
+'''
+
+# ....................{ PRIVATE ~ callables                }....................
+def _exec_func(module_codeobj, func_name, func_locals):
+    '''
+    Function with the passed name declared by executing the passed module code
+    object in the passed local scope.
+    '''
+
+    # Declare and return that function.
+    exec(module_codeobj, {}, func_locals)
+    return func_locals[func_name]
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2024 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Project-wide **cache policy** unit tests.
+
+This submodule unit tests the public API of the private
+:mod:`beartype._util.cache.utilcachepolicy` submodule.
+'''
+
+# ....................{ IMPORTS                            }....................
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+# WARNING: To raise human-readable test errors, avoid importing from
+# package-specific submodules at module scope.
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+
+# ....................{ TESTS                              }....................
+def test_make_cache(monkeypatch) -> None:
+    '''
+    Test the :func:`beartype._util.cache.utilcachepolicy.make_cache` factory
+    and the :func:`beartype._util.cache.utilcachepolicy.get_cache_size_max_or_none`
+    getter.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.MonkeyPatch
+        Fixture setting the ``${BEARTYPE_CACHE_POLICY}`` and
+        ``${BEARTYPE_CACHE_SIZE_MAX}`` environment variables.
+    '''
+
+    # Defer test-specific imports.
+    from beartype.roar import BeartypeConfShellVarException
+    from beartype._util.cache.map.utilmapbig import CacheUnboundedStrong
+    from beartype._util.cache.map.utilmaplru import CacheBoundedStrong
+    from beartype._util.cache.map.utilmapweak import CacheUnboundedWeak
+    from beartype._util.cache.utilcachepolicy import (
+        _CACHE_SIZE_MAX_DEFAULT,
+        get_cache_size_max,
+        get_cache_size_max_or_none,
+        make_cache,
+    )
+    from pytest import raises
+
+    # ....................{ PASS                           }....................
+    # Assert that the default policy creates strong unbounded caches, while
+    # caches bounded regardless of policy default to the default capacity.
+    monkeypatch.delenv('BEARTYPE_CACHE_POLICY', raising=False)
+    monkeypatch.setenv('BEARTYPE_CACHE_SIZE_MAX', '2')
+    assert type(make_cache()) is CacheUnboundedStrong
+    assert get_cache_size_max_or_none() is None
+    assert get_cache_size_max() == _CACHE_SIZE_MAX_DEFAULT
+
+    # Assert that the "lru" policy creates bounded caches of the passed size.
+    monkeypatch.setenv('BEARTYPE_CACHE_POLICY', 'lru')
+    cache = make_cache()
+    assert type(cache) is CacheBoundedStrong
+    assert cache._size_max == get_cache_size_max_or_none() == 2
+    assert get_cache_size_max() == 2
+
+    # Assert that the "weak" policy creates weak-valued caches.
+    monkeypatch.setenv('BEARTYPE_CACHE_POLICY', 'weak')
+    assert type(make_cache()) is CacheUnboundedWeak
+
+    # ....................{ FAIL                           }....................
+    # Assert that invalid environment variable values raise the expected
+    # exception.
+    monkeypatch.setenv('BEARTYPE_CACHE_SIZE_MAX', 'Mont Blanc')
+    with raises(BeartypeConfShellVarException):
+        get_cache_size_max_or_none()
+    monkeypatch.setenv('BEARTYPE_CACHE_SIZE_MAX', '0')
+    with raises(BeartypeConfShellVarException):
+        get_cache_size_max_or_none()
+    monkeypatch.setenv('BEARTYPE_CACHE_POLICY', 'The everlasting universe')
+    with raises(BeartypeConfShellVarException):
+        make_cache()
+
+
+def test_uncache_dict_oldest() -> None:
+    '''
+    Test the :func:`beartype._util.cache.utilcachepolicy.uncache_dict_oldest`
+    uncacher.
+    '''
+
+    # Defer test-specific imports.
+    from beartype._util.cache.utilcachepolicy import uncache_dict_oldest
+
+    # Dictionary to be bounded, ordered from least to most recently cached.
+    key_to_value = {
+        'The glittering': 1, 'mountains': 2, 'Shelley': 3, 'Mont Blanc': 4}
+
+    # Assert that this uncacher preserves dictionaries already within bounds.
+    uncache_dict_oldest(key_to_value, 4)
+    assert len(key_to_value) == 4
+
+    # Assert that this uncacher evicts the least recently cached items.
+    uncache_dict_oldest(key_to_value, 2)
+    assert key_to_value == {'Shelley': 3, 'Mont Blanc': 4}
+
+
+def test_callable_cached_bounded(monkeypatch) -> None:
+    '''
+    Test the :func:`beartype._util.cache.utilcachecall.callable_cached` and
+    :func:`beartype._util.cache.utilcachecall.method_cached_arg_by_id`
+    decorators under a bounded cache policy.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.MonkeyPatch
+        Fixture setting the ``${BEARTYPE_CACHE_POLICY}`` and
+        ``${BEARTYPE_CACHE_SIZE_MAX}`` environment variables.
+    '''
+
+    # Defer test-specific imports.
+    from beartype._util.cache.utilcachecall import (
+        callable_cached,
+        method_cached_arg_by_id,
+    )
+
+    # ....................{ LOCALS                         }....................
+    # Bound all caches created below to at most two entries.
+    monkeypatch.setenv('BEARTYPE_CACHE_POLICY', 'lru')
+    monkeypatch.setenv('BEARTYPE_CACHE_SIZE_MAX', '2')
+
+    # List of all parameters passed to the callables defined below.
+    args_passed = []
+
+    @callable_cached
+    def of_things(flows_through_the_mind: str) -> str:
+        '''
+        Arbitrary memoized function.
+        '''
+
+        args_passed.append(flows_through_the_mind)
+        return flows_through_the_mind
+
+    class RollsItsRapidWaves(object):
+        '''
+        Arbitrary class defining an arbitrary memoized method.
+        '''
+
+        @method_cached_arg_by_id
+        def now_dark(self, now_glittering: object) -> object:
+            '''
+            Arbitrary memoized method.
+            '''
+
+            args_passed.append(now_glittering)
+            return now_glittering
+
+    # ....................{ PASS                           }....................
+    # Assert that calling the memoized function with three different
+    # parameters evicts the first memoized call.
+    for arg in ('now', 'reflecting', 'gloom', 'now'):
+        assert of_things(arg) == arg
+    assert args_passed == ['now', 'reflecting', 'gloom', 'now']
+
+    # Assert that calling the memoized function with a recently memoized
+    # parameter does *NOT* recall that function.
+    assert of_things('gloom') == 'gloom'
+    assert args_passed == ['now', 'reflecting', 'gloom', 'now']
+
+    # Assert that calling the memoized method with three different parameters
+    # evicts the first memoized call.
+    args_passed.clear()
+    rolls_its_rapid_waves = RollsItsRapidWaves()
+    args = (object(), object(), object())
+    for arg in args + args[:1]:
+        assert rolls_its_rapid_waves.now_dark(arg) is arg
+    assert args_passed == list(args + args[:1])
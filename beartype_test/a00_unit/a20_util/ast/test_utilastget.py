@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2024 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Project-wide **abstract syntax tree (AST) getter** unit tests.
+
+This submodule unit tests the public API of the private
+:mod:`beartype._util.ast.utilastget` submodule.
+'''
+
+# ....................{ IMPORTS                            }....................
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+# WARNING: To raise human-readable test errors, avoid importing from
+# package-specific submodules at module scope.
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+from beartype_test._util.mark.pytskip import skip_if_python_version_less_than
+
+# ....................{ TESTS                              }....................
+def test_get_node_names_unstable() -> None:
+    '''
+    Test the :func:`beartype._util.ast.utilastget.get_node_names_unstable`
+    getter with respect to syntax supported by all Python versions.
+    '''
+
+    # Defer test-specific imports.
+    from ast import parse
+    from beartype._util.ast.utilastget import get_node_names_unstable
+
+    # Assert that this getter returns the empty set for a module binding each
+    # attribute at most once in its global scope.
+    assert get_node_names_unstable(parse(
+        'from collections.abc import Sequence as Seq\n'
+        'import os.path\n'
+        'Tranquil = int\n'
+        'def wandering(river: Seq) -> None: pass\n'
+    )) == {'river'}
+
+    # Assert that this getter returns the names of attributes bound in nested
+    # lexical scopes, including classes, callables, lambdas, and
+    # comprehensions.
+    assert get_node_names_unstable(parse(
+        'class Flowing:\n'
+        '    Wave = str\n'
+        'def Beneath():\n'
+        '    Ocean = float\n'
+        'Sailing = lambda Gliding: Gliding\n'
+        'Stars = [Night for Night in ()]\n'
+    )) == {'Wave', 'Ocean', 'Gliding', 'Night'}
+
+    # Assert that this getter returns the names of attributes bound in loop
+    # bodies, bound more than once, or deleted.
+    assert get_node_names_unstable(parse(
+        'for Lakes in ():\n'
+        '    Mirrored = int\n'
+        'while False:\n'
+        '    Mountains = int\n'
+        'Heaven = int\n'
+        'Heaven = str\n'
+        'Seamed = int\n'
+        'del Seamed\n'
+    )) == {'Lakes', 'Mirrored', 'Mountains', 'Heaven', 'Seamed'}
+
+    # Assert that this getter returns "None" for a module performing a star
+    # import, binding an undecidable set of names.
+    assert get_node_names_unstable(parse(
+        'from beartype.typing import *\n'
+        'Sunlit = int\n'
+    )) is None
+
+    # Assert that this getter returns "None" for a module referring to either
+    # the globals() or vars() builtins, enabling arbitrary global attributes to
+    # be bound by name.
+    assert get_node_names_unstable(parse(
+        "globals()['Azure'] = int\n")) is None
+    assert get_node_names_unstable(parse(
+        "vars()['Isles'] = int\n")) is None
+
+
+@skip_if_python_version_less_than('3.10.0')
+def test_get_node_names_unstable_pep634() -> None:
+    '''
+    Test the :func:`beartype._util.ast.utilastget.get_node_names_unstable`
+    getter with respect to :pep:`634`-compliant ``match`` statements if the
+    active Python interpreter targets Python >= 3.10 *and* skip otherwise.
+    '''
+
+    # Defer test-specific imports.
+    from ast import parse
+    from beartype._util.ast.utilastget import get_node_names_unstable
+
+    # Assert that this getter returns the names of attributes captured by
+    # "match" statement patterns bound more than once, ignoring the wildcard.
+    assert get_node_names_unstable(parse(
+        'Rivers = int\n'
+        'Streams = int\n'
+        'Fountains = int\n'
+        'match None:\n'
+        '    case int() as Rivers: pass\n'
+        '    case [*Streams]: pass\n'
+        '    case {**Fountains}: pass\n'
+        '    case _: pass\n'
+    )) == {'Rivers', 'Streams', 'Fountains'}
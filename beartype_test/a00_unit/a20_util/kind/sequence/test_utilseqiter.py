@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2024 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Project-wide **sequence iterator** unit tests.
+
+This submodule unit tests the public API of the private
+:mod:`beartype._util.kind.sequence.utilseqiter` submodule.
+'''
+
+# ....................{ IMPORTS                            }....................
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+# WARNING: To raise human-readable test errors, avoid importing from
+# package-specific submodules at module scope.
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+
+# ....................{ TESTS ~ iterators                  }....................
+def test_iter_sequence_indices_ologn() -> None:
+    '''
+    Test the
+    :func:`beartype._util.kind.sequence.utilseqiter.iter_sequence_indices_ologn`
+    and
+    :func:`beartype._util.kind.sequence.utilseqiter.iter_sequence_items_ologn`
+    generators.
+    '''
+
+    # Defer test-specific imports.
+    from beartype._util.kind.sequence.utilseqiter import (
+        iter_sequence_indices_ologn,
+        iter_sequence_items_ologn,
+    )
+    from random import getrandbits
+
+    # Assert that these generators yield nothing for empty sequences.
+    assert list(iter_sequence_indices_ologn(0, getrandbits(32))) == []
+    assert list(iter_sequence_items_ologn((), getrandbits(32))) == []
+
+    # For each sequence length of interest...
+    for sequence_len in (1, 2, 3, 7, 8, 9, 255, 256, 1000, 100000):
+        # Arbitrary sequence of this length.
+        sequence = range(sequence_len)
+
+        # For several pseudo-random integers...
+        for random_int in (0, 1, getrandbits(32), getrandbits(32), 2**32 - 1):
+            # List of all indices yielded by this generator.
+            sequence_indices = list(iter_sequence_indices_ologn(
+                sequence_len, random_int))
+
+            # Assert that this generator yielded approximately log2(n)
+            # indices, all of which are distinct and valid.
+            assert len(sequence_indices) == sequence_len.bit_length()
+            assert len(set(sequence_indices)) == len(sequence_indices)
+            assert all(
+                0 <= sequence_index < sequence_len
+                for sequence_index in sequence_indices
+            )
+
+            # Assert that the items yielded by the sibling generator are
+            # exactly the items at these indices of this sequence.
+            assert list(iter_sequence_items_ologn(sequence, random_int)) == [
+                sequence[sequence_index] for sequence_index in sequence_indices]
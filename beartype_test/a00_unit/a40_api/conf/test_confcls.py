@@ -60,12 +60,18 @@ def test_conf_dataclass() -> None:
     # * The unqualified basenames of and all public fields of this class.
     BEAR_CONF_REPR_SUBSTRS = (
         'BeartypeConf',
+        'check_stream_rate',
+        'check_time_max_multiplier',
         'claw_is_pep526',
+        'claw_is_pyc_hash',
+        'claw_loop_sample',
         'hint_overrides',
         'is_color',
         'is_debug',
+        'is_lazy',
         'is_pep484_tower',
         'strategy',
+        'union_reorder_threshold',
         'violation_door_type',
         'violation_param_type',
         'violation_return_type',
@@ -85,12 +91,18 @@ def test_conf_dataclass() -> None:
     # All possible keyword arguments initialized to non-default values with
     # which to instantiate a non-default beartype configuration.
     BEAR_CONF_NONDEFAULT_KWARGS = dict(
+        check_stream_rate=0.5,
+        check_time_max_multiplier=20,
         claw_is_pep526=False,
+        claw_is_pyc_hash=True,
+        claw_loop_sample=(100, 10),
         hint_overrides=BEAR_HINT_OVERRIDES_NONEMPTY,
         is_color=True,
         is_debug=True,
+        is_lazy=True,
         is_pep484_tower=True,
         strategy=BeartypeStrategy.Ologn,
+        union_reorder_threshold=10,
         violation_door_type=RuntimeError,
         violation_param_type=TypeError,
         violation_return_type=ValueError,
@@ -124,11 +136,17 @@ def test_conf_dataclass() -> None:
     assert (
         BeartypeConf(
             strategy=BeartypeStrategy.On,
+            check_stream_rate=0.5,
+            check_time_max_multiplier=20,
             claw_is_pep526=False,
+            claw_is_pyc_hash=True,
+            claw_loop_sample=(100, 10),
             hint_overrides=BEAR_HINT_OVERRIDES_NONEMPTY,
             is_debug=True,
             is_color=True,
+            is_lazy=True,
             is_pep484_tower=True,
+            union_reorder_threshold=10,
             violation_door_type=RuntimeError,
             violation_param_type=TypeError,
             violation_return_type=ValueError,
@@ -143,23 +161,35 @@ def test_conf_dataclass() -> None:
             violation_return_type=ValueError,
             violation_param_type=TypeError,
             violation_door_type=RuntimeError,
+            union_reorder_threshold=10,
             is_pep484_tower=True,
+            is_lazy=True,
             is_color=True,
             is_debug=True,
             hint_overrides=BEAR_HINT_OVERRIDES_NONEMPTY,
+            claw_loop_sample=(100, 10),
+            claw_is_pyc_hash=True,
             claw_is_pep526=False,
+            check_time_max_multiplier=20,
+            check_stream_rate=0.5,
             strategy=BeartypeStrategy.On,
         )
     )
 
     # ....................{ PASS ~ properties              }....................
     # Assert that the default configuration contains the expected fields.
+    assert BEAR_CONF_DEFAULT.check_stream_rate is None
+    assert BEAR_CONF_DEFAULT.check_time_max_multiplier is None
     assert BEAR_CONF_DEFAULT.claw_is_pep526 is True
+    assert BEAR_CONF_DEFAULT.claw_is_pyc_hash is False
+    assert BEAR_CONF_DEFAULT.claw_loop_sample is None
     assert BEAR_CONF_DEFAULT.hint_overrides is BEARTYPE_HINT_OVERRIDES_EMPTY
     assert BEAR_CONF_DEFAULT.is_color is None
     assert BEAR_CONF_DEFAULT.is_debug is False
+    assert BEAR_CONF_DEFAULT.is_lazy is False
     assert BEAR_CONF_DEFAULT.is_pep484_tower is False
     assert BEAR_CONF_DEFAULT.strategy is BeartypeStrategy.O1
+    assert BEAR_CONF_DEFAULT.union_reorder_threshold is None
     assert BEAR_CONF_DEFAULT.violation_door_type is (
         BeartypeDoorHintViolation)
     assert BEAR_CONF_DEFAULT.violation_param_type is (
@@ -173,13 +203,19 @@ def test_conf_dataclass() -> None:
     assert BEAR_CONF_DEFAULT._is_warning_cls_on_decorator_exception_set is False
 
     # Assert that the non-default configuration contains the expected fields.
+    assert BEAR_CONF_NONDEFAULT.check_stream_rate == 0.5
+    assert BEAR_CONF_NONDEFAULT.check_time_max_multiplier == 20
     assert BEAR_CONF_NONDEFAULT.claw_is_pep526 is False
+    assert BEAR_CONF_NONDEFAULT.claw_is_pyc_hash is True
+    assert BEAR_CONF_NONDEFAULT.claw_loop_sample == (100, 10)
     assert BEAR_CONF_NONDEFAULT.hint_overrides == (
         BEAR_HINT_OVERRIDES_NONEMPTY | BEARTYPE_HINT_OVERRIDES_PEP484_TOWER)
     assert BEAR_CONF_NONDEFAULT.is_color is True
     assert BEAR_CONF_NONDEFAULT.is_debug is True
+    assert BEAR_CONF_NONDEFAULT.is_lazy is True
     assert BEAR_CONF_NONDEFAULT.is_pep484_tower is True
     assert BEAR_CONF_NONDEFAULT.strategy is BeartypeStrategy.Ologn
+    assert BEAR_CONF_NONDEFAULT.union_reorder_threshold == 10
     assert BEAR_CONF_NONDEFAULT.violation_door_type is RuntimeError
     assert BEAR_CONF_NONDEFAULT.violation_param_type is TypeError
     assert BEAR_CONF_NONDEFAULT.violation_return_type is ValueError
@@ -265,9 +301,48 @@ def test_conf_dataclass() -> None:
     # ....................{ FAIL                           }....................
     # Assert that instantiating a configuration with an invalid parameter raises
     # the expected exception.
+    with raises(BeartypeConfParamException):
+        BeartypeConf(check_stream_rate=(
+            'Like the young moon when through the fleecy shroud'))
+    with raises(BeartypeConfParamException):
+        BeartypeConf(check_stream_rate=0.0)
+    with raises(BeartypeConfParamException):
+        BeartypeConf(check_stream_rate=1.5)
+
+    # Assert that instantiating a configuration with a boolean comparing equal
+    # to a valid parameter of a previously instantiated configuration raises
+    # the expected exception rather than returning that configuration.
+    BeartypeConf(check_stream_rate=1.0)
+    with raises(BeartypeConfParamException):
+        BeartypeConf(check_stream_rate=True)
+    with raises(BeartypeConfParamException):
+        BeartypeConf(check_time_max_multiplier=(
+            'Her starry eyes, the beauty of her smile,'))
+    with raises(BeartypeConfParamException):
+        BeartypeConf(check_time_max_multiplier=0)
+    BeartypeConf(check_time_max_multiplier=1)
+    with raises(BeartypeConfParamException):
+        BeartypeConf(check_time_max_multiplier=True)
     with raises(BeartypeConfParamException):
         BeartypeConf(claw_is_pep526=(
             'The fountains mingle with the river'))
+    with raises(BeartypeConfParamException):
+        BeartypeConf(claw_is_pyc_hash=(
+            'The winds of heaven mix for ever'))
+    with raises(BeartypeConfParamException):
+        BeartypeConf(claw_loop_sample=(
+            'And the rivers with the ocean,'))
+    with raises(BeartypeConfParamException):
+        BeartypeConf(claw_loop_sample=(100,))
+    with raises(BeartypeConfParamException):
+        BeartypeConf(claw_loop_sample=(-1, 10))
+    with raises(BeartypeConfParamException):
+        BeartypeConf(claw_loop_sample=(100, 0))
+    with raises(BeartypeConfParamException):
+        BeartypeConf(claw_loop_sample=[100, 10])
+    BeartypeConf(claw_loop_sample=(100, 1))
+    with raises(BeartypeConfParamException):
+        BeartypeConf(claw_loop_sample=(100, True))
     with raises(BeartypeConfParamException):
         BeartypeConf(hint_overrides=(
             'Wildered, and wan, and panting, she returned.'))
@@ -277,12 +352,22 @@ def test_conf_dataclass() -> None:
     with raises(BeartypeConfParamException):
         BeartypeConf(is_debug=(
             'Interpret, or make felt, or deeply feel.'))
+    with raises(BeartypeConfParamException):
+        BeartypeConf(is_lazy=(
+            'And Silence, too enamoured of that voice,'))
     with raises(BeartypeConfParamException):
         BeartypeConf(is_pep484_tower=(
             'In the calm darkness of the moonless nights,'))
     with raises(BeartypeConfParamException):
         BeartypeConf(strategy=(
             'By all, but which the wise, and great, and good'))
+    with raises(BeartypeConfParamException):
+        BeartypeConf(union_reorder_threshold=(
+            'Is there, that from the boundaries of the sky'))
+    with raises(BeartypeConfParamException):
+        BeartypeConf(union_reorder_threshold=0)
+    with raises(BeartypeConfParamException):
+        BeartypeConf(union_reorder_threshold=True)
     with raises(BeartypeConfParamException):
         BeartypeConf(violation_door_type=(
             'A vision to the sleep of him who spurned'))
@@ -330,16 +415,24 @@ def test_conf_dataclass() -> None:
     # dataclass raises the expected exception.
     with raises(AttributeError):
         BEAR_CONF_DEFAULT.claw_is_pep526 = True
+    with raises(AttributeError):
+        BEAR_CONF_DEFAULT.claw_is_pyc_hash = True
+    with raises(AttributeError):
+        BEAR_CONF_DEFAULT.claw_loop_sample = (100, 10)
     with raises(AttributeError):
         BEAR_CONF_DEFAULT.hint_overrides = {}
     with raises(AttributeError):
         BEAR_CONF_DEFAULT.is_color = True
     with raises(AttributeError):
         BEAR_CONF_DEFAULT.is_debug = True
+    with raises(AttributeError):
+        BEAR_CONF_DEFAULT.is_lazy = True
     with raises(AttributeError):
         BEAR_CONF_DEFAULT.is_pep484_tower = True
     with raises(AttributeError):
         BEAR_CONF_DEFAULT.strategy = BeartypeStrategy.O0
+    with raises(AttributeError):
+        BEAR_CONF_DEFAULT.union_reorder_threshold = 10
     with raises(AttributeError):
         BEAR_CONF_DEFAULT.violation_door_type = RuntimeError
     with raises(AttributeError):
@@ -31,6 +31,8 @@ def test_door_typehint_new() -> None:
         Any,
         Union,
     )
+    from beartype._util.py.utilpyversion import IS_PYTHON_AT_LEAST_3_9
+    from beartype_test.a00_unit.data.data_type import class_local_factory
     from pytest import raises
 
     # Intentionally import from "typing" rather than "beartype.typing" to
@@ -56,6 +58,28 @@ def test_door_typehint_new() -> None:
     # yielding the same previously memoized type hint.
     assert TypeHint(TypeHint(int)) is TypeHint(int)
 
+    # If the active Python interpreter targets Python >= 3.9 and thus supports
+    # PEP 585...
+    if IS_PYTHON_AT_LEAST_3_9:
+        # Distinct classes sharing the same fully-qualified name.
+        AndSilence = class_local_factory()
+        AndSolitude = class_local_factory()
+
+        # PEP 585-compliant type hints subscripted by these classes, which are
+        # unequal but share the same machine-readable representation.
+        hint_silence = list[AndSilence]
+        hint_solitude = list[AndSolitude]
+        assert repr(hint_silence) == repr(hint_solitude)
+        assert hint_silence != hint_solitude
+
+        # Assert that recreating a type hint against each of these hints
+        # yields distinct type hints wrapping these hints.
+        assert TypeHint(hint_silence) is not TypeHint(hint_solitude)
+        assert TypeHint(hint_silence).hint is hint_silence
+        assert TypeHint(hint_solitude).hint is hint_solitude
+        assert TypeHint(hint_solitude).is_bearable([AndSolitude()]) is True
+        assert TypeHint(hint_solitude).is_bearable([AndSilence()]) is False
+
     # Assert that public concrete subclasses of the "TypeHint" abstract base
     # class (ABC) pretend to reside in the top-level public "beartype.door"
     # subpackage rather than in a leaf private subpackage of that package.
@@ -37,3 +37,221 @@ def test_door_is_subhint(
     for subhint, superhint, IS_SUBHINT in door_cases_subhint:
         # Assert this tester returns the expected boolean for these hints.
         assert is_subhint(subhint, superhint) is IS_SUBHINT
+
+
+def test_door_is_subhint_cached() -> None:
+    '''
+    Test the memoization of the :func:`beartype.door.is_subhint` tester.
+    '''
+
+    # Defer test-specific imports.
+    from beartype.door import is_subhint
+    from beartype.typing import (
+        List,
+        Literal,
+    )
+    from collections.abc import Hashable
+
+    # ....................{ PASS                           }....................
+    # For each of several repetitions...
+    for _ in range(3):
+        # Assert this tester decides two relations as expected.
+        assert is_subhint(List[bool], object) is True
+        assert is_subhint(object, Hashable) is True
+
+        # Assert this tester infers *NO* relation by transitivity, which would
+        # erroneously imply that "List[bool] <= Hashable", as "list" is
+        # unhashable.
+        assert is_subhint(List[bool], Hashable) is False
+
+    # ....................{ PASS ~ evicted                 }....................
+    # Assert this tester decides relations as expected between many distinct
+    # hints, exceeding the size of memoization caches bounded by the
+    # ${BEARTYPE_CACHE_SIZE_MAX} environment variable if any.
+    for index in range(64):
+        assert is_subhint(Literal[index], int) is True
+        assert is_subhint(Literal[index], str) is False
+
+    # Assert this tester still decides the relations decided above as expected,
+    # regardless of whether those relations were evicted by the above calls.
+    assert is_subhint(List[bool], object) is True
+    assert is_subhint(List[bool], Hashable) is False
+
+
+def test_door_is_subhint_index(monkeypatch) -> None:
+    '''
+    Test the process-wide subhint relation index underlying the
+    :func:`beartype.door.is_subhint` tester.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.MonkeyPatch
+        Fixture temporarily bounding the size of this index.
+    '''
+
+    # Defer test-specific imports.
+    from beartype.door import TypeHint
+    from beartype.door import _doorsubhint
+    from beartype.door._doorsubhint import (
+        _hint_id_to_hint,
+        _hint_id_to_subhint_ids,
+        _hint_id_to_superhint_id_to_is_subhint,
+        _unindex_hint_id,
+        clear_subhint_index,
+        is_subhint_indexed,
+    )
+    from beartype.typing import List
+    from collections.abc import Hashable
+
+    # ....................{ LOCALS                         }....................
+    # Type hint wrappers such that "hint_sub <= hint_mid <= hint_super" but
+    # *NOT* "hint_sub <= hint_super", as "list" is unhashable.
+    #
+    # Note that this test intentionally passes these wrappers rather than the
+    # hints they wrap to the tester under test. Since the type hint wrapper
+    # cache may evict wrappers under non-default cache policies (e.g.,
+    # "BEARTYPE_CACHE_POLICY=lru BEARTYPE_CACHE_SIZE_MAX=2"), rewrapping these
+    # hints could create distinct wrappers unknown to these assertions.
+    hint_sub = TypeHint(List[bool])
+    hint_mid = TypeHint(object)
+    hint_super = TypeHint(Hashable)
+
+    # Arbitrary type hint wrapper unrelated to the above wrappers.
+    hint_other = TypeHint(int)
+
+    # Attempt to...
+    try:
+        # ....................{ PASS                       }....................
+        # Clear this index, isolating this test from prior tests.
+        clear_subhint_index()
+
+        # Temporarily bound this index to more wrappers than are tested below,
+        # isolating this test from the ${BEARTYPE_CACHE_SIZE_MAX} environment
+        # variable if any.
+        monkeypatch.setattr(_doorsubhint, '_HINTS_LEN_MAX', 64)
+
+        # Assert this tester decides two relations as expected.
+        assert is_subhint_indexed(hint_sub, hint_mid) is True
+        assert is_subhint_indexed(hint_mid, hint_super) is True
+
+        # Assert this index pins these wrappers *AND* records these relations
+        # in both directions.
+        assert _hint_id_to_hint[id(hint_sub)] is hint_sub
+        assert _hint_id_to_hint[id(hint_mid)] is hint_mid
+        assert _hint_id_to_hint[id(hint_super)] is hint_super
+        assert _hint_id_to_superhint_id_to_is_subhint[id(hint_sub)] == {
+            id(hint_mid): True}
+        assert _hint_id_to_subhint_ids[id(hint_super)] == {id(hint_mid)}
+
+        # Assert that recording a relation contradicting the relation decided
+        # by the TypeHint.is_subhint() method is reused as is, validating that
+        # this tester reuses previously decided relations *WITHOUT* calling
+        # that method.
+        _hint_id_to_superhint_id_to_is_subhint[id(hint_sub)][id(hint_mid)] = (
+            False)
+        assert is_subhint_indexed(hint_sub, hint_mid) is False
+        _hint_id_to_superhint_id_to_is_subhint[id(hint_sub)][id(hint_mid)] = (
+            True)
+
+        # ....................{ PASS ~ transitivity        }....................
+        # Assert this tester infers *NO* relation by transitivity, which would
+        # erroneously imply this subhint to be a subhint of this superhint.
+        assert is_subhint_indexed(hint_sub, hint_super) is False
+        assert _hint_id_to_superhint_id_to_is_subhint[id(hint_sub)] == {
+            id(hint_mid): True, id(hint_super): False}
+
+        # ....................{ PASS ~ unindex             }....................
+        # Assert that removing a wrapper removes all relations involving that
+        # wrapper in both directions.
+        _unindex_hint_id(id(hint_mid))
+        assert id(hint_mid) not in _hint_id_to_hint
+        assert id(hint_mid) not in _hint_id_to_superhint_id_to_is_subhint
+        assert _hint_id_to_superhint_id_to_is_subhint[id(hint_sub)] == {
+            id(hint_super): False}
+        assert _hint_id_to_subhint_ids[id(hint_super)] == {id(hint_sub)}
+
+        # Assert this tester redecides relations involving that wrapper.
+        assert is_subhint_indexed(hint_sub, hint_mid) is True
+
+        # Assert clearing this index releases all wrappers pinned by this index.
+        clear_subhint_index()
+        assert not _hint_id_to_hint
+        assert not _hint_id_to_subhint_ids
+        assert not _hint_id_to_superhint_id_to_is_subhint
+
+        # ....................{ PASS ~ eviction            }....................
+        # Temporarily bound this index to three wrappers.
+        monkeypatch.setattr(_doorsubhint, '_HINTS_LEN_MAX', 3)
+
+        # Assert that indexing a fourth wrapper evicts the least recently
+        # indexed wrapper *AND* all relations involving that wrapper.
+        assert is_subhint_indexed(hint_sub, hint_mid) is True
+        assert is_subhint_indexed(hint_mid, hint_super) is True
+        assert is_subhint_indexed(hint_other, hint_super) is True
+        assert tuple(_hint_id_to_hint) == (
+            id(hint_mid), id(hint_other), id(hint_super))
+        assert id(hint_sub) not in _hint_id_to_superhint_id_to_is_subhint
+        assert _hint_id_to_subhint_ids[id(hint_mid)] == set()
+
+        # Assert that re-testing an indexed wrapper moves that wrapper to the
+        # end of this index, preserving that wrapper from the next eviction.
+        assert is_subhint_indexed(hint_sub, hint_mid) is True
+        assert tuple(_hint_id_to_hint) == (
+            id(hint_super), id(hint_sub), id(hint_mid))
+        assert id(hint_other) not in _hint_id_to_superhint_id_to_is_subhint
+        assert _hint_id_to_subhint_ids[id(hint_super)] == {id(hint_mid)}
+    # Unconditionally clear this index, isolating subsequent tests from this
+    # test.
+    finally:
+        clear_subhint_index()
+
+
+def test_door_is_subhint_matrix(
+    door_cases_subhint: 'Iterable[Tuple[object, object, bool]]') -> None:
+    '''
+    Test the :func:`beartype.door.is_subhint_matrix` tester.
+
+    Parameters
+    ----------
+    door_cases_subhint : Iterable[Tuple[object, object, bool]]
+        Iterable of one or more 3-tuples ``(subhint, superhint, is_subhint)``,
+        declared by the :func:`hint_subhint_cases` fixture.
+    '''
+
+    # Defer test-specific imports.
+    from beartype.door import (
+        is_subhint,
+        is_subhint_matrix,
+    )
+    from beartype.typing import List
+
+    # ....................{ PASS                           }....................
+    # For each subhint relation to be tested...
+    for subhint, superhint, IS_SUBHINT in door_cases_subhint:
+        # Assert this tester returns a 1x1 matrix of the expected boolean.
+        assert is_subhint_matrix((subhint,), (superhint,)) == [[IS_SUBHINT]]
+
+        # Assert this tester returns a 2x3 matrix sharing the same relation
+        # across both duplicate rows and all three duplicate columns, now
+        # decided by the subhint relation index populated above.
+        assert is_subhint_matrix(
+            (subhint, subhint), (superhint, superhint, superhint)) == [
+            [IS_SUBHINT, IS_SUBHINT, IS_SUBHINT],
+            [IS_SUBHINT, IS_SUBHINT, IS_SUBHINT],
+        ]
+
+        # Assert the non-batch tester agrees.
+        assert is_subhint(subhint, superhint) is IS_SUBHINT
+
+    # Assert this tester relates distinct hints as expected.
+    assert is_subhint_matrix((bool, int, str), (int, object)) == [
+        [True, True], [True, True], [False, True]]
+
+    # Assert duplicate rows are distinct but equal lists.
+    matrix = is_subhint_matrix((List[int], List[int]), (List[int], int))
+    assert matrix == [[True, False], [True, False]]
+    assert matrix[0] is not matrix[1]
+
+    # Assert empty iterables produce empty matrices.
+    assert is_subhint_matrix((), (int,)) == []
+    assert is_subhint_matrix((int,), ()) == [[]]
@@ -33,3 +33,86 @@ def test_make_check_code_decoration() -> None:
         make_check_expr(str, BEARTYPE_CONF_DEFAULT) is
         make_check_expr(str, BEARTYPE_CONF_DEFAULT)
     )
+
+
+def test_make_check_code_large() -> None:
+    '''
+    Test the :func:`beartype._check.code.codemake.make_check_expr` function
+    against a hint whose hint tree contains more hints than previously fit in
+    the fixed list of hint metadata formerly used by that function.
+    '''
+
+    # Defer test-specific imports.
+    from beartype import beartype
+    from beartype.roar import BeartypeCallHintParamViolation
+    from beartype.typing import (
+        Dict,
+        List,
+        Union,
+    )
+    from pytest import raises
+
+    # Tuple of unique classes, defeating memoization.
+    classes = tuple(type(f'Class{index}', (), {}) for index in range(128))
+
+    # Union hint whose hint tree contains over 512 hints.
+    hint = Union[tuple(List[Dict[str, cls]] for cls in classes)]
+
+    # Callable annotated by this hint.
+    @beartype
+    def the_heavens(and_earth: hint) -> int:
+        return len(and_earth)
+
+    # Assert this callable accepts a valid parameter satisfying the last member
+    # of this union.
+    assert the_heavens([{'The wilderness': classes[-1]()}]) == 1
+
+    # Assert this callable rejects an invalid parameter satisfying *NO* member
+    # of this union.
+    with raises(BeartypeCallHintParamViolation):
+        the_heavens('has a mysterious tongue')
+
+# ....................{ TESTS ~ private : emit             }....................
+def test_emit_check_expr() -> None:
+    '''
+    Test the private
+    :func:`beartype._check.code.codemake._emit_check_expr` function.
+    '''
+
+    # Defer test-specific imports.
+    from beartype.roar import BeartypeDecorHintPepException
+    from beartype._check.code.codemake import _emit_check_expr
+    from pytest import raises
+
+    # Assert this function replaces each placeholder with the code snippet
+    # referred to by that placeholder, recursively.
+    assert _emit_check_expr([
+        'Which teaches @[1)! doubt, or @[2)!',
+        'awful @[3)!',
+        'faith so mild',
+        'bloody',
+    ]) == 'Which teaches awful bloody doubt, or faith so mild'
+
+    # Assert this function returns the root code snippet as is if this snippet
+    # embeds no placeholders.
+    assert _emit_check_expr(['So solemn, so serene']) == 'So solemn, so serene'
+
+    # Assert this function raises the expected exception when one or more code
+    # snippets are referred to by *NO* placeholder.
+    with raises(BeartypeDecorHintPepException):
+        _emit_check_expr(['that man may be', 'But for such faith'])
+
+    # Assert this function raises the expected exception when one code snippet
+    # is referred to by multiple placeholders while another code snippet is
+    # referred to by *NO* placeholder, even though the number of placeholders
+    # coincides with the number of child code snippets.
+    with raises(BeartypeDecorHintPepException):
+        _emit_check_expr([
+            'The wilderness @[1)! a @[1)!', 'has', 'mysterious tongue'])
+
+    # Assert this function raises the expected exception when a placeholder
+    # refers to either the root code snippet or a nonexistent code snippet.
+    with raises(BeartypeDecorHintPepException):
+        _emit_check_expr(['Thou hast @[0)!', 'a voice'])
+    with raises(BeartypeDecorHintPepException):
+        _emit_check_expr(['great Mountain, @[2)!', 'to repeal'])
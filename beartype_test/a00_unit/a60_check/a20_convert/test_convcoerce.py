@@ -76,6 +76,7 @@ def test_coerce_hint_any() -> None:
         IS_PYTHON_AT_LEAST_3_10,
         IS_PYTHON_AT_LEAST_3_9,
     )
+    from beartype_test.a00_unit.data.data_type import class_local_factory
 
     # ..................{ CORE                               }..................
     # Assert this coercer preserves an isinstanceable type as is.
@@ -99,6 +100,29 @@ def test_coerce_hint_any() -> None:
         #     False
         assert coerce_hint_any(list[int]) is hint_pep585
 
+        # Distinct classes sharing the same fully-qualified name.
+        ThoughtsOfGreatDeeds = class_local_factory()
+        ThoughtsOfGreatDeedsToo = class_local_factory()
+
+        # PEP 585-compliant type hints subscripted by these classes, which are
+        # unequal but share the same machine-readable representation.
+        hint_deeds = list[ThoughtsOfGreatDeeds]
+        hint_deeds_too = list[ThoughtsOfGreatDeedsToo]
+        assert repr(hint_deeds) == repr(hint_deeds_too)
+        assert hint_deeds != hint_deeds_too
+
+        # Assert this coercer returns hints equal to these hints rather than
+        # erroneously returning the first hint sharing the same representation
+        # passed to this coercer (possibly by a prior test).
+        #
+        # Note that identity is intentionally *NOT* asserted here. Since this
+        # coercer only deduplicates the first hint sharing each
+        # representation, only one of these hints can be deduplicated.
+        assert coerce_hint_any(hint_deeds) == hint_deeds
+        assert coerce_hint_any(list[ThoughtsOfGreatDeeds]) == hint_deeds
+        assert coerce_hint_any(hint_deeds_too) == hint_deeds_too
+        assert coerce_hint_any(list[ThoughtsOfGreatDeedsToo]) == hint_deeds_too
+
     # ..................{ PEP 604                            }..................
     # If the active Python interpreter targets Python >= 3.10 and thus supports
     # PEP 604...
@@ -99,6 +99,133 @@ def test_door_die_if_unbearable(iter_hints_piths_meta) -> None:
         )
 
 
+# See above for @ignore_warnings() discussion.
+@ignore_warnings(BeartypeDecorHintPep585DeprecationWarning)
+def test_door_die_if_unbearable_many(iter_hints_piths_meta) -> None:
+    '''
+    Test the :class:`beartype.door.die_if_unbearable_many` raiser function.
+
+    Parameters
+    ----------
+    iter_hints_piths_meta : Callable[[], Iterable[beartype_test.a00_unit.data.hint.util.data_hintmetautil.HintPithMetadata]]
+        Factory function creating and returning a generator iteratively yielding
+        ``HintPithMetadata`` instances, each describing a sample type hint
+        exercising an edge case in the :mod:`beartype` codebase paired with a
+        related object either satisfying or violating that hint.
+    '''
+
+    # ....................{ IMPORTS                        }....................
+    # Defer test-specific imports.
+    from beartype import BeartypeConf
+    from beartype.door import die_if_unbearable_many
+    from beartype.roar import (
+        BeartypeConfException,
+        BeartypeDecorHintNonpepException,
+        BeartypeDoorHintViolation,
+    )
+    from beartype.typing import List
+    from beartype_test.a00_unit.data.hint.util.data_hintmetacls import (
+        HintPithUnsatisfiedMetadata)
+    from pytest import (
+        raises,
+        warns,
+    )
+
+    # ....................{ PASS                           }....................
+    # For each predefined type hint and associated metadata...
+    for hint_pith_meta in iter_hints_piths_meta():
+        # Type hint to be type-checked.
+        hint = hint_pith_meta.hint_meta.hint
+
+        # Beartype dataclass configuring this type-check.
+        conf = hint_pith_meta.hint_meta.conf
+
+        # Object to type-check against this type hint.
+        pith = hint_pith_meta.pith
+
+        # If this pith violates this hint...
+        if isinstance(hint_pith_meta.pith_meta, HintPithUnsatisfiedMetadata):
+            # Assert this raiser raises the expected exception when passed an
+            # iterable containing only this pith and this hint.
+            with raises(BeartypeDoorHintViolation) as exception_info:
+                die_if_unbearable_many((pith,), hint, conf=conf)
+
+            # Exception message raised by this wrapper function.
+            exception_str = str(exception_info.value)
+
+            # Assert this raiser prefixed this message by the index of this
+            # pith in this iterable.
+            assert exception_str.startswith('Item 0 ')
+            assert ' violates type hint ' in exception_str
+        # Else, this raiser satisfies this hint. In this case...
+        else:
+            # Assert this validator raises *NO* exception when passed an
+            # iterable containing only this pith and this hint.
+            die_if_unbearable_many((pith,), hint, conf=conf)
+
+    # ....................{ PASS ~ stream                  }....................
+    # Iterator over arbitrary objects, the third of which violates the type hint
+    # type-checked below.
+    piths = iter((
+        ['Rapid clouds have drank the last pale beam'],
+        ['of even:'],
+        [b'A chain is round his feet,'],
+        ['his heart is wrung.'],
+    ))
+
+    # Assert this raiser raises the expected exception prefixed by the index of
+    # that object when passed this iterator.
+    with raises(BeartypeDoorHintViolation) as exception_info:
+        die_if_unbearable_many(piths, List[str])
+    assert str(exception_info.value).startswith('Item 2 ')
+
+    # Assert this raiser consumed this iterator only up to that object.
+    assert next(piths) == ['his heart is wrung.']
+
+    # Assert this raiser emits one warning for each object of this iterable
+    # violating this hint when configured to emit warnings.
+    with warns(UserWarning) as warnings_info:
+        die_if_unbearable_many(
+            (b'The shadow of white death', 'has passed', b'From',),
+            str,
+            conf=BeartypeConf(violation_door_type=UserWarning),
+        )
+    assert [str(warning_info.message)[:7] for warning_info in warnings_info] == [
+        'Item 0 ', 'Item 2 ']
+
+    # Assert this raiser randomly samples a different item of each object of
+    # an iterable of equally sized lists, each containing one item violating
+    # this hint, rather than sampling the same item of every such list.
+    with warns(UserWarning) as warnings_info:
+        die_if_unbearable_many(
+            [[b'And precipitating streams', 'the boundless sky']] * 64,
+            List[str],
+            conf=BeartypeConf(violation_door_type=UserWarning),
+        )
+    assert 0 < len(warnings_info) < 64
+
+    # Assert this raiser raises *NO* exception when passed an empty iterable.
+    die_if_unbearable_many((), List[str])
+
+    # ....................{ FAIL                           }....................
+    # Assert this tester raises the expected exception when passed an invalid
+    # object as the type hint.
+    with raises(BeartypeDecorHintNonpepException):
+        die_if_unbearable_many(
+            objs=('Holds every future leaf and flower; the bound',),
+            hint=b'With which from that detested trance they leap;',
+        )
+
+    # Assert this tester raises the expected exception when passed an invalid
+    # object as the beartype configuration.
+    with raises(BeartypeConfException):
+        die_if_unbearable_many(
+            objs=('The torpor of the year when feeble dreams',),
+            hint=str,
+            conf='Visit the hidden buds, or dreamless sleep',
+        )
+
+
 # See above for @ignore_warnings() discussion.
 @ignore_warnings(BeartypeDecorHintPep585DeprecationWarning)
 def test_door_typehint_die_if_unbearable(iter_hints_piths_meta) -> None:
@@ -160,6 +287,117 @@ def test_door_typehint_die_if_unbearable(iter_hints_piths_meta) -> None:
             else:
                 typehint.die_if_unbearable(pith, conf=conf)
 
+# ....................{ TESTS ~ factories                  }....................
+# See above for @ignore_warnings() discussion.
+@ignore_warnings(BeartypeDecorHintPep585DeprecationWarning)
+def test_door_compile_checker(iter_hints_piths_meta) -> None:
+    '''
+    Test the :func:`beartype.door.compile_checker` factory function and the
+    :class:`beartype.door.TypeChecker` objects created by that factory.
+
+    Parameters
+    ----------
+    iter_hints_piths_meta : Callable[[], Iterable[beartype_test.a00_unit.data.hint.util.data_hintmetautil.HintPithMetadata]]
+        Factory function creating and returning a generator iteratively yielding
+        ``HintPithMetadata`` instances, each describing a sample type hint
+        exercising an edge case in the :mod:`beartype` codebase paired with a
+        related object either satisfying or violating that hint.
+    '''
+
+    # ....................{ IMPORTS                        }....................
+    # Defer test-specific imports.
+    from beartype import BeartypeConf
+    from beartype.door import (
+        TypeChecker,
+        compile_checker,
+    )
+    from beartype.roar import (
+        BeartypeConfException,
+        BeartypeDecorHintNonpepException,
+        BeartypeDoorHintViolation,
+    )
+    from beartype.typing import List
+    from beartype._check.checkmake import (
+        make_func_raiser,
+        make_func_tester,
+    )
+    from beartype_test.a00_unit.data.hint.util.data_hintmetacls import (
+        HintPithUnsatisfiedMetadata)
+    from pytest import raises
+
+    # ....................{ PASS                           }....................
+    # For each predefined type hint and associated metadata...
+    for hint_pith_meta in iter_hints_piths_meta():
+        # Type hint to be type-checked.
+        hint = hint_pith_meta.hint_meta.hint
+
+        # Beartype dataclass configuring this type-check.
+        conf = hint_pith_meta.hint_meta.conf
+
+        # Object to type-check against this type hint.
+        pith = hint_pith_meta.pith
+
+        # Compiled type-checker type-checking this hint under this
+        # configuration.
+        checker = compile_checker(hint, conf=conf)
+
+        # True only if this pith satisfies this hint.
+        is_bearable_expected = not isinstance(
+            hint_pith_meta.pith_meta, HintPithUnsatisfiedMetadata)
+
+        # Assert this type-checker behaves as expected when passed this pith.
+        assert checker.test(pith) is is_bearable_expected
+        assert checker.test_many((pith,)) == [is_bearable_expected]
+        if is_bearable_expected:
+            checker.check(pith)
+            checker.check_many((pith,))
+        else:
+            with raises(BeartypeDoorHintViolation):
+                checker.check(pith)
+            with raises(BeartypeDoorHintViolation):
+                checker.check_many((pith,))
+
+    # ....................{ PASS ~ attrs                   }....................
+    # Arbitrary type hint.
+    hint = List[str]
+
+    # Compiled type-checker type-checking this hint.
+    checker = compile_checker(hint)
+
+    # Assert this type-checker is a type-checker exposing the expected type
+    # hint and configuration.
+    assert isinstance(checker, TypeChecker)
+    assert checker.hint is hint
+    assert checker.conf == BeartypeConf()
+    assert repr(checker) == f'compile_checker({repr(hint)})'
+
+    # Assert this type-checker directly references the memoized type-checking
+    # functions underlying the is_bearable() and die_if_unbearable() functions.
+    assert checker.test is make_func_tester(hint, BeartypeConf())
+    assert checker.check is make_func_raiser(hint, BeartypeConf())
+
+    # Assert this type-checker behaves as expected.
+    assert checker.test(['Her voice was like the voice']) is True
+    assert checker.test([b'of his own soul']) is False
+    assert checker.test_many(iter((
+        ['Heard in the calm of thought;'], [b'its music long,'],
+    ))) == [True, False]
+
+    # Assert this type-checker rejects unslotted instance variables.
+    with raises(AttributeError):
+        checker.like_woven_sounds = 'of streams and breezes'
+
+    # ....................{ FAIL                           }....................
+    # Assert this factory raises the expected exception when passed an invalid
+    # object as the type hint.
+    with raises(BeartypeDecorHintNonpepException):
+        compile_checker(b'Held his inmost sense suspended in its web')
+
+    # Assert this factory raises the expected exception when passed an invalid
+    # object as the beartype configuration.
+    with raises(BeartypeConfException):
+        compile_checker(str, conf='Of many-coloured woof and shifting hues.')
+
 # ....................{ TESTS ~ testers                    }....................
 # See above for @ignore_warnings() discussion.
 @ignore_warnings(BeartypeDecorHintPep585DeprecationWarning)
@@ -255,6 +493,345 @@ def test_door_is_bearable(iter_hints_piths_meta, hints_ignorable) -> None:
         )
 
 
+# See above for @ignore_warnings() discussion.
+@ignore_warnings(BeartypeDecorHintPep585DeprecationWarning)
+def test_door_is_bearable_many(iter_hints_piths_meta, hints_ignorable) -> None:
+    '''
+    Test the :class:`beartype.door.is_bearable_many` tester function.
+
+    Parameters
+    ----------
+    iter_hints_piths_meta : Callable[[], Iterable[beartype_test.a00_unit.data.hint.util.data_hintmetautil.HintPithMetadata]]
+        Factory function creating and returning a generator iteratively yielding
+        ``HintPithMetadata`` instances, each describing a sample type hint
+        exercising an edge case in the :mod:`beartype` codebase paired with a
+        related object either satisfying or violating that hint.
+    hints_ignorable : frozenset
+        Frozen set of ignorable PEP-agnostic type hints.
+    '''
+
+    # ..................{ IMPORTS                            }..................
+    # Defer test-specific imports.
+    from beartype.door import is_bearable_many
+    from beartype.roar import (
+        BeartypeConfException,
+        BeartypeDecorHintNonpepException,
+    )
+    from beartype.typing import (
+        Dict,
+        List,
+    )
+    from beartype_test.a00_unit.data.hint.util.data_hintmetacls import (
+        HintPithUnsatisfiedMetadata)
+    from pytest import raises
+
+    # ..................{ PASS ~ ignorable                   }..................
+    # Arbitrary objects to be tested below.
+    piths = ('The breath and blood', 'of distant lands, for ever')
+
+    # For each predefined ignorable type hint...
+    for hint_ignorable in hints_ignorable:
+        # Assert this tester returns a list of only true booleans when passed
+        # these objects and this hint.
+        assert is_bearable_many(piths, hint_ignorable) == [True, True]
+
+    # ..................{ PASS ~ unignorable                 }..................
+    # For each predefined unignorable type hint and associated metadata...
+    for hint_pith_meta in iter_hints_piths_meta():
+        # Type hint to be type-checked.
+        hint = hint_pith_meta.hint_meta.hint
+
+        # Beartype dataclass configuring this type-check.
+        conf = hint_pith_meta.hint_meta.conf
+
+        # Object to type-check against this type hint.
+        pith = hint_pith_meta.pith
+
+        # True only if this pith satisfies this hint.
+        is_bearable_expected = not isinstance(
+            hint_pith_meta.pith_meta, HintPithUnsatisfiedMetadata)
+
+        # Assert this tester returns the expected list of booleans when passed
+        # an iterable containing only this pith and this hint.
+        assert is_bearable_many((pith,), hint, conf=conf) == [
+            is_bearable_expected]
+
+    # ..................{ PASS ~ stream                      }..................
+    # Nested type hint requiring assignment expressions to be type-checked.
+    hint = Dict[str, List[int]]
+
+    # Generator lazily yielding arbitrary objects either satisfying or violating
+    # this hint.
+    piths = (pith for pith in (
+        {'Ere': [1]}, {'babe': ['or']}, {}, {'sage': [2, 3]}, 'his thoughts'))
+
+    # Assert this tester returns the expected list of booleans when passed this
+    # generator.
+    assert is_bearable_many(piths, hint) == [True, False, True, True, False]
+
+    # ..................{ PASS ~ random                      }..................
+    # Assert this tester randomly samples a different item of each object of
+    # an iterable of equally sized lists, each containing one item violating
+    # this hint, rather than sampling the same item of every such list.
+    assert set(is_bearable_many(
+        [['With fierce gusts', 0]] * 64, List[int])) == {True, False}
+
+    # Assert this tester returns the empty list when passed an empty iterable.
+    assert is_bearable_many((), hint) == []
+
+    # ..................{ FAIL                               }..................
+    # Assert this tester raises the expected exception when passed an invalid
+    # object as the type hint.
+    with raises(BeartypeDecorHintNonpepException):
+        is_bearable_many(
+            objs=('Holds every future leaf and flower; the bound',),
+            hint=b'With which from that detested trance they leap;',
+        )
+
+    # Assert this tester raises the expected exception when passed an invalid
+    # object as the beartype configuration.
+    with raises(BeartypeConfException):
+        is_bearable_many(
+            objs=('The torpor of the year when feeble dreams',),
+            hint=str,
+            conf='Visit the hidden buds, or dreamless sleep',
+        )
+
+
+def test_door_is_bearable_unhashable(monkeypatch) -> None:
+    '''
+    Test the :class:`beartype.door.is_bearable` tester function when passed
+    unhashable type hints, which the memoized type-checking function factories
+    underlying that tester are unable to memoize as is.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.MonkeyPatch
+        Fixture temporarily reducing the bounds of the type-checker caches.
+    '''
+
+    # ..................{ IMPORTS                            }..................
+    # Defer test-specific imports.
+    from beartype.door import (
+        die_if_unbearable,
+        is_bearable,
+    )
+    from beartype.roar import BeartypeDoorHintViolation
+    from beartype.typing import (
+        Annotated,
+        List,
+    )
+    from beartype._check import checkmake
+    from beartype._check.checkmake import (
+        make_func_raiser,
+        make_func_tester,
+    )
+    from beartype._conf.confcls import BEARTYPE_CONF_DEFAULT
+    from pytest import raises
+
+    # ..................{ LOCALS                             }..................
+    # Two classes sharing the same fully-qualified name and thus the same
+    # machine-readable representation.
+    TheSpirit = type('TheSpirit', (), {})
+    TheSpiritOther = type('TheSpirit', (), {})
+
+    # ..................{ PASS                               }..................
+    # Assert that the type-checking functions generated for equal copies of
+    # the same unhashable type hint are the same functions.
+    func_tester = make_func_tester(
+        List[Annotated[int, ['Alastor']]], BEARTYPE_CONF_DEFAULT)
+    assert func_tester is make_func_tester(
+        List[Annotated[int, ['Alastor']]], BEARTYPE_CONF_DEFAULT)
+    assert make_func_raiser(
+        List[Annotated[int, ['Alastor']]], BEARTYPE_CONF_DEFAULT) is (
+        make_func_raiser(
+            List[Annotated[int, ['Alastor']]], BEARTYPE_CONF_DEFAULT))
+
+    # Assert that the type-checking functions generated by different factories
+    # for the same unhashable type hint differ.
+    assert func_tester is not make_func_raiser(
+        List[Annotated[int, ['Alastor']]], BEARTYPE_CONF_DEFAULT)
+
+    # Assert that the type-checking functions generated for unequal unhashable
+    # type hints sharing the same representation differ.
+    assert make_func_tester(
+        Annotated[TheSpirit, ['of Solitude']], BEARTYPE_CONF_DEFAULT) is not (
+        make_func_tester(
+            Annotated[TheSpiritOther, ['of Solitude']], BEARTYPE_CONF_DEFAULT))
+
+    # Assert that these type-checkers behave as expected.
+    assert is_bearable([0, 1], List[Annotated[int, ['Alastor']]]) is True
+    assert is_bearable(
+        ['Earth, ocean, air,'], List[Annotated[int, ['Alastor']]]) is False
+    assert is_bearable(
+        TheSpirit(), Annotated[TheSpirit, ['of Solitude']]) is True
+    assert is_bearable(
+        TheSpirit(), Annotated[TheSpiritOther, ['of Solitude']]) is False
+
+    # ..................{ PASS ~ bounded                     }..................
+    # Assert that the caches of type-checking functions generated for
+    # unhashable type hints are bounded even under the default cache policy.
+    assert checkmake._HINT_UNHASHABLE_KEY_LEN_MAX > 0
+    assert checkmake._HINT_SANE_KEY_LEN_MAX > 0
+
+    # Temporarily reduce these bounds to two type-checking functions each.
+    monkeypatch.setattr(checkmake, '_HINT_UNHASHABLE_KEY_LEN_MAX', 2)
+    monkeypatch.setattr(checkmake, '_HINT_SANE_KEY_LEN_MAX', 2)
+
+    # Number of type-checking functions cached for sanified type hints.
+    hints_sane_len = len(checkmake._hint_sane_key_to_func_checker)
+
+    # Assert that type-checking against many distinct unhashable type hints
+    # evicts the least recently generated type-checking functions. Since these
+    # hints all sanify to the same hint, the cache of type-checking functions
+    # generated for sanified type hints grows by at most one function.
+    for index in range(8):
+        assert is_bearable(index, Annotated[int, ['Alastor', index]]) is True
+    assert len(checkmake._hint_unhashable_key_to_func_checker) == 2
+    assert len(checkmake._hint_sane_key_to_func_checker) <= max(
+        hints_sane_len, 2)
+
+    # ..................{ FAIL                               }..................
+    # Assert this raiser raises the expected exception when passed an object
+    # violating an unhashable type hint.
+    with raises(BeartypeDoorHintViolation):
+        die_if_unbearable(
+            ['beloved brotherhood!'], List[Annotated[int, ['Alastor']]])
+
+
+def test_door_is_bearable_interned() -> None:
+    '''
+    Test the :class:`beartype.door.is_bearable` tester function when passed
+    unequal type hints sanified into the same type hint, which the memoized
+    type-checking function factories underlying that tester memoize as
+    different type hints.
+    '''
+
+    # ..................{ IMPORTS                            }..................
+    # Defer test-specific imports.
+    from beartype.door import is_bearable
+    from beartype.typing import Union
+    from beartype._check.checkmake import (
+        make_func_raiser,
+        make_func_tester,
+    )
+    from beartype._conf.confcls import BEARTYPE_CONF_DEFAULT
+
+    # ..................{ LOCALS                             }..................
+    # Class local to this test, preventing prior tests from generating
+    # type-checking functions for the type hints below.
+    TheAwfulShadow = type('TheAwfulShadow', (), {})
+
+    # PEP-noncompliant tuple union and the unequal PEP 484-compliant union
+    # that tuple union is sanified into.
+    hint_tuple = (TheAwfulShadow, int)
+    hint_union = Union[TheAwfulShadow, int]
+    assert hint_tuple != hint_union
+
+    # ..................{ PASS                               }..................
+    # Assert that the type-checking functions generated for these hints are
+    # the same functions.
+    assert make_func_tester(hint_tuple, BEARTYPE_CONF_DEFAULT) is (
+        make_func_tester(hint_union, BEARTYPE_CONF_DEFAULT))
+    assert make_func_raiser(hint_tuple, BEARTYPE_CONF_DEFAULT) is (
+        make_func_raiser(hint_union, BEARTYPE_CONF_DEFAULT))
+
+    # Assert that the type-checking functions generated by different factories
+    # for these hints differ.
+    assert make_func_tester(hint_tuple, BEARTYPE_CONF_DEFAULT) is not (
+        make_func_raiser(hint_union, BEARTYPE_CONF_DEFAULT))
+
+    # Assert that these type-checkers behave as expected.
+    assert is_bearable(TheAwfulShadow(), hint_tuple) is True
+    assert is_bearable(1816, hint_union) is True
+    assert is_bearable('of some unseen Power', hint_union) is False
+
+
+def test_door_is_bearable_interned_repr() -> None:
+    '''
+    Test the :class:`beartype.door.is_bearable` tester function when passed
+    unequal type hints sharing the same machine-readable representation, which
+    the repr-keyed interner underlying that tester *must* avoid conflating.
+    '''
+
+    # ..................{ IMPORTS                            }..................
+    # Defer test-specific imports.
+    from beartype.door import (
+        die_if_unbearable,
+        is_bearable,
+    )
+    from beartype.roar import BeartypeDoorHintViolation
+    from beartype.typing import Annotated
+    from beartype._util.py.utilpyversion import (
+        IS_PYTHON_AT_LEAST_3_10,
+        IS_PYTHON_AT_LEAST_3_9,
+    )
+    from beartype_test.a00_unit.data.data_type import class_local_factory
+    from pytest import raises
+
+    # If the active Python interpreter targets Python < 3.9, this interpreter
+    # fails to support PEP 585. In this case, silently reduce to a noop.
+    if not IS_PYTHON_AT_LEAST_3_9:
+        return
+    # Else, this interpreter supports PEP 585.
+
+    # ..................{ LOCALS                             }..................
+    # Distinct classes sharing the same fully-qualified name.
+    TheSpiritOfSweetHuman = class_local_factory()
+    TheSpiritOfSweetHumanToo = class_local_factory()
+
+    # Objects satisfying only the first and second of these classes.
+    the_spirit = TheSpiritOfSweetHuman()
+    the_spirit_too = TheSpiritOfSweetHumanToo()
+
+    # List of 4-tuples "(hint_first, hint_second, pith_first, pith_second)" of
+    # unequal type hints sharing the same machine-readable representation
+    # subscripted by these classes *AND* objects satisfying only the first and
+    # second of these hints respectively.
+    hints_piths = [
+        (
+            list[TheSpiritOfSweetHuman],
+            list[TheSpiritOfSweetHumanToo],
+            [the_spirit],
+            [the_spirit_too],
+        ),
+        # Unhashable hints, memoized by a separate repr-keyed cache.
+        (
+            Annotated[list[TheSpiritOfSweetHuman], ['Love']],
+            Annotated[list[TheSpiritOfSweetHumanToo], ['Love']],
+            [the_spirit],
+            [the_spirit_too],
+        ),
+    ]
+
+    # If the active Python interpreter targets Python >= 3.10 and thus supports
+    # PEP 604, also test PEP 604-compliant unions.
+    if IS_PYTHON_AT_LEAST_3_10:
+        hints_piths.append((
+            TheSpiritOfSweetHuman | None,  # pyright: ignore
+            TheSpiritOfSweetHumanToo | None,  # pyright: ignore
+            the_spirit,
+            the_spirit_too,
+        ))
+
+    # ..................{ PASS                               }..................
+    # For each such pair of hints and objects...
+    for hint_first, hint_second, pith_first, pith_second in hints_piths:
+        # Assert these hints are unequal but share the same representation.
+        assert repr(hint_first) == repr(hint_second)
+        assert hint_first != hint_second
+
+        # Assert that testing these objects against these hints in this order
+        # type-checks each object against the class subscripting each hint
+        # rather than the class subscripting the first such hint tested.
+        assert is_bearable(pith_first, hint_first) is True
+        assert is_bearable(pith_second, hint_second) is True
+        assert is_bearable(pith_first, hint_second) is False
+        assert is_bearable(pith_second, hint_first) is False
+        die_if_unbearable(pith_second, hint_second)
+        with raises(BeartypeDoorHintViolation):
+            die_if_unbearable(pith_first, hint_second)
+
 # See above for @ignore_warnings() discussion.
 @ignore_warnings(BeartypeDecorHintPep585DeprecationWarning)
 def test_door_typehint_is_bearable(iter_hints_piths_meta) -> None:
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2024 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Beartype **type-checking cache utility** unit tests.
+
+This submodule unit tests the :func:`beartype._check.checkcache` submodule.
+'''
+
+# ....................{ IMPORTS                            }....................
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+# WARNING: To raise human-readable test errors, avoid importing from
+# package-specific submodules at module scope.
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+
+# ....................{ TESTS                              }....................
+def test_clear_checker_caches_module(monkeypatch) -> None:
+    '''
+    Test the :func:`beartype._check.checkcache.clear_checker_caches_module`
+    clearer, both directly *and* as indirectly called by the
+    :func:`beartype.beartype` decorator on redefining a decorated class.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.MonkeyPatch
+        Fixture temporarily registering fake modules with :data:`sys.modules`.
+    '''
+
+    # Defer test-specific imports.
+    from beartype import beartype
+    from beartype.typing import (
+        Annotated,
+        Dict,
+        List,
+    )
+    from beartype._check.checkcache import clear_checker_caches_module
+    from beartype._check.code.codescope import _tuple_union_to_tuple_union
+    from beartype._check.convert.convcoerce import _hint_repr_to_hint
+    from beartype._check.forward.reference.fwdrefmake import (
+        _forwardref_args_to_forwardref,
+        make_forwardref_indexable_subtype,
+    )
+    from beartype._check.forward.reference.fwdrefmeta import (
+        _forwardref_to_referee)
+    from sys import modules as module_name_to_module
+    from types import ModuleType
+
+    # ....................{ LOCALS                         }....................
+    # Fully-qualified names of two fake modules, the former of which is to be
+    # redefined and the latter of which is *NOT*.
+    MODULE_NAME_STALE = 'beartype_test.fake.a_lovely_youth'
+    MODULE_NAME_FRESH = 'beartype_test.fake.no_mourning_maiden'
+
+    # Classes declared by those modules.
+    TypeStale = type('Gentle', (), {'__module__': MODULE_NAME_STALE})
+    TypeFresh = type('AndBrave', (), {'__module__': MODULE_NAME_FRESH})
+
+    # Register those modules declaring those classes.
+    for module_name, cls in (
+        (MODULE_NAME_STALE, TypeStale),
+        (MODULE_NAME_FRESH, TypeFresh),
+    ):
+        module = ModuleType(module_name)
+        setattr(module, cls.__name__, cls)
+        monkeypatch.setitem(module_name_to_module, module_name, module)
+
+    # Forward reference proxies relative to those modules, resolved to those
+    # classes (thus caching those proxies and referees).
+    forwardref_stale = make_forwardref_indexable_subtype(
+        MODULE_NAME_STALE, 'Gentle')
+    forwardref_fresh = make_forwardref_indexable_subtype(
+        MODULE_NAME_FRESH, 'AndBrave')
+    assert forwardref_stale.__type_beartype__ is TypeStale
+    assert forwardref_fresh.__type_beartype__ is TypeFresh
+
+    # Tuple unions containing those classes.
+    tuple_union_stale = (int, TypeStale)
+    tuple_union_fresh = (int, TypeFresh)
+
+    # Non-self-cached type hints transitively subscripted by those classes.
+    hint_stale = List[Dict[str, Annotated[TypeStale, 'and generous']]]
+    hint_fresh = List[Dict[str, Annotated[TypeFresh, 'and generous']]]
+
+    # Cache those tuple unions and type hints.
+    for tuple_union in (tuple_union_stale, tuple_union_fresh):
+        _tuple_union_to_tuple_union[tuple_union] = tuple_union
+    for hint in (hint_stale, hint_fresh):
+        _hint_repr_to_hint.cache_or_get_cached_value(
+            key=repr(hint), value=hint)
+
+    # ....................{ PASS                           }....................
+    # Clear all cache entries depending on the former module.
+    clear_checker_caches_module(MODULE_NAME_STALE)
+
+    # Assert that *ONLY* cache entries depending on the former module were
+    # removed.
+    assert (MODULE_NAME_STALE, 'Gentle', forwardref_stale.__bases__) not in (
+        _forwardref_args_to_forwardref)
+    assert (MODULE_NAME_FRESH, 'AndBrave', forwardref_fresh.__bases__) in (
+        _forwardref_args_to_forwardref)
+    assert forwardref_stale not in _forwardref_to_referee
+    assert forwardref_fresh in _forwardref_to_referee
+    assert tuple_union_stale not in _tuple_union_to_tuple_union
+    assert tuple_union_fresh in _tuple_union_to_tuple_union
+    assert _hint_repr_to_hint.cache_or_get_cached_value(
+        key=repr(hint_stale), value=None) is None
+    assert _hint_repr_to_hint.cache_or_get_cached_value(
+        key=repr(hint_fresh), value=None) is hint_fresh
+
+    # ....................{ PASS ~ decorator               }....................
+    # Re-resolve the stale forward reference proxy *AND* recache the stale
+    # tuple union.
+    assert forwardref_stale.__type_beartype__ is TypeStale
+    _tuple_union_to_tuple_union[tuple_union_stale] = tuple_union_stale
+
+    # Decorate a class declared by the former module.
+    beartype(type('LoveliestYouth', (), {'__module__': MODULE_NAME_STALE}))
+
+    # Assert that decorating that class clears *NO* cache entries.
+    assert forwardref_stale in _forwardref_to_referee
+    assert tuple_union_stale in _tuple_union_to_tuple_union
+
+    # Redefine and decorate that class, as if by reloading that module.
+    beartype(type('LoveliestYouth', (), {'__module__': MODULE_NAME_STALE}))
+
+    # Assert that redefining that class clears *ONLY* cache entries depending
+    # on the former module.
+    assert forwardref_stale not in _forwardref_to_referee
+    assert forwardref_fresh in _forwardref_to_referee
+    assert tuple_union_stale not in _tuple_union_to_tuple_union
+    assert tuple_union_fresh in _tuple_union_to_tuple_union
+
+    # Re-resolve the stale forward reference proxy *AND* redefine and decorate
+    # that class yet again, as if by reloading that module yet again.
+    assert forwardref_stale.__type_beartype__ is TypeStale
+    beartype(type('LoveliestYouth', (), {'__module__': MODULE_NAME_STALE}))
+
+    # Assert that redefining that class yet again also clears cache entries
+    # depending on the former module.
+    assert forwardref_stale not in _forwardref_to_referee
+
+    # Remove all remaining cache entries created above.
+    clear_checker_caches_module(MODULE_NAME_FRESH)
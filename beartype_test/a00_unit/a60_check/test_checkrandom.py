@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2024 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Beartype **pseudo-random integer buffer** unit tests.
+
+This submodule unit tests the :func:`beartype._check.checkrandom` submodule.
+'''
+
+# ....................{ IMPORTS                            }....................
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+# WARNING: To raise human-readable test errors, avoid importing from
+# package-specific submodules at module scope.
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+
+# ....................{ TESTS                              }....................
+def test_refill_random_ints() -> None:
+    '''
+    Test the :func:`beartype._check.checkrandom.refill_random_ints` function.
+    '''
+
+    # Defer test-specific imports.
+    from beartype._check import checkrandom
+    from beartype._check.checkrandom import (
+        random_int_pop,
+        random_ints,
+        refill_random_ints,
+    )
+
+    # Copies of the current buffer, pool, and pool refill counter, restored
+    # below to avoid perturbing type-checkers called by subsequent tests.
+    random_ints_old = random_ints.copy()
+    random_ints_pool_old = checkrandom._random_ints_pool
+    random_ints_pool_refills_old = checkrandom._random_ints_pool_refills
+
+    # Attempt to...
+    try:
+        # Start from an exhausted buffer *AND* an exhausted pool, forcing the
+        # next refill to regenerate this pool regardless of prior refills
+        # performed by type-checkers called by other tests.
+        random_ints.clear()
+        checkrandom._random_ints_pool_refills = (
+            checkrandom._RANDOM_INTS_POOL_REFILLS_MAX)
+
+        # Assert that refilling this buffer returns a 32-bit unsigned integer
+        # and refills this buffer with the remainder of the current pool.
+        random_int = refill_random_ints()
+        assert isinstance(random_int, int)
+        assert 0 <= random_int < 2 ** 32
+        assert len(random_ints) == checkrandom._RANDOM_INTS_POOL_LEN - 1
+
+        # Assert that this buffer contains only 32-bit unsigned integers.
+        assert all(0 <= random_int < 2 ** 32 for random_int in random_ints)
+
+        # Assert that this buffer contains a reasonable number of distinct
+        # integers.
+        assert len(set(random_ints)) > checkrandom._RANDOM_INTS_POOL_LEN // 2
+
+        # Assert that the bound method popping this buffer pops this buffer.
+        random_int = random_ints[-1]
+        assert random_int_pop() == random_int
+        assert len(random_ints) == checkrandom._RANDOM_INTS_POOL_LEN - 2
+
+        # Assert that the current pool is regenerated after being reused for
+        # the maximum number of refills.
+        random_ints_pool = checkrandom._random_ints_pool
+        for _ in range(checkrandom._RANDOM_INTS_POOL_REFILLS_MAX):
+            random_ints.clear()
+            refill_random_ints()
+        assert checkrandom._random_ints_pool is not random_ints_pool
+        assert checkrandom._random_ints_pool_refills == 1
+    # Restore the prior buffer, pool, and pool refill counter.
+    finally:
+        random_ints[:] = random_ints_old
+        checkrandom._random_ints_pool = random_ints_pool_old
+        checkrandom._random_ints_pool_refills = random_ints_pool_refills_old
+
+
+def test_make_random_ints_pool() -> None:
+    '''
+    Test the :func:`beartype._check.checkrandom._make_random_ints_pool`
+    factory.
+    '''
+
+    # Defer test-specific imports.
+    from beartype._check import checkrandom
+
+    # Pool of pseudo-random integers created by this factory.
+    random_ints_pool = checkrandom._make_random_ints_pool()
+
+    # Assert this pool to be a list of the expected number of 32-bit unsigned
+    # integers.
+    assert isinstance(random_ints_pool, list)
+    assert len(random_ints_pool) == checkrandom._RANDOM_INTS_POOL_LEN
+    assert all(
+        isinstance(random_int, int) and 0 <= random_int < 2 ** 32
+        for random_int in random_ints_pool
+    )
+
+    # Assert that two successive pools differ.
+    assert random_ints_pool != checkrandom._make_random_ints_pool()
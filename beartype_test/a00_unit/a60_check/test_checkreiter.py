@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2024 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Beartype **reiterable item sampler** unit tests.
+
+This submodule unit tests the :func:`beartype._check.checkreiter` submodule.
+'''
+
+# ....................{ IMPORTS                            }....................
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+# WARNING: To raise human-readable test errors, avoid importing from
+# package-specific submodules at module scope.
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+
+# ....................{ TESTS                              }....................
+def test_get_reiterable_nonempty_item_next() -> None:
+    '''
+    Test the
+    :func:`beartype._check.checkreiter.get_reiterable_nonempty_item_next`
+    getter.
+    '''
+
+    # Defer test-specific imports.
+    from beartype._check import checkreiter
+    from beartype._check.checkreiter import (
+        clear_reiterable_cache,
+        get_reiterable_nonempty_item_next,
+    )
+    from collections import deque
+
+    # Start from an empty cache.
+    clear_reiterable_cache()
+
+    # For each non-empty reiterable of interest...
+    for reiterable in (
+        {'Lift not the painted veil', 'which those who live'},
+        frozenset(range(17)),
+        deque('Call Life'),
+        {'Though unreal shapes': 'be pictured there'}.keys(),
+    ):
+        # Assert that as many calls to this getter as this reiterable has items
+        # visit *ALL* items of this reiterable exactly once.
+        assert sorted(
+            get_reiterable_nonempty_item_next(reiterable)
+            for _ in range(len(reiterable))
+        ) == sorted(reiterable)
+
+        # Assert that a subsequent call restarts iteration from the first item.
+        assert get_reiterable_nonempty_item_next(reiterable) == next(
+            iter(reiterable))
+
+    # Set to be mutated between calls to this getter.
+    reiterable_mutated = {1, 2, 3}
+    get_reiterable_nonempty_item_next(reiterable_mutated)
+    reiterable_mutated.add(4)
+
+    # Assert that this getter silently restarts iteration when the cached
+    # iterator is invalidated by a mutation of this set.
+    assert get_reiterable_nonempty_item_next(reiterable_mutated) in (
+        reiterable_mutated)
+
+    # Assert that this getter never caches more iterators than its bound.
+    for _ in range(checkreiter._REITERABLE_CACHE_ITERS_LEN_MAX + 8):
+        get_reiterable_nonempty_item_next({object()})
+    assert len(checkreiter._reiterable_id_to_iter_len) == (
+        checkreiter._REITERABLE_CACHE_ITERS_LEN_MAX)
+
+    # Assert that this getter never caches an iterator over a reiterable larger
+    # than its total item bound.
+    reiterable_large = frozenset(
+        range(checkreiter._REITERABLE_CACHE_ITEMS_LEN_MAX + 1))
+    get_reiterable_nonempty_item_next(reiterable_large)
+    assert id(reiterable_large) not in checkreiter._reiterable_id_to_iter_len
+    assert checkreiter._reiterable_cache_items_len <= (
+        checkreiter._REITERABLE_CACHE_ITEMS_LEN_MAX)
+
+    # Assert that clearing this cache releases all cached iterators.
+    clear_reiterable_cache()
+    assert not checkreiter._reiterable_id_to_iter_len
+    assert checkreiter._reiterable_cache_items_len == 0
+
+
+def test_get_mapping_nonempty_item_next() -> None:
+    '''
+    Test the :func:`beartype._check.checkreiter.get_mapping_nonempty_item_next`
+    getter.
+    '''
+
+    # Defer test-specific imports.
+    from beartype.door import is_bearable
+    from beartype.typing import Dict
+    from beartype._check.checkreiter import (
+        clear_reiterable_cache,
+        get_mapping_nonempty_item_next,
+        get_reiterable_nonempty_item_next,
+    )
+    from beartype_test.a00_unit.data.kind.data_kindmap import (
+        THE_SONG_OF_HIAWATHA)
+    from collections import ChainMap
+
+    # Start from an empty cache.
+    clear_reiterable_cache()
+
+    # For each non-empty mapping of interest...
+    for mapping in (
+        {'And it came to pass': 'that'},
+        THE_SONG_OF_HIAWATHA,
+        ChainMap({'Should you ask me': 'whence these stories'}, {0: 1, 2: 3}),
+    ):
+        # Assert that as many calls to this getter as this mapping has pairs
+        # visit *ALL* pairs of this mapping exactly once.
+        assert {
+            get_mapping_nonempty_item_next(mapping)
+            for _ in range(len(mapping))
+        } == set(mapping.items())
+
+    # Dictionary to be iterated both as a mapping and as a reiterable.
+    mapping_reiterable = {'Whence these legends': 'and traditions'}
+
+    # Assert that iterating this dictionary as a mapping and then as a
+    # reiterable yields a pair and a key (respectively) rather than sharing the
+    # same cached iterator.
+    assert get_mapping_nonempty_item_next(mapping_reiterable) == (
+        'Whence these legends', 'and traditions')
+    assert get_reiterable_nonempty_item_next(mapping_reiterable) == (
+        'Whence these legends')
+
+    # Large dictionary whose only invalid value resides in its middle.
+    mapping_large = {key: key for key in range(1000)}
+    mapping_large[500] = 'With the odors of the forest'
+
+    # Assert that type-checking this dictionary as many times as it has pairs
+    # eventually detects this invalid value.
+    assert not all(
+        is_bearable(mapping_large, Dict[int, int])
+        for _ in range(len(mapping_large))
+    )
+
+    # Release all cached iterators.
+    clear_reiterable_cache()
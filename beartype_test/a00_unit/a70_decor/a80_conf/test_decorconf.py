@@ -155,6 +155,110 @@ def test_decor_conf_is_debug(capsys) -> None:
         # * Suffixing substrings (e.g., diagnostic comments).
         assert code_line in stdout_line
 
+def test_decor_conf_is_lazy() -> None:
+    '''
+    Test the :func:`beartype.beartype` decorator passed the optional ``conf``
+    parameter passed the optional ``is_lazy`` parameter.
+    '''
+
+    # ..................{ IMPORTS                            }..................
+    # Defer test-specific imports.
+    from beartype import (
+        BeartypeConf,
+        beartype,
+    )
+    from beartype.roar import (
+        BeartypeCallHintParamViolation,
+        BeartypeDecorHintNonpepException,
+    )
+    from pytest import (
+        raises,
+        warns,
+    )
+
+    # ..................{ LOCALS                             }..................
+    # @beartype decorator deferring the generation of wrapper functions.
+    lazybeartype = beartype(conf=BeartypeConf(is_lazy=True))
+
+    # @beartype decorator deferring the generation of wrapper functions *AND*
+    # emitting non-fatal warnings rather than raising fatal exceptions on
+    # failing to do so.
+    lazybeartype_nonfatal = beartype(conf=BeartypeConf(
+        is_lazy=True, warning_cls_on_decorator_exception=UserWarning))
+
+    # Module-scoped callables decorated lazily.
+    a_lovely_youth = lazybeartype(_a_lovely_youth)
+    with_weeping_flowers = lazybeartype(_with_weeping_flowers)
+    the_lone_couch = lazybeartype(_the_lone_couch)
+    gentle_and_brave = lazybeartype_nonfatal(_the_lone_couch)
+
+    # ..................{ CALLABLES                          }..................
+    @lazybeartype
+    def or_votive_cypress_wreath(decked: int) -> int:
+        '''
+        Arbitrary nested callable annotated by type hints, whose forward
+        references (if any) are only resolvable at decoration time.
+        '''
+
+        return decked
+
+    # ..................{ PASS                               }..................
+    # Code object of this callable before its first call.
+    a_lovely_youth_code = a_lovely_youth.__code__
+
+    # Assert that decoration preserved the metadata of this callable.
+    assert a_lovely_youth is not _a_lovely_youth
+    assert a_lovely_youth.__name__ == '_a_lovely_youth'
+    assert a_lovely_youth.__doc__ is _a_lovely_youth.__doc__
+    assert a_lovely_youth.__wrapped__ is _a_lovely_youth
+
+    # Assert that re-decorating this callable reduces to a noop.
+    assert lazybeartype(a_lovely_youth) is a_lovely_youth
+
+    # Assert that calling this callable generates its wrapper in-place *AND*
+    # returns the expected value.
+    assert a_lovely_youth('Decked with ', 2) == 'Decked with Decked with '
+    assert a_lovely_youth.__code__ is not a_lovely_youth_code
+
+    # Code object of this callable after its first call.
+    a_lovely_youth_code = a_lovely_youth.__code__
+
+    # Assert that subsequent calls to this callable preserve this code object
+    # *AND* accept default parameters.
+    assert a_lovely_youth('no mourning maiden') == 'no mourning maiden'
+    assert a_lovely_youth.__code__ is a_lovely_youth_code
+
+    # Assert that calling a callable requiring *NO* type-checking transparently
+    # forwards that call to that callable.
+    assert with_weeping_flowers(0) == 0
+    assert with_weeping_flowers('flowers') == 'flowers'
+
+    # Assert that calling a callable decorated non-fatally with an invalid type
+    # hint emits the expected warning on its first call *AND* thereafter
+    # forwards all calls to that callable *WITHOUT* type-checking.
+    with warns(UserWarning):
+        assert gentle_and_brave('and generous') == 'and generous'
+    assert gentle_and_brave(b'Gentle') == b'Gentle'
+
+    # Assert that a nested callable was decorated eagerly and thus type-checks
+    # its first call.
+    assert or_votive_cypress_wreath(1) == 1
+
+    # ..................{ FAIL                               }..................
+    # Assert that the generated wrapper type-checks subsequent calls.
+    with raises(BeartypeCallHintParamViolation):
+        a_lovely_youth(b'or votive cypress wreath')
+    with raises(BeartypeCallHintParamViolation):
+        or_votive_cypress_wreath('Decked')
+
+    # Assert that calling a callable decorated fatally with an invalid type
+    # hint raises the expected exception on each call rather than on its
+    # decoration.
+    with raises(BeartypeDecorHintNonpepException):
+        the_lone_couch('Sleep')
+    with raises(BeartypeDecorHintNonpepException):
+        the_lone_couch('Sleep')
+
 # ....................{ TESTS ~ strategy                   }....................
 def test_decor_conf_strategy_O0() -> None:
     '''
@@ -232,6 +336,432 @@ def test_decor_conf_strategy_O0() -> None:
     with raises(BeartypeCallHintViolation):
         upon_that_mountain.none_beholds_them_there()
 
+
+def test_decor_conf_strategy_On() -> None:
+    '''
+    Test the :func:`beartype.beartype` decorator passed the optional ``conf``
+    parameter passed the optional ``strategy`` parameter whose value is the
+    **linear-time strategy** (i.e., :attr:`beartype.BeartypeStrategy.On).
+    '''
+
+    # ..................{ IMPORTS                            }..................
+    # Defer test-specific imports.
+    from beartype import (
+        BeartypeConf,
+        BeartypeStrategy,
+        beartype,
+    )
+    from beartype.roar import BeartypeCallHintViolation
+    from beartype.typing import (
+        List,
+        Sequence,
+        Tuple,
+        Union,
+    )
+    from pytest import raises
+
+    # ..................{ LOCALS                             }..................
+    # @beartype decorator type-checking all items of all containers.
+    onbeartype = beartype(conf=BeartypeConf(strategy=BeartypeStrategy.On))
+
+    # ..................{ CALLABLES                          }..................
+    @onbeartype
+    def the_glaciers_creep(
+        like_snakes: List[int],
+        that_watch: Sequence[List[Union[int, str]]] = (),
+        their_prey: Tuple[Tuple[int, str], ...] = (),
+    ) -> int:
+        '''
+        Arbitrary callable annotated by single-argument sequence and variadic
+        tuple type hints, all of which are type-checked in linear time.
+        '''
+
+        return len(like_snakes)
+
+    # Large list of integers whose last item alone violates its type hint.
+    from_their_far_fountains = list(range(256))
+    from_their_far_fountains_bad = from_their_far_fountains + [
+        'From their far fountains, slow rolling on; there, many a precipice,']
+
+    # ..................{ PASS                               }..................
+    # Assert that this callable returns the expected values when passed valid
+    # parameters, including empty containers.
+    assert the_glaciers_creep([]) == 0
+    assert the_glaciers_creep(
+        from_their_far_fountains,
+        [[0, 'Frost and the Sun in scorn of mortal power'], []],
+        ((0, 'Have piled: dome, pyramid, and pinnacle,'),),
+    ) == 256
+
+    # ..................{ FAIL                               }..................
+    # Assert that this callable raises the expected exception when passed a
+    # list whose only invalid item is the last item. Since the constant-time
+    # strategy type-checks only one random item, this is *ONLY* reliably
+    # detected by the linear-time strategy. Repeat this assertion to guard
+    # against accidental reliance on pseudo-randomness.
+    for _ in range(8):
+        with raises(BeartypeCallHintViolation) as exception_info:
+            the_glaciers_creep(from_their_far_fountains_bad)
+
+        # Assert that this violation identifies the index of this item.
+        assert 'index 256 item' in str(exception_info.value)
+
+    # Assert that this callable raises the expected exception when passed a
+    # nested sequence whose only invalid item is nested in the last item.
+    with raises(BeartypeCallHintViolation) as exception_info:
+        the_glaciers_creep(
+            [], [[0, 1], [2, 'A city of death, distinct with'], [None]])
+    assert 'index 2 item' in str(exception_info.value)
+
+    # Assert that this callable raises the expected exception when passed a
+    # variadic tuple whose only invalid item is nested in the last item.
+    with raises(BeartypeCallHintViolation) as exception_info:
+        the_glaciers_creep(
+            [], (), ((0, 'And wall impregnable of beaming ice.'), (1, 2)))
+    assert 'tuple index 1 item' in str(exception_info.value)
+
+
+
+def test_decor_conf_strategy_Ologn() -> None:
+    '''
+    Test the :func:`beartype.beartype` decorator passed the optional ``conf``
+    parameter passed the optional ``strategy`` parameter whose value is the
+    **logarithmic-time strategy** (i.e., :attr:`beartype.BeartypeStrategy.Ologn).
+    '''
+
+    # ..................{ IMPORTS                            }..................
+    # Defer test-specific imports.
+    from beartype import (
+        BeartypeConf,
+        BeartypeStrategy,
+        beartype,
+    )
+    from beartype.roar import BeartypeCallHintViolation
+    from beartype.typing import (
+        List,
+        Tuple,
+        Union,
+    )
+    from pytest import raises
+
+    # ..................{ LOCALS                             }..................
+    # @beartype decorator type-checking log(n) items of all containers.
+    lognbeartype = beartype(conf=BeartypeConf(strategy=BeartypeStrategy.Ologn))
+
+    # ..................{ CALLABLES                          }..................
+    @lognbeartype
+    def the_wilderness(
+        has_a_mysterious_tongue: List[int],
+        which_teaches: List[List[Union[int, str]]] = [],
+        awful_doubt: Tuple[bytes, ...] = (),
+    ) -> int:
+        '''
+        Arbitrary callable annotated by single-argument sequence and variadic
+        tuple type hints, all of which are type-checked in logarithmic time.
+        '''
+
+        return len(has_a_mysterious_tongue)
+
+    # ..................{ PASS                               }..................
+    # Assert that this callable returns the expected values when passed valid
+    # parameters, including empty containers.
+    assert the_wilderness([]) == 0
+    assert the_wilderness(
+        list(range(1000)),
+        [[0, 'Or faith so mild,'], [], list(range(100))],
+        (b'So solemn, so serene, that man may be',) * 10,
+    ) == 1000
+
+    # ..................{ FAIL                               }..................
+    # Assert that this callable raises the expected exception when passed
+    # non-empty containers *ALL* of whose items are invalid, regardless of
+    # which items are pseudo-randomly selected. Repeat each assertion to guard
+    # against accidental reliance on pseudo-randomness.
+    for _ in range(8):
+        with raises(BeartypeCallHintViolation) as exception_info:
+            the_wilderness(['But for such faith with nature reconciled;'] * 100)
+        assert 'item str' in str(exception_info.value)
+
+        with raises(BeartypeCallHintViolation):
+            the_wilderness([], [[None]] * 100)
+
+        with raises(BeartypeCallHintViolation):
+            the_wilderness([], [], ('Thou hast a voice, great Mountain,',) * 5)
+
+    # Assert that this callable raises the expected exception when passed a
+    # singleton list whose only item is invalid.
+    with raises(BeartypeCallHintViolation):
+        the_wilderness([b'to repeal'])
+
+
+def test_decor_conf_check_time_max_multiplier() -> None:
+    '''
+    Test the :func:`beartype.beartype` decorator passed the optional ``conf``
+    parameter passed the optional ``check_time_max_multiplier`` parameter
+    imposing a deadline on non-constant type-checking strategies.
+    '''
+
+    # ..................{ IMPORTS                            }..................
+    # Defer test-specific imports.
+    from beartype import (
+        BeartypeConf,
+        BeartypeStrategy,
+        beartype,
+    )
+    from beartype.roar import BeartypeCallHintViolation
+    from beartype.typing import List
+    from beartype._check.checktime import (
+        CHECK_TIMES,
+        is_all_items_timed,
+    )
+    from pytest import raises
+
+    # ..................{ LOCALS                             }..................
+    # Copy of the current global type-checking time accumulator, restored below.
+    check_times_old = CHECK_TIMES.copy()
+
+    # ..................{ CALLABLES                          }..................
+    @beartype(conf=BeartypeConf(
+        strategy=BeartypeStrategy.On, check_time_max_multiplier=20))
+    def the_pine_branches(swayed_and_moaned: List[List[int]]) -> int:
+        '''
+        Arbitrary callable annotated by a nested single-argument sequence type
+        hint, type-checked in linear time subject to a deadline.
+        '''
+
+        return len(swayed_and_moaned)
+
+    # ..................{ PASS                               }..................
+    # Attempt to...
+    try:
+        # Reset the total time consumed by all prior deadlined type-checks,
+        # guaranteeing the subsequent type-checks to be well within budget.
+        CHECK_TIMES[1] = 0.0
+
+        # Assert that this callable returns the expected value when passed a
+        # valid parameter.
+        assert the_pine_branches([[0, 1], [], list(range(100))]) == 3
+
+        # Assert that this callable raises the expected exception when passed
+        # an invalid parameter whose only invalid item is deeply nested in the
+        # last item of a large list, which only the linear-time strategy is
+        # guaranteed to detect.
+        with raises(BeartypeCallHintViolation):
+            the_pine_branches([[0]] * 1000 + [[0, 'All the mighty cones']])
+
+        # Assert that the nesting depth of deadlined type-checks was restored
+        # to zero, despite the prior type-check halting prematurely.
+        assert CHECK_TIMES[2] == 0
+
+        # Iterator over arbitrary items, the second of which is falsy.
+        items_iter = iter((True, False, True))
+
+        # Assert that the deadlined drop-in replacement for the all() builtin
+        # short-circuits on this falsy item *AND* restores the nesting depth of
+        # deadlined type-checks to zero, despite this iterator remaining both
+        # referenced and unexhausted.
+        assert is_all_items_timed(items_iter) is False
+        assert CHECK_TIMES[2] == 0
+        assert next(items_iter) is True
+
+        # Inflate the total time consumed by all prior deadlined type-checks
+        # far beyond the total time the active Python process has been running,
+        # guaranteeing the subsequent type-checks to exceed their budget.
+        CHECK_TIMES[1] = 1e12
+
+        # Assert that this callable now silently skips type-checking the items
+        # of this invalid parameter (but still type-checks its type).
+        assert the_pine_branches([[0]] * 1000 + [[0, 'and the mighty']]) == 1001
+        with raises(BeartypeCallHintViolation):
+            the_pine_branches('Bending their fruit in a slow decay')
+    # Restore the global type-checking time accumulator.
+    finally:
+        CHECK_TIMES[:] = check_times_old
+
+
+def test_decor_conf_check_stream_rate() -> None:
+    '''
+    Test the :func:`beartype.beartype` decorator passed the optional ``conf``
+    parameter passed the optional ``check_stream_rate`` parameter lazily
+    type-checking the values streamed through synchronous iterators and
+    generators returned by decorated callables.
+    '''
+
+    # ..................{ IMPORTS                            }..................
+    # Defer test-specific imports.
+    from beartype import (
+        BeartypeConf,
+        beartype,
+    )
+    from beartype.roar import (
+        BeartypeCallHintParamViolation,
+        BeartypeCallHintReturnViolation,
+    )
+    from collections.abc import (
+        Generator,
+        Iterable,
+        Iterator,
+    )
+    from pytest import raises
+
+    # ..................{ CALLABLES                          }..................
+    @beartype(conf=BeartypeConf(check_stream_rate=1.0))
+    def the_wandering_wind(
+        and_the_clouds: list) -> Generator[int, str, bytes]:
+        '''
+        Arbitrary generator yielding the passed items, type-checking *all*
+        values yielded by, sent to, and returned by this generator.
+        '''
+
+        for cloud in and_the_clouds:
+            yield cloud
+        return b'Shedding the mockery of its vital hues'
+
+    @beartype(conf=BeartypeConf(check_stream_rate=1.0))
+    def its_mighty_river(
+        sweeps_the_ruin: object) -> Generator[int, None, str]:
+        '''
+        Arbitrary generator yielding nothing and returning the passed object.
+        '''
+
+        yield 0
+        return sweeps_the_ruin
+
+    @beartype(conf=BeartypeConf(check_stream_rate=0.25))
+    def the_sounds_of_ocean(of_the_tempest: list) -> Iterator[int]:
+        '''
+        Arbitrary callable returning an iterator over the passed items,
+        type-checking only one of every four values yielded by that iterator.
+        '''
+
+        return iter(of_the_tempest)
+
+    @beartype(conf=BeartypeConf(check_stream_rate=1.0))
+    def the_voiceless_lightning(in_these_solitudes: list) -> Iterable[int]:
+        '''
+        Arbitrary callable returning the passed list as is.
+        '''
+
+        return in_these_solitudes
+
+    @beartype
+    def the_dome_of_heaven(is_as_a_defeat: list) -> Generator[int, str, None]:
+        '''
+        Arbitrary generator yielding the passed items under the default
+        configuration, which does *not* type-check streamed values.
+        '''
+
+        yield from is_as_a_defeat
+
+    # ..................{ PASS                               }..................
+    # Assert that this generator is wrapped by a proxy yielding, accepting,
+    # and returning valid values as is.
+    stream = the_wandering_wind([1, 2])
+    assert isinstance(stream, Generator)
+    assert next(stream) == 1
+    assert stream.send('The chainless winds still come') == 2
+    with raises(StopIteration) as exception_info:
+        next(stream)
+    assert exception_info.value.value == (
+        b'Shedding the mockery of its vital hues')
+
+    # Assert that this iterator yields only a deterministic sample of invalid
+    # values. Here, the first and fifth values are type-checked.
+    assert list(the_sounds_of_ocean([1, 'Heard', 'I', 'not', 5, 'the'])) == [
+        1, 'Heard', 'I', 'not', 5, 'the']
+
+    # Assert that this callable returns a non-iterator iterable as is, as
+    # iterables need *not* be streams.
+    in_these_solitudes = ['Far, far above, piercing the infinite sky']
+    assert the_voiceless_lightning(in_these_solitudes) is in_these_solitudes
+
+    # Assert that generators are returned as is under the default
+    # configuration, which does *not* type-check streamed values.
+    assert list(the_dome_of_heaven(['Mont Blanc appears'])) == [
+        'Mont Blanc appears']
+
+    # ..................{ FAIL                               }..................
+    # Assert that this generator raises the expected exception when yielding
+    # an invalid value.
+    stream = the_wandering_wind([1, 'still, snowy, and serene'])
+    next(stream)
+    with raises(BeartypeCallHintReturnViolation):
+        next(stream)
+
+    # Assert that this generator raises the expected exception when sent an
+    # invalid value.
+    stream = the_wandering_wind([1, 2])
+    next(stream)
+    with raises(BeartypeCallHintParamViolation):
+        stream.send(b'Its subject mountains their unearthly forms')
+
+    # Assert that this generator raises the expected exception when returning
+    # an invalid value.
+    with raises(BeartypeCallHintReturnViolation):
+        list(its_mighty_river(b'Pile around it, ice and rock'))
+
+    # Assert that this iterator raises the expected exception when yielding an
+    # invalid sampled value. Here, the fifth value is type-checked.
+    with raises(BeartypeCallHintReturnViolation):
+        list(the_sounds_of_ocean([1, 2, 3, 4, 'broad vales between']))
+
+
+async def test_decor_conf_check_stream_rate_async() -> None:
+    '''
+    Test the :func:`beartype.beartype` decorator passed the optional ``conf``
+    parameter passed the optional ``check_stream_rate`` parameter lazily
+    type-checking the values streamed through asynchronous generators returned
+    by decorated callables.
+    '''
+
+    # ..................{ IMPORTS                            }..................
+    # Defer test-specific imports.
+    from asyncio import sleep
+    from beartype import (
+        BeartypeConf,
+        beartype,
+    )
+    from beartype.roar import (
+        BeartypeCallHintParamViolation,
+        BeartypeCallHintReturnViolation,
+    )
+    from collections.abc import AsyncGenerator
+    from pytest import raises
+
+    # ..................{ CALLABLES                          }..................
+    @beartype(conf=BeartypeConf(check_stream_rate=1.0))
+    async def of_frozen_floods(
+        unfathomable_deeps: list) -> AsyncGenerator[str, int]:
+        '''
+        Arbitrary asynchronous generator yielding the passed items,
+        type-checking *all* values yielded by and sent to this generator.
+        '''
+
+        for deep in unfathomable_deeps:
+            await sleep(0)
+            yield deep
+
+    # ..................{ PASS                               }..................
+    # Assert that this generator yields and accepts valid values as is.
+    stream = of_frozen_floods(['Blue as the overhanging heaven', 'that spread'])
+    assert await stream.__anext__() == 'Blue as the overhanging heaven'
+    assert await stream.asend(0xFEEDFACE) == 'that spread'
+    await stream.aclose()
+
+    # ..................{ FAIL                               }..................
+    # Assert that this generator raises the expected exception when yielding
+    # an invalid value.
+    with raises(BeartypeCallHintReturnViolation):
+        async for _ in of_frozen_floods(['And wind among', b'the accumulated']):
+            pass
+
+    # Assert that this generator raises the expected exception when sent an
+    # invalid value.
+    stream = of_frozen_floods(['steeps; how hideously'])
+    await stream.__anext__()
+    with raises(BeartypeCallHintParamViolation):
+        await stream.asend('Its shapes are heaped around!')
+
 # ....................{ PRIVATE ~ callables                }....................
 def _earthquake(and_fiery_flood: int, and_hurricane: int) -> bool:
     '''
@@ -245,3 +775,148 @@ def _earthquake(and_fiery_flood: int, and_hurricane: int) -> bool:
     '''
 
     return len(and_fiery_flood) % and_hurricane == 0
+
+
+def _a_lovely_youth(no_mourning_maiden: str, decked: int = 1) -> str:
+    '''
+    Arbitrary callable annotated by type hints to be lazily decorated by the
+    :func:`beartype.beartype` decorator.
+
+    This callable is intentionally declared at module scope, as nested
+    callables are decorated eagerly regardless of configuration.
+    '''
+
+    return no_mourning_maiden * decked
+
+
+def _with_weeping_flowers(or_votive_cypress_wreath):
+    '''
+    Arbitrary callable annotated by *no* type hints to be lazily decorated by
+    the :func:`beartype.beartype` decorator.
+    '''
+
+    return or_votive_cypress_wreath
+
+
+def _the_lone_couch(of_his_everlasting_sleep: 0xFEEDFACE):
+    '''
+    Arbitrary callable annotated by an invalid type hint to be lazily
+    decorated by the :func:`beartype.beartype` decorator.
+    '''
+
+    return of_his_everlasting_sleep
+
+
+def test_decor_conf_union_reorder_threshold() -> None:
+    '''
+    Test the :func:`beartype.beartype` decorator passed the optional ``conf``
+    parameter passed the optional ``union_reorder_threshold`` parameter
+    adaptively reordering the branches of unions type-checked by decorated
+    callables in descending order of hits.
+    '''
+
+    # ..................{ IMPORTS                            }..................
+    # Defer test-specific imports.
+    from beartype import (
+        BeartypeConf,
+        beartype,
+    )
+    from beartype.roar import BeartypeCallHintParamViolation
+    from beartype.typing import (
+        Dict,
+        List,
+        Union,
+    )
+    from beartype._check.checkunion import UnionBranchHits
+    from pytest import raises
+
+    # ..................{ LOCALS                             }..................
+    # Union whose PEP-noncompliant branch is type-checked first by default.
+    HINT_UNION = Union[int, List[int], Dict[str, int]]
+
+    # ..................{ CALLABLES                          }..................
+    @beartype(conf=BeartypeConf(union_reorder_threshold=8))
+    def the_stream_of_life(
+        among_the_bare: List[HINT_UNION]) -> Union[str, List[str]]:
+        '''
+        Arbitrary callable type-checking both a union nested in a container
+        and a root union, whose branches are adaptively reordered.
+        '''
+
+        return ['Caverns of ice'] * len(among_the_bare)
+
+    @beartype(conf=BeartypeConf(union_reorder_threshold=8))
+    def through_the_ravine(of_the_mountains: HINT_UNION) -> int:
+        '''
+        Arbitrary callable type-checking the same union, whose branches are
+        counted independently of all other callables.
+        '''
+
+        return 0
+
+    @beartype
+    def the_sun_shines(bright_above: HINT_UNION) -> int:
+        '''
+        Arbitrary callable type-checking the same union under the default
+        configuration, which does *not* count branches.
+        '''
+
+        return 1
+
+    # ..................{ PASS                               }..................
+    # Tuple of all counters of these callables.
+    union_hits = the_stream_of_life.__beartype_union_hits
+    union_hits_other = through_the_ravine.__beartype_union_hits
+
+    # Assert these callables to expose one counter for each union.
+    assert len(union_hits) == 2
+    assert len(union_hits_other) == 1
+    assert all(isinstance(hits, UnionBranchHits) for hits in union_hits)
+
+    # Assert these callables to count the same union with different counters.
+    hits_param = union_hits[0]
+    assert hits_param.hint is union_hits_other[0].hint
+    assert hits_param is not union_hits_other[0]
+
+    # Assert the default configuration to count nothing.
+    assert the_sun_shines(0) == 1
+    assert not hasattr(the_sun_shines, '__beartype_union_hits')
+
+    # Code object of this callable before reordering.
+    the_stream_of_life_code = the_stream_of_life.__code__
+
+    # Assert that calling this callable fewer times than this threshold counts
+    # the branches satisfied by these calls *WITHOUT* reordering.
+    for _ in range(7):
+        assert the_stream_of_life([{'To': 1}]) == ['Caverns of ice']
+    assert hits_param.hits_total == 7
+    assert hits_param.is_reordered is False
+    assert the_stream_of_life.__code__ is the_stream_of_life_code
+
+    # Assert that these calls only counted hits of the mapping branch.
+    hits_mapping_index = hits_param.get_branch_indices_by_hits()[0]
+    assert hits_param.hits[hits_mapping_index] == 7
+    assert hits_param.hint_branches[hits_mapping_index] == Dict[str, int]
+
+    # Assert that the call reaching this threshold regenerates this callable.
+    assert the_stream_of_life([{'and': 2}]) == ['Caverns of ice']
+    assert hits_param.is_reordered is True
+    assert all(hits.is_reordered for hits in union_hits)
+    assert the_stream_of_life.__code__ is not the_stream_of_life_code
+
+    # Assert that the regenerated callable no longer counts hits but still
+    # accepts objects satisfying any branch of these unions.
+    assert the_stream_of_life([0, [1], {'of': 2}]) == ['Caverns of ice'] * 3
+    assert hits_param.hits_total == 8
+
+    # Assert that other callables type-checking the same union remain
+    # unaffected by regenerating this callable.
+    assert through_the_ravine(0) == 0
+    assert union_hits_other[0].hits_total == 1
+    assert union_hits_other[0].is_reordered is False
+
+    # ..................{ FAIL                               }..................
+    # Assert that the regenerated callable still raises the expected exception
+    # when passed an object violating these unions.
+    with raises(BeartypeCallHintParamViolation):
+        the_stream_of_life(['Rolls its loud waters to the ocean-waves'])
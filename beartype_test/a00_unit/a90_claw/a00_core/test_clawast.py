@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2024 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Beartype **import hook abstract syntax tree (AST) transformer unit tests**
+(i.e., unit tests exercising the code injected into hooked modules by the
+:class:`beartype.claw._ast.clawastmain.BeartypeNodeTransformer` subclass).
+'''
+
+# ....................{ IMPORTS                            }....................
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+# WARNING: To raise human-readable test errors, avoid importing from
+# package-specific submodules at module scope.
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+
+# ....................{ TESTS                              }....................
+def test_claw_loop_sample() -> None:
+    '''
+    Test that the
+    :class:`beartype.claw._ast.clawastmain.BeartypeNodeTransformer` subclass
+    type-checks annotated variable assignments residing in loop bodies only on
+    the executions sampled by the :attr:`beartype.BeartypeConf.claw_loop_sample`
+    option.
+    '''
+
+    # Defer test-specific imports.
+    from ast import parse
+    from beartype import BeartypeConf
+    from beartype.claw._ast.clawastmain import BeartypeNodeTransformer
+    from beartype.claw._clawmagic import BEARTYPE_LOOP_COUNTS_VAR_NAME
+    from beartype.claw._clawstate import claw_state
+    from beartype.roar import BeartypeDoorHintViolation
+    from pytest import raises
+
+    # ....................{ LOCALS                         }....................
+    # Fully-qualified name of the fake module to be transformed.
+    MODULE_NAME = 'beartype_test.fake.claw_loop_sample'
+
+    # Beartype configuration type-checking annotated variable assignments in
+    # loop bodies only on the first two executions and every third execution.
+    CONF = BeartypeConf(claw_loop_sample=(2, 3))
+
+    # Source code of that module, defining a function whose loop body assigns
+    # each passed item to an annotated variable and a function assigning an
+    # annotated variable outside any loop.
+    CODE = '''
+def with_the_sweet_eyes(items):
+    for item in items:
+        a_pale_and_snowy_hand: int = item
+
+def and_the_frail_music(item):
+    that_she_made: int = item
+'''
+
+    # ....................{ PASS                           }....................
+    # Associate this configuration with this module *BEFORE* executing this
+    # module, as the code injected into this module accesses this association.
+    claw_state.module_name_to_beartype_conf[MODULE_NAME] = CONF
+
+    # Attempt to...
+    try:
+        # Transform this module with this configuration.
+        module_ast = BeartypeNodeTransformer(conf_beartype=CONF).visit(
+            parse(CODE))
+
+        # Execute this module.
+        module_globals = {'__name__': MODULE_NAME}
+        exec(compile(module_ast, MODULE_NAME, 'exec'), module_globals)
+        with_the_sweet_eyes = module_globals['with_the_sweet_eyes']
+        and_the_frail_music = module_globals['and_the_frail_music']
+
+        # Module-scoped list of loop sampling counters injected into this
+        # module, containing one counter for the single annotated variable
+        # assignment residing in a loop body of this module.
+        loop_counts = module_globals[BEARTYPE_LOOP_COUNTS_VAR_NAME]
+        assert loop_counts == [0]
+
+        # For each 1-based iteration of that loop...
+        for iteration in range(1, 10):
+            # Items to iterate over such that only this iteration violates the
+            # type hint annotating that assignment.
+            items = [0] * 9
+            items[iteration - 1] = 'In the calm darkness of the moonless nights'
+
+            # Reset this counter.
+            loop_counts[0] = 0
+
+            # If this iteration is sampled, assert that iterating over these
+            # items raises the expected exception.
+            if iteration <= 2 or not iteration % 3:
+                with raises(BeartypeDoorHintViolation):
+                    with_the_sweet_eyes(items)
+            # Else, this iteration is *NOT* sampled. In this case, assert that
+            # iterating over these items raises *NO* exception.
+            else:
+                with_the_sweet_eyes(items)
+
+        # Assert that annotated variable assignments residing outside loop
+        # bodies are type-checked on every execution.
+        for _ in range(5):
+            with raises(BeartypeDoorHintViolation):
+                and_the_frail_music('In lone and silent hours')
+    # Unconditionally dissociate this configuration from this module.
+    finally:
+        del claw_state.module_name_to_beartype_conf[MODULE_NAME]
+
+
+def test_claw_pep526_checkers() -> None:
+    '''
+    Test that the
+    :class:`beartype.claw._ast.clawastmain.BeartypeNodeTransformer` subclass
+    type-checks annotated variable assignments annotated by type hints
+    referring only to **stable names** (i.e., names bound at most once outside
+    any nested lexical scope or loop body) via module-scoped checkers shared
+    between all assignments annotated by the same type hint expression.
+    '''
+
+    # Defer test-specific imports.
+    from ast import parse
+    from beartype import BeartypeConf
+    from beartype.claw._ast.clawastmain import BeartypeNodeTransformer
+    from beartype.claw._clawmagic import BEARTYPE_PEP526_CHECKERS_VAR_NAME
+    from beartype.roar import BeartypeDoorHintViolation
+    from pytest import raises
+
+    # ....................{ LOCALS                         }....................
+    # Fully-qualified name of the fake module to be transformed.
+    MODULE_NAME = 'beartype_test.fake.claw_pep526_checkers'
+
+    # Source code of that module, defining functions assigning annotated
+    # variables annotated by two distinct type hint expressions referring only
+    # to stable names *AND* one type hint expression referring to an unstable
+    # name (i.e., a class local to a callable).
+    CODE = '''
+from beartype.typing import List
+
+def the_fountains_mingle(item):
+    with_the_river: int = item
+    and_the_rivers: List[int] = [item]
+
+def with_the_ocean(item):
+    the_winds_of_heaven: int = item
+
+def mix_for_ever(item):
+    class WithASweetEmotion(object): pass
+    nothing_in_the_world: WithASweetEmotion = item
+'''
+
+    # ....................{ PASS                           }....................
+    # Transform this module with the default configuration.
+    module_ast = BeartypeNodeTransformer(conf_beartype=BeartypeConf()).visit(
+        parse(CODE))
+
+    # Execute this module.
+    module_globals = {'__name__': MODULE_NAME}
+    exec(compile(module_ast, MODULE_NAME, 'exec'), module_globals)
+    the_fountains_mingle = module_globals['the_fountains_mingle']
+    with_the_ocean = module_globals['with_the_ocean']
+    mix_for_ever = module_globals['mix_for_ever']
+
+    # Module-scoped list of checkers injected into this module, containing one
+    # lazily created checker for each distinct type hint expression referring
+    # only to stable names. Since the star import of beartype-specific
+    # attributes injected into this module is *NOT* a stable name, this list
+    # existing at all implies that import to have been ignored.
+    checkers = module_globals[BEARTYPE_PEP526_CHECKERS_VAR_NAME]
+    assert checkers == [None, None]
+
+    # Assert that assignments satisfying these hints create these checkers.
+    the_fountains_mingle(0)
+    assert all(callable(checker) for checker in checkers)
+    checker_int = checkers[0]
+
+    # Assert that assignments annotated by the same hint expression share the
+    # same checker.
+    with_the_ocean(1)
+    assert checkers[0] is checker_int
+
+    # Assert that assignments violating these hints raise the expected
+    # exception.
+    with raises(BeartypeDoorHintViolation):
+        with_the_ocean('The winds of heaven mix for ever')
+
+    # Assert that assignments annotated by unstable names are still
+    # type-checked.
+    with raises(BeartypeDoorHintViolation):
+        mix_for_ever('Nothing in the world is single')
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2024 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Beartype **import hook precompiler unit tests** (i.e., unit tests exercising
+the :mod:`beartype.claw._clawcompile` submodule and the
+``python -m beartype.claw compile`` command-line interface).
+'''
+
+# ....................{ IMPORTS                            }....................
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+# WARNING: To raise human-readable test errors, avoid importing from
+# package-specific submodules at module scope.
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+
+# ....................{ TESTS                              }....................
+def test_claw_compile_packages(tmp_path, monkeypatch) -> None:
+    '''
+    Test the :func:`beartype.claw._clawcompile.compile_packages` function and
+    the ``python -m beartype.claw compile`` command-line interface wrapping
+    that function.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Temporary directory in which to create a fake package to precompile.
+    monkeypatch : pytest.MonkeyPatch
+        Fixture prepending that directory to :data:`sys.path`.
+    '''
+
+    # Defer test-specific imports.
+    from beartype.claw.__main__ import main
+    from beartype.claw._clawcompile import compile_packages
+    from beartype.claw._importlib.clawimpcache import (
+        cache_from_source_beartype)
+    from beartype.roar import BeartypeClawHookException
+    from pytest import raises
+
+    # ....................{ LOCALS                         }....................
+    # Fake package containing a subpackage, a syntactically valid submodule,
+    # and a syntactically invalid submodule.
+    package_dir = tmp_path / 'the_moon_arose'
+    subpackage_dir = package_dir / 'a_wandering_sail'
+    subpackage_dir.mkdir(parents=True)
+    package_init = package_dir / '__init__.py'
+    package_init.write_text('and_wave: int = 1\n')
+    (subpackage_dir / '__init__.py').write_text('')
+    submodule = subpackage_dir / 'the_clouds.py'
+    submodule.write_text(
+        'def of_darkness(and_stars: int) -> int:\n'
+        '    and_silver: int = and_stars\n'
+        '    return and_silver\n'
+    )
+    submodule_bad = package_dir / 'upon_the_sea.py'
+    submodule_bad.write_text('def (')
+
+    # Prepend this directory to the list of all importable directories.
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    # ....................{ PASS                           }....................
+    # Precompile this package in the active process.
+    module_name_to_error = compile_packages(
+        package_names=('the_moon_arose',), processes=1)
+
+    # Assert that all submodules of this package were found.
+    assert set(module_name_to_error) == {
+        'the_moon_arose',
+        'the_moon_arose.a_wandering_sail',
+        'the_moon_arose.a_wandering_sail.the_clouds',
+        'the_moon_arose.upon_the_sea',
+    }
+
+    # Assert that only the syntactically invalid submodule failed.
+    assert module_name_to_error['the_moon_arose'] is None
+    assert module_name_to_error[
+        'the_moon_arose.a_wandering_sail.the_clouds'] is None
+    assert 'SyntaxError' in module_name_to_error['the_moon_arose.upon_the_sea']
+
+    # Assert that beartype-specific bytecode files were written for all
+    # syntactically valid submodules.
+    for module_filename in (package_init, submodule):
+        pyc_filename = cache_from_source_beartype(str(module_filename))
+        assert (tmp_path / pyc_filename).is_file()
+
+    # Assert that precompiling this package in worker processes via our
+    # command-line interface returns the exit status signifying failure.
+    assert main(['compile', 'the_moon_arose', '--processes', '2', '-q']) == 1
+
+    # Assert that precompiling this package after removing the syntactically
+    # invalid submodule returns the exit status signifying success.
+    submodule_bad.unlink()
+    assert main(['compile', 'the_moon_arose', '-q']) == 0
+
+    # ....................{ FAIL                           }....................
+    # Assert that precompiling with invalid parameters raises the expected
+    # exceptions *AND* returns the exit status signifying invalid arguments.
+    with raises(BeartypeClawHookException):
+        compile_packages(package_names=('the_moon_arose',), processes=0)
+    with raises(BeartypeClawHookException):
+        compile_packages(
+            package_names=('the_moon_arose',),
+            conf_expr='Its peerless music, and the winds of heaven',
+        )
+    with raises(BeartypeClawHookException):
+        compile_packages(
+            package_names=('the_moon_arose',), conf_expr='len')
+    with raises(BeartypeClawHookException):
+        compile_packages(package_names=('beartype',))
+    assert main(['compile', 'the_moon_arose_in_the_gleaming_east']) == 2
+
+
+def test_claw_compile_pyc_hash(tmp_path, monkeypatch) -> None:
+    '''
+    Test that the :func:`beartype.claw._clawcompile.compile_packages` function
+    precompiles modules under beartype configurations enabling the
+    :attr:`beartype.BeartypeConf.claw_is_pyc_hash` option to :pep:`552`-compliant
+    checked hash-based bytecode files keyed on the source of those modules,
+    the version of :mod:`beartype`, and those configurations.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Temporary directory in which to create a fake module to precompile.
+    monkeypatch : pytest.MonkeyPatch
+        Fixture prepending that directory to :data:`sys.path` and enabling
+        bytecode files to be written.
+    '''
+
+    # Defer test-specific imports.
+    from beartype import BeartypeConf
+    from beartype.claw._clawcompile import compile_packages
+    from beartype.claw._importlib._clawimpload import BeartypeSourceFileLoader
+    from beartype.claw._importlib.clawimpcache import (
+        cache_from_source_beartype)
+    from beartype.claw._pkg._clawpkgmake import make_conf_hookable
+    from importlib.util import source_hash
+    from os import utime
+    import sys
+
+    # ....................{ LOCALS                         }....................
+    # Hookable beartype configuration enabling hash-based bytecode files.
+    CONF = make_conf_hookable(BeartypeConf(claw_is_pyc_hash=True))
+
+    # Fake module to be precompiled, whose source is subsequently modified
+    # *WITHOUT* modifying either its size or its modification time.
+    module_file = tmp_path / 'the_everlasting_universe.py'
+    module_file.write_text('of_things: int = 1\n')
+    utime(module_file, (0, 0))
+
+    # Prepend this directory to the list of all importable directories.
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    # Enable bytecode files to be written when recompiling that module below,
+    # regardless of the ${PYTHONDONTWRITEBYTECODE} environment variable.
+    monkeypatch.setattr(sys, 'dont_write_bytecode', False)
+
+    # Filename of the hash-based bytecode file precompiled from that module.
+    pyc_filename = cache_from_source_beartype(str(module_file), conf=CONF)
+
+    # Assert that this filename is uniquified by this configuration.
+    assert pyc_filename != cache_from_source_beartype(str(module_file))
+    assert pyc_filename != cache_from_source_beartype(
+        str(module_file), conf=BeartypeConf(
+            claw_is_pyc_hash=True, is_debug=True))
+
+    # ....................{ PASS                           }....................
+    # Precompile that module in the active process.
+    assert compile_packages(
+        package_names=('the_everlasting_universe',),
+        conf_expr='BeartypeConf(claw_is_pyc_hash=True)',
+        processes=1,
+    ) == {'the_everlasting_universe': None}
+
+    # Assert that a checked hash-based bytecode file keyed on the hash of that
+    # module's source was written.
+    pyc_data = (tmp_path / pyc_filename).read_bytes()
+    assert pyc_data[4:8] == (0b11).to_bytes(4, 'little')
+    assert pyc_data[8:16] == source_hash(module_file.read_bytes())
+
+    # Modify that module without modifying its size or modification time.
+    module_file.write_text('of_things: int = 2\n')
+    utime(module_file, (0, 0))
+
+    # Code object loaded from that module, which should have been recompiled
+    # from that modified source despite that unmodified modification time.
+    module_globals = {'__name__': 'the_everlasting_universe'}
+    exec(
+        BeartypeSourceFileLoader(
+            'the_everlasting_universe', str(module_file),
+        )._get_code_conf_beartype(
+            fullname='the_everlasting_universe', conf=CONF),
+        module_globals,
+    )
+    assert module_globals['of_things'] == 2
+
+    # Assert that the recompiled bytecode file remains hash-based *AND* keyed
+    # on the hash of that modified source.
+    pyc_data = (tmp_path / pyc_filename).read_bytes()
+    assert pyc_data[4:8] == (0b11).to_bytes(4, 'little')
+    assert pyc_data[8:16] == source_hash(module_file.read_bytes())
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2024 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Beartype **import hook profiler unit tests** (i.e., unit tests exercising the
+:mod:`beartype.claw._clawprofile` submodule).
+'''
+
+# ....................{ IMPORTS                            }....................
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+# WARNING: To raise human-readable test errors, avoid importing from
+# package-specific submodules at module scope.
+#!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+
+# ....................{ TESTS                              }....................
+def test_claw_profile_imports(tmp_path, monkeypatch) -> None:
+    '''
+    Test the public :func:`beartype.claw.profile_imports`,
+    :func:`beartype.claw.get_import_profiles`, and
+    :func:`beartype.claw.format_import_profiles` functions.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Temporary directory in which to create a fake module to be profiled.
+    monkeypatch : pytest.MonkeyPatch
+        Fixture setting the ``${BEARTYPE_CLAW_PROFILE}`` environment variable.
+    '''
+
+    # Defer test-specific imports.
+    from beartype import BeartypeConf
+    from beartype.claw import (
+        format_import_profiles,
+        get_import_profiles,
+        profile_imports,
+    )
+    from beartype.claw._clawprofile import profile_imports_if_shell_var
+    from beartype.claw._clawstate import claw_state
+    from beartype.claw._importlib._clawimpload import BeartypeSourceFileLoader
+    from beartype.roar import BeartypeClawHookException
+    from json import loads
+    from pytest import raises
+
+    # ....................{ LOCALS                         }....................
+    # Fully-qualified name of the fake module to be profiled.
+    MODULE_NAME = 'beartype_test.fake.claw_profile_imports'
+
+    # Fake module defining two typed functions, one untyped function, and one
+    # class to be decorated by @beartype.
+    module_file = tmp_path / 'claw_profile_imports.py'
+    module_file.write_text(
+        'def a_lovely_youth(no_mourning_maiden: str) -> str:\n'
+        '    return no_mourning_maiden\n'
+        '\n'
+        'def decked_with(no_mourning_maiden: str) -> str:\n'
+        '    return no_mourning_maiden\n'
+        '\n'
+        'def neither_typed(nor_decorated):\n'
+        '    return nor_decorated\n'
+        '\n'
+        'class Gentle(object):\n'
+        '    def and_brave(self, and_generous: int) -> int:\n'
+        '        return and_generous\n'
+    )
+
+    # ....................{ PASS                           }....................
+    # Assert that no profiles are recorded before enabling the profiler.
+    assert get_import_profiles() == []
+
+    # Attempt to...
+    try:
+        # Enable the profiler *WITHOUT* printing profiles at exit.
+        profile_imports(dump_format=None)
+
+        # Associate the default configuration with that module *BEFORE*
+        # compiling and executing that module.
+        claw_state.module_name_to_beartype_conf[MODULE_NAME] = BeartypeConf()
+
+        # Compile and execute that module under a beartype import hook.
+        module_code = BeartypeSourceFileLoader(
+            MODULE_NAME, str(module_file))._get_code_conf_beartype(
+                fullname=MODULE_NAME, conf=BeartypeConf())
+        exec(module_code, {'__name__': MODULE_NAME})
+
+        # Assert that exactly one profile describing that module was recorded.
+        module_profiles = get_import_profiles()
+        assert len(module_profiles) == 1
+        module_profile = module_profiles[0]
+        assert module_profile.module_name == MODULE_NAME
+
+        # Assert that this profile records the expected overhead.
+        assert module_profile.source_to_code_time > 0
+        assert 0 < module_profile.transform_time <= (
+            module_profile.source_to_code_time)
+        assert module_profile.decorate_time > 0
+        assert module_profile.decorate_callables == 2
+        assert module_profile.decorate_classes == 1
+        assert module_profile.total_time == (
+            module_profile.source_to_code_time + module_profile.decorate_time)
+
+        # Assert that formatting these profiles as text and JSON embeds that
+        # module.
+        assert MODULE_NAME in format_import_profiles()
+        assert loads(format_import_profiles('json')) == [
+            module_profile.to_dict()]
+
+        # ....................{ FAIL                       }....................
+        # Assert that passing an invalid format raises the expected exception.
+        with raises(BeartypeClawHookException):
+            profile_imports(dump_format='The fire of those soft orbs')
+        with raises(BeartypeClawHookException):
+            format_import_profiles('has ceased to burn')
+
+        # Assert that setting the ${BEARTYPE_CLAW_PROFILE} environment variable
+        # to an invalid format raises the expected exception.
+        monkeypatch.setenv('BEARTYPE_CLAW_PROFILE', 'xml')
+        with raises(BeartypeClawHookException):
+            profile_imports_if_shell_var()
+    # Unconditionally disable the profiler and dissociate that configuration.
+    finally:
+        claw_state.module_name_to_profile = None
+        claw_state.profile_dump_format = None
+        claw_state.module_name_to_beartype_conf.pop(MODULE_NAME, None)
@@ -51,6 +51,66 @@ with raises(BeartypeDoorHintViolation):
     of_starry_ice: Union[float, List[str]] = len(
         'Of starry ice the grey grass and bare boughs;')
 
+# ....................{ FUNCTIONS                          }....................
+def and_the_frail_music(lines: List[object]) -> int:
+    '''
+    Function repeatedly type-checking PEP 526-compliant annotated assignment
+    statements annotated by the same type hints, exercising the checkers cached
+    by the import hook for these type hints.
+    '''
+
+    # Total number of characters in these lines.
+    len_total: int = 0
+
+    # For each passed line, type-check that line as a string.
+    for line in lines:
+        line_str: str = line
+        len_line: int = len(line_str)
+        len_total: int = len_total + len_line
+
+    # Return this total.
+    return len_total
+
+
+def of_your_own_heart(line: object) -> object:
+    '''
+    Function type-checking a PEP 526-compliant annotated assignment statement
+    annotated by a class local to this function, exercising the import hook's
+    fallback for type hints referring to local attributes.
+    '''
+
+    # Class local to this function, redefined on each call to this function.
+    class YourOwnHeart(object): pass
+
+    # Object annotated by this class.
+    your_own_heart: YourOwnHeart = (
+        YourOwnHeart() if line is None else line)
+
+    # Return this object.
+    return your_own_heart
+
+
+# Assert that repeatedly calling a function containing annotated assignments
+# satisfying their type hints raises *NO* exception.
+assert and_the_frail_music(['Thou', 'hast']) == 8
+assert and_the_frail_music(['a', 'voice']) == 6
+
+# Assert that calling that function with an object violating one of those type
+# hints raises the expected exception *AFTER* the checkers type-checking those
+# assignments have already been created and cached.
+with raises(BeartypeDoorHintViolation):
+    and_the_frail_music(['great', b'Mountain'])
+
+# Assert that repeatedly calling a function containing an annotated assignment
+# annotated by a local class satisfying that class raises *NO* exception, even
+# though that class differs on each call.
+assert of_your_own_heart(None) is not of_your_own_heart(None)
+
+# Assert that calling that function with an object violating that class raises
+# the expected exception.
+with raises(BeartypeDoorHintViolation):
+    of_your_own_heart('to repeal')
+
 # ....................{ CLASSES                            }....................
 class ThePausesOfHerMusic(object):
     and_her_breath: int = 'The pauses of her music, and her breath'
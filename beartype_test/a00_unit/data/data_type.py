@@ -441,6 +441,29 @@ def closure_cell_factory():
     # Return this closure's first and only cell variable.
     return closure.__closure__[0]
 
+# ....................{ CALLABLES ~ sync : class           }....................
+def class_local_factory() -> type:
+    '''
+    Arbitrary pure-Python class factory function, returning a new class local
+    to this function on each call.
+
+    All classes returned by this function share the same fully-qualified name
+    and thus the same machine-readable representation, but are distinct and
+    thus unequal. Type hints subscripted by these classes thus also share the
+    same machine-readable representation but are unequal (e.g.,
+    ``list[class_local_factory()]``).
+    '''
+
+    class ClassLocal(object):
+        '''
+        Arbitrary pure-Python class local to this function.
+        '''
+
+        pass
+
+    # Return this class.
+    return ClassLocal
+
 # ....................{ CALLABLES ~ sync : instance        }....................
 sync_generator = sync_generator_factory()
 '''
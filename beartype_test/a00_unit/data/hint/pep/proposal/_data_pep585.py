@@ -49,12 +49,14 @@ def hints_pep585_meta() -> 'List[HintPepMetadata]':
         HintSignCallable,
         HintSignContextManager,
         HintSignDict,
+        HintSignFrozenSet,
         HintSignGeneric,
         HintSignList,
         HintSignMatch,
         HintSignMutableSequence,
         HintSignPattern,
         HintSignSequence,
+        HintSignSet,
         HintSignTuple,
         HintSignType,
     )
@@ -290,6 +292,27 @@ def hints_pep585_meta() -> 'List[HintPepMetadata]':
                 # String constant.
                 HintPithUnsatisfiedMetadata(
                     'To that beep‐prattling, LED‐ and lead-rattling crux'),
+                # Dictionary containing exactly one pair whose key violates
+                # this hint. Since dictionary pairs are only randomly
+                # type-checked, only a dictionary of exactly one pair enables
+                # us to match the explicit key at fault below.
+                HintPithUnsatisfiedMetadata(
+                    pith={'Tax‐bracketed': 'lives'},
+                    # Match that the exception message raised for this object
+                    # declares the key of a random pair *NOT* satisfying this
+                    # hint.
+                    exception_str_match_regexes=(r'\b[Dd]ict key str\b',),
+                ),
+                # Dictionary containing exactly one pair whose value violates
+                # this hint.
+                HintPithUnsatisfiedMetadata(
+                    pith={0xBEEF: b'Undeleted, yet deadlined'},
+                    # Match that the exception message raised for this object
+                    # declares the key of a random pair whose value does *NOT*
+                    # satisfy this hint.
+                    exception_str_match_regexes=(
+                        r'\b[Dd]ict key 48879 value bytes\b',),
+                ),
             ),
         ),
 
@@ -651,6 +674,53 @@ def hints_pep585_meta() -> 'List[HintPepMetadata]':
             ),
         ),
 
+        # ................{ SET                                }................
+        # Flat set.
+        HintPepMetadata(
+            hint=set[int],
+            pep_sign=HintSignSet,
+            isinstanceable_type=set,
+            is_pep585_builtin_subscripted=True,
+            piths_meta=(
+                # Set of integer constants.
+                HintPithSatisfiedMetadata({0xDEAD, 0xBEEF, 0xCAFE}),
+                # String constant.
+                HintPithUnsatisfiedMetadata('Unsettled, unsettling settlers'),
+                # Set containing exactly one item violating this hint. Since
+                # set items are only sampled one at a time, only a set of
+                # exactly one item enables us to match the item at fault below.
+                HintPithUnsatisfiedMetadata(
+                    pith={'Sediment‐sifted sentiments'},
+                    # Match that the exception message raised for this object
+                    # declares the type of the item *NOT* satisfying this hint.
+                    exception_str_match_regexes=(r'\bset item str\b',),
+                ),
+            ),
+        ),
+
+        # Frozen set.
+        HintPepMetadata(
+            hint=frozenset[str],
+            pep_sign=HintSignFrozenSet,
+            isinstanceable_type=frozenset,
+            is_pep585_builtin_subscripted=True,
+            piths_meta=(
+                # Frozen set of string constants.
+                HintPithSatisfiedMetadata(frozenset((
+                    'Frost‐bitten', 'frozen‐footed', 'fro‐and‐to'))),
+                # Mutable set of string constants.
+                HintPithUnsatisfiedMetadata({'Thawed', 'and thewed'}),
+                # Frozen set containing exactly one item violating this hint.
+                HintPithUnsatisfiedMetadata(
+                    pith=frozenset((b'Bytes of ice',)),
+                    # Match that the exception message raised for this object
+                    # declares the type of the item *NOT* satisfying this hint.
+                    exception_str_match_regexes=(
+                        r'\bfrozenset item bytes\b',),
+                ),
+            ),
+        ),
+
         # ................{ SUBCLASS                           }................
         # Any type, semantically equivalent under PEP 484 to the unsubscripted
         # "Type" singleton.
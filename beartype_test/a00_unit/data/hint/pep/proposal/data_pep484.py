@@ -43,6 +43,7 @@ from beartype_test.a00_unit.data.data_type import (
 from collections.abc import (
     Callable as CallableABC,
     Hashable as HashableABC,
+    KeysView as KeysViewABC,
     MutableSequence as MutableSequenceABC,
     Sequence as SequenceABC,
     Sized as SizedABC,
@@ -60,12 +61,14 @@ from typing import (
     Hashable,
     IO,
     Iterable,
+    KeysView,
     List,
     Match,
     MutableSequence,
     NewType,
     Pattern,
     Sequence,
+    Set,
     Sized,
     TextIO,
     Tuple,
@@ -282,6 +285,7 @@ def hints_pep484_meta() -> 'List[HintPepMetadata]':
         HintSignForwardRef,
         HintSignGeneric,
         HintSignHashable,
+        HintSignKeysView,
         HintSignList,
         HintSignMatch,
         HintSignMutableSequence,
@@ -290,6 +294,7 @@ def hints_pep484_meta() -> 'List[HintPepMetadata]':
         HintSignOptional,
         HintSignPattern,
         HintSignSequence,
+        HintSignSet,
         HintSignSized,
         HintSignTuple,
         HintSignType,
@@ -594,6 +599,27 @@ def hints_pep484_meta() -> 'List[HintPepMetadata]':
                 # String constant.
                 HintPithUnsatisfiedMetadata(
                     'To that beep‐prattling, LED‐ and lead-rattling crux'),
+                # Dictionary containing exactly one pair whose key violates
+                # this hint. Since dictionary pairs are only randomly
+                # type-checked, only a dictionary of exactly one pair enables
+                # us to match the explicit key at fault below.
+                HintPithUnsatisfiedMetadata(
+                    pith={'Tax‐bracketed': 'lives'},
+                    # Match that the exception message raised for this object
+                    # declares the key of a random pair *NOT* satisfying this
+                    # hint.
+                    exception_str_match_regexes=(r'\b[Dd]ict key str\b',),
+                ),
+                # Dictionary containing exactly one pair whose value violates
+                # this hint.
+                HintPithUnsatisfiedMetadata(
+                    pith={0xBEEF: b'Undeleted, yet deadlined'},
+                    # Match that the exception message raised for this object
+                    # declares the key of a random pair whose value does *NOT*
+                    # satisfy this hint.
+                    exception_str_match_regexes=(
+                        r'\b[Dd]ict key 48879 value bytes\b',),
+                ),
             ),
         ),
 
@@ -1068,6 +1094,55 @@ def hints_pep484_meta() -> 'List[HintPepMetadata]':
             ),
         ),
 
+        # ................{ SET                                }................
+        # Flat set.
+        HintPepMetadata(
+            hint=Set[str],
+            pep_sign=HintSignSet,
+            isinstanceable_type=set,
+            piths_meta=(
+                # Set of string constants.
+                HintPithSatisfiedMetadata({
+                    'Upset, reset,', 'and offset', 'by onsets of unrest'}),
+                # Frozen set of string constants.
+                HintPithUnsatisfiedMetadata(frozenset((
+                    'Set in stone', 'and stonily set',))),
+                # Set containing exactly one item violating this hint. Since
+                # set items are only sampled one at a time, only a set of
+                # exactly one item enables us to match the item at fault below.
+                HintPithUnsatisfiedMetadata(
+                    pith={0xFACADE},
+                    # Match that the exception message raised for this object
+                    # declares the type of the item *NOT* satisfying this hint.
+                    exception_str_match_regexes=(r'\bset item int\b',),
+                ),
+            ),
+        ),
+
+        # ................{ SET ~ view                         }................
+        # Dictionary keys view.
+        HintPepMetadata(
+            hint=KeysView[str],
+            pep_sign=HintSignKeysView,
+            isinstanceable_type=KeysViewABC,
+            piths_meta=(
+                # Keys view of a dictionary mapping string keys.
+                HintPithSatisfiedMetadata({
+                    'Key‐less': 'keepers', 'of keyed': 'keeps'}.keys()),
+                # Values view of a dictionary mapping string values.
+                HintPithUnsatisfiedMetadata({
+                    'Valueless': 'valuations'}.values()),
+                # Keys view of a dictionary containing exactly one key
+                # violating this hint.
+                HintPithUnsatisfiedMetadata(
+                    pith={b'Keyed up': 'and locked down'}.keys(),
+                    # Match that the exception message raised for this object
+                    # declares the type of the item *NOT* satisfying this hint.
+                    exception_str_match_regexes=(r'\bitem bytes\b',),
+                ),
+            ),
+        ),
+
         # ................{ SUBCLASS                           }................
         # Unsubscripted "Type" singleton.
         HintPepMetadata(
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2024 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Call-time benchmark measuring the time consumed by each call to callables
+decorated by the :func:`beartype.beartype` decorator and annotated by container
+type hints requiring a pseudo-random integer to deeply type-check a randomly
+indexed container item.
+
+This benchmark reports the fastest time per call to each such decorated
+callable, the same time for the equivalent undecorated callable, and the
+difference between the two (i.e., the per-call overhead of type-checking).
+
+This benchmark then reports the fastest time per item consumed by callables
+decorated under the linear-time :attr:`beartype.BeartypeStrategy.On` strategy
+and annotated by sequence type hints, alongside the same time for a
+hand-written :func:`isinstance` loop type-checking the same items.
+
+Usage
+-----
+.. code-block:: bash
+
+   $ python3 bin/benchmark_call.py
+   $ python3 bin/benchmark_call.py 2000000
+'''
+
+# ....................{ IMPORTS                            }....................
+from beartype import (
+    BeartypeConf,
+    BeartypeStrategy,
+    beartype,
+)
+from beartype.typing import (
+    Dict,
+    List,
+    Tuple,
+)
+from sys import argv
+from timeit import repeat
+
+# ....................{ CONSTANTS                          }....................
+CALLS_DEFAULT = 1_000_000
+'''
+Default number of calls to each callable per repetition.
+'''
+
+
+REPEATS = 7
+'''
+Number of times each callable is benchmarked, of which only the fastest time
+is reported to minimize noise.
+'''
+
+
+HINT_NAME_TO_HINT_PITH: Dict[str, Tuple[object, object]] = {
+    'list[int]': (List[int], list(range(16))),
+    'list[list[int]]': (List[List[int]], [list(range(16))] * 16),
+    'dict[str, list[int]]': (
+        Dict[str, List[int]], {str(index): [index] for index in range(16)}),
+}
+'''
+Dictionary mapping from the machine-readable representation of each type hint
+to be benchmarked to a 2-tuple ``(hint, pith)`` of that hint and an object
+satisfying that hint to be passed to callables annotated by that hint.
+'''
+
+
+ON_CALLS = 100
+'''
+Number of calls to each callable per repetition under the linear-time
+:attr:`beartype.BeartypeStrategy.On` strategy.
+'''
+
+
+ON_ITEMS_LEN = 100_000
+'''
+Number of items of each sequence passed to callables under the linear-time
+:attr:`beartype.BeartypeStrategy.On` strategy.
+'''
+
+
+ON_HINT_NAME_TO_HINT_PITH: Dict[str, Tuple[object, object]] = {
+    'list[int]': (List[int], list(range(ON_ITEMS_LEN))),
+    'list[list[int]]': (List[List[int]], [[index] for index in range(
+        ON_ITEMS_LEN)]),
+}
+'''
+Dictionary mapping from the machine-readable representation of each type hint
+to be benchmarked under the linear-time :attr:`beartype.BeartypeStrategy.On`
+strategy to a 2-tuple ``(hint, pith)`` of that hint and a large sequence
+satisfying that hint.
+'''
+
+# ....................{ BENCHMARKS                         }....................
+def benchmark(func, pith: object, calls: int) -> float:
+    '''
+    Fastest time in nanoseconds consumed by each call to the passed callable
+    passed the passed object.
+    '''
+
+    # Return the fastest time per call.
+    return min(repeat(
+        'func(pith)',
+        globals={'func': func, 'pith': pith},
+        number=calls,
+        repeat=REPEATS,
+    )) / calls * 1e9
+
+
+def main() -> None:
+    '''
+    Run this benchmark with the number of calls passed as the first
+    command-line argument if any *or* the default number otherwise, printing
+    one line per hint.
+    '''
+
+    # Number of calls to each callable per repetition.
+    calls = int(argv[1]) if len(argv) > 1 else CALLS_DEFAULT
+
+    print(f'{"hint":<24} {"nsec":>8} {"nsec/raw":>10} {"overhead":>10}')
+
+    # For each hint to be benchmarked...
+    for hint_name, (hint, pith) in HINT_NAME_TO_HINT_PITH.items():
+        # Undecorated callable annotated by this hint.
+        def func(arg):
+            return arg
+        func.__annotations__ = {'arg': hint}
+
+        # Time calling this callable both undecorated and decorated.
+        time_raw = benchmark(func, pith, calls)
+        time_checked = benchmark(beartype(func), pith, calls)
+
+        # Print these times.
+        print(
+            f'{hint_name:<24} {time_checked:>8.1f} {time_raw:>10.1f} '
+            f'{time_checked - time_raw:>10.1f}'
+        )
+
+    # Linear-time beartype decorator.
+    beartype_on = beartype(conf=BeartypeConf(strategy=BeartypeStrategy.On))
+
+    print()
+    print(f'{"hint (On)":<24} {"nsec/item":>10} {"isinstance":>10}')
+
+    # For each hint to be benchmarked under the linear-time strategy...
+    for hint_name, (hint, pith) in ON_HINT_NAME_TO_HINT_PITH.items():
+        # Undecorated callable annotated by this hint.
+        def func(arg):
+            return arg
+        func.__annotations__ = {'arg': hint}
+
+        # Hand-written loop type-checking the same items as the decorated
+        # callable, localizing the item type to be checked.
+        if hint_name == 'list[int]':
+            def func_loop(arg, cls=int):
+                for item in arg:
+                    if not isinstance(item, cls):
+                        raise TypeError(item)
+                return arg
+        else:
+            def func_loop(arg, cls_outer=list, cls=int):
+                for item in arg:
+                    if not isinstance(item, cls_outer):
+                        raise TypeError(item)
+                    for item_item in item:
+                        if not isinstance(item_item, cls):
+                            raise TypeError(item_item)
+                return arg
+
+        # Time calling both callables, normalized to the time per item.
+        pith_len = len(pith)
+        time_checked = benchmark(beartype_on(func), pith, ON_CALLS) / pith_len
+        time_loop = benchmark(func_loop, pith, ON_CALLS) / pith_len
+
+        # Print these times.
+        print(f'{hint_name:<24} {time_checked:>10.2f} {time_loop:>10.2f}')
+
+
+# ....................{ MAIN                               }....................
+if __name__ == '__main__':
+    main()
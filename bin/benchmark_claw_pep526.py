@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2024 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Call-time benchmark measuring the time consumed by :pep:`526`-compliant
+annotated variable assignments type-checked by :mod:`beartype.claw` import hooks
+in tight loops.
+
+This benchmark transforms the same function containing annotated assignments in
+a loop with the :mod:`beartype.claw` abstract syntax tree (AST) transformer,
+then reports the fastest time per loop iteration of:
+
+* The untransformed function (i.e., *no* type-checking).
+* That function transformed to type-check each assignment by calling the
+  :func:`beartype.door.die_if_unbearable` raiser (i.e., the prior approach).
+* That function transformed by the current :mod:`beartype.claw` AST transformer
+  (i.e., type-checking each assignment by calling a cached checker).
+* That function transformed by that transformer under the
+  :attr:`beartype.BeartypeConf.claw_loop_sample` option (i.e., type-checking
+  each assignment only on the first :data:`LOOP_SAMPLE` sampled iterations).
+
+Usage
+-----
+.. code-block:: bash
+
+   $ python3 bin/benchmark_claw_pep526.py
+   $ python3 bin/benchmark_claw_pep526.py 200000
+'''
+
+# ....................{ IMPORTS                            }....................
+from ast import (
+    NodeTransformer,
+    parse,
+)
+from beartype import BeartypeConf
+from beartype.claw._ast.clawastmain import BeartypeNodeTransformer
+from beartype.claw._clawmagic import BEARTYPE_RAISER_FUNC_NAME
+from beartype.claw._clawstate import claw_state
+from beartype._util.ast.utilastmake import (
+    make_node_call_expr,
+    make_node_name_load,
+)
+from sys import argv
+from timeit import repeat
+
+# ....................{ CONSTANTS                          }....................
+ITERATIONS_DEFAULT = 100_000
+'''
+Default number of loop iterations performed by each function per repetition.
+'''
+
+
+LOOP_SAMPLE = (100, 100)
+'''
+Loop sampling schedule benchmarked under the
+:attr:`beartype.BeartypeConf.claw_loop_sample` option.
+'''
+
+
+MODULE_NAME = 'benchmark_claw_pep526'
+'''
+Fully-qualified name of the fake module defining the function to be benchmarked.
+'''
+
+
+REPEATS = 7
+'''
+Number of times each function is benchmarked, of which only the fastest time
+is reported to minimize noise.
+'''
+
+
+CODE = '''
+from beartype.typing import Dict, List
+
+def loop(iterations):
+    for index in range(iterations):
+        count: int = index
+        name: str = 'index'
+        items: List[int] = [index]
+        mapping: Dict[str, int] = {name: count}
+'''
+'''
+Source code of the module defining the function to be benchmarked, containing
+four annotated assignments annotated by four distinct type hints in a loop.
+'''
+
+# ....................{ CLASSES                            }....................
+class _Pep526RaiserNodeTransformer(NodeTransformer):
+    '''
+    AST transformer appending each annotated assignment with a call to the
+    :func:`beartype.door.die_if_unbearable` raiser passed the annotated
+    variable and annotating type hint, reproducing the output of the
+    :mod:`beartype.claw` AST transformer *before* that transformer cached
+    checkers for annotated assignments.
+    '''
+
+    def visit_AnnAssign(self, node):
+        return [node, make_node_call_expr(
+            func_name=BEARTYPE_RAISER_FUNC_NAME,
+            nodes_args=[
+                make_node_name_load(name=node.target.id, node_sibling=node),
+                node.annotation,
+            ],
+            nodes_kwargs=[],
+            node_sibling=node,
+        )]
+
+# ....................{ BENCHMARKS                         }....................
+def make_loop(node_transformer):
+    '''
+    Function defined by the :data:`CODE` module transformed by the passed AST
+    transformer if any *or* untransformed otherwise.
+    '''
+
+    # AST of this module transformed by this transformer.
+    node_module = parse(CODE)
+    if node_transformer is not None:
+        node_module = node_transformer.visit(node_module)
+
+    # Module namespace, importing beartype-specific attributes required by
+    # calls appended by the above transformer.
+    module_globals = {'__name__': MODULE_NAME}
+    exec('from beartype.claw._ast._clawaststar import *', module_globals)
+    exec(compile(node_module, '<benchmark>', 'exec'), module_globals)
+
+    # Return this function.
+    return module_globals['loop']
+
+
+def benchmark(func, iterations: int) -> float:
+    '''
+    Fastest time in nanoseconds consumed by each loop iteration of the passed
+    function.
+    '''
+
+    # Warm up any checkers lazily created by the first iteration.
+    func(1)
+
+    # Return the fastest time per iteration.
+    return min(repeat(
+        'func(iterations)',
+        globals={'func': func, 'iterations': iterations},
+        number=1,
+        repeat=REPEATS,
+    )) / iterations * 1e9
+
+
+def main() -> None:
+    '''
+    Run this benchmark with the number of loop iterations passed as the first
+    command-line argument if any *or* the default number otherwise.
+    '''
+
+    # Number of loop iterations per repetition.
+    iterations = int(argv[1]) if len(argv) > 1 else ITERATIONS_DEFAULT
+
+    # Time each variant of this function.
+    time_raw = benchmark(make_loop(None), iterations)
+    time_raiser = benchmark(
+        make_loop(_Pep526RaiserNodeTransformer()), iterations)
+    time_cached = benchmark(
+        make_loop(BeartypeNodeTransformer(conf_beartype=BeartypeConf())),
+        iterations,
+    )
+
+    # Associate the non-default configuration sampling loops with this module,
+    # as the code injected into this module accesses this association.
+    conf_sampled = BeartypeConf(claw_loop_sample=LOOP_SAMPLE)
+    claw_state.module_name_to_beartype_conf[MODULE_NAME] = conf_sampled
+    time_sampled = benchmark(
+        make_loop(BeartypeNodeTransformer(conf_beartype=conf_sampled)),
+        iterations,
+    )
+
+    # Print these times.
+    print(f'{"variant":<24} {"nsec/iter":>10} {"overhead":>10}')
+    for variant_name, time_variant in (
+        ('unchecked', time_raw),
+        ('die_if_unbearable', time_raiser),
+        ('cached checkers', time_cached),
+        (f'sampled {LOOP_SAMPLE}', time_sampled),
+    ):
+        print(
+            f'{variant_name:<24} {time_variant:>10.1f} '
+            f'{time_variant - time_raw:>10.1f}'
+        )
+
+
+# ....................{ MAIN                               }....................
+if __name__ == '__main__':
+    main()
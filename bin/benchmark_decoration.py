@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2024 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Decoration-time benchmark measuring the time consumed by the
+:func:`beartype.beartype` decorator to decorate callables annotated by
+increasingly large nested type hints.
+
+This benchmark exercises the type-checking code generator (i.e., the
+:func:`beartype._check.code.codemake.make_check_expr` factory) against wide
+and nested fixed-length tuple and union hints whose hint trees grow linearly
+with the passed sizes. Each hint is freshly created from unique classes,
+defeating the memoization of that generator. If decoration time scales linearly
+with hint-tree size, the final "usec/hint" column remains roughly constant.
+
+Usage
+-----
+.. code-block:: bash
+
+   $ python3 bin/benchmark_decoration.py
+   $ python3 bin/benchmark_decoration.py 16 32 64 128 256 512
+'''
+
+# ....................{ IMPORTS                            }....................
+from beartype import beartype
+from beartype.typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+from sys import argv
+from time import perf_counter
+
+# ....................{ CONSTANTS                          }....................
+SIZES_DEFAULT = (8, 16, 32, 64, 128, 256)
+'''
+Default sizes (i.e., number of items of each generated fixed-length tuple hint
+and number of members of each generated union hint) to be benchmarked.
+'''
+
+
+REPEATS = 5
+'''
+Number of times each size is benchmarked, of which only the fastest time is
+reported to minimize noise.
+'''
+
+# ....................{ FACTORIES                          }....................
+def make_hint_tuple(size: int) -> Tuple[object, int]:
+    '''
+    2-tuple ``(hint, hints_len)`` of a new fixed-length tuple hint whose passed
+    number of items are each annotated by a nested optional union of unique
+    classes and the number of hints in the hint tree of that tuple hint.
+    '''
+
+    # Unique classes defeating memoization.
+    classes = [type(f'Class{index}', (), {}) for index in range(2 * size)]
+
+    # Create and return this hint and its hint-tree size. Each item is
+    # annotated by a 7-hint tree: "Dict", "str", "List", "Optional" (i.e., a
+    # union also containing "None"), and two unique classes.
+    return Tuple[tuple(
+        Dict[str, List[Optional[Union[classes[2 * index], classes[2 * index + 1]]]]]
+        for index in range(size)
+    )], 7 * size + 1
+
+
+def make_hint_union(size: int) -> Tuple[object, int]:
+    '''
+    2-tuple ``(hint, hints_len)`` of a new union hint whose passed number of
+    members are each a nested list of mappings of unique classes and the
+    number of hints in the hint tree of that union hint.
+    '''
+
+    # Unique classes defeating memoization.
+    classes = [type(f'Class{index}', (), {}) for index in range(size)]
+
+    # Create and return this hint and its hint-tree size. Each member is a
+    # 4-hint tree: "List", "Dict", "str", and a unique class.
+    return Union[tuple(
+        List[Dict[str, classes[index]]]  # type: ignore[valid-type]
+        for index in range(size)
+    )], 4 * size + 1
+
+# ....................{ BENCHMARKS                         }....................
+def benchmark(make_hint, size: int) -> Tuple[float, int]:
+    '''
+    2-tuple ``(time, hints_len)`` of the fastest time in seconds consumed by
+    the :func:`beartype.beartype` decorator to decorate a callable annotated by
+    the hint created by the passed factory for the passed size and the number
+    of hints in the hint tree of that hint.
+    '''
+
+    # Fastest time consumed by decoration.
+    time_best = float('inf')
+
+    # Number of hints in the hint tree of that hint.
+    hints_len = 0
+
+    # For each repetition...
+    for _ in range(REPEATS):
+        # New hint, defeating memoization.
+        hint, hints_len = make_hint(size)
+
+        # Undecorated callable annotated by this hint.
+        def func(arg):
+            return arg
+        func.__annotations__ = {'arg': hint, 'return': hint}
+
+        # Time decorating this callable.
+        time_start = perf_counter()
+        beartype(func)
+        time_best = min(time_best, perf_counter() - time_start)
+
+    # Return this time and size.
+    return time_best, hints_len
+
+
+def main() -> None:
+    '''
+    Run this benchmark against the sizes passed as command-line arguments if
+    any *or* the default sizes otherwise, printing one line per size.
+    '''
+
+    # Sizes to be benchmarked.
+    sizes = tuple(int(arg) for arg in argv[1:]) or SIZES_DEFAULT
+
+    # For each hint factory...
+    for make_hint in (make_hint_tuple, make_hint_union):
+        print(f'{make_hint.__name__}:')
+        print(f'{"size":>8} {"hints":>8} {"msec":>10} {"usec/hint":>10}')
+
+        # For each size, benchmark and print decoration time.
+        for size in sizes:
+            time_best, hints_len = benchmark(make_hint, size)
+            print(
+                f'{size:>8} {hints_len:>8} {time_best * 1e3:>10.2f} '
+                f'{time_best * 1e6 / hints_len:>10.2f}'
+            )
+        print()
+
+
+# ....................{ MAIN                               }....................
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2024 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Memory benchmark measuring the space and time consumed by the type-checking
+functions generated by the :func:`beartype.door.is_bearable` tester and
+:func:`beartype.door.die_if_unbearable` raiser for **unequal but equivalent
+type hints** (i.e., type hints that are unequal as is but sanified into the
+same type hint, like the tuple union ``(MuhClass, int)`` and the
+:pep:`484`-compliant union ``Union[MuhClass, int]``), both with and without
+interning these hints.
+
+This benchmark simulates a large codebase declaring many classes, each
+type-checked against several equivalent hints spelled differently in different
+modules. Each variant runs in a fresh subprocess, isolating the caches and
+memory of each variant from the other. This benchmark then reports for each
+variant:
+
+* The number of distinct type-checking functions generated.
+* The memory allocated while generating and retaining those functions, as
+  traced by the standard :mod:`tracemalloc` module.
+* The time consumed to generate those functions.
+
+The "interned" variant is the default behaviour. The "uninterned" variant
+disables interning by bounding the cache of type-checking functions keyed on
+sanified hints (i.e., the
+:data:`beartype._check.checkmake._hint_sane_key_to_func_checker` dictionary) to
+zero entries, forcing each unequal hint to generate its own function.
+
+Usage
+-----
+.. code-block:: bash
+
+   $ python3 bin/benchmark_interning.py
+   $ python3 bin/benchmark_interning.py 1000
+'''
+
+# ....................{ IMPORTS                            }....................
+from subprocess import run
+from sys import (
+    argv,
+    executable,
+)
+
+# ....................{ CONSTANTS                          }....................
+CLASSES_LEN_DEFAULT = 300
+'''
+Default number of classes type-checked against equivalent type hints.
+'''
+
+
+VARIANT_NAMES = ('interned', 'uninterned')
+'''
+Tuple of the names of all variants of this benchmark, each run in a fresh
+subprocess.
+'''
+
+# ....................{ BENCHMARKS                         }....................
+def benchmark(variant_name: str, classes_len: int) -> None:
+    '''
+    Type-check instances of the passed number of classes against equivalent
+    type hints under the variant with the passed name in the active Python
+    process, printing one line describing the results.
+    '''
+
+    # Defer heavyweight imports to this subprocess.
+    from beartype.door import (
+        die_if_unbearable,
+        is_bearable,
+    )
+    from beartype.typing import (
+        Dict,
+        Union,
+    )
+    from beartype._check import checkmake
+    from beartype._check.checkmake import (
+        make_func_raiser,
+        make_func_tester,
+    )
+    from beartype._conf.confcls import BEARTYPE_CONF_DEFAULT
+    from time import perf_counter
+    from tracemalloc import (
+        get_traced_memory,
+        start,
+        stop,
+    )
+
+    # If disabling interning, do so by bounding the cache of type-checking
+    # functions keyed on sanified hints to zero entries.
+    if variant_name == 'uninterned':
+        checkmake._HINT_SANE_KEY_LEN_MAX = 0
+    # Else, preserve interning as is.
+
+    # Classes to be type-checked, each unknown to beartype before this call.
+    clses = [type(f'Alastor{index}', (), {}) for index in range(classes_len)]
+
+    # Dictionary mapping from the object identifier of each type-checking
+    # function generated below to that function, retaining these functions for
+    # the duration of this benchmark.
+    func_checkers: Dict[int, object] = {}
+
+    # Start tracing memory allocations *AND* timing.
+    start()
+    time_start = perf_counter()
+
+    # For each such class...
+    for cls in clses:
+        # Instance of this class.
+        obj = cls()
+
+        # For each equivalent type hint spelling this class differently...
+        for hint in ((cls, int), Union[cls, int]):
+            # Type-check this instance against this hint.
+            is_bearable(obj, hint)
+            die_if_unbearable(obj, hint)
+
+            # Record the type-checking functions generated for this hint.
+            for func_checker in (
+                make_func_tester(hint, BEARTYPE_CONF_DEFAULT),
+                make_func_raiser(hint, BEARTYPE_CONF_DEFAULT),
+            ):
+                func_checkers[id(func_checker)] = func_checker
+
+    # Stop timing *AND* tracing memory allocations.
+    time_total = perf_counter() - time_start
+    memory_current, _ = get_traced_memory()
+    stop()
+
+    # Print these results.
+    print(
+        f'{variant_name:<12} {len(func_checkers):>9} '
+        f'{memory_current / 1e6:>10.2f} {time_total * 1e3:>9.1f}'
+    )
+
+
+def main() -> None:
+    '''
+    Run this benchmark with the number of classes passed as the first
+    command-line argument if any *or* the default number otherwise, running
+    each variant in a fresh subprocess.
+    '''
+
+    # If this is a subprocess running a single variant, do so and return.
+    if len(argv) > 2:
+        benchmark(variant_name=argv[1], classes_len=int(argv[2]))
+        return
+    # Else, this is the parent process running all variants.
+
+    # Number of classes to be type-checked.
+    classes_len = int(argv[1]) if len(argv) > 1 else CLASSES_LEN_DEFAULT
+
+    print(f'classes: {classes_len} (2 equivalent hints per class)')
+    print(f'{"variant":<12} {"checkers":>9} {"MB traced":>10} {"msec":>9}')
+
+    # For each variant, run that variant in a fresh subprocess.
+    for variant_name in VARIANT_NAMES:
+        run(
+            [executable, __file__, variant_name, str(classes_len)],
+            check=True,
+        )
+
+
+# ....................{ MAIN                               }....................
+if __name__ == '__main__':
+    main()
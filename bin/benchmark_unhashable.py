@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2024 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Call-time benchmark measuring the time consumed by each call to the
+:func:`beartype.door.is_bearable` tester passed **unhashable type hints**
+(i.e., type hints that the memoized type-checking function factories underlying
+that tester are unable to memoize as is, like ``Annotated[int, [index]]``).
+
+This benchmark passes that tester increasingly many distinct unhashable type
+hints created anew on each call, reporting the mean time per call and the
+number of type-checking functions cached for unhashable type hints after those
+calls. Since that cache is bounded, the time per call should remain flat and
+the size of that cache should never exceed that bound as the number of
+distinct hints grows.
+
+This benchmark then reports the same time for repeatedly passing that tester
+equal copies of the same unhashable type hint, which reuse the same cached
+type-checking function.
+
+Usage
+-----
+.. code-block:: bash
+
+   $ python3 bin/benchmark_unhashable.py
+   $ python3 bin/benchmark_unhashable.py 100000
+'''
+
+# ....................{ IMPORTS                            }....................
+from beartype.door import is_bearable
+from beartype.typing import Annotated
+from beartype._check import checkmake
+from itertools import count
+from sys import argv
+from time import perf_counter
+
+# ....................{ CONSTANTS                          }....................
+HINTS_LEN_MAX_DEFAULT = 40_000
+'''
+Default maximum number of distinct unhashable type hints passed to that tester.
+'''
+
+
+HINTS_LENS_DIVISORS = (16, 4, 1)
+'''
+Tuple of the divisors of the maximum number of distinct unhashable type hints
+yielding each number of such hints to be benchmarked.
+'''
+
+
+REPEATS = 5
+'''
+Number of times each number of hints is benchmarked, of which only the fastest
+time is reported to minimize noise.
+'''
+
+# ....................{ GLOBALS                            }....................
+_hint_int_counter = count()
+'''
+Iterator yielding each integer subscripting the distinct unhashable type hints
+passed to that tester, ensuring that each such hint is passed only once.
+'''
+
+# ....................{ BENCHMARKS                         }....................
+def benchmark(hints_len: int, is_hint_distinct: bool) -> float:
+    '''
+    Fastest mean time in nanoseconds consumed by each call to that tester
+    passed either distinct unhashable type hints *or* equal copies of the same
+    unhashable type hint, each created anew on each call.
+    '''
+
+    # Fastest total time of all calls, initialized to infinity.
+    time_min = float('inf')
+
+    # For each repetition...
+    for _ in range(REPEATS):
+        # Integers subscripting the hints passed to that tester, either unique
+        # across all repetitions of all benchmarks (preventing hints passed by
+        # prior repetitions from being reused) *OR* all zero.
+        hint_ints = (
+            [next(_hint_int_counter) for _ in range(hints_len)]
+            if is_hint_distinct else
+            [0] * hints_len
+        )
+
+        # Time all calls to that tester.
+        time_start = perf_counter()
+        for hint_int in hint_ints:
+            is_bearable(hint_int, Annotated[int, ['Alastor', hint_int]])
+        time_min = min(time_min, perf_counter() - time_start)
+
+    # Return the fastest time per call.
+    return time_min / hints_len * 1e9
+
+
+def main() -> None:
+    '''
+    Run this benchmark with the maximum number of distinct hints passed as the
+    first command-line argument if any *or* the default number otherwise,
+    printing one line per number of hints.
+    '''
+
+    # Maximum number of distinct hints passed to that tester.
+    hints_len_max = int(argv[1]) if len(argv) > 1 else HINTS_LEN_MAX_DEFAULT
+
+    print(f'cache bound: {checkmake._HINT_UNHASHABLE_KEY_LEN_MAX}')
+    print(f'{"hints":>8} {"nsec/call":>10} {"cached":>8}')
+
+    # For each number of distinct hints to be benchmarked...
+    for hints_len_divisor in HINTS_LENS_DIVISORS:
+        # Number of distinct hints passed to that tester.
+        hints_len = hints_len_max // hints_len_divisor
+
+        # Time passing that tester these hints.
+        time_call = benchmark(hints_len, is_hint_distinct=True)
+
+        # Print this time and the current size of that cache.
+        print(
+            f'{hints_len:>8} {time_call:>10.1f} '
+            f'{len(checkmake._hint_unhashable_key_to_func_checker):>8}'
+        )
+
+    # Time passing that tester equal copies of the same hint.
+    print()
+    print(
+        f'{"same hint":>8} '
+        f'{benchmark(hints_len_max, is_hint_distinct=False):>10.1f}'
+    )
+
+
+# ....................{ MAIN                               }....................
+if __name__ == '__main__':
+    main()